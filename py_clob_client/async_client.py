@@ -0,0 +1,1109 @@
+import asyncio
+import logging
+from concurrent.futures import Executor
+from functools import partial
+from typing import Optional, Union
+
+from py_order_utils.model import SignedOrder
+
+from .order_builder.builder import OrderBuilder
+from .order_book.compact import CompactOrderBookSummary
+from .order_book.mirror import OrderBookMirror
+from .market_cache import MarketMetadataCache, TICK_SIZE, is_tick_size_error
+from .metrics import ClientMetrics, phase
+from .headers.headers import create_level_1_headers, Level2HeadersContext
+from .signer import Signer
+from .config import get_contract_config
+
+from .endpoints import (
+    CANCEL,
+    CANCEL_ORDERS,
+    CANCEL_MARKET_ORDERS,
+    CANCEL_ALL,
+    CREATE_API_KEY,
+    DELETE_API_KEY,
+    DERIVE_API_KEY,
+    GET_API_KEYS,
+    CLOSED_ONLY,
+    GET_LAST_TRADE_PRICE,
+    GET_ORDER,
+    GET_ORDER_BOOK,
+    MID_POINT,
+    ORDERS,
+    POST_ORDER,
+    POST_ORDERS,
+    PRICE,
+    TIME,
+    TRADES,
+    GET_NOTIFICATIONS,
+    DROP_NOTIFICATIONS,
+    GET_BALANCE_ALLOWANCE,
+    UPDATE_BALANCE_ALLOWANCE,
+    IS_ORDER_SCORING,
+    GET_TICK_SIZE,
+    GET_NEG_RISK,
+    ARE_ORDERS_SCORING,
+    GET_SIMPLIFIED_MARKETS,
+    GET_MARKETS,
+    GET_MARKET,
+    GET_SAMPLING_SIMPLIFIED_MARKETS,
+    GET_SAMPLING_MARKETS,
+    GET_MARKET_TRADES_EVENTS,
+    GET_LAST_TRADES_PRICES,
+    MID_POINTS,
+    GET_ORDER_BOOKS,
+    GET_PRICES,
+    GET_SPREAD,
+    GET_SPREADS,
+)
+from .clob_types import (
+    ApiCreds,
+    TradeParams,
+    OpenOrderParams,
+    OrderArgs,
+    RequestArgs,
+    DropNotificationParams,
+    OrderBookSummary,
+    BalanceAllowanceParams,
+    OrderScoringParams,
+    TickSize,
+    CreateOrderOptions,
+    OrdersScoringParams,
+    OrderType,
+    PartialCreateOrderOptions,
+    BookParams,
+    MarketOrderArgs,
+    PostOrdersArgs,
+)
+from .exceptions import PolyApiException, PolyBatchException, PolyException
+from .http_helpers.helpers import (
+    add_query_trade_params,
+    add_query_open_orders_params,
+    drop_notifications_query_params,
+    add_balance_allowance_params_to_url,
+    add_order_scoring_params_to_url,
+)
+from .http_helpers.async_transport import AsyncTransport
+from .http_helpers.single_flight import AsyncSingleFlight
+from .http_helpers.pagination import aiter_records, aprojected
+from .http_helpers.batch import (
+    DEFAULT_BATCH_CHUNK_SIZE,
+    merge_dicts,
+    merge_lists,
+    post_chunked_async,
+)
+
+from .constants import L0, L1, L1_AUTH_UNAVAILABLE, L2, L2_AUTH_UNAVAILABLE
+from .utilities import (
+    parse_raw_orderbook_summary,
+    OrderBookHashCache,
+    order_to_json,
+    serialize_body,
+    is_tick_size_smaller,
+    price_valid,
+    format_number,
+)
+
+
+class AsyncClobClient:
+    def __init__(
+        self,
+        host,
+        chain_id: int = None,
+        key: str = None,
+        creds: ApiCreds = None,
+        signature_type: int = None,
+        funder: str = None,
+        transport: AsyncTransport = None,
+        order_book_mirror: OrderBookMirror = None,
+        market_cache: MarketMetadataCache = None,
+        metrics: ClientMetrics = None,
+        batch_chunk_size: int = DEFAULT_BATCH_CHUNK_SIZE,
+    ):
+        """
+        Initializes the asyncio clob client
+        Exposes the same methods as ClobClient, as coroutines for the ones making requests
+        The client can be started in 3 modes:
+        1) Level 0: Requires only the clob host url
+                    Allows access to open CLOB endpoints
+
+        2) Level 1: Requires the host, chain_id and a private key.
+                    Allows access to L1 authenticated endpoints + all unauthenticated endpoints
+
+        3) Level 2: Requires the host, chain_id, a private key, and Credentials.
+                    Allows access to all endpoints
+
+        All requests go through `transport`, a pooled keep-alive AsyncTransport
+        created with the default connection limits and timeouts if not provided
+
+        With an `order_book_mirror`, the midpoint, spread and market price of the tokens
+        it tracks are read from its local books instead of being requested, while fresh
+
+        The tick sizes and neg risk flags are kept in `market_cache`, a MarketMetadataCache
+        with the default ttl and size if not provided, which can be shared, warmed and saved.
+        A MarketCatalog can be given instead to read them from a local market catalog
+
+        With `metrics`, the requests and the phases of the order methods (tick size
+        resolution, amounts, signing, serialization, hmac, http) are recorded, see ClientMetrics
+
+        The batch reads (get_order_books, get_prices, get_midpoints, get_spreads and
+        get_last_trades_prices) are sent in chunks of at most `batch_chunk_size` params,
+        concurrently
+        """
+        self.host = host[0:-1] if host.endswith("/") else host
+        self.chain_id = chain_id
+        self.signer = Signer(key, chain_id) if key else None
+        self.creds = creds
+        self.mode = self._get_client_mode()
+        self.__l2_context = self.__create_l2_context()
+        self.transport = (
+            transport if transport is not None else AsyncTransport(metrics=metrics)
+        )
+        if metrics is not None and self.transport.metrics is None:
+            self.transport.metrics = metrics
+        self.metrics = metrics
+        self.order_book_mirror = order_book_mirror
+        self.market_cache = (
+            market_cache if market_cache is not None else MarketMetadataCache()
+        )
+        self.batch_chunk_size = batch_chunk_size
+
+        if self.signer:
+            self.builder = OrderBuilder(
+                self.signer, sig_type=signature_type, funder=funder, metrics=metrics
+            )
+
+        # local cache
+        self.__single_flight = AsyncSingleFlight()
+        self.__orderbook_hashes = OrderBookHashCache()
+
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+    async def close(self):
+        """
+        Closes the underlying transport
+        """
+        await self.transport.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        await self.close()
+
+    def get_address(self):
+        """
+        Returns the public address of the signer
+        """
+        return self.signer.address() if self.signer else None
+
+    def get_collateral_address(self):
+        """
+        Returns the collateral token address
+        """
+        contract_config = get_contract_config(self.chain_id)
+        if contract_config:
+            return contract_config.collateral
+
+    def get_conditional_address(self):
+        """
+        Returns the conditional token address
+        """
+        contract_config = get_contract_config(self.chain_id)
+        if contract_config:
+            return contract_config.conditional_tokens
+
+    def get_exchange_address(self, neg_risk=False):
+        """
+        Returns the exchange address
+        """
+        contract_config = get_contract_config(self.chain_id, neg_risk)
+        if contract_config:
+            return contract_config.exchange
+
+    async def get_ok(self):
+        """
+        Health check: Confirms that the server is up
+        Does not need authentication
+        """
+        return await self.transport.get("{}/".format(self.host))
+
+    async def get_server_time(self):
+        """
+        Returns the current timestamp on the server
+        Does not need authentication
+        """
+        return await self.transport.get("{}{}".format(self.host, TIME))
+
+    async def create_api_key(self, nonce: int = None) -> ApiCreds:
+        """
+        Creates a new CLOB API key for the given
+        """
+        self.assert_level_1_auth()
+
+        endpoint = "{}{}".format(self.host, CREATE_API_KEY)
+        headers = create_level_1_headers(self.signer, nonce)
+
+        creds_raw = await self.transport.post(endpoint, headers=headers)
+        try:
+            creds = ApiCreds(
+                api_key=creds_raw["apiKey"],
+                api_secret=creds_raw["secret"],
+                api_passphrase=creds_raw["passphrase"],
+            )
+        except:
+            self.logger.error("Couldn't parse created CLOB creds")
+            return None
+        return creds
+
+    async def derive_api_key(self, nonce: int = None) -> ApiCreds:
+        """
+        Derives an already existing CLOB API key for the given address and nonce
+        """
+        self.assert_level_1_auth()
+
+        endpoint = "{}{}".format(self.host, DERIVE_API_KEY)
+        headers = create_level_1_headers(self.signer, nonce)
+
+        creds_raw = await self.transport.get(endpoint, headers=headers)
+        try:
+            creds = ApiCreds(
+                api_key=creds_raw["apiKey"],
+                api_secret=creds_raw["secret"],
+                api_passphrase=creds_raw["passphrase"],
+            )
+        except:
+            self.logger.error("Couldn't parse derived CLOB creds")
+            return None
+        return creds
+
+    async def create_or_derive_api_creds(self, nonce: int = None) -> ApiCreds:
+        """
+        Creates API creds if not already created for nonce, otherwise derives them
+        """
+        try:
+            return await self.create_api_key(nonce)
+        except:
+            return await self.derive_api_key(nonce)
+
+    def set_api_creds(self, creds: ApiCreds):
+        """
+        Sets client api creds
+        """
+        self.creds = creds
+        self.mode = self._get_client_mode()
+        self.__l2_context = self.__create_l2_context()
+
+    async def get_api_keys(self):
+        """
+        Gets the available API keys for this address
+        Level 2 Auth required
+        """
+        self.assert_level_2_auth()
+
+        request_args = RequestArgs(method="GET", request_path=GET_API_KEYS)
+        headers = self.__l2_context.create_headers(request_args)
+        return await self.transport.get(
+            "{}{}".format(self.host, GET_API_KEYS), headers=headers
+        )
+
+    async def get_closed_only_mode(self):
+        """
+        Gets the closed only mode flag for thsi address
+        Level 2 Auth required
+        """
+        self.assert_level_2_auth()
+
+        request_args = RequestArgs(method="GET", request_path=CLOSED_ONLY)
+        headers = self.__l2_context.create_headers(request_args)
+        return await self.transport.get(
+            "{}{}".format(self.host, CLOSED_ONLY), headers=headers
+        )
+
+    async def delete_api_key(self):
+        """
+        Deletes an API key
+        Level 2 Auth required
+        """
+        self.assert_level_2_auth()
+
+        request_args = RequestArgs(method="DELETE", request_path=DELETE_API_KEY)
+        headers = self.__l2_context.create_headers(request_args)
+        return await self.transport.delete(
+            "{}{}".format(self.host, DELETE_API_KEY), headers=headers
+        )
+
+    async def get_midpoint(self, token_id):
+        """
+        Get the mid market price for the given market
+        """
+        mid = self.__local_book_value(token_id, OrderBookMirror.midpoint)
+        if mid is not None:
+            return {"mid": format_number(round(mid, 6))}
+
+        return await self.transport.get(
+            "{}{}?token_id={}".format(self.host, MID_POINT, token_id)
+        )
+
+    def __local_book_value(self, token_id, fn):
+        """
+        fn(mirror, token_id) if the token's book is mirrored and fresh, None otherwise
+        """
+        mirror = self.order_book_mirror
+        if mirror is None or not mirror.is_fresh(token_id):
+            return None
+        return fn(mirror, token_id)
+
+    async def __post_batch(self, path: str, body: list, merge):
+        """
+        POSTs a batch read in chunks of batch_chunk_size, sent concurrently
+        Raises a PolyBatchException with the merged results of the others if some chunks fail
+        """
+        return await post_chunked_async(
+            self.transport.post,
+            "{}{}".format(self.host, path),
+            body,
+            self.batch_chunk_size,
+            merge,
+        )
+
+    async def get_midpoints(self, params: list[BookParams]):
+        """
+        Get the mid market prices for a set of token ids
+        """
+        body = [{"token_id": param.token_id} for param in params]
+        return await self.__post_batch(MID_POINTS, body, merge_dicts)
+
+    async def get_price(self, token_id, side):
+        """
+        Get the market price for the given market
+        """
+        return await self.transport.get(
+            "{}{}?token_id={}&side={}".format(self.host, PRICE, token_id, side)
+        )
+
+    async def get_prices(self, params: list[BookParams]):
+        """
+        Get the market prices for a set
+        """
+        body = [{"token_id": param.token_id, "side": param.side} for param in params]
+        return await self.__post_batch(GET_PRICES, body, merge_dicts)
+
+    async def get_spread(self, token_id):
+        """
+        Get the spread for the given market
+        """
+        spread = self.__local_book_value(token_id, OrderBookMirror.spread)
+        if spread is not None:
+            return {"spread": format_number(round(spread, 6))}
+
+        return await self.transport.get(
+            "{}{}?token_id={}".format(self.host, GET_SPREAD, token_id)
+        )
+
+    async def get_spreads(self, params: list[BookParams]):
+        """
+        Get the spreads for a set of token ids
+        """
+        body = [{"token_id": param.token_id} for param in params]
+        return await self.__post_batch(GET_SPREADS, body, merge_dicts)
+
+    async def get_tick_size(self, token_id: str) -> TickSize:
+        tick_size = self.market_cache.get_tick_size(token_id)
+        if tick_size is not None:
+            return tick_size
+
+        result = await self.__get_shared(
+            "{}{}?token_id={}".format(self.host, GET_TICK_SIZE, token_id)
+        )
+        tick_size = str(result["minimum_tick_size"])
+        self.market_cache.set_tick_size(token_id, tick_size)
+
+        return tick_size
+
+    async def get_neg_risk(self, token_id: str) -> bool:
+        neg_risk = self.market_cache.get_neg_risk(token_id)
+        if neg_risk is not None:
+            return neg_risk
+
+        result = await self.__get_shared(
+            "{}{}?token_id={}".format(self.host, GET_NEG_RISK, token_id)
+        )
+        self.market_cache.set_neg_risk(token_id, result["neg_risk"])
+
+        return result["neg_risk"]
+
+    async def __get_shared(self, url: str):
+        """
+        GETs url, the concurrent GETs of the same url share one in-flight request
+        """
+        return await self.__single_flight.do(url, partial(self.transport.get, url))
+
+    async def __resolve_tick_size(
+        self, token_id: str, tick_size: TickSize = None
+    ) -> TickSize:
+        min_tick_size = await self.get_tick_size(token_id)
+        if tick_size is not None and is_tick_size_smaller(tick_size, min_tick_size):
+            # the cached tick size may be stale, the minimum changes with the price
+            self.market_cache.invalidate(token_id, TICK_SIZE)
+            min_tick_size = await self.get_tick_size(token_id)
+        if tick_size is not None:
+            if is_tick_size_smaller(tick_size, min_tick_size):
+                raise Exception(
+                    "invalid tick size ("
+                    + str(tick_size)
+                    + "), minimum for the market is "
+                    + str(min_tick_size),
+                )
+        else:
+            tick_size = min_tick_size
+        return tick_size
+
+    async def __resolve_order_options(
+        self, order_args: OrderArgs, options: Optional[PartialCreateOrderOptions] = None
+    ) -> CreateOrderOptions:
+        tick_size = await self.__resolve_tick_size(
+            order_args.token_id,
+            options.tick_size if options else None,
+        )
+
+        if not price_valid(order_args.price, tick_size):
+            raise Exception(
+                "price ("
+                + str(order_args.price)
+                + "), min: "
+                + str(tick_size)
+                + " - max: "
+                + str(1 - float(tick_size))
+            )
+
+        neg_risk = (
+            options.neg_risk
+            if options and options.neg_risk
+            else await self.get_neg_risk(order_args.token_id)
+        )
+
+        return CreateOrderOptions(
+            tick_size=tick_size,
+            neg_risk=neg_risk,
+        )
+
+    async def create_order(
+        self, order_args: OrderArgs, options: Optional[PartialCreateOrderOptions] = None
+    ):
+        """
+        Creates and signs an order
+        Level 1 Auth required
+        """
+        self.assert_level_1_auth()
+
+        with phase(self.metrics, "create_order", "tick_size"):
+            create_options = await self.__resolve_order_options(order_args, options)
+        return self.builder.create_order(order_args, create_options)
+
+    async def create_orders(
+        self,
+        orders: list[OrderArgs],
+        options: Optional[PartialCreateOrderOptions] = None,
+        executor: Executor = None,
+    ) -> list[SignedOrder]:
+        """
+        Creates and signs a batch of orders, returned in input order and ready for post_orders
+        Tick sizes and neg risk flags are resolved for every token before any order is signed
+        The signing runs off the event loop, spread over `executor` if provided,
+        a ProcessPoolExecutor scales it with cores
+        Level 1 Auth required
+        """
+        self.assert_level_1_auth()
+
+        # resolve each token once, concurrently, to warm the caches
+        first_orders = {order_args.token_id: order_args for order_args in orders}
+        await asyncio.gather(
+            *[
+                self.__resolve_order_options(order_args, options)
+                for order_args in first_orders.values()
+            ]
+        )
+        create_options = [
+            await self.__resolve_order_options(order_args, options)
+            for order_args in orders
+        ]
+
+        # off the event loop, spread over `executor` if provided
+        return await asyncio.get_running_loop().run_in_executor(
+            None, self.builder.create_orders, orders, create_options, executor
+        )
+
+    async def create_order_ladder(
+        self,
+        token_id: str,
+        side: str,
+        prices: list[float],
+        sizes: list[float],
+        options: Optional[PartialCreateOrderOptions] = None,
+        order_type: OrderType = OrderType.GTC,
+        executor: Executor = None,
+    ) -> list[PostOrdersArgs]:
+        """
+        Creates and signs a ladder of orders on one token, one per (price, size) pair
+        The tick size and neg risk flag are resolved once, every price is validated before anything is signed
+        The signing runs off the event loop, spread over `executor` if provided
+        Returned in input order, ready for post_orders
+        Level 1 Auth required
+        """
+        self.assert_level_1_auth()
+
+        tick_size = await self.__resolve_tick_size(
+            token_id, options.tick_size if options else None
+        )
+        neg_risk = (
+            options.neg_risk
+            if options and options.neg_risk
+            else await self.get_neg_risk(token_id)
+        )
+
+        return await asyncio.get_running_loop().run_in_executor(
+            None,
+            partial(
+                self.builder.create_order_ladder,
+                token_id,
+                side,
+                prices,
+                sizes,
+                CreateOrderOptions(tick_size=tick_size, neg_risk=neg_risk),
+                order_type=order_type,
+                executor=executor,
+            ),
+        )
+
+    async def create_market_order(
+        self,
+        order_args: MarketOrderArgs,
+        options: Optional[PartialCreateOrderOptions] = None,
+    ):
+        """
+        Creates and signs an order
+        Level 1 Auth required
+        """
+        self.assert_level_1_auth()
+
+        # add resolve_order_options, or similar
+        tick_size = await self.__resolve_tick_size(
+            order_args.token_id,
+            options.tick_size if options else None,
+        )
+
+        if order_args.price is None or order_args.price <= 0:
+            order_args.price = await self.calculate_market_price(
+                order_args.token_id,
+                order_args.side,
+                order_args.amount,
+                order_args.order_type,
+            )
+
+        if not price_valid(order_args.price, tick_size):
+            raise Exception(
+                "price ("
+                + str(order_args.price)
+                + "), min: "
+                + str(tick_size)
+                + " - max: "
+                + str(1 - float(tick_size))
+            )
+
+        neg_risk = (
+            options.neg_risk
+            if options and options.neg_risk
+            else await self.get_neg_risk(order_args.token_id)
+        )
+
+        return self.builder.create_market_order(
+            order_args,
+            CreateOrderOptions(
+                tick_size=tick_size,
+                neg_risk=neg_risk,
+            ),
+        )
+
+    async def post_orders(self, args: list[PostOrdersArgs]):
+        """
+        Posts orders
+        """
+        self.assert_level_2_auth()
+        with phase(self.metrics, "post_orders", "serialize"):
+            body = serialize_body(
+                [
+                    order_to_json(arg.order, self.creds.api_key, arg.orderType)
+                    for arg in args
+                ]
+            )
+        with phase(self.metrics, "post_orders", "hmac"):
+            headers = self.__l2_context.create_headers(
+                RequestArgs(method="POST", request_path=POST_ORDERS, body=body),
+            )
+        orders = [arg.order for arg in args]
+        try:
+            with phase(self.metrics, "post_orders", "http"):
+                resp = await self.transport.post(
+                    "{}{}".format(self.host, POST_ORDERS), headers=headers, data=body
+                )
+        except PolyApiException as e:
+            self.__invalidate_rejected_tick_sizes(orders, [e.error_msg] * len(orders))
+            raise
+        if isinstance(resp, list):
+            self.__invalidate_rejected_tick_sizes(
+                orders,
+                [r.get("errorMsg") if isinstance(r, dict) else None for r in resp],
+            )
+        return resp
+
+    async def post_order(self, order, orderType: OrderType = OrderType.GTC):
+        """
+        Posts the order
+        """
+        self.assert_level_2_auth()
+        with phase(self.metrics, "post_order", "serialize"):
+            body = serialize_body(order_to_json(order, self.creds.api_key, orderType))
+        with phase(self.metrics, "post_order", "hmac"):
+            headers = self.__l2_context.create_headers(
+                RequestArgs(method="POST", request_path=POST_ORDER, body=body),
+            )
+        try:
+            with phase(self.metrics, "post_order", "http"):
+                resp = await self.transport.post(
+                    "{}{}".format(self.host, POST_ORDER), headers=headers, data=body
+                )
+        except PolyApiException as e:
+            self.__invalidate_rejected_tick_sizes([order], [e.error_msg])
+            raise
+        if isinstance(resp, dict):
+            self.__invalidate_rejected_tick_sizes([order], [resp.get("errorMsg")])
+        return resp
+
+    def __invalidate_rejected_tick_sizes(self, orders: list[SignedOrder], errors: list):
+        """
+        Drops the cached tick size of the tokens of the orders rejected for their tick size
+        """
+        for order, error in zip(orders, errors):
+            if error and is_tick_size_error(error):
+                self.market_cache.invalidate(str(order.order["tokenId"]), TICK_SIZE)
+
+    async def create_and_post_order(
+        self, order_args: OrderArgs, options: PartialCreateOrderOptions = None
+    ):
+        """
+        Utility function to create and publish an order
+        """
+        ord = await self.create_order(order_args, options)
+        return await self.post_order(ord)
+
+    async def cancel(self, order_id):
+        """
+        Cancels an order
+        Level 2 Auth required
+        """
+        self.assert_level_2_auth()
+        body = serialize_body({"orderID": order_id})
+
+        request_args = RequestArgs(method="DELETE", request_path=CANCEL, body=body)
+        headers = self.__l2_context.create_headers(request_args)
+        return await self.transport.delete(
+            "{}{}".format(self.host, CANCEL), headers=headers, data=body
+        )
+
+    async def cancel_orders(self, order_ids):
+        """
+        Cancels orders
+        Level 2 Auth required
+        """
+        self.assert_level_2_auth()
+        body = serialize_body(order_ids)
+
+        request_args = RequestArgs(
+            method="DELETE", request_path=CANCEL_ORDERS, body=body
+        )
+        headers = self.__l2_context.create_headers(request_args)
+        return await self.transport.delete(
+            "{}{}".format(self.host, CANCEL_ORDERS), headers=headers, data=body
+        )
+
+    async def cancel_all(self):
+        """
+        Cancels all available orders for the user
+        Level 2 Auth required
+        """
+        self.assert_level_2_auth()
+        request_args = RequestArgs(method="DELETE", request_path=CANCEL_ALL)
+        headers = self.__l2_context.create_headers(request_args)
+        return await self.transport.delete(
+            "{}{}".format(self.host, CANCEL_ALL), headers=headers
+        )
+
+    async def cancel_market_orders(self, market: str = "", asset_id: str = ""):
+        """
+        Cancels orders
+        Level 2 Auth required
+        """
+        self.assert_level_2_auth()
+        body = serialize_body({"market": market, "asset_id": asset_id})
+
+        request_args = RequestArgs(
+            method="DELETE", request_path=CANCEL_MARKET_ORDERS, body=body
+        )
+        headers = self.__l2_context.create_headers(request_args)
+        return await self.transport.delete(
+            "{}{}".format(self.host, CANCEL_MARKET_ORDERS), headers=headers, data=body
+        )
+
+    async def get_orders(self, params: OpenOrderParams = None, next_cursor="MA=="):
+        """
+        Gets orders for the API key
+        Requires Level 2 authentication
+        """
+        self.assert_level_2_auth()
+        return [
+            record
+            async for record in self.iter_orders(params, next_cursor, prefetch=False)
+        ]
+
+    def iter_orders(
+        self, params: OpenOrderParams = None, next_cursor="MA==", prefetch: bool = True
+    ):
+        """
+        Yields the orders of get_orders page by page instead of collecting them in a list
+        With prefetch, the next page is fetched while the current one is being handled
+        Requires Level 2 authentication
+        """
+        self.assert_level_2_auth()
+
+        async def fetch(cursor):
+            headers = self.__l2_context.create_headers(
+                RequestArgs(method="GET", request_path=ORDERS)
+            )
+            url = add_query_open_orders_params(
+                "{}{}".format(self.host, ORDERS), params, cursor
+            )
+            return await self.transport.get(url, headers=headers)
+
+        return aiter_records(fetch, next_cursor, prefetch)
+
+    async def get_order_book(
+        self, token_id, compact: bool = False
+    ) -> Union[OrderBookSummary, CompactOrderBookSummary]:
+        """
+        Fetches the orderbook for the token_id
+        With compact, the levels are kept in price and size columns, see CompactOrderBookSummary
+        """
+        raw_obs = await self.transport.get(
+            "{}{}?token_id={}".format(self.host, GET_ORDER_BOOK, token_id)
+        )
+        if compact:
+            return CompactOrderBookSummary.from_raw(raw_obs)
+        return parse_raw_orderbook_summary(raw_obs)
+
+    async def get_order_books(
+        self, params: list[BookParams], compact: bool = False
+    ) -> list[Union[OrderBookSummary, CompactOrderBookSummary]]:
+        """
+        Fetches the orderbook for a set of token ids
+        With compact, the levels are kept in price and size columns, see CompactOrderBookSummary
+        """
+        body = [{"token_id": param.token_id} for param in params]
+        parse = (
+            CompactOrderBookSummary.from_raw if compact else parse_raw_orderbook_summary
+        )
+        try:
+            raw_obs = await self.__post_batch(GET_ORDER_BOOKS, body, merge_lists)
+        except PolyBatchException as e:
+            e.result = [parse(r) for r in e.result]
+            raise
+        return [parse(r) for r in raw_obs]
+
+    def get_order_book_hash(
+        self, orderbook: Union[OrderBookSummary, CompactOrderBookSummary]
+    ) -> str:
+        """
+        Calculates the hash for the given orderbook
+        Memoized by asset id and hash field: a snapshot whose server hash was already seen is not hashed again
+        """
+        return self.__orderbook_hashes.hash(orderbook)
+
+    async def get_order(self, order_id):
+        """
+        Fetches the order corresponding to the order_id
+        Requires Level 2 authentication
+        """
+        self.assert_level_2_auth()
+        endpoint = "{}{}".format(GET_ORDER, order_id)
+        request_args = RequestArgs(method="GET", request_path=endpoint)
+        headers = self.__l2_context.create_headers(request_args)
+        return await self.transport.get(
+            "{}{}".format(self.host, endpoint), headers=headers
+        )
+
+    async def get_trades(self, params: TradeParams = None, next_cursor="MA=="):
+        """
+        Fetches the trade history for a user
+        Requires Level 2 authentication
+        """
+        self.assert_level_2_auth()
+        return [
+            record
+            async for record in self.iter_trades(params, next_cursor, prefetch=False)
+        ]
+
+    def iter_trades(
+        self, params: TradeParams = None, next_cursor="MA==", prefetch: bool = True
+    ):
+        """
+        Yields the trades of get_trades page by page instead of collecting them in a list
+        With prefetch, the next page is fetched while the current one is being handled
+        Requires Level 2 authentication
+        """
+        self.assert_level_2_auth()
+
+        async def fetch(cursor):
+            headers = self.__l2_context.create_headers(
+                RequestArgs(method="GET", request_path=TRADES)
+            )
+            url = add_query_trade_params(
+                "{}{}".format(self.host, TRADES), params, cursor
+            )
+            return await self.transport.get(url, headers=headers)
+
+        return aiter_records(fetch, next_cursor, prefetch)
+
+    async def get_last_trade_price(self, token_id):
+        """
+        Fetches the last trade price token_id
+        """
+        return await self.transport.get(
+            "{}{}?token_id={}".format(self.host, GET_LAST_TRADE_PRICE, token_id)
+        )
+
+    async def get_last_trades_prices(self, params: list[BookParams]):
+        """
+        Fetches the last trades prices for a set of token ids
+        """
+        body = [{"token_id": param.token_id} for param in params]
+        return await self.__post_batch(GET_LAST_TRADES_PRICES, body, merge_lists)
+
+    def assert_level_1_auth(self):
+        """
+        Level 1 Poly Auth
+        """
+        if self.mode < L1:
+            raise PolyException(L1_AUTH_UNAVAILABLE)
+
+    def assert_level_2_auth(self):
+        """
+        Level 2 Poly Auth
+        """
+        if self.mode < L2:
+            raise PolyException(L2_AUTH_UNAVAILABLE)
+
+    def __create_l2_context(self):
+        if self.signer is None or self.creds is None:
+            return None
+        return Level2HeadersContext(self.signer, self.creds)
+
+    def _get_client_mode(self):
+        if self.signer is not None and self.creds is not None:
+            return L2
+        if self.signer is not None:
+            return L1
+        return L0
+
+    async def get_notifications(self):
+        """
+        Fetches the notifications for a user
+        Requires Level 2 authentication
+        """
+        self.assert_level_2_auth()
+        request_args = RequestArgs(method="GET", request_path=GET_NOTIFICATIONS)
+        headers = self.__l2_context.create_headers(request_args)
+        url = "{}{}?signature_type={}".format(
+            self.host, GET_NOTIFICATIONS, self.builder.sig_type
+        )
+        return await self.transport.get(url, headers=headers)
+
+    async def drop_notifications(self, params: DropNotificationParams = None):
+        """
+        Drops the notifications for a user
+        Requires Level 2 authentication
+        """
+        self.assert_level_2_auth()
+        request_args = RequestArgs(method="DELETE", request_path=DROP_NOTIFICATIONS)
+        headers = self.__l2_context.create_headers(request_args)
+        url = drop_notifications_query_params(
+            "{}{}".format(self.host, DROP_NOTIFICATIONS), params
+        )
+        return await self.transport.delete(url, headers=headers)
+
+    async def get_balance_allowance(self, params: BalanceAllowanceParams = None):
+        """
+        Fetches the balance & allowance for a user
+        Requires Level 2 authentication
+        """
+        self.assert_level_2_auth()
+        request_args = RequestArgs(method="GET", request_path=GET_BALANCE_ALLOWANCE)
+        headers = self.__l2_context.create_headers(request_args)
+        if params.signature_type == -1:
+            params.signature_type = self.builder.sig_type
+        url = add_balance_allowance_params_to_url(
+            "{}{}".format(self.host, GET_BALANCE_ALLOWANCE), params
+        )
+        return await self.transport.get(url, headers=headers)
+
+    async def update_balance_allowance(self, params: BalanceAllowanceParams = None):
+        """
+        Updates the balance & allowance for a user
+        Requires Level 2 authentication
+        """
+        self.assert_level_2_auth()
+        request_args = RequestArgs(method="GET", request_path=UPDATE_BALANCE_ALLOWANCE)
+        headers = self.__l2_context.create_headers(request_args)
+        if params.signature_type == -1:
+            params.signature_type = self.builder.sig_type
+        url = add_balance_allowance_params_to_url(
+            "{}{}".format(self.host, UPDATE_BALANCE_ALLOWANCE), params
+        )
+        return await self.transport.get(url, headers=headers)
+
+    async def is_order_scoring(self, params: OrderScoringParams):
+        """
+        Check if the order is currently scoring
+        Requires Level 2 authentication
+        """
+        self.assert_level_2_auth()
+        request_args = RequestArgs(method="GET", request_path=IS_ORDER_SCORING)
+        headers = self.__l2_context.create_headers(request_args)
+        url = add_order_scoring_params_to_url(
+            "{}{}".format(self.host, IS_ORDER_SCORING), params
+        )
+        return await self.transport.get(url, headers=headers)
+
+    async def are_orders_scoring(self, params: OrdersScoringParams):
+        """
+        Check if the orders are currently scoring
+        Requires Level 2 authentication
+        """
+        self.assert_level_2_auth()
+        body = serialize_body(params.orderIds)
+        request_args = RequestArgs(
+            method="POST", request_path=ARE_ORDERS_SCORING, body=body
+        )
+        headers = self.__l2_context.create_headers(request_args)
+        return await self.transport.post(
+            "{}{}".format(self.host, ARE_ORDERS_SCORING), headers=headers, data=body
+        )
+
+    async def get_sampling_markets(self, next_cursor="MA=="):
+        """
+        Get the current sampling markets
+        """
+        return await self.transport.get(
+            "{}{}?next_cursor={}".format(self.host, GET_SAMPLING_MARKETS, next_cursor)
+        )
+
+    async def get_sampling_simplified_markets(self, next_cursor="MA=="):
+        """
+        Get the current sampling simplified markets
+        """
+        return await self.transport.get(
+            "{}{}?next_cursor={}".format(
+                self.host, GET_SAMPLING_SIMPLIFIED_MARKETS, next_cursor
+            )
+        )
+
+    async def get_markets(self, next_cursor="MA=="):
+        """
+        Get the current markets
+        """
+        return await self.transport.get(
+            "{}{}?next_cursor={}".format(self.host, GET_MARKETS, next_cursor)
+        )
+
+    async def get_simplified_markets(self, next_cursor="MA=="):
+        """
+        Get the current simplified markets
+        """
+        return await self.transport.get(
+            "{}{}?next_cursor={}".format(self.host, GET_SIMPLIFIED_MARKETS, next_cursor)
+        )
+
+    def iter_markets(
+        self, next_cursor="MA==", prefetch: bool = True, fields: list[str] = None
+    ):
+        """
+        Yields every market, walking the get_markets pages
+        Only the given fields of every market are kept if `fields` is set
+        With prefetch, the next page is fetched while the current one is being handled
+        """
+        return self.__iter_catalog(self.get_markets, next_cursor, prefetch, fields)
+
+    def iter_simplified_markets(
+        self, next_cursor="MA==", prefetch: bool = True, fields: list[str] = None
+    ):
+        """
+        Yields every simplified market, walking the get_simplified_markets pages, see iter_markets
+        """
+        return self.__iter_catalog(
+            self.get_simplified_markets, next_cursor, prefetch, fields
+        )
+
+    def iter_sampling_markets(
+        self, next_cursor="MA==", prefetch: bool = True, fields: list[str] = None
+    ):
+        """
+        Yields every sampling market, walking the get_sampling_markets pages, see iter_markets
+        """
+        return self.__iter_catalog(
+            self.get_sampling_markets, next_cursor, prefetch, fields
+        )
+
+    def iter_sampling_simplified_markets(
+        self, next_cursor="MA==", prefetch: bool = True, fields: list[str] = None
+    ):
+        """
+        Yields every sampling simplified market, walking the get_sampling_simplified_markets pages, see iter_markets
+        """
+        return self.__iter_catalog(
+            self.get_sampling_simplified_markets, next_cursor, prefetch, fields
+        )
+
+    async def __iter_catalog(self, get_page, next_cursor, prefetch, fields):
+        fetch = get_page if fields is None else aprojected(get_page, fields)
+        async for market in aiter_records(fetch, next_cursor, prefetch):
+            yield market
+
+    async def get_market(self, condition_id):
+        """
+        Get a market by condition_id
+        """
+        return await self.__get_shared(
+            "{}{}{}".format(self.host, GET_MARKET, condition_id)
+        )
+
+    async def get_market_trades_events(self, condition_id):
+        """
+        Get the market's trades events by condition id
+        """
+        return await self.transport.get(
+            "{}{}{}".format(self.host, GET_MARKET_TRADES_EVENTS, condition_id)
+        )
+
+    async def calculate_market_price(
+        self, token_id: str, side: str, amount: float, order_type: OrderType
+    ) -> float:
+        """
+        Calculates the matching price considering an amount and the current orderbook
+        """
+        mirror = self.order_book_mirror
+        if mirror is not None and mirror.is_fresh(token_id):
+            return mirror.calculate_market_price(token_id, side, amount, order_type)
+
+        book = await self.get_order_book(token_id, compact=True)
+        if book is None:
+            raise Exception("no orderbook")
+        return book.depth(side).market_price(amount, order_type)
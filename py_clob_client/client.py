@@ -1,8 +1,17 @@
 import logging
-from typing import Optional
+import threading
+from concurrent.futures import Executor, ThreadPoolExecutor
+from functools import partial
+from typing import Optional, Union
+
+from py_order_utils.model import SignedOrder
 
 from .order_builder.builder import OrderBuilder
-from .headers.headers import create_level_1_headers, create_level_2_headers
+from .order_book.compact import CompactOrderBookSummary
+from .order_book.mirror import OrderBookMirror
+from .market_cache import MarketMetadataCache, TICK_SIZE, is_tick_size_error
+from .metrics import ClientMetrics, phase
+from .headers.headers import create_level_1_headers, Level2HeadersContext
 from .signer import Signer
 from .config import get_contract_config
 
@@ -66,25 +75,35 @@ from .clob_types import (
     MarketOrderArgs,
     PostOrdersArgs,
 )
-from .exceptions import PolyException
+from .exceptions import PolyApiException, PolyBatchException, PolyException
 from .http_helpers.helpers import (
     add_query_trade_params,
     add_query_open_orders_params,
-    delete,
-    get,
-    post,
     drop_notifications_query_params,
     add_balance_allowance_params_to_url,
     add_order_scoring_params_to_url,
 )
+from .http_helpers.transport import Transport
+from .http_helpers.coalescer import Coalescer
+from .http_helpers.single_flight import SingleFlight
+from .http_helpers.pagination import iter_records, projected
+from .http_helpers.batch import (
+    DEFAULT_BATCH_CHUNK_SIZE,
+    DEFAULT_BATCH_MAX_WORKERS,
+    merge_dicts,
+    merge_lists,
+    post_chunked,
+)
 
-from .constants import L0, L1, L1_AUTH_UNAVAILABLE, L2, L2_AUTH_UNAVAILABLE, END_CURSOR
+from .constants import L0, L1, L1_AUTH_UNAVAILABLE, L2, L2_AUTH_UNAVAILABLE
 from .utilities import (
     parse_raw_orderbook_summary,
-    generate_orderbook_summary_hash,
+    OrderBookHashCache,
     order_to_json,
+    serialize_body,
     is_tick_size_smaller,
     price_valid,
+    format_number,
 )
 
 
@@ -97,6 +116,13 @@ class ClobClient:
         creds: ApiCreds = None,
         signature_type: int = None,
         funder: str = None,
+        transport: Transport = None,
+        order_book_mirror: OrderBookMirror = None,
+        market_cache: MarketMetadataCache = None,
+        metrics: ClientMetrics = None,
+        batch_chunk_size: int = DEFAULT_BATCH_CHUNK_SIZE,
+        batch_max_workers: int = DEFAULT_BATCH_MAX_WORKERS,
+        coalesce_window: float = None,
     ):
         """
         Initializes the clob client
@@ -109,24 +135,116 @@ class ClobClient:
 
         3) Level 2: Requires the host, chain_id, a private key, and Credentials.
                     Allows access to all endpoints
+
+        All requests go through `transport`, a pooled keep-alive Transport
+        created with the default pool sizes and timeouts if not provided
+
+        With an `order_book_mirror`, the midpoint, spread and market price of the tokens
+        it tracks are read from its local books instead of being requested, while fresh
+
+        The tick sizes and neg risk flags are kept in `market_cache`, a MarketMetadataCache
+        with the default ttl and size if not provided, which can be shared, warmed and saved.
+        A MarketCatalog can be given instead to read them from a local market catalog
+
+        With `metrics`, the requests and the phases of the order methods (tick size
+        resolution, amounts, signing, serialization, hmac, http) are recorded, see ClientMetrics
+
+        The batch reads (get_order_books, get_prices, get_midpoints, get_spreads and
+        get_last_trades_prices) are sent in chunks of at most `batch_chunk_size` params,
+        over up to `batch_max_workers` concurrent requests
+
+        With a `coalesce_window` (in seconds, e.g. 0.002), the get_midpoint, get_price and
+        get_order_book calls made from any thread within the window are merged into one
+        get_midpoints, get_prices or get_order_books request, see Coalescer
         """
         self.host = host[0:-1] if host.endswith("/") else host
         self.chain_id = chain_id
         self.signer = Signer(key, chain_id) if key else None
         self.creds = creds
         self.mode = self._get_client_mode()
+        self.__l2_context = self.__create_l2_context()
+        self.transport = (
+            transport if transport is not None else Transport(metrics=metrics)
+        )
+        if metrics is not None and self.transport.metrics is None:
+            self.transport.metrics = metrics
+        self.metrics = metrics
+        self.order_book_mirror = order_book_mirror
+        self.market_cache = (
+            market_cache if market_cache is not None else MarketMetadataCache()
+        )
+        self.batch_chunk_size = batch_chunk_size
+        self.batch_max_workers = batch_max_workers
+        self.__batch_executor = None
+        self.__batch_executor_lock = threading.Lock()
+        self.__coalescers = (
+            self.__create_coalescers(coalesce_window)
+            if coalesce_window is not None
+            else None
+        )
 
         if self.signer:
             self.builder = OrderBuilder(
-                self.signer, sig_type=signature_type, funder=funder
+                self.signer, sig_type=signature_type, funder=funder, metrics=metrics
             )
 
         # local cache
-        self.__tick_sizes = {}
-        self.__neg_risk = {}
+        self.__single_flight = SingleFlight()
+        self.__orderbook_hashes = OrderBookHashCache()
 
         self.logger = logging.getLogger(self.__class__.__name__)
 
+    def close(self):
+        """
+        Shuts down the batch executor and closes the underlying transport
+        """
+        with self.__batch_executor_lock:
+            executor, self.__batch_executor = self.__batch_executor, None
+        if executor is not None:
+            executor.shutdown()
+        self.transport.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def __create_coalescers(self, window: float) -> dict:
+        def coalescer(load_many, load_one):
+            return Coalescer(load_many, load_one, window, self.batch_chunk_size)
+
+        return {
+            MID_POINT: coalescer(self.__load_midpoints, self.__get_midpoint),
+            PRICE: coalescer(self.__load_prices, lambda key: self.__get_price(*key)),
+            GET_ORDER_BOOK: coalescer(
+                self.__load_order_books, self.__get_raw_order_book
+            ),
+        }
+
+    def __load_midpoints(self, token_ids: list) -> dict:
+        body = [{"token_id": token_id} for token_id in token_ids]
+        mids = self.__post_batch(MID_POINTS, body, merge_dicts)
+        return {
+            token_id: {"mid": mids[token_id]}
+            for token_id in token_ids
+            if token_id in mids
+        }
+
+    def __load_prices(self, keys: list) -> dict:
+        body = [{"token_id": token_id, "side": side} for token_id, side in keys]
+        prices = self.__post_batch(GET_PRICES, body, merge_dicts)
+        return {
+            (token_id, side): {"price": prices[token_id][side]}
+            for token_id, side in keys
+            if side in prices.get(token_id, ())
+        }
+
+    def __load_order_books(self, token_ids: list) -> dict:
+        body = [{"token_id": token_id} for token_id in token_ids]
+        raw_obs = self.__post_batch(GET_ORDER_BOOKS, body, merge_lists)
+        return {raw_ob["asset_id"]: raw_ob for raw_ob in raw_obs}
+
     def get_address(self):
         """
         Returns the public address of the signer
@@ -162,14 +280,14 @@ class ClobClient:
         Health check: Confirms that the server is up
         Does not need authentication
         """
-        return get("{}/".format(self.host))
+        return self.transport.get("{}/".format(self.host))
 
     def get_server_time(self):
         """
         Returns the current timestamp on the server
         Does not need authentication
         """
-        return get("{}{}".format(self.host, TIME))
+        return self.transport.get("{}{}".format(self.host, TIME))
 
     def create_api_key(self, nonce: int = None) -> ApiCreds:
         """
@@ -180,7 +298,7 @@ class ClobClient:
         endpoint = "{}{}".format(self.host, CREATE_API_KEY)
         headers = create_level_1_headers(self.signer, nonce)
 
-        creds_raw = post(endpoint, headers=headers)
+        creds_raw = self.transport.post(endpoint, headers=headers)
         try:
             creds = ApiCreds(
                 api_key=creds_raw["apiKey"],
@@ -201,7 +319,7 @@ class ClobClient:
         endpoint = "{}{}".format(self.host, DERIVE_API_KEY)
         headers = create_level_1_headers(self.signer, nonce)
 
-        creds_raw = get(endpoint, headers=headers)
+        creds_raw = self.transport.get(endpoint, headers=headers)
         try:
             creds = ApiCreds(
                 api_key=creds_raw["apiKey"],
@@ -228,6 +346,7 @@ class ClobClient:
         """
         self.creds = creds
         self.mode = self._get_client_mode()
+        self.__l2_context = self.__create_l2_context()
 
     def get_api_keys(self):
         """
@@ -237,8 +356,10 @@ class ClobClient:
         self.assert_level_2_auth()
 
         request_args = RequestArgs(method="GET", request_path=GET_API_KEYS)
-        headers = create_level_2_headers(self.signer, self.creds, request_args)
-        return get("{}{}".format(self.host, GET_API_KEYS), headers=headers)
+        headers = self.__l2_context.create_headers(request_args)
+        return self.transport.get(
+            "{}{}".format(self.host, GET_API_KEYS), headers=headers
+        )
 
     def get_closed_only_mode(self):
         """
@@ -248,8 +369,10 @@ class ClobClient:
         self.assert_level_2_auth()
 
         request_args = RequestArgs(method="GET", request_path=CLOSED_ONLY)
-        headers = create_level_2_headers(self.signer, self.creds, request_args)
-        return get("{}{}".format(self.host, CLOSED_ONLY), headers=headers)
+        headers = self.__l2_context.create_headers(request_args)
+        return self.transport.get(
+            "{}{}".format(self.host, CLOSED_ONLY), headers=headers
+        )
 
     def delete_api_key(self):
         """
@@ -259,70 +382,153 @@ class ClobClient:
         self.assert_level_2_auth()
 
         request_args = RequestArgs(method="DELETE", request_path=DELETE_API_KEY)
-        headers = create_level_2_headers(self.signer, self.creds, request_args)
-        return delete("{}{}".format(self.host, DELETE_API_KEY), headers=headers)
+        headers = self.__l2_context.create_headers(request_args)
+        return self.transport.delete(
+            "{}{}".format(self.host, DELETE_API_KEY), headers=headers
+        )
 
     def get_midpoint(self, token_id):
         """
         Get the mid market price for the given market
         """
-        return get("{}{}?token_id={}".format(self.host, MID_POINT, token_id))
+        mid = self.__local_book_value(token_id, OrderBookMirror.midpoint)
+        if mid is not None:
+            return {"mid": format_number(round(mid, 6))}
+
+        if self.__coalescers is not None:
+            return self.__coalescers[MID_POINT].load(token_id)
+        return self.__get_midpoint(token_id)
+
+    def __get_midpoint(self, token_id):
+        return self.transport.get(
+            "{}{}?token_id={}".format(self.host, MID_POINT, token_id)
+        )
+
+    def __local_book_value(self, token_id, fn):
+        """
+        fn(mirror, token_id) if the token's book is mirrored and fresh, None otherwise
+        """
+        mirror = self.order_book_mirror
+        if mirror is None or not mirror.is_fresh(token_id):
+            return None
+        return fn(mirror, token_id)
+
+    def __post_batch(self, path: str, body: list, merge):
+        """
+        POSTs a batch read in chunks of batch_chunk_size, sent concurrently
+        Raises a PolyBatchException with the merged results of the others if some chunks fail
+        """
+        return post_chunked(
+            self.transport.post,
+            "{}{}".format(self.host, path),
+            body,
+            self.batch_chunk_size,
+            (
+                self.__get_batch_executor()
+                if len(body) > self.batch_chunk_size
+                else None
+            ),
+            merge,
+        )
+
+    def __get_batch_executor(self) -> ThreadPoolExecutor:
+        """
+        The thread pool of the concurrent requests, created on first use
+        """
+        if self.__batch_executor is None:
+            with self.__batch_executor_lock:
+                if self.__batch_executor is None:
+                    self.__batch_executor = ThreadPoolExecutor(
+                        max_workers=self.batch_max_workers,
+                        thread_name_prefix="clob-batch",
+                    )
+        return self.__batch_executor
 
     def get_midpoints(self, params: list[BookParams]):
         """
         Get the mid market prices for a set of token ids
         """
         body = [{"token_id": param.token_id} for param in params]
-        return post("{}{}".format(self.host, MID_POINTS), data=body)
+        return self.__post_batch(MID_POINTS, body, merge_dicts)
 
     def get_price(self, token_id, side):
         """
         Get the market price for the given market
         """
-        return get("{}{}?token_id={}&side={}".format(self.host, PRICE, token_id, side))
+        if self.__coalescers is not None:
+            return self.__coalescers[PRICE].load((token_id, side))
+        return self.__get_price(token_id, side)
+
+    def __get_price(self, token_id, side):
+        return self.transport.get(
+            "{}{}?token_id={}&side={}".format(self.host, PRICE, token_id, side)
+        )
 
     def get_prices(self, params: list[BookParams]):
         """
         Get the market prices for a set
         """
         body = [{"token_id": param.token_id, "side": param.side} for param in params]
-        return post("{}{}".format(self.host, GET_PRICES), data=body)
+        return self.__post_batch(GET_PRICES, body, merge_dicts)
 
     def get_spread(self, token_id):
         """
         Get the spread for the given market
         """
-        return get("{}{}?token_id={}".format(self.host, GET_SPREAD, token_id))
+        spread = self.__local_book_value(token_id, OrderBookMirror.spread)
+        if spread is not None:
+            return {"spread": format_number(round(spread, 6))}
+
+        return self.transport.get(
+            "{}{}?token_id={}".format(self.host, GET_SPREAD, token_id)
+        )
 
     def get_spreads(self, params: list[BookParams]):
         """
         Get the spreads for a set of token ids
         """
         body = [{"token_id": param.token_id} for param in params]
-        return post("{}{}".format(self.host, GET_SPREADS), data=body)
+        return self.__post_batch(GET_SPREADS, body, merge_dicts)
 
     def get_tick_size(self, token_id: str) -> TickSize:
-        if token_id in self.__tick_sizes:
-            return self.__tick_sizes[token_id]
+        tick_size = self.market_cache.get_tick_size(token_id)
+        if tick_size is not None:
+            return tick_size
 
-        result = get("{}{}?token_id={}".format(self.host, GET_TICK_SIZE, token_id))
-        self.__tick_sizes[token_id] = str(result["minimum_tick_size"])
+        result = self.__get_shared(
+            "{}{}?token_id={}".format(self.host, GET_TICK_SIZE, token_id)
+        )
+        tick_size = str(result["minimum_tick_size"])
+        self.market_cache.set_tick_size(token_id, tick_size)
 
-        return self.__tick_sizes[token_id]
+        return tick_size
 
     def get_neg_risk(self, token_id: str) -> bool:
-        if token_id in self.__neg_risk:
-            return self.__neg_risk[token_id]
+        neg_risk = self.market_cache.get_neg_risk(token_id)
+        if neg_risk is not None:
+            return neg_risk
 
-        result = get("{}{}?token_id={}".format(self.host, GET_NEG_RISK, token_id))
-        self.__neg_risk[token_id] = result["neg_risk"]
+        result = self.__get_shared(
+            "{}{}?token_id={}".format(self.host, GET_NEG_RISK, token_id)
+        )
+        self.market_cache.set_neg_risk(token_id, result["neg_risk"])
 
         return result["neg_risk"]
 
+    def __get_shared(self, url: str):
+        """
+        GETs url, the concurrent GETs of the same url share one in-flight request
+        """
+        return self.__single_flight.do(url, partial(self.transport.get, url))
+
     def __resolve_tick_size(
         self, token_id: str, tick_size: TickSize = None
     ) -> TickSize:
         min_tick_size = self.get_tick_size(token_id)
+        if tick_size is not None and is_tick_size_smaller(tick_size, min_tick_size):
+            # the cached tick size may be stale, the minimum changes with the price
+            self.market_cache.invalidate(token_id, TICK_SIZE)
+            min_tick_size = self.get_tick_size(token_id)
         if tick_size is not None:
             if is_tick_size_smaller(tick_size, min_tick_size):
                 raise Exception(
@@ -335,16 +541,9 @@ class ClobClient:
             tick_size = min_tick_size
         return tick_size
 
-    def create_order(
+    def __resolve_order_options(
         self, order_args: OrderArgs, options: Optional[PartialCreateOrderOptions] = None
-    ):
-        """
-        Creates and signs an order
-        Level 1 Auth required
-        """
-        self.assert_level_1_auth()
-
-        # add resolve_order_options, or similar
+    ) -> CreateOrderOptions:
         tick_size = self.__resolve_tick_size(
             order_args.token_id,
             options.tick_size if options else None,
@@ -366,12 +565,95 @@ class ClobClient:
             else self.get_neg_risk(order_args.token_id)
         )
 
-        return self.builder.create_order(
-            order_args,
-            CreateOrderOptions(
-                tick_size=tick_size,
-                neg_risk=neg_risk,
-            ),
+        return CreateOrderOptions(
+            tick_size=tick_size,
+            neg_risk=neg_risk,
+        )
+
+    def create_order(
+        self, order_args: OrderArgs, options: Optional[PartialCreateOrderOptions] = None
+    ):
+        """
+        Creates and signs an order
+        Level 1 Auth required
+        """
+        self.assert_level_1_auth()
+
+        with phase(self.metrics, "create_order", "tick_size"):
+            create_options = self.__resolve_order_options(order_args, options)
+        return self.builder.create_order(order_args, create_options)
+
+    def create_orders(
+        self,
+        orders: list[OrderArgs],
+        options: Optional[PartialCreateOrderOptions] = None,
+        executor: Executor = None,
+    ) -> list[SignedOrder]:
+        """
+        Creates and signs a batch of orders, returned in input order and ready for post_orders
+        Tick sizes and neg risk flags are resolved for every token before any order is signed
+        The signing is spread over `executor` if provided, a ProcessPoolExecutor scales it with cores
+        Level 1 Auth required
+        """
+        self.assert_level_1_auth()
+
+        # resolve each token once, concurrently, to warm the caches
+        token_ids = list(dict.fromkeys(order_args.token_id for order_args in orders))
+        if len(token_ids) > 1:
+            list(
+                self.__get_batch_executor().map(
+                    partial(self.__resolve_token, options=options), token_ids
+                )
+            )
+        create_options = [
+            self.__resolve_order_options(order_args, options) for order_args in orders
+        ]
+        return self.builder.create_orders(orders, create_options, executor)
+
+    def __resolve_token(
+        self, token_id: str, options: Optional[PartialCreateOrderOptions] = None
+    ):
+        """
+        Fetches the tick size and neg risk flag of token_id the orders need, if not cached
+        """
+        self.get_tick_size(token_id)
+        if not (options and options.neg_risk):
+            self.get_neg_risk(token_id)
+
+    def create_order_ladder(
+        self,
+        token_id: str,
+        side: str,
+        prices: list[float],
+        sizes: list[float],
+        options: Optional[PartialCreateOrderOptions] = None,
+        order_type: OrderType = OrderType.GTC,
+        executor: Executor = None,
+    ) -> list[PostOrdersArgs]:
+        """
+        Creates and signs a ladder of orders on one token, one per (price, size) pair
+        The tick size and neg risk flag are resolved once, every price is validated before anything is signed
+        Returned in input order, ready for post_orders
+        Level 1 Auth required
+        """
+        self.assert_level_1_auth()
+
+        tick_size = self.__resolve_tick_size(
+            token_id, options.tick_size if options else None
+        )
+        neg_risk = (
+            options.neg_risk
+            if options and options.neg_risk
+            else self.get_neg_risk(token_id)
+        )
+        return self.builder.create_order_ladder(
+            token_id,
+            side,
+            prices,
+            sizes,
+            CreateOrderOptions(tick_size=tick_size, neg_risk=neg_risk),
+            order_type=order_type,
+            executor=executor,
         )
 
     def create_market_order(
@@ -428,28 +710,63 @@ class ClobClient:
         Posts orders
         """
         self.assert_level_2_auth()
-        body = [
-            order_to_json(arg.order, self.creds.api_key, arg.orderType) for arg in args
-        ]
-        headers = create_level_2_headers(
-            self.signer,
-            self.creds,
-            RequestArgs(method="POST", request_path=POST_ORDERS, body=body),
-        )
-        return post("{}{}".format(self.host, POST_ORDERS), headers=headers, data=body)
+        with phase(self.metrics, "post_orders", "serialize"):
+            body = serialize_body(
+                [
+                    order_to_json(arg.order, self.creds.api_key, arg.orderType)
+                    for arg in args
+                ]
+            )
+        with phase(self.metrics, "post_orders", "hmac"):
+            headers = self.__l2_context.create_headers(
+                RequestArgs(method="POST", request_path=POST_ORDERS, body=body),
+            )
+        orders = [arg.order for arg in args]
+        try:
+            with phase(self.metrics, "post_orders", "http"):
+                resp = self.transport.post(
+                    "{}{}".format(self.host, POST_ORDERS), headers=headers, data=body
+                )
+        except PolyApiException as e:
+            self.__invalidate_rejected_tick_sizes(orders, [e.error_msg] * len(orders))
+            raise
+        if isinstance(resp, list):
+            self.__invalidate_rejected_tick_sizes(
+                orders,
+                [r.get("errorMsg") if isinstance(r, dict) else None for r in resp],
+            )
+        return resp
 
     def post_order(self, order, orderType: OrderType = OrderType.GTC):
         """
         Posts the order
         """
         self.assert_level_2_auth()
-        body = order_to_json(order, self.creds.api_key, orderType)
-        headers = create_level_2_headers(
-            self.signer,
-            self.creds,
-            RequestArgs(method="POST", request_path=POST_ORDER, body=body),
-        )
-        return post("{}{}".format(self.host, POST_ORDER), headers=headers, data=body)
+        with phase(self.metrics, "post_order", "serialize"):
+            body = serialize_body(order_to_json(order, self.creds.api_key, orderType))
+        with phase(self.metrics, "post_order", "hmac"):
+            headers = self.__l2_context.create_headers(
+                RequestArgs(method="POST", request_path=POST_ORDER, body=body),
+            )
+        try:
+            with phase(self.metrics, "post_order", "http"):
+                resp = self.transport.post(
+                    "{}{}".format(self.host, POST_ORDER), headers=headers, data=body
+                )
+        except PolyApiException as e:
+            self.__invalidate_rejected_tick_sizes([order], [e.error_msg])
+            raise
+        if isinstance(resp, dict):
+            self.__invalidate_rejected_tick_sizes([order], [resp.get("errorMsg")])
+        return resp
+
+    def __invalidate_rejected_tick_sizes(self, orders: list[SignedOrder], errors: list):
+        """
+        Drops the cached tick size of the tokens of the orders rejected for their tick size
+        """
+        for order, error in zip(orders, errors):
+            if error and is_tick_size_error(error):
+                self.market_cache.invalidate(str(order.order["tokenId"]), TICK_SIZE)
 
     def create_and_post_order(
         self, order_args: OrderArgs, options: PartialCreateOrderOptions = None
@@ -466,11 +783,13 @@ class ClobClient:
         Level 2 Auth required
         """
         self.assert_level_2_auth()
-        body = {"orderID": order_id}
+        body = serialize_body({"orderID": order_id})
 
         request_args = RequestArgs(method="DELETE", request_path=CANCEL, body=body)
-        headers = create_level_2_headers(self.signer, self.creds, request_args)
-        return delete("{}{}".format(self.host, CANCEL), headers=headers, data=body)
+        headers = self.__l2_context.create_headers(request_args)
+        return self.transport.delete(
+            "{}{}".format(self.host, CANCEL), headers=headers, data=body
+        )
 
     def cancel_orders(self, order_ids):
         """
@@ -478,13 +797,13 @@ class ClobClient:
         Level 2 Auth required
         """
         self.assert_level_2_auth()
-        body = order_ids
+        body = serialize_body(order_ids)
 
         request_args = RequestArgs(
             method="DELETE", request_path=CANCEL_ORDERS, body=body
         )
-        headers = create_level_2_headers(self.signer, self.creds, request_args)
-        return delete(
+        headers = self.__l2_context.create_headers(request_args)
+        return self.transport.delete(
             "{}{}".format(self.host, CANCEL_ORDERS), headers=headers, data=body
         )
 
@@ -495,8 +814,10 @@ class ClobClient:
         """
         self.assert_level_2_auth()
         request_args = RequestArgs(method="DELETE", request_path=CANCEL_ALL)
-        headers = create_level_2_headers(self.signer, self.creds, request_args)
-        return delete("{}{}".format(self.host, CANCEL_ALL), headers=headers)
+        headers = self.__l2_context.create_headers(request_args)
+        return self.transport.delete(
+            "{}{}".format(self.host, CANCEL_ALL), headers=headers
+        )
 
     def cancel_market_orders(self, market: str = "", asset_id: str = ""):
         """
@@ -504,13 +825,13 @@ class ClobClient:
         Level 2 Auth required
         """
         self.assert_level_2_auth()
-        body = {"market": market, "asset_id": asset_id}
+        body = serialize_body({"market": market, "asset_id": asset_id})
 
         request_args = RequestArgs(
             method="DELETE", request_path=CANCEL_MARKET_ORDERS, body=body
         )
-        headers = create_level_2_headers(self.signer, self.creds, request_args)
-        return delete(
+        headers = self.__l2_context.create_headers(request_args)
+        return self.transport.delete(
             "{}{}".format(self.host, CANCEL_MARKET_ORDERS), headers=headers, data=body
         )
 
@@ -520,41 +841,75 @@ class ClobClient:
         Requires Level 2 authentication
         """
         self.assert_level_2_auth()
-        request_args = RequestArgs(method="GET", request_path=ORDERS)
-        headers = create_level_2_headers(self.signer, self.creds, request_args)
+        return list(self.iter_orders(params, next_cursor, prefetch=False))
+
+    def iter_orders(
+        self, params: OpenOrderParams = None, next_cursor="MA==", prefetch: bool = True
+    ):
+        """
+        Yields the orders of get_orders page by page instead of collecting them in a list
+        With prefetch, the next page is fetched while the current one is being handled
+        Requires Level 2 authentication
+        """
+        self.assert_level_2_auth()
 
-        results = []
-        next_cursor = next_cursor if next_cursor is not None else "MA=="
-        while next_cursor != END_CURSOR:
+        def fetch(cursor):
+            headers = self.__l2_context.create_headers(
+                RequestArgs(method="GET", request_path=ORDERS)
+            )
             url = add_query_open_orders_params(
-                "{}{}".format(self.host, ORDERS), params, next_cursor
+                "{}{}".format(self.host, ORDERS), params, cursor
             )
-            response = get(url, headers=headers)
-            next_cursor = response["next_cursor"]
-            results += response["data"]
+            return self.transport.get(url, headers=headers)
 
-        return results
+        return iter_records(fetch, next_cursor, prefetch)
 
-    def get_order_book(self, token_id) -> OrderBookSummary:
+    def get_order_book(
+        self, token_id, compact: bool = False
+    ) -> Union[OrderBookSummary, CompactOrderBookSummary]:
         """
         Fetches the orderbook for the token_id
+        With compact, the levels are kept in price and size columns, see CompactOrderBookSummary
         """
-        raw_obs = get("{}{}?token_id={}".format(self.host, GET_ORDER_BOOK, token_id))
+        if self.__coalescers is not None:
+            raw_obs = self.__coalescers[GET_ORDER_BOOK].load(token_id)
+        else:
+            raw_obs = self.__get_raw_order_book(token_id)
+        if compact:
+            return CompactOrderBookSummary.from_raw(raw_obs)
         return parse_raw_orderbook_summary(raw_obs)
 
-    def get_order_books(self, params: list[BookParams]) -> list[OrderBookSummary]:
+    def __get_raw_order_book(self, token_id):
+        return self.transport.get(
+            "{}{}?token_id={}".format(self.host, GET_ORDER_BOOK, token_id)
+        )
+
+    def get_order_books(
+        self, params: list[BookParams], compact: bool = False
+    ) -> list[Union[OrderBookSummary, CompactOrderBookSummary]]:
         """
         Fetches the orderbook for a set of token ids
+        With compact, the levels are kept in price and size columns, see CompactOrderBookSummary
         """
         body = [{"token_id": param.token_id} for param in params]
-        raw_obs = post("{}{}".format(self.host, GET_ORDER_BOOKS), data=body)
-        return [parse_raw_orderbook_summary(r) for r in raw_obs]
+        parse = (
+            CompactOrderBookSummary.from_raw if compact else parse_raw_orderbook_summary
+        )
+        try:
+            raw_obs = self.__post_batch(GET_ORDER_BOOKS, body, merge_lists)
+        except PolyBatchException as e:
+            e.result = [parse(r) for r in e.result]
+            raise
+        return [parse(r) for r in raw_obs]
 
-    def get_order_book_hash(self, orderbook: OrderBookSummary) -> str:
+    def get_order_book_hash(
+        self, orderbook: Union[OrderBookSummary, CompactOrderBookSummary]
+    ) -> str:
         """
         Calculates the hash for the given orderbook
+        Memoized by asset id and hash field: a snapshot whose server hash was already seen is not hashed again
         """
-        return generate_orderbook_summary_hash(orderbook)
+        return self.__orderbook_hashes.hash(orderbook)
 
     def get_order(self, order_id):
         """
@@ -564,8 +919,8 @@ class ClobClient:
         self.assert_level_2_auth()
         endpoint = "{}{}".format(GET_ORDER, order_id)
         request_args = RequestArgs(method="GET", request_path=endpoint)
-        headers = create_level_2_headers(self.signer, self.creds, request_args)
-        return get("{}{}".format(self.host, endpoint), headers=headers)
+        headers = self.__l2_context.create_headers(request_args)
+        return self.transport.get("{}{}".format(self.host, endpoint), headers=headers)
 
     def get_trades(self, params: TradeParams = None, next_cursor="MA=="):
         """
@@ -573,33 +928,43 @@ class ClobClient:
         Requires Level 2 authentication
         """
         self.assert_level_2_auth()
-        request_args = RequestArgs(method="GET", request_path=TRADES)
-        headers = create_level_2_headers(self.signer, self.creds, request_args)
+        return list(self.iter_trades(params, next_cursor, prefetch=False))
+
+    def iter_trades(
+        self, params: TradeParams = None, next_cursor="MA==", prefetch: bool = True
+    ):
+        """
+        Yields the trades of get_trades page by page instead of collecting them in a list
+        With prefetch, the next page is fetched while the current one is being handled
+        Requires Level 2 authentication
+        """
+        self.assert_level_2_auth()
 
-        results = []
-        next_cursor = next_cursor if next_cursor is not None else "MA=="
-        while next_cursor != END_CURSOR:
+        def fetch(cursor):
+            headers = self.__l2_context.create_headers(
+                RequestArgs(method="GET", request_path=TRADES)
+            )
             url = add_query_trade_params(
-                "{}{}".format(self.host, TRADES), params, next_cursor
+                "{}{}".format(self.host, TRADES), params, cursor
             )
-            response = get(url, headers=headers)
-            next_cursor = response["next_cursor"]
-            results += response["data"]
+            return self.transport.get(url, headers=headers)
 
-        return results
+        return iter_records(fetch, next_cursor, prefetch)
 
     def get_last_trade_price(self, token_id):
         """
         Fetches the last trade price token_id
         """
-        return get("{}{}?token_id={}".format(self.host, GET_LAST_TRADE_PRICE, token_id))
+        return self.transport.get(
+            "{}{}?token_id={}".format(self.host, GET_LAST_TRADE_PRICE, token_id)
+        )
 
     def get_last_trades_prices(self, params: list[BookParams]):
         """
         Fetches the last trades prices for a set of token ids
         """
         body = [{"token_id": param.token_id} for param in params]
-        return post("{}{}".format(self.host, GET_LAST_TRADES_PRICES), data=body)
+        return self.__post_batch(GET_LAST_TRADES_PRICES, body, merge_lists)
 
     def assert_level_1_auth(self):
         """
@@ -615,6 +980,11 @@ class ClobClient:
         if self.mode < L2:
             raise PolyException(L2_AUTH_UNAVAILABLE)
 
+    def __create_l2_context(self):
+        if self.signer is None or self.creds is None:
+            return None
+        return Level2HeadersContext(self.signer, self.creds)
+
     def _get_client_mode(self):
         if self.signer is not None and self.creds is not None:
             return L2
@@ -629,11 +999,11 @@ class ClobClient:
         """
         self.assert_level_2_auth()
         request_args = RequestArgs(method="GET", request_path=GET_NOTIFICATIONS)
-        headers = create_level_2_headers(self.signer, self.creds, request_args)
+        headers = self.__l2_context.create_headers(request_args)
         url = "{}{}?signature_type={}".format(
             self.host, GET_NOTIFICATIONS, self.builder.sig_type
         )
-        return get(url, headers=headers)
+        return self.transport.get(url, headers=headers)
 
     def drop_notifications(self, params: DropNotificationParams = None):
         """
@@ -642,11 +1012,11 @@ class ClobClient:
         """
         self.assert_level_2_auth()
         request_args = RequestArgs(method="DELETE", request_path=DROP_NOTIFICATIONS)
-        headers = create_level_2_headers(self.signer, self.creds, request_args)
+        headers = self.__l2_context.create_headers(request_args)
         url = drop_notifications_query_params(
             "{}{}".format(self.host, DROP_NOTIFICATIONS), params
         )
-        return delete(url, headers=headers)
+        return self.transport.delete(url, headers=headers)
 
     def get_balance_allowance(self, params: BalanceAllowanceParams = None):
         """
@@ -655,13 +1025,13 @@ class ClobClient:
         """
         self.assert_level_2_auth()
         request_args = RequestArgs(method="GET", request_path=GET_BALANCE_ALLOWANCE)
-        headers = create_level_2_headers(self.signer, self.creds, request_args)
+        headers = self.__l2_context.create_headers(request_args)
         if params.signature_type == -1:
             params.signature_type = self.builder.sig_type
         url = add_balance_allowance_params_to_url(
             "{}{}".format(self.host, GET_BALANCE_ALLOWANCE), params
         )
-        return get(url, headers=headers)
+        return self.transport.get(url, headers=headers)
 
     def update_balance_allowance(self, params: BalanceAllowanceParams = None):
         """
@@ -670,13 +1040,13 @@ class ClobClient:
         """
         self.assert_level_2_auth()
         request_args = RequestArgs(method="GET", request_path=UPDATE_BALANCE_ALLOWANCE)
-        headers = create_level_2_headers(self.signer, self.creds, request_args)
+        headers = self.__l2_context.create_headers(request_args)
         if params.signature_type == -1:
             params.signature_type = self.builder.sig_type
         url = add_balance_allowance_params_to_url(
             "{}{}".format(self.host, UPDATE_BALANCE_ALLOWANCE), params
         )
-        return get(url, headers=headers)
+        return self.transport.get(url, headers=headers)
 
     def is_order_scoring(self, params: OrderScoringParams):
         """
@@ -685,11 +1055,11 @@ class ClobClient:
         """
         self.assert_level_2_auth()
         request_args = RequestArgs(method="GET", request_path=IS_ORDER_SCORING)
-        headers = create_level_2_headers(self.signer, self.creds, request_args)
+        headers = self.__l2_context.create_headers(request_args)
         url = add_order_scoring_params_to_url(
             "{}{}".format(self.host, IS_ORDER_SCORING), params
         )
-        return get(url, headers=headers)
+        return self.transport.get(url, headers=headers)
 
     def are_orders_scoring(self, params: OrdersScoringParams):
         """
@@ -697,12 +1067,12 @@ class ClobClient:
         Requires Level 2 authentication
         """
         self.assert_level_2_auth()
-        body = params.orderIds
+        body = serialize_body(params.orderIds)
         request_args = RequestArgs(
             method="POST", request_path=ARE_ORDERS_SCORING, body=body
         )
-        headers = create_level_2_headers(self.signer, self.creds, request_args)
-        return post(
+        headers = self.__l2_context.create_headers(request_args)
+        return self.transport.post(
             "{}{}".format(self.host, ARE_ORDERS_SCORING), headers=headers, data=body
         )
 
@@ -710,7 +1080,7 @@ class ClobClient:
         """
         Get the current sampling markets
         """
-        return get(
+        return self.transport.get(
             "{}{}?next_cursor={}".format(self.host, GET_SAMPLING_MARKETS, next_cursor)
         )
 
@@ -718,7 +1088,7 @@ class ClobClient:
         """
         Get the current sampling simplified markets
         """
-        return get(
+        return self.transport.get(
             "{}{}?next_cursor={}".format(
                 self.host, GET_SAMPLING_SIMPLIFIED_MARKETS, next_cursor
             )
@@ -728,27 +1098,75 @@ class ClobClient:
         """
         Get the current markets
         """
-        return get("{}{}?next_cursor={}".format(self.host, GET_MARKETS, next_cursor))
+        return self.transport.get(
+            "{}{}?next_cursor={}".format(self.host, GET_MARKETS, next_cursor)
+        )
 
     def get_simplified_markets(self, next_cursor="MA=="):
         """
         Get the current simplified markets
         """
-        return get(
+        return self.transport.get(
             "{}{}?next_cursor={}".format(self.host, GET_SIMPLIFIED_MARKETS, next_cursor)
         )
 
+    def iter_markets(
+        self, next_cursor="MA==", prefetch: bool = True, fields: list[str] = None
+    ):
+        """
+        Yields every market, walking the get_markets pages
+        Only the given fields of every market are kept if `fields` is set
+        With prefetch, the next page is fetched while the current one is being handled
+        """
+        return self.__iter_catalog(self.get_markets, next_cursor, prefetch, fields)
+
+    def iter_simplified_markets(
+        self, next_cursor="MA==", prefetch: bool = True, fields: list[str] = None
+    ):
+        """
+        Yields every simplified market, walking the get_simplified_markets pages, see iter_markets
+        """
+        return self.__iter_catalog(
+            self.get_simplified_markets, next_cursor, prefetch, fields
+        )
+
+    def iter_sampling_markets(
+        self, next_cursor="MA==", prefetch: bool = True, fields: list[str] = None
+    ):
+        """
+        Yields every sampling market, walking the get_sampling_markets pages, see iter_markets
+        """
+        return self.__iter_catalog(
+            self.get_sampling_markets, next_cursor, prefetch, fields
+        )
+
+    def iter_sampling_simplified_markets(
+        self, next_cursor="MA==", prefetch: bool = True, fields: list[str] = None
+    ):
+        """
+        Yields every sampling simplified market, walking the get_sampling_simplified_markets pages, see iter_markets
+        """
+        return self.__iter_catalog(
+            self.get_sampling_simplified_markets, next_cursor, prefetch, fields
+        )
+
+    def __iter_catalog(self, get_page, next_cursor, prefetch, fields):
+        fetch = get_page if fields is None else projected(get_page, fields)
+        return iter_records(fetch, next_cursor, prefetch)
+
     def get_market(self, condition_id):
         """
         Get a market by condition_id
         """
-        return get("{}{}{}".format(self.host, GET_MARKET, condition_id))
+        return self.__get_shared("{}{}{}".format(self.host, GET_MARKET, condition_id))
 
     def get_market_trades_events(self, condition_id):
         """
         Get the market's trades events by condition id
         """
-        return get("{}{}{}".format(self.host, GET_MARKET_TRADES_EVENTS, condition_id))
+        return self.transport.get(
+            "{}{}{}".format(self.host, GET_MARKET_TRADES_EVENTS, condition_id)
+        )
 
     def calculate_market_price(
         self, token_id: str, side: str, amount: float, order_type: OrderType
@@ -756,18 +1174,11 @@ class ClobClient:
         """
         Calculates the matching price considering an amount and the current orderbook
         """
-        book = self.get_order_book(token_id)
+        mirror = self.order_book_mirror
+        if mirror is not None and mirror.is_fresh(token_id):
+            return mirror.calculate_market_price(token_id, side, amount, order_type)
+
+        book = self.get_order_book(token_id, compact=True)
         if book is None:
             raise Exception("no orderbook")
-        if side == "BUY":
-            if book.asks is None:
-                raise Exception("no match")
-            return self.builder.calculate_buy_market_price(
-                book.asks, amount, order_type
-            )
-        else:
-            if book.bids is None:
-                raise Exception("no match")
-            return self.builder.calculate_sell_market_price(
-                book.bids, amount, order_type
-            )
+        return book.depth(side).market_price(amount, order_type)
@@ -1,6 +1,7 @@
 from typing import Any
 from dataclasses import dataclass, asdict
 from json import dumps
+from json.encoder import encode_basestring_ascii
 from typing import Literal, Optional
 from py_order_utils.model import (
     SignedOrder,
@@ -156,6 +157,38 @@ class OrderSummary:
         return dumps(self.__dict__)
 
 
+ORDER_BOOK_SUMMARY_JSON = (
+    '{"market":%s,"asset_id":%s,"timestamp":%s,"bids":%s,"asks":%s,"hash":%s}'
+)
+ORDER_SUMMARY_JSON = '{"price":%s,"size":%s}'
+
+
+def _levels_json(levels: list[OrderSummary]) -> str:
+    """
+    Compact json of a list of OrderSummary, the same as dumps of their asdict
+    """
+    if levels is None:
+        return "null"
+    try:
+        return (
+            "["
+            + ",".join(
+                [
+                    ORDER_SUMMARY_JSON
+                    % (
+                        encode_basestring_ascii(level.price),
+                        encode_basestring_ascii(level.size),
+                    )
+                    for level in levels
+                ]
+            )
+            + "]"
+        )
+    except TypeError:
+        # prices or sizes which are not strings
+        return dumps([asdict(level) for level in levels], separators=(",", ":"))
+
+
 @dataclass
 class OrderBookSummary:
     market: str = None
@@ -171,7 +204,18 @@ class OrderBookSummary:
 
     @property
     def json(self):
-        return dumps(self.__dict__, separators=(",", ":"))
+        """
+        Compact json, the same as dumps(self.__dict__, separators=(",", ":"))
+        without the asdict deep copy of every level
+        """
+        return ORDER_BOOK_SUMMARY_JSON % (
+            dumps(self.market),
+            dumps(self.asset_id),
+            dumps(self.timestamp),
+            _levels_json(self.bids),
+            _levels_json(self.asks),
+            dumps(self.hash),
+        )
 
 
 class AssetType(enumerate):
@@ -218,6 +262,71 @@ class RoundConfig:
     amount: float
 
 
+@dataclass
+class AmountScales:
+    """
+    Integer scales of the fixed-point amount math for a RoundConfig
+    """
+
+    tick: int
+    """
+    Ticks per unit of price, 10**price
+    """
+
+    size: int
+    """
+    Lots per unit of size, 10**size
+    """
+
+    notional: int
+    """
+    Tick-lots per unit of notional, 10**(price + size)
+    """
+
+    lot: int
+    """
+    Token decimals units per lot, 10**(TOKEN_DECIMALS - size)
+    """
+
+
+@dataclass
+class MarketImpact:
+    """
+    Result of walking the book with a market order
+    Amounts are in collateral for BUY orders and in shares for SELL orders
+    """
+
+    amount: float
+    """
+    Requested amount
+    """
+
+    filled: float
+    """
+    Amount the book can fill, at most amount
+    """
+
+    best_price: float
+    """
+    Price of the best level
+    """
+
+    worst_price: float
+    """
+    Price of the deepest level reached
+    """
+
+    vwap: float
+    """
+    Average price of the filled amount
+    """
+
+    slippage: float
+    """
+    Relative cost of the vwap over the best price
+    """
+
+
 @dataclass
 class ContractConfig:
     """
@@ -7,14 +7,14 @@ class PolyException(Exception):
 
 
 class PolyApiException(PolyException):
-    def __init__(self, resp: Response = None, error_msg=None):
+    def __init__(self, resp: Response = None, error_msg=None, status_code=None):
         assert resp is not None or error_msg is not None
         if resp is not None:
             self.status_code = resp.status_code
             self.error_msg = self._get_message(resp)
         if error_msg is not None:
             self.error_msg = error_msg
-            self.status_code = None
+            self.status_code = status_code
 
     def _get_message(self, resp: Response):
         try:
@@ -29,3 +29,23 @@ class PolyApiException(PolyException):
 
     def __str__(self):
         return self.__repr__()
+
+
+class PolyBatchException(PolyException):
+    """
+    Raised when some chunks of a chunked batch request failed
+
+    result: the merged responses of the chunks which succeeded
+    errors: a (start, end, exception) tuple per failed chunk, the chunk being params[start:end]
+    """
+
+    def __init__(self, result, errors: list[tuple[int, int, Exception]]):
+        self.result = result
+        self.errors = errors
+        self.msg = "{} of the batch chunks failed".format(len(errors))
+
+    def __repr__(self):
+        return "PolyBatchException[errors={}]".format(self.errors)
+
+    def __str__(self):
+        return self.__repr__()
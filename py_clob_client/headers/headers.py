@@ -1,5 +1,5 @@
 from ..clob_types import ApiCreds, RequestArgs
-from ..signing.hmac import build_hmac_signature
+from ..signing.hmac import HmacSigner
 from ..signer import Signer
 from ..signing.eip712 import sign_clob_auth_message
 from datetime import datetime
@@ -33,24 +33,42 @@ def create_level_1_headers(signer: Signer, nonce: int = None):
     return headers
 
 
-def create_level_2_headers(signer: Signer, creds: ApiCreds, request_args: RequestArgs):
+class Level2HeadersContext:
     """
-    Creates Level 2 Poly headers for a request
+    Level 2 signing context for a set of credentials
+
+    Built once per credentials: holds the keyed hmac and the static header fields,
+    so each request only adds its timestamp and signature
     """
-    timestamp = int(datetime.now().timestamp())
 
-    hmac_sig = build_hmac_signature(
-        creds.api_secret,
-        timestamp,
-        request_args.method,
-        request_args.request_path,
-        request_args.body,
-    )
+    def __init__(self, signer: Signer, creds: ApiCreds):
+        self.creds = creds
+        self.hmac_signer = HmacSigner(creds.api_secret)
+        self.static_headers = {
+            POLY_ADDRESS: signer.address(),
+            POLY_API_KEY: creds.api_key,
+            POLY_PASSPHRASE: creds.api_passphrase,
+        }
 
-    return {
-        POLY_ADDRESS: signer.address(),
-        POLY_SIGNATURE: hmac_sig,
-        POLY_TIMESTAMP: str(timestamp),
-        POLY_API_KEY: creds.api_key,
-        POLY_PASSPHRASE: creds.api_passphrase,
-    }
+    def create_headers(self, request_args: RequestArgs) -> dict:
+        """
+        Creates Level 2 Poly headers for a request
+        """
+        timestamp = int(datetime.now().timestamp())
+
+        headers = self.static_headers.copy()
+        headers[POLY_SIGNATURE] = self.hmac_signer.sign(
+            timestamp,
+            request_args.method,
+            request_args.request_path,
+            request_args.body,
+        )
+        headers[POLY_TIMESTAMP] = str(timestamp)
+        return headers
+
+
+def create_level_2_headers(signer: Signer, creds: ApiCreds, request_args: RequestArgs):
+    """
+    Creates Level 2 Poly headers for a request
+    """
+    return Level2HeadersContext(signer, creds).create_headers(request_args)
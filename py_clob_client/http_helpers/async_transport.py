@@ -0,0 +1,188 @@
+import asyncio
+import json
+import time
+
+try:
+    import aiohttp
+except ImportError:  # pragma: no cover
+    aiohttp = None
+
+from ..exceptions import PolyApiException, PolyException
+from ..metrics import ClientMetrics
+from .rate_limit import RateLimiter, RetryPolicy, parse_retry_after
+from .transport import (
+    GET,
+    POST,
+    DELETE,
+    DEFAULT_CONNECT_TIMEOUT,
+    DEFAULT_READ_TIMEOUT,
+    overloadHeaders,
+)
+
+DEFAULT_LIMIT = 100
+DEFAULT_LIMIT_PER_HOST = 0
+
+AIOHTTP_UNAVAILABLE = (
+    "aiohttp is needed for the async client: pip install py_clob_client[async]"
+)
+
+
+def _decode(text: str):
+    try:
+        return json.loads(text)
+    except ValueError:
+        return text
+
+
+class AsyncTransport:
+    """
+    Pooled, keep-alive asyncio HTTP transport backed by an aiohttp ClientSession
+
+    The session is created lazily, on first use, so it binds to the running event loop
+    """
+
+    def __init__(
+        self,
+        limit: int = DEFAULT_LIMIT,
+        limit_per_host: int = DEFAULT_LIMIT_PER_HOST,
+        connect_timeout: float = DEFAULT_CONNECT_TIMEOUT,
+        read_timeout: float = DEFAULT_READ_TIMEOUT,
+        rate_limiter: RateLimiter = None,
+        retry: RetryPolicy = None,
+        metrics: ClientMetrics = None,
+    ):
+        """
+        limit: max number of simultaneous connections, 0 for no limit
+        limit_per_host: max number of simultaneous connections per host, 0 for no limit
+        connect_timeout / read_timeout: in seconds, None disables the timeout
+        rate_limiter: paces the requests of every endpoint group, not paced if not provided
+        retry: the RetryPolicy of the failed unsigned GETs, a default one if not provided
+        metrics: records the latency, sizes, retries and errors of every request
+        """
+        if aiohttp is None:
+            raise PolyException(AIOHTTP_UNAVAILABLE)
+
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self.rate_limiter = rate_limiter
+        self.retry = retry if retry is not None else RetryPolicy()
+        self.metrics = metrics
+        self._session = None
+
+    def _get_session(self):
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=self.limit, limit_per_host=self.limit_per_host
+                ),
+                timeout=aiohttp.ClientTimeout(
+                    sock_connect=self.connect_timeout, sock_read=self.read_timeout
+                ),
+            )
+        return self._session
+
+    async def request(self, endpoint: str, method: str, headers=None, data=None):
+        headers = overloadHeaders(method, headers)
+        if isinstance(data, bytes):
+            # pre-serialized body, sent as is
+            body = data
+        else:
+            body = json.dumps(data).encode("utf-8") if data else None
+
+        attempt = 0
+        while True:
+            if self.rate_limiter is not None:
+                delay = self.rate_limiter.reserve(method, endpoint)
+                if delay > 0:
+                    await asyncio.sleep(delay)
+            start = time.perf_counter()
+            try:
+                async with self._get_session().request(
+                    method, endpoint, headers=headers, data=body
+                ) as resp:
+                    status = resp.status
+                    retry_after = resp.headers.get("Retry-After")
+                    raw = await resp.read()
+                    text = await resp.text()
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                if self.metrics is not None:
+                    self.metrics.observe_request(
+                        method,
+                        endpoint,
+                        None,
+                        time.perf_counter() - start,
+                        request_bytes=len(body) if body else 0,
+                        exception=e,
+                    )
+                if self.retry.should_retry(method, attempt, headers=headers):
+                    await self.__wait_retry(method, endpoint, attempt)
+                    attempt += 1
+                    continue
+                raise PolyApiException(
+                    error_msg="Request exception! {!r}".format(e)
+                ) from e
+            seconds = time.perf_counter() - start
+
+            if status != 200:
+                if self.metrics is not None:
+                    self.metrics.observe_request(
+                        method,
+                        endpoint,
+                        status,
+                        seconds,
+                        request_bytes=len(body) if body else 0,
+                        response_bytes=len(raw),
+                    )
+                retry_after = parse_retry_after(retry_after)
+                if self.retry.should_retry(
+                    method, attempt, status, retry_after, headers
+                ):
+                    await self.__wait_retry(method, endpoint, attempt, retry_after)
+                    attempt += 1
+                    continue
+                raise PolyApiException(error_msg=_decode(text), status_code=status)
+
+            decode_start = time.perf_counter()
+            result = _decode(text)
+            if self.metrics is not None:
+                self.metrics.observe_request(
+                    method,
+                    endpoint,
+                    status,
+                    seconds,
+                    request_bytes=len(body) if body else 0,
+                    response_bytes=len(raw),
+                    decode_seconds=time.perf_counter() - decode_start,
+                )
+            return result
+
+    async def __wait_retry(self, method, endpoint, attempt, retry_after=None):
+        delay = self.retry.delay(attempt, retry_after)
+        if self.metrics is not None:
+            self.metrics.observe_retry(method, endpoint, attempt, delay)
+        await asyncio.sleep(delay)
+
+    async def post(self, endpoint, headers=None, data=None):
+        return await self.request(endpoint, POST, headers, data)
+
+    async def get(self, endpoint, headers=None, data=None):
+        return await self.request(endpoint, GET, headers, data)
+
+    async def delete(self, endpoint, headers=None, data=None):
+        return await self.request(endpoint, DELETE, headers, data)
+
+    async def close(self):
+        """
+        Closes every pooled connection
+        """
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        await self.close()
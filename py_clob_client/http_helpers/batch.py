@@ -0,0 +1,97 @@
+import asyncio
+from concurrent.futures import Executor
+from typing import Callable
+
+from ..exceptions import PolyBatchException
+
+DEFAULT_BATCH_CHUNK_SIZE = 500
+DEFAULT_BATCH_MAX_WORKERS = 8
+
+
+def chunk(items: list, size: int) -> list[tuple[int, list]]:
+    """
+    Splits items in (start index, chunk) pairs of at most size items
+    """
+    if size < 1:
+        raise ValueError("chunk size must be positive")
+    return [
+        (start, items[start : start + size]) for start in range(0, len(items), size)
+    ]
+
+
+def merge_lists(results: list[list]) -> list:
+    merged = []
+    for result in results:
+        merged.extend(result)
+    return merged
+
+
+def merge_dicts(results: list[dict]) -> dict:
+    """
+    Merges dicts keyed by token id, nested dicts of a token are merged as well
+    i.e. the {token_id: {side: price}} responses of /prices
+    """
+    merged = {}
+    for result in results:
+        for key, value in result.items():
+            if isinstance(value, dict) and isinstance(merged.get(key), dict):
+                merged[key].update(value)
+            else:
+                merged[key] = value
+    return merged
+
+
+def _result(chunks: list, results: list, merge: Callable):
+    errors = [
+        (start, start + len(items), result)
+        for (start, items), result in zip(chunks, results)
+        if isinstance(result, BaseException)
+    ]
+    merged = merge([r for r in results if not isinstance(r, BaseException)])
+    if errors:
+        raise PolyBatchException(merged, errors)
+    return merged
+
+
+def post_chunked(
+    post: Callable,
+    url: str,
+    body: list,
+    chunk_size: int,
+    executor: Executor,
+    merge: Callable,
+):
+    """
+    POSTs body to url in chunks of chunk_size items, concurrently over executor,
+    and merges the responses in input order
+    A body fitting in one chunk is sent as is. If any chunk fails, raises a
+    PolyBatchException carrying the merged responses of the others
+    """
+    if len(body) <= chunk_size:
+        return post(url, data=body)
+
+    def send(items):
+        try:
+            return post(url, data=items)
+        except Exception as e:
+            return e
+
+    chunks = chunk(body, chunk_size)
+    results = list(executor.map(send, [items for _, items in chunks]))
+    return _result(chunks, results, merge)
+
+
+async def post_chunked_async(
+    post: Callable, url: str, body: list, chunk_size: int, merge: Callable
+):
+    """
+    post_chunked for coroutine posts, the chunks are sent concurrently
+    """
+    if len(body) <= chunk_size:
+        return await post(url, data=body)
+
+    chunks = chunk(body, chunk_size)
+    results = await asyncio.gather(
+        *[post(url, data=items) for _, items in chunks], return_exceptions=True
+    )
+    return _result(chunks, results, merge)
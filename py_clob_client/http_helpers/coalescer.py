@@ -0,0 +1,86 @@
+import threading
+import time
+from concurrent.futures import Future
+from typing import Callable, Hashable
+
+DEFAULT_COALESCE_WINDOW = 0.002
+
+# resolved by the caller with load_one, when the batch had no result for its key
+_MISSING = object()
+
+
+class Coalescer:
+    """
+    Merges the single key loads made from many threads within a short window into
+    one batch load, dataloader style
+
+    The first caller of a batch waits `window` seconds for the others to join it,
+    then calls load_many(keys) -> {key: result} and hands every waiter its result.
+    Identical keys within a batch share one result. A batch reaching max_batch_size
+    keys is sent right away by the caller filling it.
+    Keys missing from the batch result are loaded on their own with load_one(key), so
+    their callers get the result or error the single request would have given. A failed
+    batch raises its error in every caller, without a request per key
+    """
+
+    def __init__(
+        self,
+        load_many: Callable[[list], dict],
+        load_one: Callable,
+        window: float = DEFAULT_COALESCE_WINDOW,
+        max_batch_size: int = 500,
+    ):
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be positive")
+        self.load_many = load_many
+        self.load_one = load_one
+        self.window = window
+        self.max_batch_size = max_batch_size
+        self.__lock = threading.Lock()
+        self.__batch = {}
+
+    def load(self, key: Hashable):
+        """
+        Loads key as part of the current batch, blocking until its result is known
+        """
+        batch = None
+        with self.__lock:
+            pending = self.__batch
+            future = pending.get(key)
+            leader = not pending
+            if future is None:
+                future = pending[key] = Future()
+            if len(pending) >= self.max_batch_size:
+                batch = self.__close(pending)
+
+        if leader and batch is None:
+            time.sleep(self.window)
+            with self.__lock:
+                batch = self.__close(pending)
+
+        if batch:
+            self.__dispatch(batch)
+
+        result = future.result()
+        if result is _MISSING:
+            return self.load_one(key)
+        return result
+
+    def __close(self, pending: dict):
+        """
+        Ends the batch if it is still open, returns it to the caller sending it
+        """
+        if self.__batch is not pending:
+            return None
+        self.__batch = {}
+        return pending
+
+    def __dispatch(self, batch: dict):
+        try:
+            results = self.load_many(list(batch))
+        except Exception as e:
+            for future in batch.values():
+                future.set_exception(e)
+            return
+        for key, future in batch.items():
+            future.set_result(results.get(key, _MISSING))
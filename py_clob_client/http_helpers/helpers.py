@@ -1,5 +1,3 @@
-import requests
-
 from py_clob_client.clob_types import (
     DropNotificationParams,
     BalanceAllowanceParams,
@@ -9,45 +7,14 @@ from py_clob_client.clob_types import (
     OpenOrderParams,
 )
 
-from ..exceptions import PolyApiException
-
-GET = "GET"
-POST = "POST"
-DELETE = "DELETE"
-PUT = "PUT"
-
-
-def overloadHeaders(method: str, headers: dict) -> dict:
-    if headers is None:
-        headers = dict()
-    headers["User-Agent"] = "py_clob_client"
-
-    headers["Accept"] = "*/*"
-    headers["Connection"] = "keep-alive"
-    headers["Content-Type"] = "application/json"
-
-    if method == GET:
-        headers["Accept-Encoding"] = "gzip"
+from .transport import GET, POST, DELETE, PUT, Transport, overloadHeaders
 
-    return headers
+# shared by the module level helpers, clients own their own transport
+_default_transport = Transport()
 
 
 def request(endpoint: str, method: str, headers=None, data=None):
-    try:
-        headers = overloadHeaders(method, headers)
-        resp = requests.request(
-            method=method, url=endpoint, headers=headers, json=data if data else None
-        )
-        if resp.status_code != 200:
-            raise PolyApiException(resp)
-
-        try:
-            return resp.json()
-        except requests.JSONDecodeError:
-            return resp.text
-
-    except requests.RequestException:
-        raise PolyApiException(error_msg="Request exception!")
+    return _default_transport.request(endpoint, method, headers, data)
 
 
 def post(endpoint, headers=None, data=None):
@@ -81,8 +48,9 @@ def add_query_trade_params(
     Adds query parameters to a url
     """
     url = base_url
-    if params:
+    if params or next_cursor:
         url = url + "?"
+    if params:
         if params.market:
             url = build_query_params(url, "market", params.market)
         if params.asset_id:
@@ -95,8 +63,8 @@ def add_query_trade_params(
             url = build_query_params(url, "maker_address", params.maker_address)
         if params.id:
             url = build_query_params(url, "id", params.id)
-        if next_cursor:
-            url = build_query_params(url, "next_cursor", next_cursor)
+    if next_cursor:
+        url = build_query_params(url, "next_cursor", next_cursor)
     return url
 
 
@@ -107,16 +75,17 @@ def add_query_open_orders_params(
     Adds query parameters to a url
     """
     url = base_url
-    if params:
+    if params or next_cursor:
         url = url + "?"
+    if params:
         if params.market:
             url = build_query_params(url, "market", params.market)
         if params.asset_id:
             url = build_query_params(url, "asset_id", params.asset_id)
         if params.id:
             url = build_query_params(url, "id", params.id)
-        if next_cursor:
-            url = build_query_params(url, "next_cursor", next_cursor)
+    if next_cursor:
+        url = build_query_params(url, "next_cursor", next_cursor)
     return url
 
 
@@ -0,0 +1,137 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import AsyncIterator, Awaitable, Callable, Iterable, Iterator
+
+from ..constants import END_CURSOR
+
+FIRST_CURSOR = "MA=="
+
+
+def project(page: dict, fields: Iterable[str]) -> dict:
+    """
+    The page with its records reduced to the given fields, the missing ones are skipped
+    """
+    fields = tuple(fields)
+    data = [
+        {field: record[field] for field in fields if field in record}
+        for record in page.get("data") or ()
+    ]
+    return {**page, "data": data}
+
+
+def projected(fetch: Callable[[str], dict], fields: Iterable[str]) -> Callable:
+    """
+    fetch projecting every page it returns, in the fetching thread so the full
+    records of a prefetched page are not held
+    """
+    fields = tuple(fields)
+
+    def fetch_projected(next_cursor: str) -> dict:
+        return project(fetch(next_cursor), fields)
+
+    return fetch_projected
+
+
+def aprojected(
+    fetch: Callable[[str], Awaitable[dict]], fields: Iterable[str]
+) -> Callable:
+    """
+    projected for coroutine fetches
+    """
+    fields = tuple(fields)
+
+    async def fetch_projected(next_cursor: str) -> dict:
+        return project(await fetch(next_cursor), fields)
+
+    return fetch_projected
+
+
+def iter_pages(
+    fetch: Callable[[str], dict], next_cursor: str = FIRST_CURSOR, prefetch=True
+) -> Iterator[dict]:
+    """
+    Yields the pages of a cursor paginated endpoint, fetch(next_cursor) -> page
+    With prefetch, page N+1 is fetched in a background thread while page N is handled.
+    Breaking out of the loop stops the pagination
+    """
+    next_cursor = next_cursor if next_cursor is not None else FIRST_CURSOR
+    if next_cursor == END_CURSOR:
+        return
+    if not prefetch:
+        while next_cursor != END_CURSOR:
+            page = fetch(next_cursor)
+            next_cursor = page.get("next_cursor") or END_CURSOR
+            yield page
+        return
+
+    executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="clob-pages")
+    try:
+        pending = executor.submit(fetch, next_cursor)
+        while pending is not None:
+            page = pending.result()
+            next_cursor = page.get("next_cursor") or END_CURSOR
+            pending = (
+                executor.submit(fetch, next_cursor)
+                if next_cursor != END_CURSOR
+                else None
+            )
+            yield page
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def iter_records(
+    fetch: Callable[[str], dict], next_cursor: str = FIRST_CURSOR, prefetch=True
+) -> Iterator:
+    """
+    Yields the records (the `data`) of every page, see iter_pages
+    """
+    for page in iter_pages(fetch, next_cursor, prefetch):
+        yield from page.get("data") or ()
+
+
+async def aiter_pages(
+    fetch: Callable[[str], Awaitable[dict]],
+    next_cursor: str = FIRST_CURSOR,
+    prefetch=True,
+) -> AsyncIterator[dict]:
+    """
+    iter_pages for coroutine fetches, the next page is fetched in a task
+    """
+    next_cursor = next_cursor if next_cursor is not None else FIRST_CURSOR
+    if next_cursor == END_CURSOR:
+        return
+    if not prefetch:
+        while next_cursor != END_CURSOR:
+            page = await fetch(next_cursor)
+            next_cursor = page.get("next_cursor") or END_CURSOR
+            yield page
+        return
+
+    pending = asyncio.ensure_future(fetch(next_cursor))
+    try:
+        while pending is not None:
+            page = await pending
+            next_cursor = page.get("next_cursor") or END_CURSOR
+            pending = (
+                asyncio.ensure_future(fetch(next_cursor))
+                if next_cursor != END_CURSOR
+                else None
+            )
+            yield page
+    finally:
+        if pending is not None:
+            pending.cancel()
+
+
+async def aiter_records(
+    fetch: Callable[[str], Awaitable[dict]],
+    next_cursor: str = FIRST_CURSOR,
+    prefetch=True,
+) -> AsyncIterator:
+    """
+    Yields the records of every page, see aiter_pages
+    """
+    async for page in aiter_pages(fetch, next_cursor, prefetch):
+        for record in page.get("data") or ():
+            yield record
@@ -0,0 +1,201 @@
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Optional
+from urllib.parse import urlparse
+
+from ..endpoints import (
+    CANCEL_ALL,
+    CANCEL_MARKET_ORDERS,
+    GET_LAST_TRADE_PRICE,
+    GET_LAST_TRADES_PRICES,
+    GET_ORDER_BOOK,
+    GET_ORDER_BOOKS,
+    GET_PRICES,
+    GET_SPREAD,
+    GET_SPREADS,
+    MID_POINT,
+    MID_POINTS,
+    POST_ORDER,
+    POST_ORDERS,
+    PRICE,
+)
+from ..headers.headers import POLY_SIGNATURE
+
+# endpoint groups
+ORDERS = "orders"
+CANCELS = "cancels"
+MARKET_DATA = "market_data"
+DEFAULT = "default"
+
+MARKET_DATA_PATHS = frozenset(
+    (
+        GET_ORDER_BOOK,
+        GET_ORDER_BOOKS,
+        MID_POINT,
+        MID_POINTS,
+        PRICE,
+        GET_PRICES,
+        GET_SPREAD,
+        GET_SPREADS,
+        GET_LAST_TRADE_PRICE,
+        GET_LAST_TRADES_PRICES,
+    )
+)
+CANCEL_PATHS = frozenset((CANCEL_ALL, CANCEL_MARKET_ORDERS))
+
+DEFAULT_MAX_RETRIES = 3
+DEFAULT_BACKOFF = 0.1
+DEFAULT_MAX_BACKOFF = 5.0
+DEFAULT_MAX_RETRY_AFTER = 60.0
+RETRY_STATUSES = frozenset((429, 500, 502, 503, 504))
+
+
+def endpoint_group(method: str, url: str) -> str:
+    """
+    The rate limit group of a request: ORDERS, CANCELS, MARKET_DATA or DEFAULT
+    """
+    path = urlparse(url).path
+    if method == "DELETE" or path in CANCEL_PATHS:
+        return CANCELS
+    if method == "POST" and path in (POST_ORDER, POST_ORDERS):
+        return ORDERS
+    if path in MARKET_DATA_PATHS:
+        return MARKET_DATA
+    return DEFAULT
+
+
+class TokenBucket:
+    """
+    Allows `rate` requests per second on average, in bursts of up to `burst`
+    """
+
+    def __init__(self, rate: float, burst: int = None):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.burst = burst if burst is not None else max(1, int(rate))
+        self.__tokens = float(self.burst)
+        self.__updated = time.monotonic()
+        self.__lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """
+        Takes a token, returns how long to wait, in seconds, before using it
+        The callers are served in order, the wait grows with the queue
+        """
+        with self.__lock:
+            now = time.monotonic()
+            self.__tokens = min(
+                self.burst, self.__tokens + (now - self.__updated) * self.rate
+            )
+            self.__updated = now
+            self.__tokens -= 1
+            if self.__tokens >= 0:
+                return 0.0
+            return -self.__tokens / self.rate
+
+    def acquire(self):
+        """
+        Waits for a token
+        """
+        delay = self.reserve()
+        if delay > 0:
+            time.sleep(delay)
+
+
+class RateLimiter:
+    """
+    One TokenBucket per endpoint group, limits maps the group to (rate, burst)
+    i.e {ORDERS: (50, 100), CANCELS: (50, 100), MARKET_DATA: (100, 200)}
+    The requests of a group without limits are not paced
+    """
+
+    def __init__(self, limits: dict[str, tuple[float, int]]):
+        self.buckets = {
+            group: TokenBucket(rate, burst) for group, (rate, burst) in limits.items()
+        }
+
+    def reserve(self, method: str, url: str) -> float:
+        """
+        Takes a token of the request's group, returns how long to wait before sending it
+        """
+        bucket = self.buckets.get(endpoint_group(method, url))
+        return bucket.reserve() if bucket is not None else 0.0
+
+    def acquire(self, method: str, url: str):
+        delay = self.reserve(method, url)
+        if delay > 0:
+            time.sleep(delay)
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    The delay in seconds of a Retry-After header, given in seconds or as an http date
+    """
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class RetryPolicy:
+    """
+    Retries of the idempotent requests (GETs) failing with a connection error or one of
+    `statuses`, with full jitter exponential backoff, never shorter than Retry-After
+
+    A Retry-After longer than max_retry_after is not waited for, the error is raised.
+    Signed requests (L1 and L2 headers) are not retried: their timestamp and signature
+    would be sent again as is, only the unauthenticated GETs are
+    """
+
+    def __init__(
+        self,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        backoff: float = DEFAULT_BACKOFF,
+        max_backoff: float = DEFAULT_MAX_BACKOFF,
+        statuses=RETRY_STATUSES,
+        methods=("GET",),
+        max_retry_after: float = DEFAULT_MAX_RETRY_AFTER,
+    ):
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.statuses = frozenset(statuses)
+        self.methods = frozenset(methods)
+        self.max_retry_after = max_retry_after
+
+    def should_retry(
+        self,
+        method: str,
+        attempt: int,
+        status: int = None,
+        retry_after: float = None,
+        headers: dict = None,
+    ) -> bool:
+        """
+        attempt: the number of retries already made
+        status: None for a connection error
+        retry_after: the parsed Retry-After of the response
+        headers: the request headers
+        """
+        return (
+            attempt < self.max_retries
+            and method in self.methods
+            and (status is None or status in self.statuses)
+            and (retry_after is None or retry_after <= self.max_retry_after)
+            and not (headers and POLY_SIGNATURE in headers)
+        )
+
+    def delay(self, attempt: int, retry_after: float = None) -> float:
+        delay = random.uniform(0, min(self.max_backoff, self.backoff * 2**attempt))
+        if retry_after is not None:
+            delay = max(delay, min(retry_after, self.max_retry_after))
+        return delay
@@ -0,0 +1,311 @@
+import asyncio
+import json
+import threading
+import time
+from urllib.parse import urlparse
+
+from ..exceptions import PolyApiException
+from .transport import DELETE, GET, POST
+
+
+def _path(url: str) -> str:
+    """
+    The path and query of url, so recordings replay against any host
+    """
+    parsed = urlparse(url)
+    return parsed.path + ("?" + parsed.query if parsed.query else "")
+
+
+def _body(data):
+    if isinstance(data, bytes):
+        try:
+            return json.loads(data)
+        except ValueError:
+            return data.decode("utf-8", "replace")
+    return data if data else None
+
+
+# fields never written to a recording: the credentials of the auth responses and
+# the api key owning the posted orders, orders and trades
+REDACTED_FIELDS = frozenset(("apiKey", "apiKeys", "secret", "passphrase", "owner"))
+REDACTED = "<redacted>"
+
+
+def redact(value):
+    """
+    value with the api credentials replaced by REDACTED, at any depth
+    """
+    if isinstance(value, dict):
+        return {
+            k: REDACTED if k in REDACTED_FIELDS else redact(v) for k, v in value.items()
+        }
+    if isinstance(value, list):
+        return [redact(v) for v in value]
+    return value
+
+
+def _entry(method: str, url: str, data, status: int, response) -> dict:
+    return {
+        "method": method,
+        "path": _path(url),
+        "body": redact(_body(data)),
+        "status": status,
+        "response": redact(response),
+    }
+
+
+def load_recording(path: str) -> list[dict]:
+    """
+    The entries of a JSONL recording, one request/response pair per line
+    """
+    with open(path) as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+class _Recorder:
+    def __init__(self, path: str):
+        self.path = path
+        self.__lock = threading.Lock()
+        self.__file = open(path, "a")
+
+    def write(self, entry: dict):
+        line = json.dumps(entry, separators=(",", ":")) + "\n"
+        with self.__lock:
+            self.__file.write(line)
+            self.__file.flush()
+
+    def close(self):
+        with self.__lock:
+            self.__file.close()
+
+
+class RecordingTransport:
+    """
+    Transport recording every request/response pair it sends through `transport`
+    to a JSONL file, for ReplayTransport. The headers are not recorded and the api
+    credentials of the bodies and responses are redacted, see REDACTED_FIELDS
+    """
+
+    def __init__(self, path: str, transport):
+        self.transport = transport
+        self.__recorder = _Recorder(path)
+
+    @property
+    def metrics(self):
+        return self.transport.metrics
+
+    @metrics.setter
+    def metrics(self, metrics):
+        self.transport.metrics = metrics
+
+    def request(self, endpoint: str, method: str, headers=None, data=None):
+        try:
+            response = self.transport.request(endpoint, method, headers, data)
+        except PolyApiException as e:
+            self.__recorder.write(
+                _entry(method, endpoint, data, e.status_code, e.error_msg)
+            )
+            raise
+        self.__recorder.write(_entry(method, endpoint, data, 200, response))
+        return response
+
+    def post(self, endpoint, headers=None, data=None):
+        return self.request(endpoint, POST, headers, data)
+
+    def get(self, endpoint, headers=None, data=None):
+        return self.request(endpoint, GET, headers, data)
+
+    def delete(self, endpoint, headers=None, data=None):
+        return self.request(endpoint, DELETE, headers, data)
+
+    def close(self):
+        self.__recorder.close()
+        self.transport.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+class AsyncRecordingTransport:
+    """
+    RecordingTransport for an AsyncTransport
+    """
+
+    def __init__(self, path: str, transport):
+        self.transport = transport
+        self.__recorder = _Recorder(path)
+
+    @property
+    def metrics(self):
+        return self.transport.metrics
+
+    @metrics.setter
+    def metrics(self, metrics):
+        self.transport.metrics = metrics
+
+    async def request(self, endpoint: str, method: str, headers=None, data=None):
+        try:
+            response = await self.transport.request(endpoint, method, headers, data)
+        except PolyApiException as e:
+            self.__recorder.write(
+                _entry(method, endpoint, data, e.status_code, e.error_msg)
+            )
+            raise
+        self.__recorder.write(_entry(method, endpoint, data, 200, response))
+        return response
+
+    async def post(self, endpoint, headers=None, data=None):
+        return await self.request(endpoint, POST, headers, data)
+
+    async def get(self, endpoint, headers=None, data=None):
+        return await self.request(endpoint, GET, headers, data)
+
+    async def delete(self, endpoint, headers=None, data=None):
+        return await self.request(endpoint, DELETE, headers, data)
+
+    async def close(self):
+        self.__recorder.close()
+        await self.transport.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        await self.close()
+
+
+class Replay:
+    """
+    Serves the entries of a recording back, without any network
+
+    A request is answered with the next unused entry of the same method and path (with
+    its query), the one with the same body first, as the signed bodies of orders differ
+    from run to run. With loop, the entries of a path are served again once all used,
+    so a short recording can drive a long benchmark
+    """
+
+    def __init__(self, entries: list[dict], loop: bool = False):
+        self.loop = loop
+        self.__lock = threading.Lock()
+        self.__entries = {}
+        for entry in entries:
+            key = (entry["method"], entry["path"])
+            self.__entries.setdefault(key, []).append(entry)
+        self.__used = {key: [False] * len(e) for key, e in self.__entries.items()}
+
+    def next(self, method: str, url: str, data) -> dict:
+        key = (method, _path(url))
+        # compared as recorded
+        body = redact(_body(data))
+        with self.__lock:
+            entries = self.__entries.get(key)
+            if not entries:
+                raise PolyApiException(
+                    error_msg="no recorded response for {} {}".format(*key),
+                    status_code=None,
+                )
+            used = self.__used[key]
+            if all(used):
+                if not self.loop:
+                    raise PolyApiException(
+                        error_msg="recorded responses of {} {} exhausted".format(*key),
+                        status_code=None,
+                    )
+                used[:] = [False] * len(used)
+
+            unused = [i for i, u in enumerate(used) if not u]
+            index = next((i for i in unused if entries[i]["body"] == body), unused[0])
+            used[index] = True
+            return entries[index]
+
+    @staticmethod
+    def respond(entry: dict):
+        if entry["status"] != 200:
+            raise PolyApiException(
+                error_msg=entry["response"], status_code=entry["status"]
+            )
+        return entry["response"]
+
+
+class ReplayTransport:
+    """
+    Transport serving a JSONL recording back, see Replay
+    latency: simulated network time of every request, in seconds
+    """
+
+    metrics = None
+
+    def __init__(
+        self, path: str = None, latency: float = 0.0, loop=False, entries=None
+    ):
+        self.latency = latency
+        self.replay = Replay(
+            entries if entries is not None else load_recording(path), loop
+        )
+
+    def request(self, endpoint: str, method: str, headers=None, data=None):
+        entry = self.replay.next(method, endpoint, data)
+        if self.latency:
+            time.sleep(self.latency)
+        return Replay.respond(entry)
+
+    def post(self, endpoint, headers=None, data=None):
+        return self.request(endpoint, POST, headers, data)
+
+    def get(self, endpoint, headers=None, data=None):
+        return self.request(endpoint, GET, headers, data)
+
+    def delete(self, endpoint, headers=None, data=None):
+        return self.request(endpoint, DELETE, headers, data)
+
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+class AsyncReplayTransport:
+    """
+    ReplayTransport for the async client, the latency is awaited
+    """
+
+    metrics = None
+
+    def __init__(
+        self, path: str = None, latency: float = 0.0, loop=False, entries=None
+    ):
+        self.latency = latency
+        self.replay = Replay(
+            entries if entries is not None else load_recording(path), loop
+        )
+
+    async def request(self, endpoint: str, method: str, headers=None, data=None):
+        entry = self.replay.next(method, endpoint, data)
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        return Replay.respond(entry)
+
+    async def post(self, endpoint, headers=None, data=None):
+        return await self.request(endpoint, POST, headers, data)
+
+    async def get(self, endpoint, headers=None, data=None):
+        return await self.request(endpoint, GET, headers, data)
+
+    async def delete(self, endpoint, headers=None, data=None):
+        return await self.request(endpoint, DELETE, headers, data)
+
+    async def close(self):
+        pass
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        await self.close()
@@ -0,0 +1,67 @@
+import asyncio
+import threading
+from concurrent.futures import Future
+from functools import partial
+from typing import Awaitable, Callable, Hashable
+
+
+class SingleFlight:
+    """
+    Shares one in-flight call between the threads making the same call concurrently
+
+    The first caller of a key runs fn, the others wait for it and get the same result,
+    or exception. Once it completes, the next call of the key runs fn again
+    """
+
+    def __init__(self):
+        self.__lock = threading.Lock()
+        self.__calls = {}
+
+    def do(self, key: Hashable, fn: Callable):
+        with self.__lock:
+            future = self.__calls.get(key)
+            leader = future is None
+            if leader:
+                future = self.__calls[key] = Future()
+
+        if not leader:
+            return future.result()
+
+        try:
+            result = fn()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self.__lock:
+                del self.__calls[key]
+
+
+class AsyncSingleFlight:
+    """
+    SingleFlight for coroutines, the tasks awaiting the same key share one call
+
+    The call runs in its own task, so cancelling any caller, the first one included,
+    neither cancels it nor fails the others. The key is shared until the task completes
+    """
+
+    def __init__(self):
+        self.__calls = {}
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable]):
+        future = self.__calls.get(key)
+        if future is None:
+            future = self.__calls[key] = asyncio.ensure_future(fn())
+            future.add_done_callback(partial(self.__done, key))
+        # shielded so a cancelled caller does not cancel the shared call
+        return await asyncio.shield(future)
+
+    def __done(self, key: Hashable, future: asyncio.Future):
+        if self.__calls.get(key) is future:
+            del self.__calls[key]
+        if not future.cancelled():
+            # retrieved, in case every caller was cancelled
+            future.exception()
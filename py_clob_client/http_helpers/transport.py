@@ -0,0 +1,191 @@
+import time
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from ..exceptions import PolyApiException
+from ..metrics import ClientMetrics
+from .rate_limit import RateLimiter, RetryPolicy, parse_retry_after
+
+GET = "GET"
+POST = "POST"
+DELETE = "DELETE"
+PUT = "PUT"
+
+DEFAULT_POOL_CONNECTIONS = 10
+DEFAULT_POOL_MAXSIZE = 10
+DEFAULT_CONNECT_TIMEOUT = 5.0
+DEFAULT_READ_TIMEOUT = 30.0
+
+
+def overloadHeaders(method: str, headers: dict) -> dict:
+    if headers is None:
+        headers = dict()
+    headers["User-Agent"] = "py_clob_client"
+
+    headers["Accept"] = "*/*"
+    headers["Connection"] = "keep-alive"
+    headers["Content-Type"] = "application/json"
+
+    if method == GET:
+        headers["Accept-Encoding"] = "gzip"
+
+    return headers
+
+
+class Transport:
+    """
+    Pooled, keep-alive HTTP transport
+
+    Holds a requests Session so connections (and their TLS sessions)
+    are reused across requests instead of being rebuilt for every call
+    """
+
+    def __init__(
+        self,
+        pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+        pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+        host_pool_maxsize: dict[str, int] = None,
+        connect_timeout: float = DEFAULT_CONNECT_TIMEOUT,
+        read_timeout: float = DEFAULT_READ_TIMEOUT,
+        rate_limiter: RateLimiter = None,
+        retry: RetryPolicy = None,
+        metrics: ClientMetrics = None,
+    ):
+        """
+        pool_connections: number of per-host connection pools to keep
+        pool_maxsize: max number of connections kept open per host
+        host_pool_maxsize: per-host overrides of pool_maxsize, keyed by url prefix
+            i.e {"https://clob.polymarket.com": 50}
+        connect_timeout / read_timeout: in seconds, None disables the timeout
+        rate_limiter: paces the requests of every endpoint group, not paced if not provided
+        retry: the RetryPolicy of the failed unsigned GETs, a default one if not provided
+        metrics: records the latency, sizes, retries and errors of every request
+        """
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.timeout = (connect_timeout, read_timeout)
+        self.rate_limiter = rate_limiter
+        self.retry = retry if retry is not None else RetryPolicy()
+        self.metrics = metrics
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=pool_connections, pool_maxsize=pool_maxsize
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+        if host_pool_maxsize:
+            for host, maxsize in host_pool_maxsize.items():
+                self.set_pool_maxsize(host, maxsize)
+
+    def set_pool_maxsize(self, host: str, maxsize: int):
+        """
+        Sets the max number of connections kept open for the given host
+        """
+        prefix = host[0:-1] if host.endswith("/") else host
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=maxsize)
+        self.session.mount(prefix, adapter)
+
+    def request(self, endpoint: str, method: str, headers=None, data=None):
+        headers = overloadHeaders(method, headers)
+        if isinstance(data, bytes):
+            # pre-serialized body, sent as is
+            kwargs = {"data": data}
+        else:
+            kwargs = {"json": data if data else None}
+
+        attempt = 0
+        while True:
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire(method, endpoint)
+            start = time.perf_counter()
+            try:
+                resp = self.session.request(
+                    method=method,
+                    url=endpoint,
+                    headers=headers,
+                    timeout=self.timeout,
+                    **kwargs,
+                )
+            except requests.RequestException as e:
+                if self.metrics is not None:
+                    self.metrics.observe_request(
+                        method,
+                        endpoint,
+                        None,
+                        time.perf_counter() - start,
+                        request_bytes=len(data) if isinstance(data, bytes) else 0,
+                        exception=e,
+                    )
+                if self.retry.should_retry(method, attempt, headers=headers):
+                    self.__wait_retry(method, endpoint, attempt)
+                    attempt += 1
+                    continue
+                raise PolyApiException(
+                    error_msg="Request exception! {!r}".format(e)
+                ) from e
+            seconds = time.perf_counter() - start
+
+            if resp.status_code != 200:
+                if self.metrics is not None:
+                    self.__observe(method, endpoint, resp, seconds)
+                retry_after = parse_retry_after(resp.headers.get("Retry-After"))
+                if self.retry.should_retry(
+                    method, attempt, resp.status_code, retry_after, headers
+                ):
+                    self.__wait_retry(method, endpoint, attempt, retry_after)
+                    attempt += 1
+                    continue
+                raise PolyApiException(resp)
+
+            decode_start = time.perf_counter()
+            try:
+                result = resp.json()
+            except requests.JSONDecodeError:
+                result = resp.text
+            if self.metrics is not None:
+                self.__observe(
+                    method, endpoint, resp, seconds, time.perf_counter() - decode_start
+                )
+            return result
+
+    def __observe(self, method, endpoint, resp, seconds, decode_seconds=0.0):
+        body = resp.request.body
+        self.metrics.observe_request(
+            method,
+            endpoint,
+            resp.status_code,
+            seconds,
+            request_bytes=len(body) if body else 0,
+            response_bytes=len(resp.content),
+            decode_seconds=decode_seconds,
+        )
+
+    def __wait_retry(self, method, endpoint, attempt, retry_after=None):
+        delay = self.retry.delay(attempt, retry_after)
+        if self.metrics is not None:
+            self.metrics.observe_retry(method, endpoint, attempt, delay)
+        time.sleep(delay)
+
+    def post(self, endpoint, headers=None, data=None):
+        return self.request(endpoint, POST, headers, data)
+
+    def get(self, endpoint, headers=None, data=None):
+        return self.request(endpoint, GET, headers, data)
+
+    def delete(self, endpoint, headers=None, data=None):
+        return self.request(endpoint, DELETE, headers, data)
+
+    def close(self):
+        """
+        Closes every pooled connection
+        """
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
@@ -0,0 +1,184 @@
+import json
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional
+
+from .clob_types import TickSize
+from .constants import END_CURSOR
+
+DEFAULT_MARKET_CACHE_TTL = 3600.0
+DEFAULT_MARKET_CACHE_MAXSIZE = 100_000
+
+TICK_SIZE = "tick_size"
+NEG_RISK = "neg_risk"
+
+_TICK_SIZE_ERROR = re.compile(r"tick.?size", re.IGNORECASE)
+
+
+def is_tick_size_error(error) -> bool:
+    """
+    True if an order rejection (an exception or error message) is about the tick size
+    """
+    return bool(_TICK_SIZE_ERROR.search(str(error)))
+
+
+class MarketMetadataCache:
+    """
+    Bounded cache of the tick size and neg risk flag of every token
+
+    Entries expire `ttl` seconds after being set and the least recently used ones are
+    evicted past `maxsize` entries. It can be warmed in bulk from the get_markets pages
+    and saved to a JSON file, so a restarted process can quote without fetching them.
+    Expiry uses the wall clock so that it holds across restarts
+    """
+
+    def __init__(
+        self,
+        ttl: float = DEFAULT_MARKET_CACHE_TTL,
+        maxsize: int = DEFAULT_MARKET_CACHE_MAXSIZE,
+    ):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self.__lock = threading.Lock()
+        # (field, token_id) -> (value, expires at)
+        self.__entries = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self.__entries)
+
+    def __get(self, field: str, token_id: str):
+        key = (field, token_id)
+        with self.__lock:
+            entry = self.__entries.get(key)
+            if entry is None:
+                return None
+            if entry[1] <= time.time():
+                del self.__entries[key]
+                return None
+            self.__entries.move_to_end(key)
+            return entry[0]
+
+    def __set(self, field: str, token_id: str, value, expires_at: float = None):
+        key = (field, token_id)
+        if expires_at is None:
+            expires_at = time.time() + self.ttl
+        with self.__lock:
+            self.__entries[key] = (value, expires_at)
+            self.__entries.move_to_end(key)
+            while len(self.__entries) > self.maxsize:
+                self.__entries.popitem(last=False)
+
+    def get_tick_size(self, token_id: str) -> Optional[TickSize]:
+        return self.__get(TICK_SIZE, token_id)
+
+    def set_tick_size(self, token_id: str, tick_size: TickSize):
+        self.__set(TICK_SIZE, token_id, str(tick_size))
+
+    def get_neg_risk(self, token_id: str) -> Optional[bool]:
+        return self.__get(NEG_RISK, token_id)
+
+    def set_neg_risk(self, token_id: str, neg_risk: bool):
+        self.__set(NEG_RISK, token_id, bool(neg_risk))
+
+    def invalidate(self, token_id: str, field: str = None):
+        """
+        Drops the cached metadata of token_id, only `field` if given
+        """
+        fields = (field,) if field is not None else (TICK_SIZE, NEG_RISK)
+        with self.__lock:
+            for f in fields:
+                self.__entries.pop((f, token_id), None)
+
+    def clear(self):
+        with self.__lock:
+            self.__entries.clear()
+
+    def warm(self, markets: list[dict]) -> int:
+        """
+        Caches the tick size and neg risk flag of the tokens of every market,
+        i.e. the `data` of a get_markets page. Returns the number of tokens cached,
+        the markets without either, as the simplified markets, are skipped
+        """
+        count = 0
+        for market in markets:
+            tick_size = market.get("minimum_tick_size")
+            neg_risk = market.get("neg_risk")
+            if tick_size is None and neg_risk is None:
+                continue
+            for token in market.get("tokens") or ():
+                token_id = token.get("token_id")
+                if not token_id:
+                    continue
+                if tick_size is not None:
+                    self.set_tick_size(token_id, tick_size)
+                if neg_risk is not None:
+                    self.set_neg_risk(token_id, neg_risk)
+                count += 1
+        return count
+
+    def warm_from(self, client, max_pages: int = None) -> int:
+        """
+        Warms the cache from the get_markets pages of client
+        Returns the number of tokens cached
+        """
+        count = 0
+        pages = 0
+        next_cursor = "MA=="
+        while next_cursor != END_CURSOR and (max_pages is None or pages < max_pages):
+            page = client.get_markets(next_cursor=next_cursor)
+            count += self.warm(page.get("data") or ())
+            next_cursor = page.get("next_cursor") or END_CURSOR
+            pages += 1
+        return count
+
+    async def warm_from_async(self, client, max_pages: int = None) -> int:
+        """
+        warm_from for an AsyncClobClient
+        """
+        count = 0
+        pages = 0
+        next_cursor = "MA=="
+        while next_cursor != END_CURSOR and (max_pages is None or pages < max_pages):
+            page = await client.get_markets(next_cursor=next_cursor)
+            count += self.warm(page.get("data") or ())
+            next_cursor = page.get("next_cursor") or END_CURSOR
+            pages += 1
+        return count
+
+    def save(self, path: str):
+        """
+        Writes the unexpired entries to a JSON file, atomically
+        """
+        now = time.time()
+        with self.__lock:
+            entries = [
+                [field, token_id, value, expires_at]
+                for (field, token_id), (value, expires_at) in self.__entries.items()
+                if expires_at > now
+            ]
+        tmp = "{}.tmp".format(path)
+        with open(tmp, "w") as f:
+            json.dump({"version": 1, "entries": entries}, f)
+        os.replace(tmp, path)
+
+    def load(self, path: str) -> int:
+        """
+        Reads the entries saved by save, keeping their expiry
+        A missing file is ignored. Returns the number of entries loaded
+        """
+        try:
+            with open(path) as f:
+                saved = json.load(f)
+        except FileNotFoundError:
+            return 0
+
+        now = time.time()
+        count = 0
+        for field, token_id, value, expires_at in saved.get("entries", ()):
+            if field in (TICK_SIZE, NEG_RISK) and expires_at > now:
+                self.__set(field, token_id, value, expires_at)
+                count += 1
+        return count
@@ -0,0 +1,346 @@
+import sqlite3
+import threading
+import time
+from typing import Iterable, Optional
+
+from .clob_types import TickSize
+from .constants import END_CURSOR
+from .http_helpers.pagination import FIRST_CURSOR, iter_pages
+from .market_cache import NEG_RISK, TICK_SIZE
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS markets (
+    condition_id TEXT PRIMARY KEY,
+    question TEXT,
+    market_slug TEXT,
+    active INTEGER,
+    closed INTEGER,
+    minimum_tick_size TEXT,
+    neg_risk INTEGER,
+    updated_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS tokens (
+    token_id TEXT PRIMARY KEY,
+    condition_id TEXT NOT NULL,
+    outcome TEXT,
+    tick_size TEXT,
+    neg_risk INTEGER,
+    tick_size_updated_at REAL,
+    neg_risk_updated_at REAL
+);
+CREATE INDEX IF NOT EXISTS tokens_condition_id ON tokens (condition_id);
+CREATE TABLE IF NOT EXISTS checkpoints (
+    name TEXT PRIMARY KEY,
+    next_cursor TEXT NOT NULL,
+    updated_at REAL NOT NULL
+);
+"""
+
+UPSERT_MARKET = """
+INSERT INTO markets (
+    condition_id, question, market_slug, active, closed, minimum_tick_size, neg_risk, updated_at
+) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT (condition_id) DO UPDATE SET
+    question = COALESCE(excluded.question, question),
+    market_slug = COALESCE(excluded.market_slug, market_slug),
+    active = COALESCE(excluded.active, active),
+    closed = COALESCE(excluded.closed, closed),
+    minimum_tick_size = COALESCE(excluded.minimum_tick_size, minimum_tick_size),
+    neg_risk = COALESCE(excluded.neg_risk, neg_risk),
+    updated_at = excluded.updated_at
+"""
+
+UPSERT_TOKEN = """
+INSERT INTO tokens (
+    token_id, condition_id, outcome, tick_size, neg_risk, tick_size_updated_at, neg_risk_updated_at
+) VALUES (?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT (token_id) DO UPDATE SET
+    condition_id = excluded.condition_id,
+    outcome = COALESCE(excluded.outcome, outcome),
+    tick_size = COALESCE(excluded.tick_size, tick_size),
+    neg_risk = COALESCE(excluded.neg_risk, neg_risk),
+    tick_size_updated_at = COALESCE(excluded.tick_size_updated_at, tick_size_updated_at),
+    neg_risk_updated_at = COALESCE(excluded.neg_risk_updated_at, neg_risk_updated_at)
+"""
+
+# added to the tokens of the catalogs created before them
+TOKEN_TIMESTAMPS = ("tick_size_updated_at", "neg_risk_updated_at")
+
+MARKETS = "markets"
+SIMPLIFIED_MARKETS = "simplified_markets"
+# suffix of the checkpoint recording when the last full sync of a name completed
+FULL_SYNC = ":full"
+
+
+def _flag(value) -> Optional[int]:
+    return None if value is None else int(bool(value))
+
+
+def _tick_size(value) -> Optional[str]:
+    return None if value is None else str(value)
+
+
+class MarketCatalog:
+    """
+    Local SQLite store of the market catalog: condition ids, token ids, tick sizes
+    and neg risk flags, indexed by token and condition id
+
+    sync walks the get_markets pages from the last checkpointed cursor, so only the
+    markets listed since the previous sync are downloaded. The checkpoint is written
+    in the same transaction as its page, an interrupted sync resumes where it stopped.
+    The server has no change feed: the markets of the earlier pages whose tick size,
+    neg risk flag or status changed are only refreshed by a full sync, made with full
+    or once the last one is older than refresh_after
+
+    It has the tick size and neg risk interface of MarketMetadataCache, so it can be
+    given to ClobClient as its `market_cache`. The tick sizes fetched by the client are
+    then stored in the catalog and the tick size errors invalidate them. With a `ttl`,
+    the tick sizes and neg risk flags are only returned for `ttl` seconds after they were
+    stored; they never expire by default, a restarted process quotes from the catalog
+    and relies on the syncs and invalidations to keep them current
+    """
+
+    def __init__(self, path: str = ":memory:", ttl: Optional[float] = None):
+        self.path = path
+        self.ttl = ttl
+        self.__lock = threading.Lock()
+        self.__db = sqlite3.connect(path, check_same_thread=False)
+        self.__db.row_factory = sqlite3.Row
+        with self.__lock, self.__db:
+            self.__db.executescript(SCHEMA)
+            columns = {
+                row["name"] for row in self.__db.execute("PRAGMA table_info(tokens)")
+            }
+            for column in TOKEN_TIMESTAMPS:
+                if column not in columns:
+                    self.__db.execute(
+                        "ALTER TABLE tokens ADD COLUMN {} REAL".format(column)
+                    )
+
+    def close(self):
+        with self.__lock:
+            self.__db.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def __len__(self) -> int:
+        return self.__query_one("SELECT COUNT(*) FROM markets")[0]
+
+    def __query_one(self, sql: str, args: tuple = ()):
+        with self.__lock:
+            return self.__db.execute(sql, args).fetchone()
+
+    def __query_all(self, sql: str, args: tuple = ()) -> list:
+        with self.__lock:
+            return self.__db.execute(sql, args).fetchall()
+
+    def __execute(self, sql: str, args: tuple = ()):
+        with self.__lock, self.__db:
+            self.__db.execute(sql, args)
+
+    def upsert_markets(self, markets: Iterable[dict], checkpoint: tuple = None) -> int:
+        """
+        Stores markets, i.e. the `data` of a get_markets page, and the optional
+        (name, next_cursor) checkpoint in one transaction
+        Returns the number of markets stored
+        """
+        now = time.time()
+        market_rows = []
+        token_rows = []
+        for market in markets:
+            condition_id = market.get("condition_id")
+            if not condition_id:
+                continue
+            tick_size = _tick_size(market.get("minimum_tick_size"))
+            neg_risk = _flag(market.get("neg_risk"))
+            market_rows.append(
+                (
+                    condition_id,
+                    market.get("question"),
+                    market.get("market_slug"),
+                    _flag(market.get("active")),
+                    _flag(market.get("closed")),
+                    tick_size,
+                    neg_risk,
+                    now,
+                )
+            )
+            for token in market.get("tokens") or ():
+                if token.get("token_id"):
+                    token_rows.append(
+                        (
+                            token["token_id"],
+                            condition_id,
+                            token.get("outcome"),
+                            tick_size,
+                            neg_risk,
+                            None if tick_size is None else now,
+                            None if neg_risk is None else now,
+                        )
+                    )
+
+        with self.__lock, self.__db:
+            self.__db.executemany(UPSERT_MARKET, market_rows)
+            self.__db.executemany(UPSERT_TOKEN, token_rows)
+            if checkpoint is not None:
+                self.__db.execute(
+                    "INSERT OR REPLACE INTO checkpoints VALUES (?, ?, ?)",
+                    (*checkpoint, now),
+                )
+        return len(market_rows)
+
+    def get_checkpoint(self, name: str = MARKETS) -> Optional[str]:
+        """
+        The cursor the next sync of `name` starts from, None before the first sync
+        """
+        row = self.__query_one(
+            "SELECT next_cursor FROM checkpoints WHERE name = ?", (name,)
+        )
+        return row[0] if row else None
+
+    def get_last_full_sync(self, name: str = MARKETS) -> Optional[float]:
+        """
+        When the last full sync of `name` completed, None if none did
+        """
+        row = self.__query_one(
+            "SELECT updated_at FROM checkpoints WHERE name = ?", (name + FULL_SYNC,)
+        )
+        return row[0] if row else None
+
+    def sync(
+        self,
+        client,
+        simplified: bool = False,
+        full: bool = False,
+        prefetch=True,
+        refresh_after: Optional[float] = None,
+    ) -> int:
+        """
+        Downloads the markets listed since the last sync, all of them with full or if
+        the last full sync is older than refresh_after seconds, refreshing the others
+        Uses the get_simplified_markets pages if simplified, they have no tick sizes
+        Returns the number of markets stored
+        """
+        name = SIMPLIFIED_MARKETS if simplified else MARKETS
+        get_page = client.get_simplified_markets if simplified else client.get_markets
+        if refresh_after is not None:
+            last_full_sync = self.get_last_full_sync(name)
+            full = full or (
+                last_full_sync is None or last_full_sync + refresh_after <= time.time()
+            )
+        cursor = None if full else self.get_checkpoint(name)
+        cursor = cursor or FIRST_CURSOR
+
+        count = 0
+        for page in iter_pages(_with_cursor(get_page), cursor, prefetch):
+            # the last page is fetched again by the next sync as it may still grow
+            next_cursor = page.get("next_cursor") or END_CURSOR
+            checkpoint = page["cursor"] if next_cursor == END_CURSOR else next_cursor
+            count += self.upsert_markets(page.get("data") or (), (name, checkpoint))
+        if cursor == FIRST_CURSOR:
+            self.__execute(
+                "INSERT OR REPLACE INTO checkpoints VALUES (?, ?, ?)",
+                (name + FULL_SYNC, END_CURSOR, time.time()),
+            )
+        return count
+
+    def get_market(self, condition_id: str) -> Optional[dict]:
+        """
+        The stored fields of a market, with its `tokens`
+        """
+        row = self.__query_one(
+            "SELECT * FROM markets WHERE condition_id = ?", (condition_id,)
+        )
+        if row is None:
+            return None
+        market = dict(row)
+        market["tokens"] = [
+            {"token_id": token["token_id"], "outcome": token["outcome"]}
+            for token in self.__query_all(
+                "SELECT token_id, outcome FROM tokens WHERE condition_id = ? ORDER BY rowid",
+                (condition_id,),
+            )
+        ]
+        return market
+
+    def get_condition_id(self, token_id: str) -> Optional[str]:
+        row = self.__query_one(
+            "SELECT condition_id FROM tokens WHERE token_id = ?", (token_id,)
+        )
+        return row[0] if row else None
+
+    def get_token_ids(self, condition_id: str) -> list[str]:
+        return [
+            row[0]
+            for row in self.__query_all(
+                "SELECT token_id FROM tokens WHERE condition_id = ? ORDER BY rowid",
+                (condition_id,),
+            )
+        ]
+
+    def __get_token(self, token_id: str, field: str):
+        """
+        The field of token_id, None if unknown or older than ttl
+        """
+        row = self.__query_one(
+            "SELECT {0}, {0}_updated_at FROM tokens WHERE token_id = ?".format(field),
+            (token_id,),
+        )
+        if row is None or row[0] is None:
+            return None
+        if self.ttl is not None and (
+            row[1] is None or row[1] + self.ttl <= time.time()
+        ):
+            return None
+        return row[0]
+
+    def get_tick_size(self, token_id: str) -> Optional[TickSize]:
+        return self.__get_token(token_id, TICK_SIZE)
+
+    def get_neg_risk(self, token_id: str) -> Optional[bool]:
+        neg_risk = self.__get_token(token_id, NEG_RISK)
+        return None if neg_risk is None else bool(neg_risk)
+
+    def set_tick_size(self, token_id: str, tick_size: TickSize):
+        self.__set_token(token_id, TICK_SIZE, _tick_size(tick_size))
+
+    def set_neg_risk(self, token_id: str, neg_risk: bool):
+        self.__set_token(token_id, NEG_RISK, _flag(neg_risk))
+
+    def __set_token(self, token_id: str, field: str, value):
+        # the condition id of a token only known from the client is filled by the next sync
+        self.__execute(
+            "INSERT INTO tokens (token_id, condition_id, {0}, {0}_updated_at) "
+            "VALUES (?, '', ?, ?) ON CONFLICT (token_id) DO UPDATE SET "
+            "{0} = excluded.{0}, {0}_updated_at = excluded.{0}_updated_at".format(
+                field
+            ),
+            (token_id, value, time.time()),
+        )
+
+    def invalidate(self, token_id: str, field: str = None):
+        """
+        Drops the tick size and neg risk flag of token_id, only `field` if given
+        """
+        fields = (field,) if field is not None else (TICK_SIZE, NEG_RISK)
+        self.__execute(
+            "UPDATE tokens SET {} WHERE token_id = ?".format(
+                ", ".join("{} = NULL".format(f) for f in fields)
+            ),
+            (token_id,),
+        )
+
+
+def _with_cursor(get_page):
+    """
+    get_page adding the cursor each page was fetched with, for the checkpoints
+    """
+
+    def fetch(next_cursor: str) -> dict:
+        return {**get_page(next_cursor=next_cursor), "cursor": next_cursor}
+
+    return fetch
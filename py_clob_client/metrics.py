@@ -0,0 +1,336 @@
+import threading
+import time
+from bisect import bisect_left
+from contextlib import nullcontext
+from typing import Callable, Optional
+from urllib.parse import urlparse
+
+from .endpoints import GET_MARKET, GET_MARKET_TRADES_EVENTS, GET_ORDER
+
+DEFAULT_LATENCY_BUCKETS = (
+    0.0001,
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+# event kinds given to the hooks
+REQUEST = "request"
+RETRY = "retry"
+PHASE = "phase"
+
+# endpoints ending with an id, labelled by their prefix
+_ID_PREFIXES = (GET_ORDER, GET_MARKET, GET_MARKET_TRADES_EVENTS)
+
+NO_PHASE = nullcontext()
+
+
+def endpoint_label(url: str) -> str:
+    """
+    The path of url, without the id of the endpoints ending with one
+    """
+    path = urlparse(url).path
+    for prefix in _ID_PREFIXES:
+        if path.startswith(prefix) and len(path) > len(prefix):
+            return prefix + "{id}"
+    return path
+
+
+def error_class(status: int = None, exception: BaseException = None) -> str:
+    """
+    i.e "4xx", "5xx" or the class name of a connection error
+    """
+    if exception is not None:
+        return type(exception).__name__
+    return "{}xx".format(status // 100)
+
+
+class Histogram:
+    """
+    Cumulative histogram with fixed bucket upper bounds, as exported to Prometheus
+    """
+
+    def __init__(self, buckets=DEFAULT_LATENCY_BUCKETS):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float):
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def cumulative(self) -> list[tuple[str, int]]:
+        """
+        (le, count) pairs, the last one being +Inf
+        """
+        total = 0
+        out = []
+        for bound, count in zip(self.buckets + (float("inf"),), self.counts):
+            total += count
+            out.append(("+Inf" if bound == float("inf") else repr(bound), total))
+        return out
+
+
+class _Phase:
+    __slots__ = ("metrics", "operation", "phase", "start")
+
+    def __init__(self, metrics: "ClientMetrics", operation: str, phase: str):
+        self.metrics = metrics
+        self.operation = operation
+        self.phase = phase
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *args):
+        self.metrics.observe_phase(
+            self.operation, self.phase, time.perf_counter() - self.start
+        )
+
+
+class ClientMetrics:
+    """
+    Metrics of the client request path
+
+    Per endpoint latency histograms, request and response byte counts, retries and
+    error classes, recorded by the transports, and the duration of the phases of the
+    client methods (tick size resolution, amounts, signing, hmac, http).
+    Exported with to_prometheus, or streamed to the hooks: fn(kind, data) called with
+    every REQUEST, RETRY and PHASE event
+    """
+
+    def __init__(self, buckets=DEFAULT_LATENCY_BUCKETS):
+        self.buckets = tuple(buckets)
+        self.__lock = threading.Lock()
+        self.__hooks = []
+        self.reset()
+
+    def reset(self):
+        with self.__lock:
+            # (method, endpoint) ->
+            self.latency = {}
+            self.decode = {}
+            self.request_bytes = {}
+            self.response_bytes = {}
+            self.retries = {}
+            # (method, endpoint, status) ->
+            self.requests = {}
+            # (method, endpoint, error class) ->
+            self.errors = {}
+            # (operation, phase) ->
+            self.phases = {}
+
+    def add_hook(self, hook: Callable[[str, dict], None]):
+        self.__hooks.append(hook)
+
+    def remove_hook(self, hook: Callable[[str, dict], None]):
+        self.__hooks.remove(hook)
+
+    def __emit(self, kind: str, data: dict):
+        for hook in self.__hooks:
+            hook(kind, data)
+
+    def __histogram(self, histograms: dict, key: tuple) -> Histogram:
+        histogram = histograms.get(key)
+        if histogram is None:
+            histogram = histograms[key] = Histogram(self.buckets)
+        return histogram
+
+    def observe_request(
+        self,
+        method: str,
+        url: str,
+        status: Optional[int],
+        seconds: float,
+        request_bytes: int = 0,
+        response_bytes: int = 0,
+        decode_seconds: float = 0.0,
+        exception: BaseException = None,
+    ):
+        """
+        Records one HTTP exchange, status is None if no response was received
+        seconds is the network time, decode_seconds the time spent decoding the response
+        """
+        endpoint = endpoint_label(url)
+        key = (method, endpoint)
+        error = (
+            error_class(status, exception)
+            if exception is not None or status != 200
+            else None
+        )
+        with self.__lock:
+            self.__histogram(self.latency, key).observe(seconds)
+            if status is not None:
+                self.__histogram(self.decode, key).observe(decode_seconds)
+            self.request_bytes[key] = self.request_bytes.get(key, 0) + request_bytes
+            self.response_bytes[key] = self.response_bytes.get(key, 0) + response_bytes
+            request_key = (method, endpoint, str(status or 0))
+            self.requests[request_key] = self.requests.get(request_key, 0) + 1
+            if error is not None:
+                error_key = (method, endpoint, error)
+                self.errors[error_key] = self.errors.get(error_key, 0) + 1
+
+        if self.__hooks:
+            self.__emit(
+                REQUEST,
+                {
+                    "method": method,
+                    "endpoint": endpoint,
+                    "status": status,
+                    "seconds": seconds,
+                    "decode_seconds": decode_seconds,
+                    "request_bytes": request_bytes,
+                    "response_bytes": response_bytes,
+                    "error": error,
+                },
+            )
+
+    def observe_retry(self, method: str, url: str, attempt: int, delay: float):
+        endpoint = endpoint_label(url)
+        key = (method, endpoint)
+        with self.__lock:
+            self.retries[key] = self.retries.get(key, 0) + 1
+        if self.__hooks:
+            self.__emit(
+                RETRY,
+                {
+                    "method": method,
+                    "endpoint": endpoint,
+                    "attempt": attempt,
+                    "delay": delay,
+                },
+            )
+
+    def observe_phase(self, operation: str, phase: str, seconds: float):
+        with self.__lock:
+            self.__histogram(self.phases, (operation, phase)).observe(seconds)
+        if self.__hooks:
+            self.__emit(
+                PHASE, {"operation": operation, "phase": phase, "seconds": seconds}
+            )
+
+    def phase(self, operation: str, phase: str) -> _Phase:
+        """
+        Context manager timing a phase of a client operation
+        """
+        return _Phase(self, operation, phase)
+
+    def to_prometheus(self, prefix: str = "clob") -> str:
+        """
+        The metrics in the Prometheus text exposition format
+        """
+        lines = []
+        with self.__lock:
+            _histogram_lines(
+                lines,
+                prefix + "_request_duration_seconds",
+                "Network time of the requests",
+                ("method", "endpoint"),
+                self.latency,
+            )
+            _histogram_lines(
+                lines,
+                prefix + "_response_decode_seconds",
+                "Time spent decoding the responses",
+                ("method", "endpoint"),
+                self.decode,
+            )
+            _counter_lines(
+                lines,
+                prefix + "_requests_total",
+                "Requests by response status, 0 if none was received",
+                ("method", "endpoint", "status"),
+                self.requests,
+            )
+            _counter_lines(
+                lines,
+                prefix + "_request_errors_total",
+                "Failed requests by error class",
+                ("method", "endpoint", "error"),
+                self.errors,
+            )
+            _counter_lines(
+                lines,
+                prefix + "_request_retries_total",
+                "Retried requests",
+                ("method", "endpoint"),
+                self.retries,
+            )
+            _counter_lines(
+                lines,
+                prefix + "_request_bytes_total",
+                "Bytes sent in request bodies",
+                ("method", "endpoint"),
+                self.request_bytes,
+            )
+            _counter_lines(
+                lines,
+                prefix + "_response_bytes_total",
+                "Bytes received in response bodies",
+                ("method", "endpoint"),
+                self.response_bytes,
+            )
+            _histogram_lines(
+                lines,
+                prefix + "_phase_duration_seconds",
+                "Duration of the phases of the client operations",
+                ("operation", "phase"),
+                self.phases,
+            )
+        return "\n".join(lines) + "\n"
+
+
+def phase(metrics: Optional[ClientMetrics], operation: str, name: str):
+    """
+    metrics.phase(operation, name), a no-op context manager without metrics
+    """
+    return metrics.phase(operation, name) if metrics is not None else NO_PHASE
+
+
+def _labels(names: tuple, values: tuple, extra: str = "") -> str:
+    pairs = [
+        '{}="{}"'.format(name, str(value).replace("\\", "\\\\").replace('"', '\\"'))
+        for name, value in zip(names, values)
+    ]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}"
+
+
+def _counter_lines(lines: list, name: str, help: str, labels: tuple, values: dict):
+    lines.append("# HELP {} {}".format(name, help))
+    lines.append("# TYPE {} counter".format(name))
+    for key, value in sorted(values.items()):
+        lines.append("{}{} {}".format(name, _labels(labels, key), value))
+
+
+def _histogram_lines(
+    lines: list, name: str, help: str, labels: tuple, histograms: dict
+):
+    lines.append("# HELP {} {}".format(name, help))
+    lines.append("# TYPE {} histogram".format(name))
+    for key, histogram in sorted(histograms.items()):
+        for le, count in histogram.cumulative():
+            lines.append(
+                "{}_bucket{} {}".format(
+                    name, _labels(labels, key, 'le="{}"'.format(le)), count
+                )
+            )
+        lines.append("{}_sum{} {}".format(name, _labels(labels, key), histogram.sum))
+        lines.append(
+            "{}_count{} {}".format(name, _labels(labels, key), histogram.count)
+        )
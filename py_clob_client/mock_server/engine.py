@@ -0,0 +1,462 @@
+import heapq
+import itertools
+import threading
+import time
+from bisect import bisect_left, insort
+from collections import defaultdict, deque
+from dataclasses import dataclass, field
+from typing import Optional
+
+from ..clob_types import OrderType
+from ..order_builder.constants import BUY
+from ..utilities import generate_orderbook_summary_hash, parse_raw_orderbook_summary
+
+# prices and sizes are kept in integer millionths, as the order amounts
+UNIT = 1_000_000
+
+# order statuses
+LIVE = "LIVE"
+MATCHED = "MATCHED"
+CANCELED = "CANCELED"
+UNMATCHED = "UNMATCHED"
+
+DEFAULT_MAX_HISTORY = 10_000
+
+
+def to_units(value) -> int:
+    return int(round(float(value) * UNIT))
+
+
+def from_units(units: int) -> str:
+    """
+    i.e. 1_500_000 -> "1.5", 2_000_000 -> "2"
+    """
+    whole, fraction = divmod(units, UNIT)
+    if not fraction:
+        return str(whole)
+    return "{}.{}".format(whole, "{:06d}".format(fraction).rstrip("0"))
+
+
+@dataclass
+class Order:
+    id: str
+    owner: str
+    maker_address: str
+    asset_id: str
+    side: str
+    price: int
+    original_size: int
+    order_type: str = OrderType.GTC
+    expiration: int = 0
+    size_matched: int = 0
+    status: str = LIVE
+    created_at: int = 0
+    associate_trades: list = field(default_factory=list)
+
+    @property
+    def remaining(self) -> int:
+        return self.original_size - self.size_matched
+
+    def to_json(self, market: str = "") -> dict:
+        return {
+            "id": self.id,
+            "status": self.status,
+            "owner": self.owner,
+            "maker_address": self.maker_address,
+            "market": market,
+            "asset_id": self.asset_id,
+            "side": self.side,
+            "original_size": from_units(self.original_size),
+            "size_matched": from_units(self.size_matched),
+            "price": from_units(self.price),
+            "outcome": "",
+            "expiration": str(self.expiration),
+            "order_type": self.order_type,
+            "associate_trades": list(self.associate_trades),
+            "created_at": self.created_at,
+        }
+
+
+class _Side:
+    """
+    The resting orders of one side of a book, a FIFO queue per price level
+    prices are sorted ascending, the best bid is the last one and the best ask the first
+    """
+
+    def __init__(self, is_bid: bool):
+        self.is_bid = is_bid
+        self.prices = []
+        self.levels = {}
+
+    def best(self) -> Optional[int]:
+        if not self.prices:
+            return None
+        return self.prices[-1] if self.is_bid else self.prices[0]
+
+    def add(self, order: Order):
+        level = self.levels.get(order.price)
+        if level is None:
+            level = self.levels[order.price] = deque()
+            insort(self.prices, order.price)
+        level.append(order)
+
+    def remove(self, order: Order):
+        level = self.levels.get(order.price)
+        if level is None:
+            return
+        try:
+            level.remove(order)
+        except ValueError:
+            return
+        if not level:
+            self.__drop_level(order.price)
+
+    def __drop_level(self, price: int):
+        del self.levels[price]
+        del self.prices[bisect_left(self.prices, price)]
+
+    def pop_front(self, price: int):
+        level = self.levels[price]
+        level.popleft()
+        if not level:
+            self.__drop_level(price)
+
+    def crossing(self, price: int) -> list[int]:
+        """
+        The levels an incoming order at price matches against, best first
+        """
+        if self.is_bid:
+            # a sell order matches the bids at or above its price
+            return self.prices[bisect_left(self.prices, price) :][::-1]
+        # a buy order matches the asks at or below its price
+        return self.prices[: bisect_left(self.prices, price + 1)]
+
+    def available(self, price: int) -> int:
+        return sum(
+            order.remaining for p in self.crossing(price) for order in self.levels[p]
+        )
+
+    def summary(self) -> list[dict]:
+        """
+        The aggregated levels, best last as served by the CLOB
+        """
+        prices = self.prices if self.is_bid else self.prices[::-1]
+        return [
+            {
+                "price": from_units(p),
+                "size": from_units(sum(o.remaining for o in self.levels[p])),
+            }
+            for p in prices
+        ]
+
+
+class OrderBook:
+    def __init__(self, asset_id: str, market: str = ""):
+        self.asset_id = asset_id
+        self.market = market
+        self.bids = _Side(is_bid=True)
+        self.asks = _Side(is_bid=False)
+        self.last_trade_price = None
+        self.last_trade_side = None
+
+    def summary(self) -> dict:
+        raw = {
+            "market": self.market,
+            "asset_id": self.asset_id,
+            "timestamp": str(int(time.time() * 1000)),
+            "bids": self.bids.summary(),
+            "asks": self.asks.summary(),
+            "hash": "",
+        }
+        raw["hash"] = generate_orderbook_summary_hash(parse_raw_orderbook_summary(raw))
+        return raw
+
+
+class MatchingEngine:
+    """
+    In-memory price-time priority matching of the orders of every token
+
+    Incoming orders match the resting orders of the opposite side from the best price,
+    oldest first at each level, and trade at the resting order's price. The remainder of
+    a GTC or GTD order rests in the book, the one of a FAK order is canceled and a FOK
+    order not filled in full is not matched at all. GTD orders are canceled once their
+    expiration is passed, before matching and listing
+
+    The live orders are indexed by owner and asset, only the last max_history closed
+    orders and trades are kept
+    """
+
+    def __init__(self, max_history: int = DEFAULT_MAX_HISTORY):
+        self.max_history = max_history
+        self.__lock = threading.Lock()
+        self.__ids = itertools.count(1)
+        self.books = {}
+        # the live orders and the last closed ones, by id
+        self.orders = {}
+        self.trades = deque(maxlen=max_history)
+        self.__closed = deque()
+        # owner -> asset id -> order id -> live order
+        self.__live = defaultdict(lambda: defaultdict(dict))
+        # heap of (expiration, order id) of the resting GTD orders
+        self.__expirations = []
+        self.__owner_trades = defaultdict(lambda: deque(maxlen=max_history))
+        self.__market_trades = defaultdict(lambda: deque(maxlen=max_history))
+
+    def __next_id(self, prefix: str) -> str:
+        return "0x{}{:062x}".format(prefix, next(self.__ids))
+
+    def book(self, asset_id: str, market: str = "") -> OrderBook:
+        book = self.books.get(asset_id)
+        if book is None:
+            book = self.books[asset_id] = OrderBook(asset_id, market)
+        return book
+
+    def summary(self, asset_id: str) -> dict:
+        with self.__lock:
+            self.__expire(int(time.time()))
+            return self.book(asset_id).summary()
+
+    def best_prices(self, asset_id: str) -> tuple[Optional[int], Optional[int]]:
+        with self.__lock:
+            self.__expire(int(time.time()))
+            book = self.book(asset_id)
+            return book.bids.best(), book.asks.best()
+
+    def last_trade(self, asset_id: str) -> tuple[Optional[int], Optional[str]]:
+        with self.__lock:
+            book = self.book(asset_id)
+            return book.last_trade_price, book.last_trade_side
+
+    def place(
+        self,
+        owner: str,
+        maker_address: str,
+        asset_id: str,
+        side: str,
+        price: int,
+        size: int,
+        order_type: str = OrderType.GTC,
+        expiration: int = 0,
+        market: str = "",
+    ) -> tuple[Order, list[dict]]:
+        """
+        Matches an order, returns it with the trades it made
+        """
+        now = int(time.time())
+        with self.__lock:
+            self.__expire(now)
+            book = self.book(asset_id, market)
+            order = Order(
+                id=self.__next_id("0"),
+                owner=owner,
+                maker_address=maker_address,
+                asset_id=asset_id,
+                side=side,
+                price=price,
+                original_size=size,
+                order_type=order_type,
+                expiration=expiration,
+                created_at=now,
+            )
+            self.orders[order.id] = order
+            opposite = book.asks if side == BUY else book.bids
+
+            if order_type == OrderType.FOK and opposite.available(price) < size:
+                self.__close(order, UNMATCHED)
+                return order, []
+
+            trades = []
+            for level in opposite.crossing(price):
+                queue = opposite.levels[level]
+                while queue and order.remaining:
+                    trades.append(self.__fill(book, order, queue[0], now))
+                    if not queue[0].remaining:
+                        self.__close(queue[0], MATCHED)
+                        opposite.pop_front(level)
+                if not order.remaining:
+                    break
+
+            if not order.remaining:
+                self.__close(order, MATCHED)
+            elif order_type in (OrderType.FOK, OrderType.FAK):
+                self.__close(order, CANCELED if order.size_matched else UNMATCHED)
+            else:
+                (book.bids if side == BUY else book.asks).add(order)
+                self.__live[owner][asset_id][order.id] = order
+                if order_type == OrderType.GTD and expiration:
+                    heapq.heappush(self.__expirations, (expiration, order.id))
+            return order, trades
+
+    def __close(self, order: Order, status: str):
+        """
+        Sets the final status of an order, drops it from the live orders and forgets
+        the oldest closed ones past max_history
+        """
+        order.status = status
+        owner_orders = self.__live.get(order.owner)
+        if owner_orders is not None:
+            asset_orders = owner_orders.get(order.asset_id)
+            if asset_orders is not None:
+                asset_orders.pop(order.id, None)
+                if not asset_orders:
+                    del owner_orders[order.asset_id]
+            if not owner_orders:
+                del self.__live[order.owner]
+        self.__closed.append(order.id)
+        while len(self.__closed) > self.max_history:
+            self.orders.pop(self.__closed.popleft(), None)
+
+    def __expire(self, now: int):
+        while self.__expirations and self.__expirations[0][0] <= now:
+            _, order_id = heapq.heappop(self.__expirations)
+            order = self.orders.get(order_id)
+            if order is not None and order.status == LIVE:
+                self.__cancel(order)
+
+    def __live_orders(
+        self, owner: str, market: str = "", asset_id: str = ""
+    ) -> list[Order]:
+        """
+        The live orders of owner, oldest first
+        """
+        owner_orders = self.__live.get(owner, {})
+        asset_ids = [asset_id] if asset_id else list(owner_orders)
+        orders = [
+            order
+            for a in asset_ids
+            if a in owner_orders and (not market or self.books[a].market == market)
+            for order in owner_orders[a].values()
+        ]
+        # the ids are increasing
+        orders.sort(key=lambda order: order.id)
+        return orders
+
+    def __fill(self, book: OrderBook, taker: Order, maker: Order, now: int) -> dict:
+        size = min(taker.remaining, maker.remaining)
+        taker.size_matched += size
+        maker.size_matched += size
+        book.last_trade_price = maker.price
+        book.last_trade_side = taker.side
+
+        trade = {
+            "id": self.__next_id("1"),
+            "taker_order_id": taker.id,
+            "market": book.market,
+            "asset_id": book.asset_id,
+            "side": taker.side,
+            "size": from_units(size),
+            "fee_rate_bps": "0",
+            "price": from_units(maker.price),
+            "status": MATCHED,
+            "match_time": str(now),
+            "last_update": str(now),
+            "outcome": "",
+            "owner": taker.owner,
+            "maker_address": taker.maker_address,
+            "bucket_index": 0,
+            "transaction_hash": "",
+            "trader_side": "TAKER",
+            "maker_orders": [
+                {
+                    "order_id": maker.id,
+                    "owner": maker.owner,
+                    "maker_address": maker.maker_address,
+                    "matched_amount": from_units(size),
+                    "price": from_units(maker.price),
+                    "fee_rate_bps": "0",
+                    "asset_id": book.asset_id,
+                    "outcome": "",
+                    "side": maker.side,
+                }
+            ],
+        }
+        taker.associate_trades.append(trade["id"])
+        maker.associate_trades.append(trade["id"])
+        self.trades.append(trade)
+        self.__owner_trades[taker.owner].append(trade)
+        if maker.owner != taker.owner:
+            self.__owner_trades[maker.owner].append(trade)
+        self.__market_trades[book.market].append(trade)
+        return trade
+
+    def cancel(self, owner: str, order_ids) -> dict:
+        """
+        Cancels the live orders of owner, {"canceled": [...], "not_canceled": {id: reason}}
+        """
+        canceled = []
+        not_canceled = {}
+        with self.__lock:
+            for order_id in order_ids:
+                order = self.orders.get(order_id)
+                if order is None or order.owner != owner:
+                    not_canceled[order_id] = "order not found"
+                elif order.status != LIVE:
+                    not_canceled[order_id] = (
+                        "order can't be found - already canceled or matched"
+                    )
+                else:
+                    self.__cancel(order)
+                    canceled.append(order_id)
+        return {"canceled": canceled, "not_canceled": not_canceled}
+
+    def __cancel(self, order: Order):
+        book = self.books[order.asset_id]
+        (book.bids if order.side == BUY else book.asks).remove(order)
+        self.__close(order, CANCELED)
+
+    def cancel_all(self, owner: str, market: str = "", asset_id: str = "") -> dict:
+        """
+        Cancels every live order of owner, only those of market and asset_id if given
+        """
+        with self.__lock:
+            self.__expire(int(time.time()))
+            order_ids = [
+                order.id for order in self.__live_orders(owner, market, asset_id)
+            ]
+        return self.cancel(owner, order_ids)
+
+    def open_orders(
+        self, owner: str, market: str = "", asset_id: str = "", order_id: str = ""
+    ) -> list[dict]:
+        with self.__lock:
+            self.__expire(int(time.time()))
+            return [
+                order.to_json(self.books[order.asset_id].market)
+                for order in self.__live_orders(owner, market, asset_id)
+                if not order_id or order.id == order_id
+            ]
+
+    def get_order(self, owner: str, order_id: str) -> Optional[dict]:
+        with self.__lock:
+            self.__expire(int(time.time()))
+            order = self.orders.get(order_id)
+            if order is None or order.owner != owner:
+                return None
+            return order.to_json(self.books[order.asset_id].market)
+
+    def user_trades(
+        self,
+        owner: str,
+        market: str = "",
+        asset_id: str = "",
+        trade_id: str = "",
+        after: int = None,
+        before: int = None,
+    ) -> list[dict]:
+        """
+        The trades owner took part in, as taker or maker
+        """
+        with self.__lock:
+            return [
+                trade
+                for trade in self.__owner_trades.get(owner, ())
+                if (not market or trade["market"] == market)
+                and (not asset_id or trade["asset_id"] == asset_id)
+                and (not trade_id or trade["id"] == trade_id)
+                and (after is None or int(trade["match_time"]) > after)
+                and (before is None or int(trade["match_time"]) < before)
+            ]
+
+    def market_trades(self, market: str) -> list[dict]:
+        with self.__lock:
+            return list(self.__market_trades.get(market, ()))
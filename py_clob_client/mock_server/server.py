@@ -0,0 +1,709 @@
+import argparse
+import base64
+import hashlib
+import json
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional
+from urllib.parse import parse_qs, urlparse
+
+from eth_account import Account
+
+from ..clob_types import ApiCreds, OrderType
+from ..constants import AMOY, END_CURSOR
+from ..endpoints import (
+    ARE_ORDERS_SCORING,
+    CANCEL,
+    CANCEL_ALL,
+    CANCEL_MARKET_ORDERS,
+    CANCEL_ORDERS,
+    CLOSED_ONLY,
+    CREATE_API_KEY,
+    DELETE_API_KEY,
+    DERIVE_API_KEY,
+    DROP_NOTIFICATIONS,
+    GET_API_KEYS,
+    GET_BALANCE_ALLOWANCE,
+    GET_LAST_TRADE_PRICE,
+    GET_LAST_TRADES_PRICES,
+    GET_MARKET,
+    GET_MARKET_TRADES_EVENTS,
+    GET_MARKETS,
+    GET_NEG_RISK,
+    GET_NOTIFICATIONS,
+    GET_ORDER,
+    GET_ORDER_BOOK,
+    GET_ORDER_BOOKS,
+    GET_PRICES,
+    GET_SAMPLING_MARKETS,
+    GET_SAMPLING_SIMPLIFIED_MARKETS,
+    GET_SIMPLIFIED_MARKETS,
+    GET_SPREAD,
+    GET_SPREADS,
+    GET_TICK_SIZE,
+    IS_ORDER_SCORING,
+    MID_POINT,
+    MID_POINTS,
+    ORDERS,
+    POST_ORDER,
+    POST_ORDERS,
+    PRICE,
+    TIME,
+    TRADES,
+    UPDATE_BALANCE_ALLOWANCE,
+)
+from ..headers.headers import (
+    POLY_ADDRESS,
+    POLY_API_KEY,
+    POLY_NONCE,
+    POLY_PASSPHRASE,
+    POLY_SIGNATURE,
+    POLY_TIMESTAMP,
+)
+from ..order_builder.constants import BUY, SELL
+from ..signing.eip712 import get_clob_auth_hash
+from ..signing.hmac import HmacSigner
+from .engine import UNIT, MatchingEngine, from_units, to_units
+
+DEFAULT_TICK_SIZE = "0.01"
+DEFAULT_PAGE_SIZE = 100
+DEFAULT_MAX_CLOCK_SKEW = 300
+
+# authentication levels of the routes
+L0 = 0
+L1 = 1
+L2 = 2
+
+SIMPLIFIED_FIELDS = (
+    "condition_id",
+    "tokens",
+    "rewards",
+    "active",
+    "closed",
+    "archived",
+    "accepting_orders",
+)
+
+
+class _HttpError(Exception):
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+class _Request:
+    __slots__ = ("method", "path", "query", "headers", "raw_body", "body", "api_key")
+
+    def __init__(self, method, path, query, headers, raw_body):
+        self.method = method
+        self.path = path
+        self.query = query
+        self.headers = headers
+        self.raw_body = raw_body
+        self.body = json.loads(raw_body) if raw_body else None
+        self.api_key = None
+
+
+def encode_cursor(offset: int) -> str:
+    return base64.b64encode(str(offset).encode()).decode()
+
+
+def decode_cursor(cursor: Optional[str]) -> int:
+    if not cursor:
+        return 0
+    try:
+        return int(base64.b64decode(cursor).decode())
+    except ValueError:
+        raise _HttpError(400, "invalid next_cursor")
+
+
+def paginate(records: list, cursor: Optional[str], page_size: int) -> dict:
+    """
+    A page of records in the CLOB format, the cursors encode the offset as base64
+    """
+    offset = decode_cursor(cursor)
+    if offset < 0:
+        offset = len(records)
+    data = records[offset : offset + page_size]
+    end = offset + len(data)
+    return {
+        "limit": page_size,
+        "count": len(data),
+        "next_cursor": encode_cursor(end) if end < len(records) else END_CURSOR,
+        "data": data,
+    }
+
+
+def derive_api_creds(address: str, nonce: int) -> ApiCreds:
+    """
+    The credentials the server derives for an address and nonce
+    """
+    seed = hashlib.sha256("{}:{}".format(address.lower(), nonce).encode()).digest()
+    return ApiCreds(
+        api_key=str(uuid.UUID(bytes=seed[:16])),
+        api_secret=base64.urlsafe_b64encode(seed).decode(),
+        api_passphrase=hashlib.sha256(seed).hexdigest(),
+    )
+
+
+class MockClobServer:
+    """
+    Local stand-in for the CLOB, for end-to-end tests and load tests of the clients
+
+    Serves the routes of endpoints.py over HTTP/1.1 keep-alive connections, checks the
+    L1 headers (ClobAuth signatures) and the L2 headers (api key, passphrase and hmac)
+    with the signing code of the clients, and matches the posted orders in an in-memory
+    MatchingEngine. The order signatures are not verified.
+
+    markets: the get_markets records, their tokens' tick sizes and neg risk flags are
+    served by /tick-size and /neg-risk, the other tokens have DEFAULT_TICK_SIZE
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        chain_id: int = AMOY,
+        markets: list[dict] = None,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        max_clock_skew: Optional[int] = DEFAULT_MAX_CLOCK_SKEW,
+    ):
+        self.chain_id = chain_id
+        self.page_size = page_size
+        self.max_clock_skew = max_clock_skew
+        self.engine = MatchingEngine()
+        self.__lock = threading.Lock()
+        # api key -> (address, ApiCreds)
+        self.api_keys = {}
+        self.markets = []
+        self.__markets = {}
+        self.__tokens = {}
+        for market in markets or ():
+            self.add_market(market)
+
+        self.__routes = {
+            ("GET", "/"): (L0, lambda r: "OK"),
+            ("GET", TIME): (L0, lambda r: int(time.time())),
+            ("POST", CREATE_API_KEY): (L1, self.__create_api_key),
+            ("GET", DERIVE_API_KEY): (L1, self.__derive_api_key),
+            ("GET", GET_API_KEYS): (L2, self.__get_api_keys),
+            ("DELETE", DELETE_API_KEY): (L2, self.__delete_api_key),
+            ("GET", CLOSED_ONLY): (L2, lambda r: {"closed_only": False}),
+            ("GET", GET_TICK_SIZE): (L0, self.__get_tick_size),
+            ("GET", GET_NEG_RISK): (L0, self.__get_neg_risk),
+            ("GET", GET_ORDER_BOOK): (L0, self.__get_book),
+            ("POST", GET_ORDER_BOOKS): (L0, self.__get_books),
+            ("GET", MID_POINT): (L0, self.__get_midpoint),
+            ("POST", MID_POINTS): (L0, self.__get_midpoints),
+            ("GET", PRICE): (L0, self.__get_price),
+            ("POST", GET_PRICES): (L0, self.__get_prices),
+            ("GET", GET_SPREAD): (L0, self.__get_spread),
+            ("POST", GET_SPREADS): (L0, self.__get_spreads),
+            ("GET", GET_LAST_TRADE_PRICE): (L0, self.__get_last_trade_price),
+            ("POST", GET_LAST_TRADES_PRICES): (L0, self.__get_last_trades_prices),
+            ("POST", POST_ORDER): (L2, self.__post_order),
+            ("POST", POST_ORDERS): (L2, self.__post_orders),
+            ("DELETE", CANCEL): (L2, self.__cancel),
+            ("DELETE", CANCEL_ORDERS): (L2, self.__cancel_orders),
+            ("DELETE", CANCEL_ALL): (L2, self.__cancel_all),
+            ("DELETE", CANCEL_MARKET_ORDERS): (L2, self.__cancel_market_orders),
+            ("GET", ORDERS): (L2, self.__get_orders),
+            ("GET", TRADES): (L2, self.__get_trades),
+            ("GET", GET_NOTIFICATIONS): (L2, lambda r: []),
+            ("DELETE", DROP_NOTIFICATIONS): (L2, lambda r: None),
+            ("GET", GET_BALANCE_ALLOWANCE): (L2, self.__get_balance_allowance),
+            ("GET", UPDATE_BALANCE_ALLOWANCE): (L2, lambda r: None),
+            ("GET", IS_ORDER_SCORING): (L2, lambda r: {"scoring": False}),
+            ("POST", ARE_ORDERS_SCORING): (L2, self.__are_orders_scoring),
+            ("GET", GET_MARKETS): (L0, self.__markets_page(False)),
+            ("GET", GET_SIMPLIFIED_MARKETS): (L0, self.__markets_page(True)),
+            ("GET", GET_SAMPLING_MARKETS): (L0, self.__markets_page(False)),
+            ("GET", GET_SAMPLING_SIMPLIFIED_MARKETS): (L0, self.__markets_page(True)),
+        }
+        # routes ending with an id
+        self.__prefix_routes = (
+            ("GET", GET_ORDER, L2, self.__get_order),
+            ("GET", GET_MARKET, L0, self.__get_market),
+            ("GET", GET_MARKET_TRADES_EVENTS, L0, self.__get_market_trades_events),
+        )
+
+        self._server = ThreadingHTTPServer((host, port), self._handler())
+        self._server.daemon_threads = True
+        self.host = "http://{}:{}".format(host, self._server.server_port)
+        self._thread = None
+
+    def add_market(self, market: dict):
+        """
+        Adds a get_markets record, i.e. {"condition_id": ..., "tokens": [{"token_id": ...}],
+        "minimum_tick_size": 0.01, "neg_risk": False}
+        """
+        with self.__lock:
+            self.markets.append(market)
+            self.__markets[market["condition_id"]] = market
+            for token in market.get("tokens") or ():
+                self.__tokens[token["token_id"]] = market
+                self.engine.book(token["token_id"], market["condition_id"])
+
+    def __market_of(self, token_id: str) -> Optional[dict]:
+        return self.__tokens.get(token_id)
+
+    def tick_size(self, token_id: str) -> str:
+        market = self.__market_of(token_id)
+        if market is None or market.get("minimum_tick_size") is None:
+            return DEFAULT_TICK_SIZE
+        return str(market["minimum_tick_size"])
+
+    def neg_risk(self, token_id: str) -> bool:
+        market = self.__market_of(token_id)
+        return bool(market and market.get("neg_risk"))
+
+    def start(self) -> "MockClobServer":
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def serve_forever(self):
+        self._server.serve_forever()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *args):
+        self.stop()
+
+    def _handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            # the headers and the body are separate writes, not delayed by Nagle
+            disable_nagle_algorithm = True
+
+            def _handle(self):
+                url = urlparse(self.path)
+                length = int(self.headers.get("Content-Length", 0))
+                raw = self.rfile.read(length) if length else b""
+                try:
+                    request = _Request(
+                        self.command,
+                        url.path,
+                        {k: v[0] for k, v in parse_qs(url.query).items()},
+                        self.headers,
+                        raw,
+                    )
+                    status, payload = 200, server.handle(request)
+                except _HttpError as e:
+                    status, payload = e.status, {"error": e.message}
+                except (ValueError, KeyError, TypeError) as e:
+                    status, payload = 400, {"error": "invalid request: {!r}".format(e)}
+
+                body = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            do_GET = _handle
+            do_POST = _handle
+            do_DELETE = _handle
+            do_PUT = _handle
+
+            def log_message(self, *args):
+                pass
+
+        return Handler
+
+    def handle(self, request: _Request):
+        """
+        The payload of the response to request, raises _HttpError
+        """
+        route = self.__routes.get((request.method, request.path))
+        if route is None:
+            for method, prefix, level, fn in self.__prefix_routes:
+                if (
+                    request.method == method
+                    and request.path.startswith(prefix)
+                    and len(request.path) > len(prefix)
+                ):
+                    route = (level, fn)
+                    break
+        if route is None:
+            raise _HttpError(404, "not found")
+
+        level, fn = route
+        if level == L1:
+            self.__check_level_1(request)
+        elif level == L2:
+            self.__check_level_2(request)
+        return fn(request)
+
+    def __check_timestamp(self, timestamp: str):
+        if self.max_clock_skew is not None and (
+            abs(time.time() - int(timestamp)) > self.max_clock_skew
+        ):
+            raise _HttpError(401, "Unauthorized/Invalid api key")
+
+    def __check_level_1(self, request: _Request):
+        headers = request.headers
+        try:
+            address = headers[POLY_ADDRESS]
+            signature = headers[POLY_SIGNATURE]
+            timestamp = headers[POLY_TIMESTAMP]
+            nonce = int(headers.get(POLY_NONCE) or 0)
+        except (KeyError, TypeError, ValueError):
+            raise _HttpError(401, "Invalid L1 Request headers")
+        if address is None or signature is None or timestamp is None:
+            raise _HttpError(401, "Invalid L1 Request headers")
+        self.__check_timestamp(timestamp)
+
+        auth_hash = get_clob_auth_hash(address, self.chain_id, int(timestamp), nonce)
+        try:
+            signer = Account._recover_hash(
+                bytes.fromhex(auth_hash[2:]), signature=signature
+            )
+        except Exception:
+            raise _HttpError(401, "Invalid L1 Request headers")
+        if signer.lower() != address.lower():
+            raise _HttpError(401, "Invalid L1 Request headers")
+
+    def __check_level_2(self, request: _Request):
+        headers = request.headers
+        api_key = headers.get(POLY_API_KEY)
+        timestamp = headers.get(POLY_TIMESTAMP)
+        signature = headers.get(POLY_SIGNATURE)
+        with self.__lock:
+            entry = self.api_keys.get(api_key)
+        if entry is None or timestamp is None or signature is None:
+            raise _HttpError(401, "Unauthorized/Invalid api key")
+        address, creds = entry
+        if (
+            headers.get(POLY_PASSPHRASE) != creds.api_passphrase
+            or (headers.get(POLY_ADDRESS) or "").lower() != address.lower()
+        ):
+            raise _HttpError(401, "Unauthorized/Invalid api key")
+        self.__check_timestamp(timestamp)
+
+        expected = HmacSigner(creds.api_secret).sign(
+            timestamp, request.method, request.path, request.raw_body or None
+        )
+        if signature != expected:
+            raise _HttpError(401, "Unauthorized/Invalid api key")
+        request.api_key = api_key
+
+    # auth
+
+    def __api_creds(self, request: _Request, create: bool) -> dict:
+        address = request.headers[POLY_ADDRESS]
+        creds = derive_api_creds(address, int(request.headers.get(POLY_NONCE) or 0))
+        with self.__lock:
+            exists = creds.api_key in self.api_keys
+            if create and exists:
+                raise _HttpError(400, "Could not create api key")
+            if not create and not exists:
+                raise _HttpError(400, "Could not derive api key!")
+            self.api_keys[creds.api_key] = (address, creds)
+        return {
+            "apiKey": creds.api_key,
+            "secret": creds.api_secret,
+            "passphrase": creds.api_passphrase,
+        }
+
+    def __create_api_key(self, request: _Request) -> dict:
+        return self.__api_creds(request, create=True)
+
+    def __derive_api_key(self, request: _Request) -> dict:
+        return self.__api_creds(request, create=False)
+
+    def __address(self, request: _Request) -> str:
+        with self.__lock:
+            return self.api_keys[request.api_key][0]
+
+    def __get_api_keys(self, request: _Request) -> dict:
+        address = self.__address(request).lower()
+        with self.__lock:
+            keys = [k for k, (a, _) in self.api_keys.items() if a.lower() == address]
+        return {"apiKeys": keys}
+
+    def __delete_api_key(self, request: _Request) -> str:
+        with self.__lock:
+            self.api_keys.pop(request.api_key, None)
+        return "OK"
+
+    # market data
+
+    def __get_tick_size(self, request: _Request) -> dict:
+        return {"minimum_tick_size": float(self.tick_size(request.query["token_id"]))}
+
+    def __get_neg_risk(self, request: _Request) -> dict:
+        return {"neg_risk": self.neg_risk(request.query["token_id"])}
+
+    def __get_book(self, request: _Request) -> dict:
+        return self.engine.summary(request.query["token_id"])
+
+    def __get_books(self, request: _Request) -> list:
+        return [self.engine.summary(p["token_id"]) for p in request.body]
+
+    def __midpoint(self, token_id: str) -> Optional[str]:
+        bid, ask = self.engine.best_prices(token_id)
+        if bid is None or ask is None:
+            return None
+        return from_units((bid + ask) // 2)
+
+    def __get_midpoint(self, request: _Request) -> dict:
+        mid = self.__midpoint(request.query["token_id"])
+        if mid is None:
+            raise _HttpError(404, "No orderbook exists for the requested token id")
+        return {"mid": mid}
+
+    def __get_midpoints(self, request: _Request) -> dict:
+        mids = {p["token_id"]: self.__midpoint(p["token_id"]) for p in request.body}
+        return {token_id: mid for token_id, mid in mids.items() if mid is not None}
+
+    def __price(self, token_id: str, side: str) -> Optional[str]:
+        """
+        The best bid for BUY, the best ask for SELL
+        """
+        bid, ask = self.engine.best_prices(token_id)
+        price = bid if side == BUY else ask
+        return from_units(price) if price is not None else None
+
+    def __get_price(self, request: _Request) -> dict:
+        if request.query.get("side") not in (BUY, SELL):
+            raise _HttpError(400, "Invalid side")
+        price = self.__price(request.query["token_id"], request.query["side"])
+        if price is None:
+            raise _HttpError(404, "No orderbook exists for the requested token id")
+        return {"price": price}
+
+    def __get_prices(self, request: _Request) -> dict:
+        prices = {}
+        for p in request.body:
+            price = self.__price(p["token_id"], p["side"])
+            if price is not None:
+                prices.setdefault(p["token_id"], {})[p["side"]] = price
+        return prices
+
+    def __spread(self, token_id: str) -> Optional[str]:
+        bid, ask = self.engine.best_prices(token_id)
+        if bid is None or ask is None:
+            return None
+        return from_units(ask - bid)
+
+    def __get_spread(self, request: _Request) -> dict:
+        spread = self.__spread(request.query["token_id"])
+        if spread is None:
+            raise _HttpError(404, "No orderbook exists for the requested token id")
+        return {"spread": spread}
+
+    def __get_spreads(self, request: _Request) -> dict:
+        spreads = {p["token_id"]: self.__spread(p["token_id"]) for p in request.body}
+        return {token_id: s for token_id, s in spreads.items() if s is not None}
+
+    def __last_trade_price(self, token_id: str) -> dict:
+        price, side = self.engine.last_trade(token_id)
+        return {
+            "price": from_units(price) if price is not None else "0.5",
+            "side": side or "",
+        }
+
+    def __get_last_trade_price(self, request: _Request) -> dict:
+        return self.__last_trade_price(request.query["token_id"])
+
+    def __get_last_trades_prices(self, request: _Request) -> list:
+        return [
+            {"token_id": p["token_id"], **self.__last_trade_price(p["token_id"])}
+            for p in request.body
+        ]
+
+    def __markets_page(self, simplified: bool):
+        def get_page(request: _Request) -> dict:
+            with self.__lock:
+                markets = list(self.markets)
+            if simplified:
+                markets = [
+                    {f: m[f] for f in SIMPLIFIED_FIELDS if f in m} for m in markets
+                ]
+            return paginate(markets, request.query.get("next_cursor"), self.page_size)
+
+        return get_page
+
+    def __get_market(self, request: _Request) -> dict:
+        market = self.__markets.get(request.path[len(GET_MARKET) :])
+        if market is None:
+            raise _HttpError(404, "market not found")
+        return market
+
+    def __get_market_trades_events(self, request: _Request) -> list:
+        return self.engine.market_trades(request.path[len(GET_MARKET_TRADES_EVENTS) :])
+
+    # orders
+
+    def __place(self, request: _Request, payload: dict) -> dict:
+        """
+        Matches a posted order, raises _HttpError if it is rejected
+        """
+        if payload.get("owner") != request.api_key:
+            raise _HttpError(400, "the order owner has to be the owner of the API KEY")
+        order = payload["order"]
+        order_type = payload.get("orderType") or OrderType.GTC
+        if order_type not in (
+            OrderType.GTC,
+            OrderType.FOK,
+            OrderType.GTD,
+            OrderType.FAK,
+        ):
+            raise _HttpError(400, "invalid order type")
+        address = self.__address(request)
+        if str(order["signer"]).lower() != address.lower():
+            raise _HttpError(
+                400, "the order signer address has to be the address of the API KEY"
+            )
+
+        token_id = str(order["tokenId"])
+        side = order["side"]
+        maker_amount = int(order["makerAmount"])
+        taker_amount = int(order["takerAmount"])
+        if side not in (BUY, SELL) or maker_amount <= 0 or taker_amount <= 0:
+            raise _HttpError(400, "invalid order")
+        if side == BUY:
+            size, cost = taker_amount, maker_amount
+        else:
+            size, cost = maker_amount, taker_amount
+
+        tick_size = self.tick_size(token_id)
+        tick = to_units(tick_size)
+        ticks = cost * UNIT / size / tick
+        price = round(ticks) * tick
+        # the amounts of market orders are rounded, their price is only close to a tick
+        if abs(ticks - round(ticks)) > 0.01 or not tick <= price <= UNIT - tick:
+            raise _HttpError(
+                400,
+                "INVALID_ORDER_MIN_TICK_SIZE: invalid price ({}), min: {} - max: {}".format(
+                    from_units(round(cost * UNIT / size)),
+                    tick_size,
+                    from_units(UNIT - tick),
+                ),
+            )
+
+        market = self.__market_of(token_id)
+        placed, trades = self.engine.place(
+            owner=request.api_key,
+            maker_address=order["maker"],
+            asset_id=token_id,
+            side=side,
+            price=price,
+            size=size,
+            order_type=order_type,
+            expiration=int(order.get("expiration") or 0),
+            market=market["condition_id"] if market else "",
+        )
+        matched = placed.size_matched
+        matched_cost = sum(
+            to_units(t["price"]) * to_units(t["size"]) // UNIT for t in trades
+        )
+        making, taking = (
+            (matched_cost, matched) if side == BUY else (matched, matched_cost)
+        )
+        return {
+            "success": True,
+            "errorMsg": "",
+            "orderID": placed.id,
+            "status": placed.status.lower(),
+            "makingAmount": from_units(making),
+            "takingAmount": from_units(taking),
+            "transactionsHashes": [],
+            "tradeIDs": [t["id"] for t in trades],
+        }
+
+    def __post_order(self, request: _Request) -> dict:
+        return self.__place(request, request.body)
+
+    def __post_orders(self, request: _Request) -> list:
+        responses = []
+        for payload in request.body:
+            try:
+                responses.append(self.__place(request, payload))
+            except _HttpError as e:
+                responses.append(
+                    {"success": False, "errorMsg": e.message, "orderID": ""}
+                )
+        return responses
+
+    def __cancel(self, request: _Request) -> dict:
+        return self.engine.cancel(request.api_key, [request.body["orderID"]])
+
+    def __cancel_orders(self, request: _Request) -> dict:
+        return self.engine.cancel(request.api_key, request.body)
+
+    def __cancel_all(self, request: _Request) -> dict:
+        return self.engine.cancel_all(request.api_key)
+
+    def __cancel_market_orders(self, request: _Request) -> dict:
+        body = request.body or {}
+        return self.engine.cancel_all(
+            request.api_key, body.get("market") or "", body.get("asset_id") or ""
+        )
+
+    def __get_orders(self, request: _Request) -> dict:
+        query = request.query
+        orders = self.engine.open_orders(
+            request.api_key,
+            query.get("market", ""),
+            query.get("asset_id", ""),
+            query.get("id", ""),
+        )
+        return paginate(orders, query.get("next_cursor"), self.page_size)
+
+    def __get_order(self, request: _Request) -> dict:
+        order = self.engine.get_order(request.api_key, request.path[len(GET_ORDER) :])
+        if order is None:
+            raise _HttpError(404, "order not found")
+        return order
+
+    def __get_trades(self, request: _Request) -> dict:
+        query = request.query
+        trades = self.engine.user_trades(
+            request.api_key,
+            query.get("market", ""),
+            query.get("asset_id", ""),
+            query.get("id", ""),
+            int(query["after"]) if query.get("after") else None,
+            int(query["before"]) if query.get("before") else None,
+        )
+        return paginate(trades, query.get("next_cursor"), self.page_size)
+
+    def __get_balance_allowance(self, request: _Request) -> dict:
+        return {"balance": str(10**15), "allowance": str(10**15)}
+
+    def __are_orders_scoring(self, request: _Request) -> dict:
+        return {order_id: False for order_id in request.body or ()}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local mock CLOB server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--chain-id", type=int, default=AMOY)
+    parser.add_argument("--page-size", type=int, default=DEFAULT_PAGE_SIZE)
+    args = parser.parse_args()
+
+    server = MockClobServer(
+        args.host, args.port, args.chain_id, page_size=args.page_size
+    )
+    print("mock CLOB listening on {}".format(server.host))
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
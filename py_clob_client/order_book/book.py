@@ -0,0 +1,161 @@
+from array import array
+from bisect import bisect_left
+from typing import Union
+
+from ..clob_types import OrderBookSummary, OrderSummary, OrderType
+from ..order_builder.constants import BUY, SELL
+from ..utilities import format_number
+from .compact import CompactOrderBookSummary
+from .depth import DepthIndex
+
+
+def _level(level) -> tuple[float, float]:
+    if isinstance(level, OrderSummary):
+        return float(level.price), float(level.size)
+    return float(level["price"]), float(level["size"])
+
+
+def _columns(levels) -> tuple[array, array]:
+    """
+    Price and size columns of a list of levels, sorted by ascending price
+    """
+    pairs = sorted(_level(level) for level in levels or ())
+    return array("d", [p for p, _ in pairs]), array("d", [s for _, s in pairs])
+
+
+class LocalOrderBook:
+    """
+    Order book of a single token, kept locally
+
+    Each side is stored as a pair of price and size columns sorted by ascending price,
+    so level updates are a binary search plus an array insert or delete and the best
+    bid and ask are the last bid and the first ask
+    """
+
+    def __init__(self, asset_id: str, market: str = None):
+        self.asset_id = asset_id
+        self.market = market
+        self.timestamp = None
+        self.hash = None
+
+        self.bid_prices = array("d")
+        self.bid_sizes = array("d")
+        self.ask_prices = array("d")
+        self.ask_sizes = array("d")
+
+        # DepthIndex per side, dropped on every change
+        self.__depths = {}
+
+    @classmethod
+    def from_summary(
+        cls, summary: Union[OrderBookSummary, CompactOrderBookSummary]
+    ) -> "LocalOrderBook":
+        book = cls(summary.asset_id, summary.market)
+        if isinstance(summary, CompactOrderBookSummary):
+            # already in columns, bids ascending and asks descending
+            book.bid_prices = array("d", summary.bid_prices)
+            book.bid_sizes = array("d", summary.bid_sizes)
+            book.ask_prices = array("d", reversed(summary.ask_prices))
+            book.ask_sizes = array("d", reversed(summary.ask_sizes))
+            book.timestamp = summary.timestamp
+            book.hash = summary.hash
+            book.__depths.clear()
+        else:
+            book.set_levels(summary.bids, summary.asks, summary.timestamp, summary.hash)
+        return book
+
+    def set_levels(self, bids, asks, timestamp: str = None, hash: str = None):
+        """
+        Replaces every level with a snapshot
+        bids and asks are lists of OrderSummary or of {"price": ..., "size": ...} dicts
+        """
+        self.bid_prices, self.bid_sizes = _columns(bids)
+        self.ask_prices, self.ask_sizes = _columns(asks)
+        self.timestamp = timestamp
+        self.hash = hash
+        self.__depths.clear()
+
+    def set_level(self, side: str, price: float, size: float):
+        """
+        Sets the size resting at a price level, a size of 0 removes the level
+        side is BUY for bids and SELL for asks
+        """
+        if side == BUY:
+            prices, sizes = self.bid_prices, self.bid_sizes
+        elif side == SELL:
+            prices, sizes = self.ask_prices, self.ask_sizes
+        else:
+            raise ValueError(f"side must be '{BUY}' or '{SELL}'")
+
+        self.__depths.clear()
+        i = bisect_left(prices, price)
+        if i < len(prices) and prices[i] == price:
+            if size > 0:
+                sizes[i] = size
+            else:
+                del prices[i]
+                del sizes[i]
+        elif size > 0:
+            prices.insert(i, price)
+            sizes.insert(i, size)
+
+    def best_bid(self) -> float:
+        return self.bid_prices[-1] if self.bid_prices else None
+
+    def best_ask(self) -> float:
+        return self.ask_prices[0] if self.ask_prices else None
+
+    def midpoint(self) -> float:
+        if not self.bid_prices or not self.ask_prices:
+            return None
+        return (self.bid_prices[-1] + self.ask_prices[0]) / 2
+
+    def spread(self) -> float:
+        if not self.bid_prices or not self.ask_prices:
+            return None
+        return self.ask_prices[0] - self.bid_prices[-1]
+
+    def depth(self, side: str) -> DepthIndex:
+        """
+        DepthIndex of the side a market order on `side` walks, built once per state of the book
+        """
+        side = BUY if side == BUY else SELL
+        depth = self.__depths.get(side)
+        if depth is None:
+            if side == BUY:
+                depth = DepthIndex(BUY, self.ask_prices, self.ask_sizes)
+            else:
+                depth = DepthIndex(
+                    SELL, reversed(self.bid_prices), reversed(self.bid_sizes)
+                )
+            self.__depths[side] = depth
+        return depth
+
+    def calculate_market_price(
+        self, side: str, amount: float, order_type: OrderType
+    ) -> float:
+        """
+        Calculates the matching price of a market order, as OrderBuilder.calculate_buy_market_price
+        and calculate_sell_market_price do: BUY amounts are in collateral, SELL amounts in shares
+        """
+        return self.depth(side).market_price(amount, order_type)
+
+    def to_summary(self) -> OrderBookSummary:
+        """
+        OrderBookSummary of the book, levels ordered as the server sends them:
+        bids by ascending price and asks by descending price
+        """
+        return OrderBookSummary(
+            market=self.market,
+            asset_id=self.asset_id,
+            timestamp=self.timestamp,
+            bids=[
+                OrderSummary(price=format_number(p), size=format_number(s))
+                for p, s in zip(self.bid_prices, self.bid_sizes)
+            ],
+            asks=[
+                OrderSummary(price=format_number(p), size=format_number(s))
+                for p, s in zip(reversed(self.ask_prices), reversed(self.ask_sizes))
+            ],
+            hash=self.hash,
+        )
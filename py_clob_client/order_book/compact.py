@@ -0,0 +1,184 @@
+from array import array
+from dataclasses import dataclass, field
+from functools import cached_property
+
+from json import dumps, loads
+from json.encoder import encode_basestring_ascii
+
+from ..clob_types import (
+    ORDER_BOOK_SUMMARY_JSON,
+    ORDER_SUMMARY_JSON,
+    OrderBookSummary,
+    OrderSummary,
+)
+from ..order_builder.constants import BUY, SELL
+from ..utilities import format_number
+from .depth import DepthIndex
+
+
+_COLUMNS = frozenset(("bid_prices", "bid_sizes", "ask_prices", "ask_sizes"))
+
+
+def _column(levels: list[dict], key: str) -> array:
+    return array("d", [float(level[key]) for level in levels])
+
+
+def _levels_json(prices: array, sizes: array) -> str:
+    # shortest float strings never need escaping, and only the trailing .0 of a
+    # float's repr can be followed by a quote
+    return (
+        "["
+        + ",".join(
+            ['{"price":"%r","size":"%r"}' % level for level in zip(prices, sizes)]
+        ).replace('.0"', '"')
+        + "]"
+    )
+
+
+def _raw_levels_json(levels: list[dict]) -> str:
+    """
+    Compact json of raw levels, as clob_types._levels_json of their OrderSummary
+    """
+    try:
+        return (
+            "["
+            + ",".join(
+                [
+                    ORDER_SUMMARY_JSON
+                    % (
+                        encode_basestring_ascii(level["price"]),
+                        encode_basestring_ascii(level["size"]),
+                    )
+                    for level in levels
+                ]
+            )
+            + "]"
+        )
+    except TypeError:
+        # prices or sizes which are not strings
+        return dumps(
+            [{"price": level["price"], "size": level["size"]} for level in levels],
+            separators=(",", ":"),
+        )
+
+
+def _levels(prices: array, sizes: array) -> list[OrderSummary]:
+    return [
+        OrderSummary(price=format_number(p), size=format_number(s))
+        for p, s in zip(prices, sizes)
+    ]
+
+
+@dataclass
+class CompactOrderBookSummary:
+    """
+    Order book summary holding its levels as contiguous price and size float columns,
+    in the order the server sends them: bids by ascending price, asks by descending price
+
+    The per level OrderSummary lists of `bids` and `asks` are only built if accessed.
+    A summary built with from_raw keeps the json of the server's levels, one string per
+    side, so `bids`, `asks` and `json` use its price and size strings as sent, otherwise
+    their shortest string form. The DepthIndex of each side is built once per snapshot,
+    and dropped along with the server's levels and the built `bids` and `asks` if a
+    column is replaced
+    """
+
+    market: str = None
+    asset_id: str = None
+    timestamp: str = None
+    hash: str = None
+    bid_prices: array = field(default_factory=lambda: array("d"))
+    bid_sizes: array = field(default_factory=lambda: array("d"))
+    ask_prices: array = field(default_factory=lambda: array("d"))
+    ask_sizes: array = field(default_factory=lambda: array("d"))
+
+    def __setattr__(self, name, value):
+        super().__setattr__(name, value)
+        if name in _COLUMNS:
+            # DepthIndex per side, built from the columns
+            self.__depths = {}
+            # json of the levels as sent by the server, see from_raw
+            self.__bids_json = None
+            self.__asks_json = None
+            # and the levels built from either
+            self.__dict__.pop("bids", None)
+            self.__dict__.pop("asks", None)
+
+    @classmethod
+    def from_raw(cls, raw_obs: dict) -> "CompactOrderBookSummary":
+        bids = raw_obs["bids"] or []
+        asks = raw_obs["asks"] or []
+        book = cls(
+            market=raw_obs["market"],
+            asset_id=raw_obs["asset_id"],
+            timestamp=raw_obs["timestamp"],
+            hash=raw_obs["hash"],
+            bid_prices=_column(bids, "price"),
+            bid_sizes=_column(bids, "size"),
+            ask_prices=_column(asks, "price"),
+            ask_sizes=_column(asks, "size"),
+        )
+        book.__bids_json = _raw_levels_json(bids)
+        book.__asks_json = _raw_levels_json(asks)
+        return book
+
+    @cached_property
+    def bids(self) -> list[OrderSummary]:
+        if self.__bids_json is not None:
+            return [OrderSummary(**level) for level in loads(self.__bids_json)]
+        return _levels(self.bid_prices, self.bid_sizes)
+
+    @cached_property
+    def asks(self) -> list[OrderSummary]:
+        if self.__asks_json is not None:
+            return [OrderSummary(**level) for level in loads(self.__asks_json)]
+        return _levels(self.ask_prices, self.ask_sizes)
+
+    @property
+    def json(self):
+        """
+        Compact json of the summary, as OrderBookSummary.json
+        Levels are the server's if kept, with its price and size strings, so the json and its
+        hash match the server's, otherwise from the columns in their shortest form
+        """
+        if self.__bids_json is not None:
+            bids, asks = self.__bids_json, self.__asks_json
+        else:
+            bids = _levels_json(self.bid_prices, self.bid_sizes)
+            asks = _levels_json(self.ask_prices, self.ask_sizes)
+        return ORDER_BOOK_SUMMARY_JSON % (
+            dumps(self.market),
+            dumps(self.asset_id),
+            dumps(self.timestamp),
+            bids,
+            asks,
+            dumps(self.hash),
+        )
+
+    def depth(self, side: str) -> DepthIndex:
+        """
+        DepthIndex of the side a market order on `side` walks, built once per snapshot
+        """
+        side = BUY if side == BUY else SELL
+        depth = self.__depths.get(side)
+        if depth is None:
+            if side == BUY:
+                depth = DepthIndex(
+                    BUY, reversed(self.ask_prices), reversed(self.ask_sizes)
+                )
+            else:
+                depth = DepthIndex(
+                    SELL, reversed(self.bid_prices), reversed(self.bid_sizes)
+                )
+            self.__depths[side] = depth
+        return depth
+
+    def to_summary(self) -> OrderBookSummary:
+        return OrderBookSummary(
+            market=self.market,
+            asset_id=self.asset_id,
+            timestamp=self.timestamp,
+            bids=self.bids,
+            asks=self.asks,
+            hash=self.hash,
+        )
@@ -0,0 +1,117 @@
+from array import array
+from bisect import bisect_left
+from itertools import accumulate
+from operator import mul
+from typing import Iterable
+
+from ..clob_types import MarketImpact, OrderBookSummary, OrderType
+from ..order_builder.constants import BUY
+
+
+class DepthIndex:
+    """
+    Cumulative depth of one side of a book snapshot, levels ordered best first
+
+    Holds the prefix sums of the level sizes and notionals so a market order of any
+    amount is priced with a binary search instead of a walk over the levels.
+    BUY orders walk the asks and are sized in collateral, SELL orders walk the bids
+    and are sized in shares, as in OrderBuilder.calculate_buy_market_price and
+    calculate_sell_market_price
+    """
+
+    def __init__(self, side: str, prices: Iterable[float], sizes: Iterable[float]):
+        self.side = side
+        self.prices = array("d", prices)
+        self.sizes = array("d", sizes)
+        if len(self.prices) != len(self.sizes):
+            raise ValueError("prices and sizes must have the same length")
+
+        # summed best first, in the same order as the linear walk
+        self.cum_sizes = array("d", accumulate(self.sizes))
+        self.cum_notionals = array("d", accumulate(map(mul, self.sizes, self.prices)))
+        self.__cum_amounts = self.cum_notionals if side == BUY else self.cum_sizes
+
+    @classmethod
+    def from_summary(cls, summary: OrderBookSummary, side: str) -> "DepthIndex":
+        """
+        Depth of the side of an OrderBookSummary a market order on `side` walks
+        """
+        positions = (summary.asks if side == BUY else summary.bids) or ()
+        # the server sends the best level last
+        return cls(
+            side,
+            [float(p.price) for p in reversed(positions)],
+            [float(p.size) for p in reversed(positions)],
+        )
+
+    def __len__(self) -> int:
+        return len(self.prices)
+
+    def market_price(self, amount: float, order_type: OrderType) -> float:
+        """
+        Price of the deepest level needed to fill amount
+        If the book is too thin, raises for FOK orders and returns the worst price otherwise
+        """
+        if not self.prices:
+            raise Exception("no match")
+
+        i = bisect_left(self.__cum_amounts, amount)
+        if i < len(self.prices):
+            return self.prices[i]
+
+        if order_type == OrderType.FOK:
+            raise Exception("no match")
+
+        return self.prices[-1]
+
+    def market_prices(
+        self, amounts: Iterable[float], order_type: OrderType
+    ) -> list[float]:
+        """
+        market_price of every amount
+        """
+        return [self.market_price(amount, order_type) for amount in amounts]
+
+    def impact(self, amount: float) -> MarketImpact:
+        """
+        Fill, average price and slippage of a market order of the given amount
+        If the book is too thin, the impact of filling the whole side
+        """
+        if not self.prices:
+            raise Exception("no match")
+
+        i = bisect_left(self.__cum_amounts, amount)
+        if i < len(self.prices):
+            filled = amount
+        else:
+            i = len(self.prices) - 1
+            filled = self.__cum_amounts[i]
+
+        price = self.prices[i]
+        prev_size = self.cum_sizes[i - 1] if i else 0.0
+        prev_notional = self.cum_notionals[i - 1] if i else 0.0
+        if self.side == BUY:
+            notional = filled
+            shares = prev_size + (filled - prev_notional) / price
+        else:
+            shares = filled
+            notional = prev_notional + (filled - prev_size) * price
+        vwap = notional / shares if shares > 0 else price
+
+        best = self.prices[0]
+        slippage = (vwap - best) / best if self.side == BUY else (best - vwap) / best
+
+        return MarketImpact(
+            amount=amount,
+            filled=filled,
+            best_price=best,
+            worst_price=price,
+            vwap=vwap,
+            slippage=slippage,
+        )
+
+    def impacts(self, amounts: Iterable[float]) -> list[MarketImpact]:
+        """
+        impact of every amount
+        """
+        return [self.impact(amount) for amount in amounts]
@@ -0,0 +1,122 @@
+import asyncio
+import json
+import logging
+import threading
+
+try:
+    import websockets
+except ImportError:  # pragma: no cover
+    websockets = None
+
+from ..exceptions import PolyException
+from .mirror import OrderBookMirror
+
+MARKET_CHANNEL_URL = "wss://ws-subscriptions-clob.polymarket.com/ws/market"
+
+WEBSOCKETS_UNAVAILABLE = (
+    "websockets is needed for the market feed: pip install py_clob_client[ws]"
+)
+
+
+class MarketFeed:
+    """
+    Keeps an OrderBookMirror up to date from the market websocket channel,
+    the subscribed tokens are tracked by the mirror
+
+    The server sends a book snapshot of every subscribed token on subscription,
+    so the mirror is consistent again after each reconnection. The mirror is marked
+    disconnected whenever the connection ends, its books are fresh again once their
+    snapshot is applied. The reconnections back off exponentially up to
+    max_reconnect_delay, reset once a message is received
+    """
+
+    def __init__(
+        self,
+        mirror: OrderBookMirror,
+        token_ids: list[str],
+        url: str = MARKET_CHANNEL_URL,
+        reconnect_delay: float = 1.0,
+        max_reconnect_delay: float = 30.0,
+    ):
+        if websockets is None:
+            raise PolyException(WEBSOCKETS_UNAVAILABLE)
+
+        self.mirror = mirror
+        self.token_ids = list(token_ids)
+        mirror.track(self.token_ids)
+        self.url = url
+        self.reconnect_delay = reconnect_delay
+        self.max_reconnect_delay = max_reconnect_delay
+
+        self.__stopped = False
+        self.__ws = None
+        self.__loop = None
+        self.__thread = None
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+    async def run(self):
+        """
+        Receives and applies messages until stop is called, reconnecting when the
+        connection ends or fails
+        """
+        self.__loop = asyncio.get_running_loop()
+        failures = 0
+        while not self.__stopped:
+            try:
+                async with websockets.connect(self.url) as ws:
+                    self.__ws = ws
+                    if self.__stopped:
+                        break
+                    await ws.send(
+                        json.dumps({"assets_ids": self.token_ids, "type": "market"})
+                    )
+                    self.mirror.set_connected(True)
+                    async for raw in ws:
+                        try:
+                            message = json.loads(raw)
+                        except ValueError:
+                            # PONG and other non json frames
+                            continue
+                        self.mirror.apply_message(message)
+                        failures = 0
+                if not self.__stopped:
+                    self.logger.warning("market feed closed by the server")
+            except (websockets.ConnectionClosed, OSError) as e:
+                if not self.__stopped:
+                    self.logger.warning("market feed disconnected: %s", e)
+            except Exception:
+                if not self.__stopped:
+                    self.logger.exception("market feed failed")
+            finally:
+                self.__ws = None
+                self.mirror.set_connected(False)
+
+            if self.__stopped:
+                break
+            await asyncio.sleep(
+                min(self.max_reconnect_delay, self.reconnect_delay * 2**failures)
+            )
+            failures += 1
+
+    def start(self) -> "MarketFeed":
+        """
+        Runs the feed in a background thread
+        """
+        self.__stopped = False
+        self.__thread = threading.Thread(
+            target=asyncio.run, args=(self.run(),), daemon=True
+        )
+        self.__thread.start()
+        return self
+
+    def stop(self):
+        """
+        Closes the connection and, if started with start, waits for the thread to exit
+        """
+        self.__stopped = True
+        ws, loop = self.__ws, self.__loop
+        if ws is not None and loop is not None and loop.is_running():
+            asyncio.run_coroutine_threadsafe(ws.close(), loop)
+        if self.__thread is not None:
+            self.__thread.join()
+            self.__thread = None
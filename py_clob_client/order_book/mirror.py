@@ -0,0 +1,220 @@
+import logging
+import threading
+import time
+from typing import Optional, Union
+
+from ..clob_types import BookParams, OrderBookSummary, OrderType
+from .book import LocalOrderBook
+from .compact import CompactOrderBookSummary
+from .depth import DepthIndex
+
+BOOK_EVENT = "book"
+PRICE_CHANGE_EVENT = "price_change"
+
+
+class OrderBookMirror:
+    """
+    Local order books of a set of tokens
+
+    Seeded from get_order_books and kept up to date with the messages of the
+    market websocket channel (see MarketFeed), every read is served locally
+    Only the tracked tokens have a book: the ones seeded, passed to track or
+    subscribed to by a MarketFeed, events of other tokens are ignored
+    Thread safe: the feed may apply messages from another thread
+
+    The clients only read a book that is_fresh: a feed is attached and connected
+    (see set_connected), the book was replaced by a snapshot since the last disconnection
+    or malformed event of the token and, with max_age, it was updated in the last
+    max_age seconds. Without a feed, seeded books are never fresh
+    """
+
+    def __init__(self, max_age: Optional[float] = None):
+        self.max_age = max_age
+        # until a feed connects, see set_connected
+        self.connected = False
+        self.__tracked: set[str] = set()
+        self.__books: dict[str, LocalOrderBook] = {}
+        # token id -> time.monotonic() of the last update, fresh books only
+        self.__updated: dict[str, float] = {}
+        self.__lock = threading.Lock()
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+    def track(self, token_ids: list[str]):
+        """
+        Adds tokens to the tracked set, their books are created by their first book event
+        """
+        with self.__lock:
+            self.__tracked.update(token_ids)
+
+    def seed(self, client, token_ids: list[str]):
+        """
+        Fetches a snapshot of every token's book with client.get_order_books
+        """
+        summaries = client.get_order_books(
+            [BookParams(token_id=token_id) for token_id in token_ids], compact=True
+        )
+        self.apply_summaries(summaries)
+
+    def apply_summaries(
+        self, summaries: list[Union[OrderBookSummary, CompactOrderBookSummary]]
+    ):
+        now = time.monotonic()
+        with self.__lock:
+            for summary in summaries:
+                self.__tracked.add(summary.asset_id)
+                self.__books[summary.asset_id] = LocalOrderBook.from_summary(summary)
+                self.__updated[summary.asset_id] = now
+
+    def set_connected(self, connected: bool):
+        """
+        Set by the feed, the books are not fresh before it first connects, while it is
+        disconnected and after it reconnects, until the snapshot of each one is applied
+        """
+        with self.__lock:
+            self.connected = connected
+            if not connected:
+                self.__updated.clear()
+
+    def is_fresh(self, token_id: str) -> bool:
+        """
+        True if the token is tracked and its book can be trusted, see the class docstring
+        """
+        with self.__lock:
+            if not self.connected:
+                return False
+            updated = self.__updated.get(token_id)
+        if updated is None:
+            return False
+        return self.max_age is None or time.monotonic() - updated <= self.max_age
+
+    def apply_message(self, message):
+        """
+        Applies a message of the market websocket channel, a single event or a list of them
+        book events replace a token's levels, price_change events update them,
+        other events and events of untracked tokens are ignored, malformed ones skipped
+        and their tokens not fresh until their next book event
+        """
+        events = message if isinstance(message, list) else [message]
+        with self.__lock:
+            for event in events:
+                if not isinstance(event, dict):
+                    self.logger.warning("skipped market event: %r", event)
+                    continue
+                try:
+                    event_type = event.get("event_type")
+                    if event_type == BOOK_EVENT:
+                        self.__apply_book(event)
+                    elif event_type == PRICE_CHANGE_EVENT:
+                        self.__apply_price_change(event)
+                except (KeyError, TypeError, ValueError, AttributeError) as e:
+                    self.logger.warning("skipped market event %r: %r", event, e)
+                    self.__mark_stale(event)
+
+    def __mark_stale(self, event: dict):
+        """
+        Drops the fresh mark of the tokens of a skipped event, of all of them if unknown
+        """
+        asset_ids = {event.get("asset_id")}
+        changes = event.get("price_changes")
+        if isinstance(changes, list):
+            asset_ids.update(c.get("asset_id") for c in changes if isinstance(c, dict))
+        asset_ids.discard(None)
+        if not asset_ids:
+            self.__updated.clear()
+        for asset_id in asset_ids:
+            self.__updated.pop(asset_id, None)
+
+    def __apply_book(self, event: dict):
+        asset_id = event["asset_id"]
+        if asset_id not in self.__tracked:
+            return
+        book = self.__books.get(asset_id)
+        if book is None:
+            book = LocalOrderBook(asset_id, event.get("market"))
+            self.__books[asset_id] = book
+        book.set_levels(
+            event.get("bids", event.get("buys")),
+            event.get("asks", event.get("sells")),
+            event.get("timestamp"),
+            event.get("hash"),
+        )
+        self.__updated[asset_id] = time.monotonic()
+
+    def __apply_price_change(self, event: dict):
+        if "price_changes" in event:
+            # one entry per level, each carrying its asset_id
+            changes = event["price_changes"]
+        else:
+            changes = [
+                dict(change, asset_id=event["asset_id"], hash=event.get("hash"))
+                for change in event.get("changes", ())
+            ]
+
+        for change in changes:
+            book = self.__books.get(change["asset_id"])
+            if book is None:
+                continue
+            book.set_level(
+                change["side"], float(change["price"]), float(change["size"])
+            )
+            book.timestamp = event.get("timestamp", book.timestamp)
+            book.hash = change.get("hash", book.hash)
+            # a stale book stays stale until its next snapshot
+            if change["asset_id"] in self.__updated:
+                self.__updated[change["asset_id"]] = time.monotonic()
+
+    def __contains__(self, token_id: str) -> bool:
+        return token_id in self.__books
+
+    def token_ids(self) -> list[str]:
+        with self.__lock:
+            return list(self.__books)
+
+    def get_order_book(self, token_id: str) -> OrderBookSummary:
+        """
+        OrderBookSummary of the token's local book, None if the token is not tracked
+        """
+        with self.__lock:
+            book = self.__books.get(token_id)
+            return book.to_summary() if book is not None else None
+
+    def best_bid(self, token_id: str) -> float:
+        with self.__lock:
+            return self.__books[token_id].best_bid()
+
+    def best_ask(self, token_id: str) -> float:
+        with self.__lock:
+            return self.__books[token_id].best_ask()
+
+    def midpoint(self, token_id: str) -> float:
+        """
+        Mid price of the token's local book, None if a side is empty
+        """
+        with self.__lock:
+            return self.__books[token_id].midpoint()
+
+    def spread(self, token_id: str) -> float:
+        """
+        Spread of the token's local book, None if a side is empty
+        """
+        with self.__lock:
+            return self.__books[token_id].spread()
+
+    def depth(self, token_id: str, side: str) -> DepthIndex:
+        """
+        DepthIndex of the token's local book for a market order on `side`
+        It is not updated by later messages, fetch it again to see them
+        """
+        with self.__lock:
+            return self.__books[token_id].depth(side)
+
+    def calculate_market_price(
+        self, token_id: str, side: str, amount: float, order_type: OrderType
+    ) -> float:
+        """
+        Calculates the matching price considering an amount and the token's local book
+        """
+        with self.__lock:
+            return self.__books[token_id].calculate_market_price(
+                side, amount, order_type
+            )
@@ -1,3 +1,8 @@
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor
+from functools import lru_cache
+from itertools import repeat
+
 from py_order_utils.builders import OrderBuilder as UtilsOrderBuilder
 from py_order_utils.signer import Signer as UtilsSigner
 from py_order_utils.model import (
@@ -9,20 +14,24 @@ from py_order_utils.model import (
 )
 
 from .helpers import (
-    to_token_decimals,
-    round_down,
-    round_normal,
-    decimal_places,
-    round_up,
+    TOKEN_DECIMALS,
+    to_ticks,
+    to_lots,
+    amount_to_token_decimals,
 )
 from .constants import BUY, SELL
 from ..config import get_contract_config
 from ..signer import Signer
+from ..utilities import price_valid
+from ..constants import ZERO_ADDRESS
+from ..metrics import ClientMetrics, phase
 from ..clob_types import (
     OrderArgs,
+    PostOrdersArgs,
     CreateOrderOptions,
     TickSize,
     RoundConfig,
+    AmountScales,
     MarketOrderArgs,
     OrderSummary,
     OrderType,
@@ -36,8 +45,23 @@ ROUNDING_CONFIG: dict[TickSize, RoundConfig] = {
 }
 
 
+@lru_cache(maxsize=None)
+def get_amount_scales(price_decimals: int, size_decimals: int) -> AmountScales:
+    """
+    Integer scales of the fixed-point amount math for a RoundConfig
+    """
+    return AmountScales(
+        tick=10**price_decimals,
+        size=10**size_decimals,
+        notional=10 ** (price_decimals + size_decimals),
+        lot=10 ** (TOKEN_DECIMALS - size_decimals),
+    )
+
+
 class OrderBuilder:
-    def __init__(self, signer: Signer, sig_type=None, funder=None):
+    def __init__(
+        self, signer: Signer, sig_type=None, funder=None, metrics: ClientMetrics = None
+    ):
         self.signer = signer
 
         # Signature type used sign orders, defaults to EOA type
@@ -48,71 +72,86 @@ class OrderBuilder:
         # Defaults to the address of the signer
         self.funder = funder if funder is not None else self.signer.address()
 
-    def get_order_amounts(
-        self, side: str, size: float, price: float, round_config: RoundConfig
-    ):
-        raw_price = round_normal(price, round_config.price)
+        # py_order_utils builders, keyed by (chain_id, neg_risk)
+        self.__order_builders = {}
 
-        if side == BUY:
-            raw_taker_amt = round_down(size, round_config.size)
+        # times the amounts and signing phases of create_order if set
+        self.metrics = metrics
 
-            raw_maker_amt = raw_taker_amt * raw_price
-            if decimal_places(raw_maker_amt) > round_config.amount:
-                raw_maker_amt = round_up(raw_maker_amt, round_config.amount + 4)
-                if decimal_places(raw_maker_amt) > round_config.amount:
-                    raw_maker_amt = round_down(raw_maker_amt, round_config.amount)
-
-            maker_amount = to_token_decimals(raw_maker_amt)
-            taker_amount = to_token_decimals(raw_taker_amt)
+    def __get_order_builder(self, neg_risk: bool) -> UtilsOrderBuilder:
+        """
+        Returns the py_order_utils builder for the exchange, created on first use
+        """
+        key = (self.signer.get_chain_id(), bool(neg_risk))
+        order_builder = self.__order_builders.get(key)
+        if order_builder is None:
+            contract_config = get_contract_config(key[0], key[1])
+            order_builder = UtilsOrderBuilder(
+                contract_config.exchange,
+                key[0],
+                UtilsSigner(key=self.signer.key),
+            )
+            self.__order_builders[key] = order_builder
+        return order_builder
+
+    def build_signed_order(self, data: OrderData, neg_risk: bool) -> SignedOrder:
+        """
+        Signs the order data for the exchange
+        """
+        return self.__get_order_builder(neg_risk).build_signed_order(data)
 
-            return UtilsBuy, maker_amount, taker_amount
-        elif side == SELL:
-            raw_maker_amt = round_down(size, round_config.size)
+    def __worker_args(self) -> tuple:
+        """
+        Constructor args of the OrderBuilders of the process pool workers
+        """
+        return (
+            self.signer.private_key,
+            self.signer.get_chain_id(),
+            self.sig_type,
+            self.funder,
+        )
 
-            raw_taker_amt = raw_maker_amt * raw_price
-            if decimal_places(raw_taker_amt) > round_config.amount:
-                raw_taker_amt = round_up(raw_taker_amt, round_config.amount + 4)
-                if decimal_places(raw_taker_amt) > round_config.amount:
-                    raw_taker_amt = round_down(raw_taker_amt, round_config.amount)
+    def get_order_amounts(
+        self, side: str, size: float, price: float, round_config: RoundConfig
+    ):
+        scales = get_amount_scales(round_config.price, round_config.size)
+        price_ticks = to_ticks(price, round_config.price)
+        size_lots = to_lots(size, round_config.size)
 
-            maker_amount = to_token_decimals(raw_maker_amt)
-            taker_amount = to_token_decimals(raw_taker_amt)
+        # size * price, exact
+        notional = amount_to_token_decimals(
+            size_lots * price_ticks, scales.notional, round_config.amount
+        )
 
-            return UtilsSell, maker_amount, taker_amount
+        if side == BUY:
+            return UtilsBuy, notional, size_lots * scales.lot
+        elif side == SELL:
+            return UtilsSell, size_lots * scales.lot, notional
         else:
             raise ValueError(f"order_args.side must be '{BUY}' or '{SELL}'")
 
     def get_market_order_amounts(
         self, side: str, amount: float, price: float, round_config: RoundConfig
     ):
-        raw_price = round_normal(price, round_config.price)
+        scales = get_amount_scales(round_config.price, round_config.size)
+        price_ticks = to_ticks(price, round_config.price)
+        amount_lots = to_lots(amount, round_config.size)
 
         if side == BUY:
-            raw_maker_amt = round_down(amount, round_config.size)
-            raw_taker_amt = raw_maker_amt / raw_price
-            if decimal_places(raw_taker_amt) > round_config.amount:
-                raw_taker_amt = round_up(raw_taker_amt, round_config.amount + 4)
-                if decimal_places(raw_taker_amt) > round_config.amount:
-                    raw_taker_amt = round_down(raw_taker_amt, round_config.amount)
-
-            maker_amount = to_token_decimals(raw_maker_amt)
-            taker_amount = to_token_decimals(raw_taker_amt)
-
-            return UtilsBuy, maker_amount, taker_amount
+            # amount / price, exact before rounding
+            taker_amount = amount_to_token_decimals(
+                amount_lots * scales.tick,
+                price_ticks * scales.size,
+                round_config.amount,
+            )
+            return UtilsBuy, amount_lots * scales.lot, taker_amount
 
         elif side == SELL:
-            raw_maker_amt = round_down(amount, round_config.size)
-
-            raw_taker_amt = raw_maker_amt * raw_price
-            if decimal_places(raw_taker_amt) > round_config.amount:
-                raw_taker_amt = round_up(raw_taker_amt, round_config.amount + 4)
-                if decimal_places(raw_taker_amt) > round_config.amount:
-                    raw_taker_amt = round_down(raw_taker_amt, round_config.amount)
-
-            maker_amount = to_token_decimals(raw_maker_amt)
-            taker_amount = to_token_decimals(raw_taker_amt)
-
-            return UtilsSell, maker_amount, taker_amount
+            # amount * price, exact
+            taker_amount = amount_to_token_decimals(
+                amount_lots * price_ticks, scales.notional, round_config.amount
+            )
+            return UtilsSell, amount_lots * scales.lot, taker_amount
         else:
             raise ValueError(f"order_args.side must be '{BUY}' or '{SELL}'")
 
@@ -122,12 +161,13 @@ class OrderBuilder:
         """
         Creates and signs an order
         """
-        side, maker_amount, taker_amount = self.get_order_amounts(
-            order_args.side,
-            order_args.size,
-            order_args.price,
-            ROUNDING_CONFIG[options.tick_size],
-        )
+        with phase(self.metrics, "create_order", "amounts"):
+            side, maker_amount, taker_amount = self.get_order_amounts(
+                order_args.side,
+                order_args.size,
+                order_args.price,
+                ROUNDING_CONFIG[options.tick_size],
+            )
 
         data = OrderData(
             maker=self.funder,
@@ -143,17 +183,118 @@ class OrderBuilder:
             signatureType=self.sig_type,
         )
 
-        contract_config = get_contract_config(
-            self.signer.get_chain_id(), options.neg_risk
-        )
+        with phase(self.metrics, "create_order", "signing"):
+            return self.build_signed_order(data, options.neg_risk)
 
-        order_builder = UtilsOrderBuilder(
-            contract_config.exchange,
-            self.signer.get_chain_id(),
-            UtilsSigner(key=self.signer.private_key),
-        )
+    def create_orders(
+        self,
+        orders: list[OrderArgs],
+        options: list[CreateOrderOptions],
+        executor: Executor = None,
+    ) -> list[SignedOrder]:
+        """
+        Creates and signs a batch of orders, returned in input order
+        Signing is CPU bound, a ProcessPoolExecutor spreads it over multiple cores
+        """
+        if len(orders) != len(options):
+            raise ValueError("orders and options must have the same length")
+
+        if executor is None:
+            return [
+                self.create_order(order_args, order_options)
+                for order_args, order_options in zip(orders, options)
+            ]
+
+        if isinstance(executor, ProcessPoolExecutor):
+            # workers build their own OrderBuilder, only the args are sent to them
+            return list(
+                executor.map(
+                    _create_order_in_worker,
+                    repeat(self.__worker_args()),
+                    orders,
+                    options,
+                    chunksize=_chunksize(len(orders)),
+                )
+            )
+
+        return list(executor.map(self.create_order, orders, options))
+
+    def create_order_ladder(
+        self,
+        token_id: str,
+        side: str,
+        prices: list[float],
+        sizes: list[float],
+        options: CreateOrderOptions,
+        order_type: OrderType = OrderType.GTC,
+        fee_rate_bps: int = 0,
+        nonce: int = 0,
+        expiration: int = 0,
+        taker: str = ZERO_ADDRESS,
+        executor: Executor = None,
+    ) -> list[PostOrdersArgs]:
+        """
+        Creates and signs a ladder of orders on one token, one per (price, size) pair
+        Every price is validated and every amount computed before anything is signed
+        Returned in input order, ready for post_orders
+        """
+        if len(prices) != len(sizes):
+            raise ValueError("prices and sizes must have the same length")
+        if side not in (BUY, SELL):
+            raise ValueError(f"side must be '{BUY}' or '{SELL}'")
+
+        invalid = [
+            price for price in prices if not price_valid(price, options.tick_size)
+        ]
+        if invalid:
+            raise ValueError(
+                f"prices {invalid}, min: {options.tick_size} - max: {1 - float(options.tick_size)}"
+            )
+
+        round_config = ROUNDING_CONFIG[options.tick_size]
+        signer_address = self.signer.address()
+
+        orders_data = []
+        for price, size in zip(prices, sizes):
+            utils_side, maker_amount, taker_amount = self.get_order_amounts(
+                side, size, price, round_config
+            )
+            orders_data.append(
+                OrderData(
+                    maker=self.funder,
+                    taker=taker,
+                    tokenId=token_id,
+                    makerAmount=str(maker_amount),
+                    takerAmount=str(taker_amount),
+                    side=utils_side,
+                    feeRateBps=str(fee_rate_bps),
+                    nonce=str(nonce),
+                    signer=signer_address,
+                    expiration=str(expiration),
+                    signatureType=self.sig_type,
+                )
+            )
+
+        if executor is None:
+            order_builder = self.__get_order_builder(options.neg_risk)
+            signed_orders = [order_builder.build_signed_order(d) for d in orders_data]
+        elif isinstance(executor, ProcessPoolExecutor):
+            signed_orders = executor.map(
+                _build_signed_order_in_worker,
+                repeat(self.__worker_args()),
+                orders_data,
+                repeat(options.neg_risk),
+                chunksize=_chunksize(len(orders_data)),
+            )
+        else:
+            signed_orders = executor.map(
+                self.build_signed_order, orders_data, repeat(options.neg_risk)
+            )
 
-        return order_builder.build_signed_order(data)
+        return [
+            PostOrdersArgs(order=signed_order, orderType=order_type)
+            for signed_order in signed_orders
+        ]
 
     def create_market_order(
         self, order_args: MarketOrderArgs, options: CreateOrderOptions
@@ -182,17 +323,7 @@ class OrderBuilder:
             signatureType=self.sig_type,
         )
 
-        contract_config = get_contract_config(
-            self.signer.get_chain_id(), options.neg_risk
-        )
-
-        order_builder = UtilsOrderBuilder(
-            contract_config.exchange,
-            self.signer.get_chain_id(),
-            UtilsSigner(key=self.signer.private_key),
-        )
-
-        return order_builder.build_signed_order(data)
+        return self.build_signed_order(data, options.neg_risk)
 
     def calculate_buy_market_price(
         self,
@@ -233,3 +364,37 @@ class OrderBuilder:
             raise Exception("no match")
 
         return float(positions[0].price)
+
+
+# OrderBuilders of the process pool workers, keyed by their constructor args
+_worker_builders: dict[tuple, OrderBuilder] = {}
+
+
+def _get_worker_builder(builder_args: tuple) -> OrderBuilder:
+    builder = _worker_builders.get(builder_args)
+    if builder is None:
+        private_key, chain_id, sig_type, funder = builder_args
+        builder = OrderBuilder(
+            Signer(private_key, chain_id), sig_type=sig_type, funder=funder
+        )
+        _worker_builders[builder_args] = builder
+    return builder
+
+
+def _create_order_in_worker(
+    builder_args: tuple, order_args: OrderArgs, options: CreateOrderOptions
+) -> SignedOrder:
+    return _get_worker_builder(builder_args).create_order(order_args, options)
+
+
+def _build_signed_order_in_worker(
+    builder_args: tuple, data: OrderData, neg_risk: bool
+) -> SignedOrder:
+    return _get_worker_builder(builder_args).build_signed_order(data, neg_risk)
+
+
+def _chunksize(n: int) -> int:
+    """
+    Orders sent to a process pool worker at once
+    """
+    return max(1, n // ((os.cpu_count() or 1) * 4))
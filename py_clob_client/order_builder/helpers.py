@@ -23,3 +23,37 @@ def to_token_decimals(x: float) -> int:
 
 def decimal_places(x: float) -> int:
     return abs(Decimal(x.__str__()).as_tuple().exponent)
+
+
+TOKEN_DECIMALS = 6
+
+
+def to_ticks(x: float, decimals: int) -> int:
+    """
+    Number of 10**-decimals units in x, rounded like round_normal
+    """
+    return round(x * (10**decimals))
+
+
+def to_lots(x: float, decimals: int) -> int:
+    """
+    Number of 10**-decimals units in x, rounded down like round_down
+    """
+    return floor(x * (10**decimals))
+
+
+def amount_to_token_decimals(
+    numerator: int, denominator: int, amount_decimals: int
+) -> int:
+    """
+    Converts the exact amount numerator / denominator to token decimals,
+    first rounded to amount_decimals as the float path does:
+    up to amount_decimals + 4 decimals, then down to amount_decimals
+    """
+    scale = 10**amount_decimals
+    if (numerator * scale) % denominator != 0:
+        # ceil at amount_decimals + 4, then floor at amount_decimals
+        numerator = -((-numerator * scale * 10**4) // denominator) // 10**4
+    else:
+        numerator = numerator * scale // denominator
+    return numerator * 10 ** (TOKEN_DECIMALS - amount_decimals)
@@ -1,4 +1,5 @@
 from eth_account import Account
+from eth_keys import keys
 
 
 class Signer:
@@ -9,6 +10,9 @@ class Signer:
         self.account = Account.from_key(private_key)
         self.chain_id = chain_id
 
+        # parsed once, signing with the raw key would derive the public key on every call
+        self.key = keys.PrivateKey(self.account.key)
+
     def address(self):
         return self.account.address
 
@@ -19,4 +23,4 @@ class Signer:
         """
         Signs a message hash
         """
-        return Account._sign_hash(message_hash, self.private_key).signature.hex()
+        return Account._sign_hash(message_hash, self.key).signature.hex()
@@ -1,4 +1,6 @@
-from poly_eip712_structs import make_domain
+from functools import lru_cache
+
+from poly_eip712_structs import make_domain, Address
 from eth_utils import keccak
 from py_order_utils.utils import prepend_zx
 
@@ -9,20 +11,43 @@ CLOB_DOMAIN_NAME = "ClobAuthDomain"
 CLOB_VERSION = "1"
 MSG_TO_SIGN = "This message attests that I control the given wallet"
 
+# constant parts of the ClobAuth struct hash
+CLOB_AUTH_TYPE_HASH = ClobAuth.type_hash()
+MSG_TO_SIGN_HASH = keccak(text=MSG_TO_SIGN)
+
 
 def get_clob_auth_domain(chain_id: int):
     return make_domain(name=CLOB_DOMAIN_NAME, version=CLOB_VERSION, chainId=chain_id)
 
 
-def sign_clob_auth_message(signer: Signer, timestamp: int, nonce: int) -> str:
-    clob_auth_msg = ClobAuth(
-        address=signer.address(),
-        timestamp=str(timestamp),
-        nonce=nonce,
-        message=MSG_TO_SIGN,
+@lru_cache(maxsize=1024)
+def get_clob_auth_prefix(address: str, chain_id: int) -> tuple[bytes, bytes]:
+    """
+    Returns the domain separator and the encoded address for a signer,
+    the parts of the ClobAuth signable bytes which never change for it
+    """
+    domain_separator = get_clob_auth_domain(chain_id).hash_struct()
+    return domain_separator, Address().encode_value(address)
+
+
+def get_clob_auth_hash(address: str, chain_id: int, timestamp: int, nonce: int) -> str:
+    """
+    Returns the EIP712 hash of the ClobAuth message,
+    only the timestamp and nonce are encoded on each call
+    """
+    domain_separator, encoded_address = get_clob_auth_prefix(address, chain_id)
+    struct_hash = keccak(
+        CLOB_AUTH_TYPE_HASH
+        + encoded_address
+        + keccak(text=str(timestamp))
+        + nonce.to_bytes(32, byteorder="big", signed=False)
+        + MSG_TO_SIGN_HASH
     )
-    chain_id = signer.get_chain_id()
-    auth_struct_hash = prepend_zx(
-        keccak(clob_auth_msg.signable_bytes(get_clob_auth_domain(chain_id))).hex()
+    return prepend_zx(keccak(b"\x19\x01" + domain_separator + struct_hash).hex())
+
+
+def sign_clob_auth_message(signer: Signer, timestamp: int, nonce: int) -> str:
+    auth_struct_hash = get_clob_auth_hash(
+        signer.address(), signer.get_chain_id(), timestamp, nonce
     )
     return prepend_zx(signer.sign(auth_struct_hash))
@@ -3,20 +3,40 @@ import hashlib
 import base64
 
 
+class HmacSigner:
+    """
+    Signs payloads with a secret
+
+    The secret is decoded and the hmac state keyed once, each signature works on a copy
+    """
+
+    def __init__(self, secret: str):
+        self._hmac = hmac.new(
+            base64.urlsafe_b64decode(secret), digestmod=hashlib.sha256
+        )
+
+    def sign(self, timestamp: str, method: str, requestPath: str, body=None) -> str:
+        message = bytes(str(timestamp) + str(method) + str(requestPath), "utf-8")
+        if body:
+            if isinstance(body, bytes):
+                # already serialized body, sign the exact bytes sent over the wire
+                message += body
+            else:
+                # NOTE: Necessary to replace single quotes with double quotes
+                # to generate the same hmac message as go and typescript
+                message += bytes(str(body).replace("'", '"'), "utf-8")
+
+        h = self._hmac.copy()
+        h.update(message)
+
+        # ensure base64 encoded
+        return (base64.urlsafe_b64encode(h.digest())).decode("utf-8")
+
+
 def build_hmac_signature(
     secret: str, timestamp: str, method: str, requestPath: str, body=None
 ):
     """
     Creates an HMAC signature by signing a payload with the secret
     """
-    base64_secret = base64.urlsafe_b64decode(secret)
-    message = str(timestamp) + str(method) + str(requestPath)
-    if body:
-        # NOTE: Necessary to replace single quotes with double quotes
-        # to generate the same hmac message as go and typescript
-        message += str(body).replace("'", '"')
-
-    h = hmac.new(base64_secret, bytes(message, "utf-8"), hashlib.sha256)
-
-    # ensure base64 encoded
-    return (base64.urlsafe_b64encode(h.digest())).decode("utf-8")
+    return HmacSigner(secret).sign(timestamp, method, requestPath, body)
@@ -1,4 +1,7 @@
 import hashlib
+import json
+import threading
+from collections import OrderedDict
 
 from .clob_types import OrderBookSummary, OrderSummary, TickSize
 
@@ -25,12 +28,70 @@ def parse_raw_orderbook_summary(raw_obs: any) -> OrderBookSummary:
 
 
 def generate_orderbook_summary_hash(orderbook: OrderBookSummary) -> str:
+    """
+    SHA-1 of the summary's compact json with an empty hash field, set as its hash
+    Also accepts a CompactOrderBookSummary
+    """
     orderbook.hash = ""
-    hash = hashlib.sha1(str(orderbook.json).encode("utf-8")).hexdigest()
+    hash = hashlib.sha1(orderbook.json.encode("utf-8")).hexdigest()
     orderbook.hash = hash
+    # tells the hash set here from one sent by the server, see OrderBookHashCache
+    orderbook._computed_hash = hash
     return hash
 
 
+class OrderBookHashCache:
+    """
+    Memoizes generate_orderbook_summary_hash by asset id and server sent hash
+
+    A snapshot carrying a hash the server already sent for its asset is not hashed again.
+    The hash set by generate_orderbook_summary_hash is never looked up nor stored, a
+    summary changed after it was hashed is hashed again. Summaries with an empty hash
+    field are always hashed
+    """
+
+    def __init__(self, maxsize: int = 4096):
+        self.maxsize = maxsize
+        self.__hashes = OrderedDict()
+        self.__lock = threading.Lock()
+
+    def hash(self, orderbook: OrderBookSummary) -> str:
+        server_hash = orderbook.hash
+        if server_hash == getattr(orderbook, "_computed_hash", None):
+            server_hash = None
+        key = (orderbook.asset_id, server_hash)
+        with self.__lock:
+            hash = self.__hashes.get(key) if server_hash else None
+            if hash is not None:
+                self.__hashes.move_to_end(key)
+                orderbook.hash = hash
+                return hash
+
+        hash = generate_orderbook_summary_hash(orderbook)
+
+        with self.__lock:
+            if key[1]:
+                self.__hashes[key] = hash
+            while len(self.__hashes) > self.maxsize:
+                self.__hashes.popitem(last=False)
+        return hash
+
+
+def serialize_body(body) -> bytes:
+    """
+    Serializes a request body once, the same bytes are signed and sent
+    """
+    return json.dumps(body, allow_nan=False).encode("utf-8")
+
+
+def format_number(x: float) -> str:
+    """
+    Shortest string that parses back to x, without a trailing .0
+    """
+    s = repr(x)
+    return s[:-2] if s.endswith(".0") else s
+
+
 def order_to_json(order, owner, orderType) -> dict:
     return {"order": order.dict(), "owner": owner, "orderType": orderType}
 
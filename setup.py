@@ -16,12 +16,17 @@ setuptools.setup(
     url="https://github.com/Polymarket/py-clob-client",
     install_requires=[
         "eth-account>=0.13.0",
+        "eth-keys>=0.4.0",
         "eth-utils>=4.1.1",
         "poly_eip712_structs>=0.0.1",
         "py-order-utils>=0.3.2",
         "python-dotenv",
         "requests",
     ],
+    extras_require={
+        "async": ["aiohttp>=3.9"],
+        "ws": ["websockets>=12.0"],
+    },
     project_urls={
         "Bug Tracker": "https://github.com/Polymarket/py-clob-client/issues",
     },
@@ -0,0 +1,74 @@
+"""
+Orders signed per second by OrderBuilder.create_order
+
+before: a py_order_utils builder and signer are created, and the private key parsed, for every order
+after: the builder and signer are cached per (chain_id, neg_risk)
+
+python -m tests.benchmarks.bench_create_order
+"""
+
+from py_order_utils.builders import OrderBuilder as UtilsOrderBuilder
+from py_order_utils.model import OrderData
+from py_order_utils.signer import Signer as UtilsSigner
+
+from py_clob_client.clob_types import CreateOrderOptions, OrderArgs
+from py_clob_client.config import get_contract_config
+from py_clob_client.constants import AMOY
+from py_clob_client.order_builder.builder import OrderBuilder, ROUNDING_CONFIG
+from py_clob_client.order_builder.constants import BUY
+from py_clob_client.signer import Signer
+
+from tests.benchmarks.utils import measure, report
+
+# publicly known private key
+private_key = "0xac0974bec39a17e36ba4a6b4d238ff944bacb478cbed5efcae784d7bf4f2ff80"
+
+
+def uncached_create_order(builder: OrderBuilder, order_args: OrderArgs, options):
+    side, maker_amount, taker_amount = builder.get_order_amounts(
+        order_args.side,
+        order_args.size,
+        order_args.price,
+        ROUNDING_CONFIG[options.tick_size],
+    )
+    data = OrderData(
+        maker=builder.funder,
+        taker=order_args.taker,
+        tokenId=order_args.token_id,
+        makerAmount=str(maker_amount),
+        takerAmount=str(taker_amount),
+        side=side,
+        feeRateBps=str(order_args.fee_rate_bps),
+        nonce=str(order_args.nonce),
+        signer=builder.signer.address(),
+        expiration=str(order_args.expiration),
+        signatureType=builder.sig_type,
+    )
+    contract_config = get_contract_config(
+        builder.signer.get_chain_id(), options.neg_risk
+    )
+    order_builder = UtilsOrderBuilder(
+        contract_config.exchange,
+        builder.signer.get_chain_id(),
+        UtilsSigner(key=builder.signer.private_key),
+    )
+    return order_builder.build_signed_order(data)
+
+
+def main():
+    builder = OrderBuilder(Signer(private_key, AMOY))
+    options = CreateOrderOptions(tick_size="0.01", neg_risk=False)
+    order_args = OrderArgs(token_id="123", price=0.52, size=100, side=BUY)
+
+    before = measure(lambda: uncached_create_order(builder, order_args, options), 50)
+    after = measure(lambda: builder.create_order(order_args, options), 50)
+    report("create_order", before, after)
+    print(
+        "{:<40} before: {:>10.0f}/s   after: {:>10.0f}/s".format(
+            "orders signed per second", 1 / before, 1 / after
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""
+Wall time to sign a 200 order ladder with OrderBuilder.create_orders
+
+sequential vs a ProcessPoolExecutor with one worker per core
+
+python -m tests.benchmarks.bench_create_orders
+"""
+
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from py_clob_client.clob_types import CreateOrderOptions, OrderArgs
+from py_clob_client.constants import AMOY
+from py_clob_client.order_builder.builder import OrderBuilder
+from py_clob_client.order_builder.constants import BUY
+from py_clob_client.signer import Signer
+
+from tests.benchmarks.utils import report
+
+# publicly known private key
+private_key = "0xac0974bec39a17e36ba4a6b4d238ff944bacb478cbed5efcae784d7bf4f2ff80"
+
+
+def wall_time(fn) -> float:
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+def main():
+    builder = OrderBuilder(Signer(private_key, AMOY))
+    orders = [
+        OrderArgs(token_id="123", price=round(0.01 + i * 0.0049, 2), size=10, side=BUY)
+        for i in range(200)
+    ]
+    options = [CreateOrderOptions(tick_size="0.01", neg_risk=False)] * len(orders)
+
+    sequential = wall_time(lambda: builder.create_orders(orders, options))
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+        # warm up the workers
+        builder.create_orders(orders[:10], options[:10], executor)
+        parallel = wall_time(lambda: builder.create_orders(orders, options, executor))
+
+    report(
+        "200 orders, {} worker(s)".format(os.cpu_count()),
+        sequential / len(orders),
+        parallel / len(orders),
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""
+CPU time spent hashing and signing the ClobAuth message of Level 1 headers
+
+before: the domain and the ClobAuth struct are built and fully encoded on every call
+after: the domain separator and constant fields are cached per signer
+
+python -m tests.benchmarks.bench_l1_headers
+"""
+
+from eth_utils import keccak
+from py_order_utils.utils import prepend_zx
+
+from py_clob_client.constants import AMOY
+from py_clob_client.signer import Signer
+from py_clob_client.signing.eip712 import (
+    MSG_TO_SIGN,
+    get_clob_auth_domain,
+    get_clob_auth_hash,
+)
+from py_clob_client.signing.model import ClobAuth
+
+from tests.benchmarks.utils import measure, report
+
+# publicly known private key
+private_key = "0xac0974bec39a17e36ba4a6b4d238ff944bacb478cbed5efcae784d7bf4f2ff80"
+
+
+def full_struct_hash(signer: Signer, timestamp: int, nonce: int) -> str:
+    clob_auth_msg = ClobAuth(
+        address=signer.address(),
+        timestamp=str(timestamp),
+        nonce=nonce,
+        message=MSG_TO_SIGN,
+    )
+    return prepend_zx(
+        keccak(
+            clob_auth_msg.signable_bytes(get_clob_auth_domain(signer.get_chain_id()))
+        ).hex()
+    )
+
+
+def main():
+    signer = Signer(private_key, AMOY)
+
+    def cached_hash():
+        return get_clob_auth_hash(signer.address(), AMOY, 1718000000, 0)
+
+    report(
+        "ClobAuth hash",
+        measure(lambda: full_struct_hash(signer, 1718000000, 0), 2000),
+        measure(cached_hash, 2000),
+    )
+    report(
+        "ClobAuth hash + sign",
+        measure(lambda: signer.sign(full_struct_hash(signer, 1718000000, 0)), 200),
+        measure(lambda: signer.sign(cached_hash()), 200),
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""
+CPU time spent serializing and signing a post_orders batch
+
+before: the body is stringified for the hmac, then json encoded again by the transport
+after: the body is serialized once, the same bytes are signed and sent
+
+python -m tests.benchmarks.bench_l2_body
+"""
+
+import json
+
+from py_clob_client.clob_types import CreateOrderOptions, OrderArgs, OrderType
+from py_clob_client.constants import AMOY
+from py_clob_client.order_builder.builder import OrderBuilder
+from py_clob_client.order_builder.constants import BUY
+from py_clob_client.signer import Signer
+from py_clob_client.signing.hmac import build_hmac_signature
+from py_clob_client.utilities import order_to_json, serialize_body
+
+from tests.benchmarks.utils import measure, report
+
+# publicly known private key
+private_key = "0xac0974bec39a17e36ba4a6b4d238ff944bacb478cbed5efcae784d7bf4f2ff80"
+secret = "AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA="
+api_key = "000000000-0000-0000-0000-000000000000"
+
+
+def make_body(size: int) -> list:
+    builder = OrderBuilder(Signer(private_key, AMOY))
+    options = CreateOrderOptions(tick_size="0.01", neg_risk=False)
+    order = builder.create_order(
+        OrderArgs(token_id="123", price=0.5, size=100, side=BUY), options
+    )
+    return [order_to_json(order, api_key, OrderType.GTC) for _ in range(size)]
+
+
+def before(body):
+    build_hmac_signature(secret, 1000000, "POST", "/orders", body)
+    json.dumps(body).encode("utf-8")
+
+
+def after(body):
+    build_hmac_signature(secret, 1000000, "POST", "/orders", serialize_body(body))
+
+
+def main():
+    for size in (1, 15, 100, 500):
+        body = make_body(size)
+        number = max(10, 2000 // size)
+        report(
+            "post_orders batch of {}".format(size),
+            measure(lambda: before(body), number=number),
+            measure(lambda: after(body), number=number),
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+"""
+CPU time spent building Level 2 headers for a request
+
+before: the secret is decoded, the hmac keyed and the headers rebuilt on every call
+after: a Level2HeadersContext built once per credentials
+
+python -m tests.benchmarks.bench_l2_headers
+"""
+
+from py_clob_client.clob_types import ApiCreds, RequestArgs
+from py_clob_client.constants import AMOY
+from py_clob_client.headers.headers import (
+    Level2HeadersContext,
+    create_level_2_headers,
+)
+from py_clob_client.signer import Signer
+
+from tests.benchmarks.utils import measure, report
+
+# publicly known private key
+private_key = "0xac0974bec39a17e36ba4a6b4d238ff944bacb478cbed5efcae784d7bf4f2ff80"
+creds = ApiCreds(
+    api_key="000000000-0000-0000-0000-000000000000",
+    api_passphrase="aaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaa",
+    api_secret="AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA=",
+)
+
+
+def main():
+    signer = Signer(private_key, AMOY)
+    context = Level2HeadersContext(signer, creds)
+    request_args = RequestArgs(
+        method="DELETE", request_path="/order", body=b'{"orderID": "0x123"}'
+    )
+
+    report(
+        "level 2 headers",
+        measure(lambda: create_level_2_headers(signer, creds, request_args), 20000),
+        measure(lambda: context.create_headers(request_args), 20000),
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""
+CPU time to price 500 market order amounts against one 200 level book
+
+before: OrderBuilder.calculate_buy_market_price, a linear walk per amount
+after: one DepthIndex per snapshot, a binary search per amount
+
+python -m tests.benchmarks.bench_market_price
+"""
+
+from py_clob_client.clob_types import OrderSummary, OrderType
+from py_clob_client.constants import AMOY
+from py_clob_client.order_book.depth import DepthIndex
+from py_clob_client.order_builder.builder import OrderBuilder
+from py_clob_client.order_builder.constants import BUY
+from py_clob_client.signer import Signer
+
+from tests.benchmarks.utils import measure, report
+
+# publicly known private key
+private_key = "0xac0974bec39a17e36ba4a6b4d238ff944bacb478cbed5efcae784d7bf4f2ff80"
+
+
+def main():
+    builder = OrderBuilder(Signer(private_key, AMOY))
+    # best ask last, as the server sends them
+    asks = [
+        OrderSummary(price=str(round(0.999 - i * 0.0025, 4)), size=str(50 + i))
+        for i in range(200)
+    ]
+    total = sum(float(a.size) * float(a.price) for a in asks)
+    amounts = [total * i / 500 for i in range(1, 501)]
+
+    def before():
+        for amount in amounts:
+            builder.calculate_buy_market_price(asks, amount, OrderType.FOK)
+
+    def after():
+        depth = DepthIndex(
+            BUY,
+            [float(a.price) for a in reversed(asks)],
+            [float(a.size) for a in reversed(asks)],
+        )
+        depth.market_prices(amounts, OrderType.FOK)
+
+    report(
+        "500 amounts x 200 levels",
+        measure(before, 1, 5) / len(amounts),
+        measure(after, 10, 5) / len(amounts),
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+"""
+CPU time of OrderBuilder.get_order_amounts and get_market_order_amounts
+
+before: float rounding, with decimal_places building a Decimal from str(float) on every check
+after: integer tick/lot arithmetic
+
+python -m tests.benchmarks.bench_order_amounts
+"""
+
+from py_order_utils.model import BUY as UtilsBuy, SELL as UtilsSell
+
+from py_clob_client.clob_types import RoundConfig
+from py_clob_client.constants import AMOY
+from py_clob_client.order_builder.builder import OrderBuilder, ROUNDING_CONFIG
+from py_clob_client.order_builder.constants import BUY, SELL
+from py_clob_client.order_builder.helpers import (
+    decimal_places,
+    round_down,
+    round_normal,
+    round_up,
+    to_token_decimals,
+)
+from py_clob_client.signer import Signer
+
+from tests.benchmarks.utils import measure, report
+
+# publicly known private key
+private_key = "0xac0974bec39a17e36ba4a6b4d238ff944bacb478cbed5efcae784d7bf4f2ff80"
+
+
+def float_order_amounts(
+    side: str, size: float, price: float, round_config: RoundConfig
+):
+    raw_price = round_normal(price, round_config.price)
+    if side == BUY:
+        raw_taker_amt = round_down(size, round_config.size)
+        raw_maker_amt = raw_taker_amt * raw_price
+        if decimal_places(raw_maker_amt) > round_config.amount:
+            raw_maker_amt = round_up(raw_maker_amt, round_config.amount + 4)
+            if decimal_places(raw_maker_amt) > round_config.amount:
+                raw_maker_amt = round_down(raw_maker_amt, round_config.amount)
+        return (
+            UtilsBuy,
+            to_token_decimals(raw_maker_amt),
+            to_token_decimals(raw_taker_amt),
+        )
+    else:
+        raw_maker_amt = round_down(size, round_config.size)
+        raw_taker_amt = raw_maker_amt * raw_price
+        if decimal_places(raw_taker_amt) > round_config.amount:
+            raw_taker_amt = round_up(raw_taker_amt, round_config.amount + 4)
+            if decimal_places(raw_taker_amt) > round_config.amount:
+                raw_taker_amt = round_down(raw_taker_amt, round_config.amount)
+        return (
+            UtilsSell,
+            to_token_decimals(raw_maker_amt),
+            to_token_decimals(raw_taker_amt),
+        )
+
+
+def float_market_order_amounts(
+    side: str, amount: float, price: float, round_config: RoundConfig
+):
+    raw_price = round_normal(price, round_config.price)
+    raw_maker_amt = round_down(amount, round_config.size)
+    if side == BUY:
+        raw_taker_amt = raw_maker_amt / raw_price
+    else:
+        raw_taker_amt = raw_maker_amt * raw_price
+    if decimal_places(raw_taker_amt) > round_config.amount:
+        raw_taker_amt = round_up(raw_taker_amt, round_config.amount + 4)
+        if decimal_places(raw_taker_amt) > round_config.amount:
+            raw_taker_amt = round_down(raw_taker_amt, round_config.amount)
+    return (
+        UtilsBuy if side == BUY else UtilsSell,
+        to_token_decimals(raw_maker_amt),
+        to_token_decimals(raw_taker_amt),
+    )
+
+
+def main():
+    builder = OrderBuilder(Signer(private_key, AMOY))
+    round_config = ROUNDING_CONFIG["0.01"]
+    inputs = [
+        (BUY if i % 2 else SELL, 10 + i * 1.37, 0.01 + (i % 98) * 0.01)
+        for i in range(1000)
+    ]
+
+    def before():
+        for side, size, price in inputs:
+            float_order_amounts(side, size, price, round_config)
+
+    def after():
+        for side, size, price in inputs:
+            builder.get_order_amounts(side, size, price, round_config)
+
+    report("get_order_amounts", measure(before, 10) / 1000, measure(after, 10) / 1000)
+
+    def market_before():
+        for side, amount, price in inputs:
+            float_market_order_amounts(side, amount, price, round_config)
+
+    def market_after():
+        for side, amount, price in inputs:
+            builder.get_market_order_amounts(side, amount, price, round_config)
+
+    report(
+        "get_market_order_amounts",
+        measure(market_before, 10) / 1000,
+        measure(market_after, 10) / 1000,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""
+CPU time of generate_orderbook_summary_hash on a 500 level per side book
+
+before: sha1 of dumps(asdict(book))
+after: sha1 of the summary json built without asdict, from the OrderSummary
+    strings or from the CompactOrderBookSummary columns, and an
+    OrderBookHashCache hit on an unchanged snapshot
+
+python -m tests.benchmarks.bench_order_book_hash
+"""
+
+import hashlib
+import json
+from dataclasses import asdict
+
+from py_clob_client.order_book.compact import CompactOrderBookSummary
+from py_clob_client.utilities import (
+    OrderBookHashCache,
+    generate_orderbook_summary_hash,
+    parse_raw_orderbook_summary,
+)
+
+from tests.benchmarks.utils import measure, report
+
+
+def raw_book(depth: int = 500) -> dict:
+    return {
+        "market": "0xbd31dc8a20211944f6b70f31557f1001557b59905b7738480ca09bd4532f84af",
+        "asset_id": "52114319501245915516055106046884209969926127482827954674443846427813813222426",
+        "timestamp": "1700000000000",
+        "hash": "",
+        "bids": [
+            {
+                "price": str(round(0.001 * (i + 1), 3)),
+                "size": "{:g}".format(100 + i * 1.5),
+            }
+            for i in range(depth)
+        ],
+        "asks": [
+            {
+                "price": str(round(0.999 - 0.001 * i, 3)),
+                "size": "{:g}".format(100 + i * 2.25),
+            }
+            for i in range(depth)
+        ],
+    }
+
+
+def asdict_hash(orderbook) -> str:
+    orderbook.hash = ""
+    hash = hashlib.sha1(
+        json.dumps(asdict(orderbook), separators=(",", ":")).encode("utf-8")
+    ).hexdigest()
+    orderbook.hash = hash
+    return hash
+
+
+def main():
+    raw = raw_book()
+    summary = parse_raw_orderbook_summary(raw)
+    compact = CompactOrderBookSummary.from_raw(raw)
+    assert asdict_hash(summary) == generate_orderbook_summary_hash(summary)
+    assert asdict_hash(summary) == generate_orderbook_summary_hash(compact)
+
+    before = measure(lambda: asdict_hash(summary), 20)
+    report(
+        "OrderBookSummary",
+        before,
+        measure(lambda: generate_orderbook_summary_hash(summary), 20),
+    )
+    report(
+        "CompactOrderBookSummary",
+        before,
+        measure(lambda: generate_orderbook_summary_hash(compact), 20),
+    )
+
+    # a new snapshot carrying a server hash the cache has already seen
+    raw = dict(raw, hash=summary.hash)
+    cache = OrderBookHashCache()
+    cache.hash(parse_raw_orderbook_summary(raw))
+    summary = parse_raw_orderbook_summary(raw)
+    report("OrderBookHashCache hit", before, measure(lambda: cache.hash(summary), 20))
+
+
+if __name__ == "__main__":
+    main()
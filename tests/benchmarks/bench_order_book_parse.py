@@ -0,0 +1,82 @@
+"""
+Parse time and retained memory of 1000 order books of 50 levels per side
+
+before: parse_raw_orderbook_summary, one OrderSummary of strings per level
+after: CompactOrderBookSummary.from_raw, price and size float columns
+    and the json of the levels
+
+python -m tests.benchmarks.bench_order_book_parse
+"""
+
+import gc
+import json
+import tracemalloc
+
+from py_clob_client.order_book.compact import CompactOrderBookSummary
+from py_clob_client.utilities import parse_raw_orderbook_summary
+
+from tests.benchmarks.utils import measure, report
+
+
+def raw_books(n: int = 1000, depth: int = 50) -> str:
+    return json.dumps(
+        [
+            {
+                "market": "0x{:064x}".format(i),
+                "asset_id": str(10**70 + i),
+                "timestamp": "1700000000000",
+                "hash": "9d6d9e8831a150ac4cd878f99f7b2c6d419b875f",
+                "bids": [
+                    {"price": str(round(0.01 * (j + 1), 2)), "size": str(100 + j * 1.5)}
+                    for j in range(depth)
+                ],
+                "asks": [
+                    {
+                        "price": str(round(0.99 - 0.01 * j, 2)),
+                        "size": str(100 + j * 2.25),
+                    }
+                    for j in range(depth)
+                ],
+            }
+            for i in range(n)
+        ]
+    )
+
+
+def retained(parse, payload: str) -> int:
+    """
+    Bytes still allocated once the raw json objects are released
+    """
+    raw = json.loads(payload)
+    gc.collect()
+    tracemalloc.start()
+    parsed = [parse(r) for r in raw]
+    del raw
+    gc.collect()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del parsed
+    return size
+
+
+def main():
+    payload = raw_books()
+    raw = json.loads(payload)
+
+    report(
+        "parse 1000 books x 100 levels",
+        measure(lambda: [parse_raw_orderbook_summary(r) for r in raw], 1, 5),
+        measure(lambda: [CompactOrderBookSummary.from_raw(r) for r in raw], 1, 5),
+    )
+
+    before = retained(parse_raw_orderbook_summary, payload)
+    after = retained(CompactOrderBookSummary.from_raw, payload)
+    print(
+        "{:<40} before: {:>8.1f}MB  after: {:>8.1f}MB  ratio: {:.2f}x".format(
+            "retained memory", before / 2**20, after / 2**20, before / after
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
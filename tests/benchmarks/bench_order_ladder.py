@@ -0,0 +1,50 @@
+"""
+CPU time to build a 500 order ladder ready for post_orders
+
+before: one OrderArgs and create_order call per level
+after: OrderBuilder.create_order_ladder
+
+python -m tests.benchmarks.bench_order_ladder
+"""
+
+from py_clob_client.clob_types import CreateOrderOptions, OrderArgs, PostOrdersArgs
+from py_clob_client.constants import AMOY
+from py_clob_client.order_builder.builder import OrderBuilder
+from py_clob_client.order_builder.constants import BUY
+from py_clob_client.signer import Signer
+
+from tests.benchmarks.utils import measure, report
+
+# publicly known private key
+private_key = "0xac0974bec39a17e36ba4a6b4d238ff944bacb478cbed5efcae784d7bf4f2ff80"
+
+
+def main():
+    builder = OrderBuilder(Signer(private_key, AMOY))
+    options = CreateOrderOptions(tick_size="0.0001", neg_risk=False)
+    prices = [round(0.45 - i * 0.0005, 4) for i in range(500)]
+    sizes = [10 + i * 0.5 for i in range(500)]
+
+    def before():
+        return [
+            PostOrdersArgs(
+                order=builder.create_order(
+                    OrderArgs(token_id="123", price=price, size=size, side=BUY),
+                    options,
+                )
+            )
+            for price, size in zip(prices, sizes)
+        ]
+
+    def after():
+        return builder.create_order_ladder("123", BUY, prices, sizes, options)
+
+    report(
+        "500 order ladder",
+        measure(before, number=1, repeat=3) / 500,
+        measure(after, number=1, repeat=3) / 500,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,187 @@
+"""
+Throughput of get_order_books, get_trades pagination and post_orders replayed from
+a JSONL recording, without network
+
+cpu: client side time per call, the replayed responses are served instantly
+wall: time per call with 5ms of simulated latency per request
+
+python -m tests.benchmarks.bench_replay
+"""
+
+import json
+import os
+import tempfile
+import time
+
+from py_clob_client.client import ClobClient
+from py_clob_client.clob_types import (
+    ApiCreds,
+    BookParams,
+    OrderArgs,
+    OrderType,
+    PartialCreateOrderOptions,
+    PostOrdersArgs,
+)
+from py_clob_client.constants import AMOY, END_CURSOR
+from py_clob_client.http_helpers.replay import ReplayTransport
+from py_clob_client.order_builder.constants import BUY
+
+from tests.benchmarks.utils import measure
+
+# publicly known private key
+private_key = "0xac0974bec39a17e36ba4a6b4d238ff944bacb478cbed5efcae784d7bf4f2ff80"
+
+creds = ApiCreds(
+    api_key="000000000-0000-0000-0000-000000000000",
+    api_passphrase="aaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaa",
+    api_secret="AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA=",
+)
+
+BOOKS = 100
+DEPTH = 50
+TRADE_PAGES = 10
+TRADES_PER_PAGE = 500
+ORDERS = 15
+LATENCY = 0.005
+
+
+def _entry(method, path, body, response) -> dict:
+    return {
+        "method": method,
+        "path": path,
+        "body": body,
+        "status": 200,
+        "response": response,
+    }
+
+
+def _book(token_id: str) -> dict:
+    return {
+        "market": "0xaabbcc",
+        "asset_id": token_id,
+        "timestamp": "1700000000000",
+        "hash": "9d6d9e8831a150ac4cd878f99f7b2c6d419b875f",
+        "bids": [
+            {"price": str(round(0.01 * (j + 1), 2)), "size": str(100 + j)}
+            for j in range(DEPTH)
+        ],
+        "asks": [
+            {"price": str(round(0.99 - 0.01 * j, 2)), "size": str(100 + j)}
+            for j in range(DEPTH)
+        ],
+    }
+
+
+def _cursor(page: int) -> str:
+    return "MA==" if page == 0 else str(page)
+
+
+def recording(client: ClobClient, orders: list) -> list[dict]:
+    """
+    The entries a live session of the benchmarked calls would record
+    """
+    token_ids = [str(i) for i in range(BOOKS)]
+    entries = []
+    for start in range(0, BOOKS, client.batch_chunk_size):
+        chunk = token_ids[start : start + client.batch_chunk_size]
+        entries.append(
+            _entry(
+                "POST",
+                "/books",
+                [{"token_id": t} for t in chunk],
+                [_book(t) for t in chunk],
+            )
+        )
+
+    for page in range(TRADE_PAGES):
+        next_cursor = _cursor(page + 1) if page + 1 < TRADE_PAGES else END_CURSOR
+        data = [
+            {"id": "{}-{}".format(page, i), "price": "0.5", "size": "10"}
+            for i in range(TRADES_PER_PAGE)
+        ]
+        entries.append(
+            _entry(
+                "GET",
+                "/data/trades?next_cursor={}".format(_cursor(page)),
+                None,
+                {"data": data, "next_cursor": next_cursor},
+            )
+        )
+
+    entries.append(
+        _entry(
+            "POST",
+            "/orders",
+            None,
+            [{"success": True, "orderID": str(i)} for i in range(len(orders))],
+        )
+    )
+    return entries
+
+
+def wall_time(fn, number: int = 5) -> float:
+    start = time.perf_counter()
+    for _ in range(number):
+        fn()
+    return (time.perf_counter() - start) / number
+
+
+def main():
+    client = ClobClient("http://replay", chain_id=AMOY, key=private_key, creds=creds)
+    client.market_cache.set_tick_size("123", "0.01")
+    client.market_cache.set_neg_risk("123", False)
+    options = PartialCreateOrderOptions(tick_size="0.01", neg_risk=False)
+    orders = [
+        PostOrdersArgs(
+            order=client.create_order(
+                OrderArgs(token_id="123", price=0.01 * (i + 1), size=10, side=BUY),
+                options,
+            ),
+            orderType=OrderType.GTC,
+        )
+        for i in range(ORDERS)
+    ]
+    books = [BookParams(token_id=str(i)) for i in range(BOOKS)]
+
+    fd, path = tempfile.mkstemp(suffix=".jsonl")
+    with os.fdopen(fd, "w") as f:
+        for entry in recording(client, orders):
+            f.write(json.dumps(entry) + "\n")
+
+    try:
+        calls = {
+            "get_order_books, {} books".format(BOOKS): lambda c: c.get_order_books(
+                books
+            ),
+            "get_trades, {} pages of {}".format(
+                TRADE_PAGES, TRADES_PER_PAGE
+            ): lambda c: c.get_trades(),
+            "post_orders, {} orders".format(ORDERS): lambda c: c.post_orders(orders),
+        }
+        for latency in (0.0, LATENCY):
+            replayed = ClobClient(
+                "http://replay",
+                chain_id=AMOY,
+                key=private_key,
+                creds=creds,
+                transport=ReplayTransport(path, latency=latency, loop=True),
+            )
+            for name, call in calls.items():
+                if latency:
+                    print(
+                        "{:<40} wall: {:>10.1f}ms".format(
+                            name, wall_time(lambda: call(replayed)) * 1e3
+                        )
+                    )
+                else:
+                    print(
+                        "{:<40} cpu:  {:>10.1f}ms".format(
+                            name, measure(lambda: call(replayed), 5, 3) * 1e3
+                        )
+                    )
+    finally:
+        os.remove(path)
+
+
+if __name__ == "__main__":
+    main()
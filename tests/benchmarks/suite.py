@@ -0,0 +1,328 @@
+"""
+Benchmark suite of the client's hot paths, with saved baselines
+
+Every benchmark reports the best per call time of several repeats, CPU time for the
+local computations and wall time for the end-to-end requests to a local MockClobServer.
+A run can be saved as a baseline and compared with a later one, the benchmarks slower
+than the baseline by more than the threshold are reported as regressions.
+Baselines depend on the machine, so they are saved locally and not committed:
+comparing with a missing baseline fails instead of passing.
+
+python -m tests.benchmarks.suite
+python -m tests.benchmarks.suite --save .benchmarks/baseline.json
+python -m tests.benchmarks.suite --compare .benchmarks/baseline.json -k market_price
+"""
+
+import argparse
+import json
+import os
+import platform
+import re
+import sys
+import time
+from contextlib import contextmanager
+
+from py_clob_client.client import ClobClient
+from py_clob_client.clob_types import (
+    ApiCreds,
+    CreateOrderOptions,
+    OrderArgs,
+    OrderType,
+    PostOrdersArgs,
+    RequestArgs,
+)
+from py_clob_client.constants import AMOY
+from py_clob_client.headers.headers import create_level_2_headers
+from py_clob_client.http_helpers.transport import Transport
+from py_clob_client.mock_server.server import MockClobServer
+from py_clob_client.order_book.compact import CompactOrderBookSummary
+from py_clob_client.order_builder.builder import ROUNDING_CONFIG, OrderBuilder
+from py_clob_client.order_builder.constants import BUY, SELL
+from py_clob_client.signer import Signer
+from py_clob_client.signing.hmac import build_hmac_signature
+from py_clob_client.utilities import (
+    OrderBookHashCache,
+    generate_orderbook_summary_hash,
+    parse_raw_orderbook_summary,
+)
+
+from tests.benchmarks.utils import measure
+
+# publicly known private key
+private_key = "0xac0974bec39a17e36ba4a6b4d238ff944bacb478cbed5efcae784d7bf4f2ff80"
+creds = ApiCreds(
+    api_key="000000000-0000-0000-0000-000000000000",
+    api_passphrase="aaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaa",
+    api_secret="AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA=",
+)
+
+DEFAULT_THRESHOLD = 0.1
+BOOK_DEPTH = 1000
+POSTED_ORDERS = 15
+
+# name -> setup, a context manager yielding (fn, number of calls per repeat, clock)
+BENCHMARKS = {}
+
+
+def benchmark(name: str):
+    """
+    Registers a setup generator, the code after its yield runs once measured
+    """
+
+    def register(setup):
+        BENCHMARKS[name] = contextmanager(setup)
+        return setup
+
+    return register
+
+
+def raw_book(depth: int = BOOK_DEPTH) -> dict:
+    """
+    A book of depth levels per side with 0.0001 ticks, best last as sent by the server
+    """
+    return {
+        "market": "0x{:064x}".format(1),
+        "asset_id": str(10**70),
+        "timestamp": "1700000000000",
+        "hash": "",
+        "bids": [
+            {"price": str(round(0.0001 * (i + 1), 4)), "size": str(100 + i * 1.5)}
+            for i in range(depth)
+        ],
+        "asks": [
+            {"price": str(round(0.9999 - 0.0001 * i, 4)), "size": str(100 + i * 2.25)}
+            for i in range(depth)
+        ],
+    }
+
+
+def _builder() -> OrderBuilder:
+    return OrderBuilder(Signer(private_key, AMOY))
+
+
+@benchmark("create_order")
+def _create_order():
+    builder = _builder()
+    order_args = OrderArgs(token_id="123", price=0.5, size=100, side=BUY)
+    options = CreateOrderOptions(tick_size="0.01", neg_risk=False)
+    yield lambda: builder.create_order(order_args, options), 200, time.process_time
+
+
+@benchmark("get_order_amounts")
+def _get_order_amounts():
+    builder = _builder()
+    round_config = ROUNDING_CONFIG["0.001"]
+    yield (
+        lambda: builder.get_order_amounts(SELL, 123.45, 0.567, round_config),
+        20000,
+        time.process_time,
+    )
+
+
+@benchmark("build_hmac_signature")
+def _build_hmac_signature():
+    body = json.dumps([{"order": {"salt": i}} for i in range(POSTED_ORDERS)]).encode()
+    yield (
+        lambda: build_hmac_signature(
+            creds.api_secret, "1700000000", "POST", "/orders", body
+        ),
+        20000,
+        time.process_time,
+    )
+
+
+@benchmark("create_level_2_headers")
+def _create_level_2_headers():
+    signer = Signer(private_key, AMOY)
+    request_args = RequestArgs(
+        method="DELETE", request_path="/order", body=b'{"orderID": "0x123"}'
+    )
+    yield (
+        lambda: create_level_2_headers(signer, creds, request_args),
+        20000,
+        time.process_time,
+    )
+
+
+@benchmark("parse_raw_orderbook_summary")
+def _parse_raw_orderbook_summary():
+    raw = raw_book()
+    yield lambda: parse_raw_orderbook_summary(raw), 100, time.process_time
+
+
+@benchmark("generate_orderbook_summary_hash")
+def _generate_orderbook_summary_hash():
+    summary = parse_raw_orderbook_summary(raw_book())
+    yield lambda: generate_orderbook_summary_hash(summary), 100, time.process_time
+
+
+@benchmark("compact_order_book_from_raw")
+def _compact_order_book_from_raw():
+    raw = raw_book()
+    yield lambda: CompactOrderBookSummary.from_raw(raw), 100, time.process_time
+
+
+@benchmark("order_book_hash_cache")
+def _order_book_hash_cache():
+    # a new snapshot carrying a server hash the cache has already seen
+    raw = raw_book()
+    raw["hash"] = generate_orderbook_summary_hash(parse_raw_orderbook_summary(raw))
+    cache = OrderBookHashCache()
+    cache.hash(parse_raw_orderbook_summary(raw))
+    summary = parse_raw_orderbook_summary(raw)
+    yield lambda: cache.hash(summary), 20000, time.process_time
+
+
+def _market_price(side: str):
+    """
+    The client's market price of half the book, from the compact book it fetches
+    """
+    book = CompactOrderBookSummary.from_raw(raw_book())
+    if side == BUY:
+        # half of the asks' notional
+        amount = sum(p * s for p, s in zip(book.ask_prices, book.ask_sizes)) / 2
+    else:
+        amount = sum(book.bid_sizes) / 2
+    return lambda: book.depth(side).market_price(amount, OrderType.FOK)
+
+
+@benchmark("calculate_market_price_buy")
+def _calculate_market_price_buy():
+    yield _market_price(BUY), 200, time.process_time
+
+
+@benchmark("calculate_market_price_sell")
+def _calculate_market_price_sell():
+    yield _market_price(SELL), 200, time.process_time
+
+
+@benchmark("post_orders_e2e")
+def _post_orders():
+    with MockClobServer() as server, Transport() as transport:
+        client = ClobClient(
+            server.host, chain_id=AMOY, key=private_key, transport=transport
+        )
+        client.set_api_creds(client.create_or_derive_api_creds())
+        options = CreateOrderOptions(tick_size="0.01", neg_risk=False)
+        # resting bids, nothing is matched
+        orders = [
+            PostOrdersArgs(
+                order=client.builder.create_order(
+                    OrderArgs(token_id="123", price=0.01 * (i + 1), size=10, side=BUY),
+                    options,
+                ),
+                orderType=OrderType.GTC,
+            )
+            for i in range(POSTED_ORDERS)
+        ]
+        yield lambda: client.post_orders(orders), 20, time.perf_counter
+
+
+def run(names: list[str], repeat: int = 5) -> dict[str, float]:
+    """
+    The best per call time, in seconds, of every benchmark
+    """
+    results = {}
+    for name in names:
+        with BENCHMARKS[name]() as (fn, number, clock):
+            # warm up the caches
+            fn()
+            results[name] = measure(fn, number, repeat, clock)
+        print("{:<40} {:>12.2f}us".format(name, results[name] * 1e6), flush=True)
+    return results
+
+
+def save(path: str, results: dict[str, float]):
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, "w") as f:
+        json.dump(
+            {
+                "python": platform.python_version(),
+                "machine": platform.machine(),
+                "processor": platform.processor(),
+                "created_at": int(time.time()),
+                "results": results,
+            },
+            f,
+            indent=2,
+            sort_keys=True,
+        )
+
+
+def load(path: str) -> dict[str, float]:
+    with open(path) as f:
+        return json.load(f)["results"]
+
+
+def compare(
+    baseline: dict[str, float],
+    results: dict[str, float],
+    threshold: float = DEFAULT_THRESHOLD,
+) -> list[str]:
+    """
+    Prints the results against the baseline, returns the names of the regressions
+    """
+    regressions = []
+    print(
+        "\n{:<40} {:>12} {:>12} {:>8}".format(
+            "benchmark", "baseline", "current", "ratio"
+        )
+    )
+    for name, current in results.items():
+        before = baseline.get(name)
+        if before is None:
+            print("{:<40} {:>12} {:>10.2f}us".format(name, "-", current * 1e6))
+            continue
+        ratio = current / before
+        status = ""
+        if ratio > 1 + threshold:
+            status = "slower"
+            regressions.append(name)
+        elif ratio < 1 - threshold:
+            status = "faster"
+        print(
+            "{:<40} {:>10.2f}us {:>10.2f}us {:>7.2f}x {}".format(
+                name, before * 1e6, current * 1e6, ratio, status
+            )
+        )
+    return regressions
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("-k", dest="pattern", help="only the benchmarks matching")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--save", metavar="PATH", help="save the results as baseline")
+    parser.add_argument("--compare", metavar="PATH", help="compare with a baseline")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    args = parser.parse_args(argv)
+
+    if args.compare and not os.path.exists(args.compare):
+        # a comparison without baseline would never report a regression
+        print(
+            "no baseline at {}, save one with --save (make bench-baseline)".format(
+                args.compare
+            ),
+            file=sys.stderr,
+        )
+        return 2
+
+    names = [
+        name
+        for name in BENCHMARKS
+        if args.pattern is None or re.search(args.pattern, name)
+    ]
+    results = run(names, args.repeat)
+
+    regressions = []
+    if args.compare:
+        regressions = compare(load(args.compare), results, args.threshold)
+    if args.save:
+        save(args.save, results)
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
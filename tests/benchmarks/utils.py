@@ -0,0 +1,27 @@
+import time
+
+
+def measure(fn, number: int = 1000, repeat: int = 5, clock=time.process_time) -> float:
+    """
+    Returns the best CPU time, in seconds, of a single call to fn
+    clock=time.perf_counter measures the wall time instead
+    """
+    best = None
+    for _ in range(repeat):
+        start = clock()
+        for _ in range(number):
+            fn()
+        elapsed = (clock() - start) / number
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def report(name: str, before: float, after: float):
+    """
+    Prints the per call timings of a before/after pair
+    """
+    print(
+        "{:<40} before: {:>10.1f}us  after: {:>10.1f}us  speedup: {:.2f}x".format(
+            name, before * 1e6, after * 1e6, before / after
+        )
+    )
@@ -9,9 +9,11 @@ from py_clob_client.headers.headers import (
     POLY_PASSPHRASE,
     POLY_SIGNATURE,
     POLY_TIMESTAMP,
+    Level2HeadersContext,
     create_level_1_headers,
     create_level_2_headers,
 )
+from py_clob_client.signing.hmac import build_hmac_signature
 from py_clob_client.signer import Signer
 
 # publicly known private key
@@ -82,3 +84,39 @@ class TestHeaders(TestCase):
         )
         self.assertEqual(l2_headers[POLY_API_KEY], creds.api_key)
         self.assertEqual(l2_headers[POLY_PASSPHRASE], creds.api_passphrase)
+
+    def test_level_2_headers_context(self):
+        context = Level2HeadersContext(signer, creds)
+        request_args = RequestArgs(
+            method="POST", request_path="/order", body=b'{"hash": "0x123"}'
+        )
+
+        l2_headers = context.create_headers(request_args)
+        self.assertEqual(l2_headers[POLY_ADDRESS], signer.address())
+        self.assertEqual(l2_headers[POLY_API_KEY], creds.api_key)
+        self.assertEqual(l2_headers[POLY_PASSPHRASE], creds.api_passphrase)
+        self.assertEqual(
+            l2_headers[POLY_SIGNATURE],
+            build_hmac_signature(
+                creds.api_secret,
+                l2_headers[POLY_TIMESTAMP],
+                "POST",
+                "/order",
+                b'{"hash": "0x123"}',
+            ),
+        )
+
+        # callers may mutate the returned headers, i.e the transport does
+        l2_headers["Content-Type"] = "application/json"
+        l2_headers = context.create_headers(request_args)
+        self.assertNotIn("Content-Type", l2_headers)
+        self.assertEqual(
+            set(l2_headers.keys()),
+            {
+                POLY_ADDRESS,
+                POLY_SIGNATURE,
+                POLY_TIMESTAMP,
+                POLY_API_KEY,
+                POLY_PASSPHRASE,
+            },
+        )
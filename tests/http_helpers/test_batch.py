@@ -0,0 +1,81 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from unittest import TestCase
+
+from py_clob_client.exceptions import PolyApiException, PolyBatchException
+from py_clob_client.http_helpers.batch import (
+    chunk,
+    merge_dicts,
+    merge_lists,
+    post_chunked,
+    post_chunked_async,
+)
+
+
+def _post(url, data=None):
+    if any(item == "bad" for item in data):
+        raise PolyApiException(error_msg="bad chunk", status_code=500)
+    return [item.upper() for item in data]
+
+
+class TestBatch(TestCase):
+    def test_chunk(self):
+        self.assertEqual(
+            chunk([1, 2, 3, 4, 5], 2), [(0, [1, 2]), (2, [3, 4]), (4, [5])]
+        )
+        self.assertEqual(chunk([], 2), [])
+        with self.assertRaises(ValueError):
+            chunk([1], 0)
+
+    def test_merge(self):
+        self.assertEqual(merge_lists([[1, 2], [], [3]]), [1, 2, 3])
+        self.assertEqual(
+            merge_dicts([{"1": "0.5", "2": {"BUY": "0.4"}}, {"2": {"SELL": "0.6"}}]),
+            {"1": "0.5", "2": {"BUY": "0.4", "SELL": "0.6"}},
+        )
+
+    def test_post_chunked(self):
+        body = ["a", "b", "c", "d", "e"]
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            self.assertEqual(
+                post_chunked(_post, "url", body, 2, executor, merge_lists),
+                ["A", "B", "C", "D", "E"],
+            )
+            # a single chunk is sent as is
+            self.assertEqual(
+                post_chunked(_post, "url", body, 5, None, merge_lists),
+                ["A", "B", "C", "D", "E"],
+            )
+            with self.assertRaises(PolyApiException):
+                post_chunked(_post, "url", ["bad"], 5, None, merge_lists)
+
+            with self.assertRaises(PolyBatchException) as e:
+                post_chunked(
+                    _post,
+                    "url",
+                    body[:2] + ["bad"] + body[2:],
+                    2,
+                    executor,
+                    merge_lists,
+                )
+        self.assertEqual(e.exception.result, ["A", "B", "D", "E"])
+        self.assertEqual(
+            [(start, end) for start, end, _ in e.exception.errors], [(2, 4)]
+        )
+        self.assertIsInstance(e.exception.errors[0][2], PolyApiException)
+
+    def test_post_chunked_async(self):
+        async def post(url, data=None):
+            return _post(url, data)
+
+        body = ["a", "b", "c", "d", "e"]
+        self.assertEqual(
+            asyncio.run(post_chunked_async(post, "url", body, 2, merge_lists)),
+            ["A", "B", "C", "D", "E"],
+        )
+        with self.assertRaises(PolyBatchException) as e:
+            asyncio.run(post_chunked_async(post, "url", ["bad"] + body, 3, merge_lists))
+        self.assertEqual(e.exception.result, ["C", "D", "E"])
+        self.assertEqual(
+            [(start, end) for start, end, _ in e.exception.errors], [(0, 3)]
+        )
@@ -0,0 +1,82 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from unittest import TestCase
+
+from py_clob_client.http_helpers.coalescer import Coalescer
+
+
+class Loader:
+    def __init__(self):
+        self.batches = []
+        self.singles = []
+        self.lock = threading.Lock()
+
+    def load_many(self, keys):
+        with self.lock:
+            self.batches.append(keys)
+        if "fail" in keys:
+            raise Exception("batch failed")
+        return {k: k.upper() for k in keys if k != "missing"}
+
+    def load_one(self, key):
+        with self.lock:
+            self.singles.append(key)
+        if key == "fail":
+            raise ValueError(key)
+        return "single " + key
+
+
+class TestCoalescer(TestCase):
+    def load_all(self, coalescer, keys):
+        with ThreadPoolExecutor(max_workers=len(keys)) as executor:
+            futures = [executor.submit(coalescer.load, k) for k in keys]
+        return [f.exception() or f.result() for f in futures]
+
+    def test_coalesces(self):
+        loader = Loader()
+        coalescer = Coalescer(loader.load_many, loader.load_one, window=0.05)
+        keys = ["k{}".format(i) for i in range(20)] + ["k0", "k1"]
+
+        self.assertEqual(self.load_all(coalescer, keys), [k.upper() for k in keys])
+        self.assertEqual(len(loader.batches), 1)
+        # identical keys are loaded once
+        self.assertEqual(sorted(loader.batches[0]), sorted(set(keys)))
+        self.assertEqual(loader.singles, [])
+
+        # the next calls start a new batch
+        self.assertEqual(coalescer.load("a"), "A")
+        self.assertEqual(loader.batches[1], ["a"])
+
+    def test_max_batch_size(self):
+        loader = Loader()
+        coalescer = Coalescer(
+            loader.load_many, loader.load_one, window=0.2, max_batch_size=5
+        )
+        keys = ["k{}".format(i) for i in range(12)]
+
+        self.assertEqual(self.load_all(coalescer, keys), [k.upper() for k in keys])
+        self.assertTrue(all(len(b) <= 5 for b in loader.batches))
+        self.assertEqual(sorted(k for b in loader.batches for k in b), sorted(keys))
+
+    def test_fallback(self):
+        loader = Loader()
+        coalescer = Coalescer(loader.load_many, loader.load_one, window=0.05)
+
+        # keys missing from the result are loaded on their own
+        self.assertEqual(
+            self.load_all(coalescer, ["a", "missing"]), ["A", "single missing"]
+        )
+        self.assertEqual(loader.singles, ["missing"])
+
+        with self.assertRaises(ValueError):
+            Coalescer(loader.load_many, loader.load_one, max_batch_size=0)
+
+    def test_failed_batch(self):
+        loader = Loader()
+        coalescer = Coalescer(loader.load_many, loader.load_one, window=0.05)
+
+        # every caller gets the batch error, no key is loaded on its own
+        results = self.load_all(coalescer, ["a", "b", "fail"])
+        self.assertEqual([str(r) for r in results], ["batch failed"] * 3)
+        self.assertEqual(len(loader.batches), 1)
+        self.assertEqual(loader.singles, [])
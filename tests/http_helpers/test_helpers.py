@@ -62,6 +62,19 @@ class TestHelpers(TestCase):
             "http://tracker?market=10000&asset_id=100&id=aa-bb&next_cursor=MA==",
         )
 
+    def test_next_cursor_without_params(self):
+        self.assertEqual(
+            add_query_open_orders_params("http://tracker", None, "MQ=="),
+            "http://tracker?next_cursor=MQ==",
+        )
+        self.assertEqual(
+            add_query_trade_params("http://tracker", None, "MQ=="),
+            "http://tracker?next_cursor=MQ==",
+        )
+        self.assertEqual(
+            add_query_trade_params("http://tracker", None, None), "http://tracker"
+        )
+
     def test_drop_notifications_query_params(self):
         url = drop_notifications_query_params(
             "http://tracker",
@@ -0,0 +1,105 @@
+import asyncio
+import threading
+from unittest import IsolatedAsyncioTestCase, TestCase
+
+from py_clob_client.constants import END_CURSOR
+from py_clob_client.http_helpers.pagination import (
+    aiter_pages,
+    aiter_records,
+    iter_pages,
+    iter_records,
+    project,
+    projected,
+)
+
+PAGES = {
+    "MA==": {"data": [1, 2], "next_cursor": "MQ=="},
+    "MQ==": {"data": [3], "next_cursor": "Mg=="},
+    "Mg==": {"data": [4, 5], "next_cursor": END_CURSOR},
+}
+
+
+class Fetcher:
+    def __init__(self):
+        self.cursors = []
+        self.threads = set()
+
+    def __call__(self, cursor):
+        self.cursors.append(cursor)
+        self.threads.add(threading.current_thread().name)
+        return PAGES[cursor]
+
+
+class TestPagination(TestCase):
+    def test_iter_records(self):
+        for prefetch in (True, False):
+            fetch = Fetcher()
+            self.assertEqual(
+                list(iter_records(fetch, prefetch=prefetch)), [1, 2, 3, 4, 5]
+            )
+            self.assertEqual(fetch.cursors, ["MA==", "MQ==", "Mg=="])
+
+        self.assertEqual(list(iter_records(Fetcher(), "MQ==")), [3, 4, 5])
+        self.assertEqual(list(iter_records(Fetcher(), None)), [1, 2, 3, 4, 5])
+        self.assertEqual(list(iter_records(Fetcher(), END_CURSOR)), [])
+
+    def test_prefetch(self):
+        fetch = Fetcher()
+        pages = iter_pages(fetch)
+        self.assertEqual(next(pages)["data"], [1, 2])
+        # the second page is requested in the background before it is asked for
+        pages.close()
+        self.assertTrue(all(t.startswith("clob-pages") for t in fetch.threads))
+        self.assertNotIn("Mg==", fetch.cursors)
+
+    def test_project(self):
+        page = {
+            "data": [{"condition_id": "0x1", "tokens": [], "question": "?"}, {}],
+            "next_cursor": END_CURSOR,
+            "count": 2,
+        }
+        self.assertEqual(
+            project(page, ["condition_id", "tokens"]),
+            {
+                "data": [{"condition_id": "0x1", "tokens": []}, {}],
+                "next_cursor": END_CURSOR,
+                "count": 2,
+            },
+        )
+        fetch = projected(lambda cursor: page, iter(["question"]))
+        self.assertEqual(fetch("MA==")["data"], [{"question": "?"}, {}])
+        self.assertEqual(fetch("MA==")["data"], [{"question": "?"}, {}])
+
+    def test_early_break(self):
+        fetch = Fetcher()
+        for record in iter_records(fetch, prefetch=False):
+            break
+        self.assertEqual(fetch.cursors, ["MA=="])
+
+
+class TestAsyncPagination(IsolatedAsyncioTestCase):
+    async def test_aiter_records(self):
+        for prefetch in (True, False):
+            cursors = []
+
+            async def fetch(cursor):
+                cursors.append(cursor)
+                await asyncio.sleep(0)
+                return PAGES[cursor]
+
+            records = [r async for r in aiter_records(fetch, prefetch=prefetch)]
+            self.assertEqual(records, [1, 2, 3, 4, 5])
+            self.assertEqual(cursors, ["MA==", "MQ==", "Mg=="])
+
+    async def test_early_break(self):
+        cursors = []
+
+        async def fetch(cursor):
+            cursors.append(cursor)
+            return PAGES[cursor]
+
+        pages = aiter_pages(fetch)
+        async for page in pages:
+            break
+        await pages.aclose()
+        self.assertNotIn("Mg==", cursors)
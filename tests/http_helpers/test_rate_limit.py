@@ -0,0 +1,86 @@
+import time
+from email.utils import formatdate
+from unittest import TestCase
+
+from py_clob_client.http_helpers.rate_limit import (
+    CANCELS,
+    DEFAULT,
+    MARKET_DATA,
+    ORDERS,
+    RateLimiter,
+    RetryPolicy,
+    TokenBucket,
+    endpoint_group,
+    parse_retry_after,
+)
+
+
+class TestRateLimit(TestCase):
+    def test_endpoint_group(self):
+        host = "https://clob.polymarket.com"
+        self.assertEqual(endpoint_group("POST", host + "/order"), ORDERS)
+        self.assertEqual(endpoint_group("POST", host + "/orders"), ORDERS)
+        self.assertEqual(endpoint_group("DELETE", host + "/order"), CANCELS)
+        self.assertEqual(endpoint_group("DELETE", host + "/cancel-all"), CANCELS)
+        self.assertEqual(endpoint_group("GET", host + "/book?token_id=1"), MARKET_DATA)
+        self.assertEqual(endpoint_group("POST", host + "/books"), MARKET_DATA)
+        self.assertEqual(endpoint_group("GET", host + "/data/orders"), DEFAULT)
+
+    def test_token_bucket(self):
+        bucket = TokenBucket(rate=100, burst=5)
+        self.assertEqual([bucket.reserve() for _ in range(5)], [0.0] * 5)
+        # then one token every 10ms, queued in order
+        delays = [bucket.reserve() for _ in range(3)]
+        self.assertAlmostEqual(delays[0], 0.01, delta=0.002)
+        self.assertAlmostEqual(delays[2], 0.03, delta=0.002)
+
+        bucket = TokenBucket(rate=50, burst=1)
+        start = time.monotonic()
+        for _ in range(6):
+            bucket.acquire()
+        self.assertGreaterEqual(time.monotonic() - start, 0.09)
+
+        with self.assertRaises(ValueError):
+            TokenBucket(rate=0)
+
+    def test_rate_limiter(self):
+        limiter = RateLimiter({ORDERS: (1, 1)})
+        self.assertEqual(limiter.reserve("POST", "http://h/order"), 0.0)
+        self.assertGreater(limiter.reserve("POST", "http://h/orders"), 0.9)
+        # not limited
+        self.assertEqual(limiter.reserve("GET", "http://h/book"), 0.0)
+        self.assertEqual(limiter.reserve("GET", "http://h/book"), 0.0)
+
+    def test_parse_retry_after(self):
+        self.assertEqual(parse_retry_after("2"), 2.0)
+        self.assertEqual(parse_retry_after("0.5"), 0.5)
+        self.assertIsNone(parse_retry_after(None))
+        self.assertIsNone(parse_retry_after("soon"))
+        delay = parse_retry_after(formatdate(time.time() + 10, usegmt=True))
+        self.assertAlmostEqual(delay, 10, delta=1.5)
+        self.assertEqual(parse_retry_after(formatdate(0, usegmt=True)), 0.0)
+
+    def test_retry_policy(self):
+        retry = RetryPolicy(max_retries=2, backoff=0.1, max_backoff=0.3)
+        self.assertTrue(retry.should_retry("GET", 0))
+        self.assertTrue(retry.should_retry("GET", 1, 429))
+        self.assertFalse(retry.should_retry("GET", 2, 429))
+        self.assertFalse(retry.should_retry("GET", 0, 400))
+        self.assertFalse(retry.should_retry("POST", 0, 503))
+
+        for attempt in range(5):
+            delay = retry.delay(attempt)
+            self.assertTrue(0 <= delay <= min(0.3, 0.1 * 2**attempt))
+        self.assertEqual(retry.delay(0, retry_after=2), 2)
+
+        # Retry-After is bounded
+        retry = RetryPolicy(max_retry_after=10)
+        self.assertTrue(retry.should_retry("GET", 0, 429, retry_after=10))
+        self.assertFalse(retry.should_retry("GET", 0, 429, retry_after=3600))
+        self.assertEqual(retry.delay(0, retry_after=3600), 10)
+
+        # signed requests are not retried
+        self.assertFalse(
+            retry.should_retry("GET", 0, 503, headers={"POLY_SIGNATURE": "0x1"})
+        )
+        self.assertTrue(retry.should_retry("GET", 0, 503, headers={"Accept": "*/*"}))
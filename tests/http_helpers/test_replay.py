@@ -0,0 +1,229 @@
+import asyncio
+import os
+import tempfile
+import time
+from unittest import IsolatedAsyncioTestCase, TestCase
+
+from py_clob_client.client import ClobClient
+from py_clob_client.clob_types import ApiCreds, BookParams, OrderArgs
+from py_clob_client.constants import AMOY, END_CURSOR
+from py_clob_client.exceptions import PolyApiException
+from py_clob_client.http_helpers.replay import (
+    REDACTED,
+    AsyncReplayTransport,
+    RecordingTransport,
+    ReplayTransport,
+    load_recording,
+)
+from py_clob_client.http_helpers.transport import GET, POST, Transport
+from py_clob_client.mock_server.server import MockClobServer
+from py_clob_client.order_builder.constants import BUY
+
+from tests.stub_server import StubServer
+
+creds = ApiCreds(
+    api_key="000000000-0000-0000-0000-000000000000",
+    api_passphrase="aaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaa",
+    api_secret="AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA=",
+)
+
+
+def _trades(query, body):
+    pages = {
+        "MA==": {"data": [{"id": "1"}, {"id": "2"}], "next_cursor": "MQ=="},
+        "MQ==": {"data": [{"id": "3"}], "next_cursor": END_CURSOR},
+    }
+    return 200, pages[query["next_cursor"]]
+
+
+def _books(query, body):
+    return 200, [
+        {
+            "market": "0xaabbcc",
+            "asset_id": p["token_id"],
+            "bids": [{"price": "0.4", "size": "100"}],
+            "asks": [{"price": "0.6", "size": "100"}],
+            "hash": "",
+            "timestamp": "123456789",
+        }
+        for p in body
+    ]
+
+
+ROUTES = {
+    ("GET", "/data/trades"): _trades,
+    ("POST", "/books"): _books,
+    ("GET", "/error"): lambda q, b: (400, {"error": "bad request"}),
+}
+
+
+def _entry(method, path, body=None, response=None, status=200):
+    return {
+        "method": method,
+        "path": path,
+        "body": body,
+        "status": status,
+        "response": response,
+    }
+
+
+class TestRecordReplay(TestCase):
+    def setUp(self):
+        fd, self.path = tempfile.mkstemp(suffix=".jsonl")
+        os.close(fd)
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def test_replays_a_recorded_session(self):
+        with StubServer(ROUTES) as server:
+            with RecordingTransport(self.path, Transport()) as transport:
+                client = ClobClient(
+                    server.host,
+                    chain_id=AMOY,
+                    key="0x" + "1" * 64,
+                    creds=creds,
+                    transport=transport,
+                )
+                trades = client.get_trades()
+                books = client.get_order_books(
+                    [BookParams(token_id="1"), BookParams(token_id="2")]
+                )
+                with self.assertRaises(PolyApiException):
+                    transport.get(server.host + "/error")
+
+        entries = load_recording(self.path)
+        self.assertEqual(
+            [(e["method"], e["path"], e["status"]) for e in entries],
+            [
+                (GET, "/data/trades?next_cursor=MA==", 200),
+                (GET, "/data/trades?next_cursor=MQ==", 200),
+                (POST, "/books", 200),
+                (GET, "/error", 400),
+            ],
+        )
+        self.assertEqual(entries[2]["body"], [{"token_id": "1"}, {"token_id": "2"}])
+
+        # replayed against another host, without network
+        transport = ReplayTransport(self.path)
+        client = ClobClient(
+            "http://replay",
+            chain_id=AMOY,
+            key="0x" + "1" * 64,
+            creds=creds,
+            transport=transport,
+        )
+        self.assertEqual(client.get_trades(), trades)
+        self.assertEqual(
+            client.get_order_books(
+                [BookParams(token_id="1"), BookParams(token_id="2")]
+            ),
+            books,
+        )
+        with self.assertRaises(PolyApiException) as e:
+            transport.get("http://replay/error")
+        self.assertEqual(e.exception.status_code, 400)
+        self.assertEqual(e.exception.error_msg, {"error": "bad request"})
+
+    def test_redacts_api_credentials(self):
+        with MockClobServer() as server:
+            with RecordingTransport(self.path, Transport()) as transport:
+                client = ClobClient(
+                    server.host,
+                    chain_id=AMOY,
+                    key="0x" + "1" * 64,
+                    transport=transport,
+                )
+                created = client.create_api_key()
+                derived = client.derive_api_key()
+                client.set_api_creds(created)
+                client.get_api_keys()
+
+        with open(self.path) as f:
+            recording = f.read()
+        for secret in (created.api_key, created.api_secret, created.api_passphrase):
+            self.assertNotIn(secret, recording)
+        self.assertEqual(derived, created)
+        self.assertEqual(
+            load_recording(self.path)[0]["response"],
+            {"apiKey": REDACTED, "secret": REDACTED, "passphrase": REDACTED},
+        )
+
+    def test_redacts_order_owner(self):
+        with MockClobServer() as server:
+            with RecordingTransport(self.path, Transport()) as transport:
+                client = ClobClient(
+                    server.host,
+                    chain_id=AMOY,
+                    key="0x" + "1" * 64,
+                    transport=transport,
+                )
+                client.set_api_creds(client.create_or_derive_api_creds())
+                orders = [
+                    client.create_order(
+                        OrderArgs(token_id="1", price=price, size=10, side=BUY)
+                    )
+                    for price in (0.4, 0.5)
+                ]
+                responses = [client.post_order(order) for order in orders]
+                client.get_orders()
+
+        with open(self.path) as f:
+            recording = f.read()
+        self.assertNotIn(client.creds.api_key, recording)
+        post = [e for e in load_recording(self.path) if e["path"] == "/order"][0]
+        self.assertEqual(post["body"]["owner"], REDACTED)
+
+        # the redacted bodies are still told apart on replay
+        client.transport = ReplayTransport(self.path)
+        self.assertEqual(client.post_order(orders[1]), responses[1])
+        self.assertEqual(client.post_order(orders[0]), responses[0])
+
+    def test_prefers_the_entry_with_the_same_body(self):
+        transport = ReplayTransport(
+            entries=[
+                _entry(POST, "/books", [{"token_id": "1"}], ["one"]),
+                _entry(POST, "/books", [{"token_id": "2"}], ["two"]),
+            ]
+        )
+        self.assertEqual(
+            transport.post("http://host/books", data=b'[{"token_id":"2"}]'), ["two"]
+        )
+        # no entry with this body, the next unused one is served
+        self.assertEqual(
+            transport.post("http://host/books", data=b'[{"token_id":"3"}]'), ["one"]
+        )
+
+    def test_exhausted_and_unknown_requests(self):
+        transport = ReplayTransport(entries=[_entry(GET, "/time", response=1)])
+        self.assertEqual(transport.get("http://host/time"), 1)
+        with self.assertRaises(PolyApiException):
+            transport.get("http://host/time")
+        with self.assertRaises(PolyApiException):
+            transport.get("http://host/ok")
+
+        transport = ReplayTransport(
+            entries=[_entry(GET, "/time", response=1)], loop=True
+        )
+        self.assertEqual([transport.get("http://host/time") for _ in range(3)], [1] * 3)
+
+    def test_latency(self):
+        transport = ReplayTransport(
+            entries=[_entry(GET, "/time", response=1)], latency=0.05, loop=True
+        )
+        start = time.monotonic()
+        transport.get("http://host/time")
+        self.assertGreaterEqual(time.monotonic() - start, 0.05)
+
+
+class TestAsyncReplay(IsolatedAsyncioTestCase):
+    async def test_latency_is_awaited(self):
+        transport = AsyncReplayTransport(
+            entries=[_entry(GET, "/time", response=1)], latency=0.05, loop=True
+        )
+        start = time.monotonic()
+        results = await asyncio.gather(
+            *(transport.get("http://host/time") for _ in range(10))
+        )
+        self.assertEqual(results, [1] * 10)
+        self.assertLess(time.monotonic() - start, 0.4)
@@ -0,0 +1,109 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest import IsolatedAsyncioTestCase, TestCase
+
+from py_clob_client.http_helpers.single_flight import AsyncSingleFlight, SingleFlight
+
+
+class TestSingleFlight(TestCase):
+    def test_shares_in_flight_call(self):
+        single_flight = SingleFlight()
+        calls = []
+
+        def fn():
+            calls.append(1)
+            time.sleep(0.1)
+            return {"minimum_tick_size": 0.01}
+
+        with ThreadPoolExecutor(max_workers=10) as executor:
+            results = list(executor.map(lambda _: single_flight.do("k", fn), range(10)))
+
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(results, [{"minimum_tick_size": 0.01}] * 10)
+
+        # the next call runs again
+        single_flight.do("k", fn)
+        self.assertEqual(len(calls), 2)
+
+    def test_exception(self):
+        single_flight = SingleFlight()
+        started = threading.Event()
+
+        def fn():
+            started.set()
+            time.sleep(0.1)
+            raise ValueError("boom")
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            leader = executor.submit(single_flight.do, "k", fn)
+            started.wait()
+            waiter = executor.submit(single_flight.do, "k", fn)
+
+        self.assertIsInstance(leader.exception(), ValueError)
+        self.assertIsInstance(waiter.exception(), ValueError)
+        self.assertEqual(single_flight.do("k", lambda: 1), 1)
+
+
+class TestAsyncSingleFlight(IsolatedAsyncioTestCase):
+    async def test_shares_in_flight_call(self):
+        single_flight = AsyncSingleFlight()
+        calls = []
+
+        async def fn():
+            calls.append(1)
+            await asyncio.sleep(0.05)
+            if len(calls) > 1:
+                raise ValueError("boom")
+            return True
+
+        self.assertEqual(
+            await asyncio.gather(*[single_flight.do("k", fn) for _ in range(10)]),
+            [True] * 10,
+        )
+        self.assertEqual(len(calls), 1)
+
+        results = await asyncio.gather(
+            *[single_flight.do("k", fn) for _ in range(3)], return_exceptions=True
+        )
+        self.assertEqual(len(calls), 2)
+        self.assertTrue(all(isinstance(r, ValueError) for r in results))
+
+    async def test_cancelled_waiter(self):
+        single_flight = AsyncSingleFlight()
+
+        async def fn():
+            await asyncio.sleep(0.05)
+            return True
+
+        first = asyncio.ensure_future(single_flight.do("k", fn))
+        second = asyncio.ensure_future(single_flight.do("k", fn))
+        await asyncio.sleep(0)
+        first.cancel()
+        self.assertTrue(await second)
+
+    async def test_cancelled_leader(self):
+        single_flight = AsyncSingleFlight()
+        calls = []
+
+        async def fn():
+            calls.append(1)
+            await asyncio.sleep(0.05)
+            return True
+
+        leader = asyncio.ensure_future(single_flight.do("k", fn))
+        follower = asyncio.ensure_future(single_flight.do("k", fn))
+        await asyncio.sleep(0)
+        leader.cancel()
+        await asyncio.sleep(0)
+
+        # still shared with the callers after the cancellation
+        late = asyncio.ensure_future(single_flight.do("k", fn))
+        self.assertEqual(await asyncio.gather(follower, late), [True, True])
+        self.assertTrue(leader.cancelled())
+        self.assertEqual(len(calls), 1)
+
+        # and the next call runs again
+        self.assertTrue(await single_flight.do("k", fn))
+        self.assertEqual(len(calls), 2)
@@ -0,0 +1,164 @@
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest import TestCase
+
+from py_clob_client.exceptions import PolyApiException
+from py_clob_client.http_helpers.rate_limit import ORDERS, RateLimiter, RetryPolicy
+from py_clob_client.http_helpers.transport import Transport
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # number of requests of every path
+    counts = {}
+
+    def do_GET(self):
+        count = self.counts[self.path] = self.counts.get(self.path, 0) + 1
+        if self.path.startswith("/limited"):
+            self._reply(429, {"error": "too many requests"}, {"Retry-After": "3600"})
+            return
+        if self.path.startswith("/flaky") and count < 3:
+            self._reply(429, {"error": "too many requests"}, {"Retry-After": "0.05"})
+            return
+        if self.path == "/slow":
+            time.sleep(0.5)
+        if self.path == "/error":
+            self._reply(400, {"error": "bad request"})
+            return
+        self._reply(200, {"port": self.client_address[1], "path": self.path})
+
+    def do_POST(self):
+        self.counts[self.path] = self.counts.get(self.path, 0) + 1
+        if self.path.startswith("/flaky"):
+            self._reply(503, {"error": "unavailable"})
+            return
+        length = int(self.headers.get("Content-Length", 0))
+        body = json.loads(self.rfile.read(length)) if length else None
+        self._reply(200, {"port": self.client_address[1], "body": body})
+
+    def _reply(self, status, payload, headers=None):
+        raw = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(raw)))
+        self.end_headers()
+        self.wfile.write(raw)
+
+    def log_message(self, *args):
+        pass
+
+
+class TestTransport(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+        cls.host = "http://127.0.0.1:{}".format(cls.server.server_port)
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def test_reuses_connection(self):
+        with Transport() as transport:
+            first = transport.get("{}/a".format(self.host))
+            second = transport.get("{}/b".format(self.host))
+            third = transport.post("{}/c".format(self.host), data={"a": 1})
+
+        self.assertEqual(first["path"], "/a")
+        self.assertEqual(second["path"], "/b")
+        self.assertEqual(third["body"], {"a": 1})
+        # same client port => same keep-alive connection
+        self.assertEqual(first["port"], second["port"])
+        self.assertEqual(first["port"], third["port"])
+
+    def test_read_timeout(self):
+        with Transport(read_timeout=0.1) as transport:
+            with self.assertRaises(PolyApiException):
+                transport.get("{}/slow".format(self.host))
+
+        with Transport(read_timeout=5) as transport:
+            self.assertEqual(
+                transport.get("{}/slow".format(self.host))["path"], "/slow"
+            )
+
+    def test_non_200(self):
+        with Transport() as transport:
+            with self.assertRaises(PolyApiException) as ctx:
+                transport.get("{}/error".format(self.host))
+            self.assertEqual(ctx.exception.status_code, 400)
+            self.assertEqual(ctx.exception.error_msg, {"error": "bad request"})
+
+    def test_host_pool_maxsize(self):
+        transport = Transport(
+            pool_maxsize=4, host_pool_maxsize={"{}/".format(self.host): 32}
+        )
+        adapter = transport.session.get_adapter("{}/a".format(self.host))
+        self.assertEqual(adapter._pool_maxsize, 32)
+
+        adapter = transport.session.get_adapter("http://other-host/a")
+        self.assertEqual(adapter._pool_maxsize, 4)
+        transport.close()
+
+    def test_retries_gets(self):
+        with Transport() as transport:
+            start = time.monotonic()
+            self.assertEqual(
+                transport.get("{}/flaky/a".format(self.host))["path"], "/flaky/a"
+            )
+            # two retries, after Retry-After each
+            self.assertGreaterEqual(time.monotonic() - start, 0.1)
+            self.assertEqual(_Handler.counts["/flaky/a"], 3)
+
+            # not idempotent
+            with self.assertRaises(PolyApiException) as ctx:
+                transport.post("{}/flaky/b".format(self.host))
+            self.assertEqual(ctx.exception.status_code, 503)
+            self.assertEqual(_Handler.counts["/flaky/b"], 1)
+
+        with Transport(retry=RetryPolicy(max_retries=1)) as transport:
+            with self.assertRaises(PolyApiException) as ctx:
+                transport.get("{}/flaky/c".format(self.host))
+            self.assertEqual(ctx.exception.status_code, 429)
+            self.assertEqual(_Handler.counts["/flaky/c"], 2)
+
+    def test_does_not_retry(self):
+        with Transport() as transport:
+            # Retry-After past max_retry_after
+            start = time.monotonic()
+            with self.assertRaises(PolyApiException) as ctx:
+                transport.get("{}/limited".format(self.host))
+            self.assertEqual(ctx.exception.status_code, 429)
+            self.assertLess(time.monotonic() - start, 1)
+            self.assertEqual(_Handler.counts["/limited"], 1)
+
+            # signed with L2 headers
+            with self.assertRaises(PolyApiException) as ctx:
+                transport.get(
+                    "{}/flaky/signed".format(self.host),
+                    headers={"POLY_SIGNATURE": "sig", "POLY_TIMESTAMP": "1"},
+                )
+            self.assertEqual(ctx.exception.status_code, 429)
+            self.assertEqual(_Handler.counts["/flaky/signed"], 1)
+
+    def test_connection_error(self):
+        transport = Transport(retry=RetryPolicy(max_retries=2, backoff=0.01))
+        with self.assertRaises(PolyApiException) as ctx:
+            transport.get("http://127.0.0.1:9/")
+        self.assertIn("Request exception!", ctx.exception.error_msg)
+        self.assertIn("ConnectionError", ctx.exception.error_msg)
+        transport.close()
+
+    def test_rate_limiter(self):
+        limiter = RateLimiter({ORDERS: (20, 1)})
+        with Transport(rate_limiter=limiter) as transport:
+            start = time.monotonic()
+            for _ in range(4):
+                transport.post("{}/order".format(self.host), data={})
+            # paced at 20 per second after the first
+            self.assertGreaterEqual(time.monotonic() - start, 0.14)
@@ -0,0 +1,148 @@
+import time
+from unittest import TestCase
+from unittest.mock import patch
+
+from py_clob_client.clob_types import OrderType
+from py_clob_client.mock_server.engine import (
+    CANCELED,
+    LIVE,
+    MATCHED,
+    UNMATCHED,
+    MatchingEngine,
+    from_units,
+    to_units,
+)
+from py_clob_client.order_builder.constants import BUY, SELL
+
+
+def _place(engine, owner, side, price, size, order_type=OrderType.GTC, **kwargs):
+    return engine.place(
+        owner, owner, "1", side, to_units(price), to_units(size), order_type, **kwargs
+    )
+
+
+class TestMatchingEngine(TestCase):
+    def test_units(self):
+        self.assertEqual(to_units("0.55"), 550_000)
+        self.assertEqual(from_units(1_500_000), "1.5")
+        self.assertEqual(from_units(2_000_000), "2")
+        self.assertEqual(from_units(10_000), "0.01")
+
+    def test_resting_orders(self):
+        engine = MatchingEngine()
+        _place(engine, "a", BUY, 0.4, 10)
+        _place(engine, "a", BUY, 0.5, 5)
+        _place(engine, "a", BUY, 0.5, 5)
+        _place(engine, "b", SELL, 0.6, 7)
+        _place(engine, "b", SELL, 0.7, 3)
+
+        summary = engine.summary("1")
+        # best last
+        self.assertEqual(
+            summary["bids"],
+            [{"price": "0.4", "size": "10"}, {"price": "0.5", "size": "10"}],
+        )
+        self.assertEqual(
+            summary["asks"],
+            [{"price": "0.7", "size": "3"}, {"price": "0.6", "size": "7"}],
+        )
+        self.assertEqual(len(summary["hash"]), 40)
+        self.assertEqual(engine.best_prices("1"), (500_000, 600_000))
+
+    def test_price_time_priority(self):
+        engine = MatchingEngine()
+        first, _ = _place(engine, "a", SELL, 0.6, 5)
+        second, _ = _place(engine, "b", SELL, 0.6, 5)
+        cheaper, _ = _place(engine, "c", SELL, 0.55, 2)
+
+        order, trades = _place(engine, "d", BUY, 0.6, 8)
+        self.assertEqual(order.status, MATCHED)
+        self.assertEqual(
+            [(t["maker_orders"][0]["order_id"], t["size"], t["price"]) for t in trades],
+            [
+                (cheaper.id, "2", "0.55"),
+                (first.id, "5", "0.6"),
+                (second.id, "1", "0.6"),
+            ],
+        )
+        self.assertEqual(first.status, MATCHED)
+        self.assertEqual(second.status, LIVE)
+        self.assertEqual(second.remaining, to_units(4))
+        self.assertEqual(engine.last_trade("1"), (600_000, BUY))
+
+    def test_remainder_rests(self):
+        engine = MatchingEngine()
+        _place(engine, "a", SELL, 0.6, 5)
+        order, trades = _place(engine, "b", BUY, 0.65, 8)
+        self.assertEqual(len(trades), 1)
+        self.assertEqual(order.status, LIVE)
+        self.assertEqual(engine.summary("1")["bids"], [{"price": "0.65", "size": "3"}])
+        self.assertEqual(engine.summary("1")["asks"], [])
+
+    def test_fok_and_fak(self):
+        engine = MatchingEngine()
+        _place(engine, "a", BUY, 0.5, 5)
+
+        order, trades = _place(engine, "b", SELL, 0.5, 8, OrderType.FOK)
+        self.assertEqual((order.status, trades), (UNMATCHED, []))
+        self.assertEqual(engine.summary("1")["bids"], [{"price": "0.5", "size": "5"}])
+
+        order, trades = _place(engine, "b", SELL, 0.5, 8, OrderType.FAK)
+        self.assertEqual(order.status, CANCELED)
+        self.assertEqual(order.size_matched, to_units(5))
+        self.assertEqual(engine.summary("1")["bids"], [])
+        self.assertEqual(engine.summary("1")["asks"], [])
+
+    def test_cancel(self):
+        engine = MatchingEngine()
+        a, _ = _place(engine, "a", BUY, 0.5, 5)
+        b, _ = _place(engine, "a", BUY, 0.4, 5)
+        c, _ = _place(engine, "b", BUY, 0.4, 5)
+
+        self.assertEqual(
+            engine.cancel("a", [a.id, c.id]),
+            {"canceled": [a.id], "not_canceled": {c.id: "order not found"}},
+        )
+        self.assertEqual(engine.cancel_all("a")["canceled"], [b.id])
+        self.assertEqual(engine.summary("1")["bids"], [{"price": "0.4", "size": "5"}])
+        self.assertEqual([o["id"] for o in engine.open_orders("b")], [c.id])
+
+    def test_user_trades(self):
+        engine = MatchingEngine()
+        _place(engine, "a", SELL, 0.6, 5)
+        _place(engine, "b", BUY, 0.6, 5)
+        self.assertEqual(len(engine.user_trades("a")), 1)
+        self.assertEqual(len(engine.user_trades("b")), 1)
+        self.assertEqual(engine.user_trades("c"), [])
+
+    def test_gtd_expiration(self):
+        engine = MatchingEngine()
+        now = int(time.time())
+        gtd, _ = _place(engine, "a", SELL, 0.6, 5, OrderType.GTD, expiration=now + 60)
+        gtc, _ = _place(engine, "a", SELL, 0.65, 5)
+        self.assertEqual(len(engine.open_orders("a")), 2)
+
+        with patch("time.time", return_value=now + 61):
+            self.assertEqual([o["id"] for o in engine.open_orders("a")], [gtc.id])
+            self.assertEqual(gtd.status, CANCELED)
+            # not matched once expired
+            order, trades = _place(engine, "b", BUY, 0.65, 5)
+        self.assertEqual(order.status, MATCHED)
+        self.assertEqual(trades[0]["maker_orders"][0]["order_id"], gtc.id)
+
+    def test_history(self):
+        engine = MatchingEngine(max_history=2)
+        live, _ = engine.place("a", "a", "2", BUY, to_units(0.4), to_units(5))
+        for _ in range(3):
+            _place(engine, "a", SELL, 0.6, 5)
+            _place(engine, "b", BUY, 0.6, 5)
+
+        # the live order is kept, only the last closed orders and trades
+        self.assertEqual(len(engine.orders), 3)
+        self.assertIsNotNone(engine.get_order("a", live.id))
+        self.assertEqual(len(engine.trades), 2)
+        self.assertEqual(len(engine.user_trades("a")), 2)
+        self.assertEqual([o["id"] for o in engine.open_orders("a")], [live.id])
+        self.assertEqual(engine.open_orders("a", asset_id="1"), [])
+        self.assertEqual(engine.cancel_all("a", asset_id="2")["canceled"], [live.id])
+        self.assertEqual(engine.open_orders("a"), [])
@@ -0,0 +1,187 @@
+from unittest import IsolatedAsyncioTestCase, TestCase
+
+from py_clob_client.async_client import AsyncClobClient
+from py_clob_client.client import ClobClient
+from py_clob_client.clob_types import (
+    ApiCreds,
+    BookParams,
+    OrderArgs,
+    OrderType,
+    PostOrdersArgs,
+    TradeParams,
+)
+from py_clob_client.constants import AMOY, END_CURSOR
+from py_clob_client.exceptions import PolyApiException
+from py_clob_client.mock_server.server import MockClobServer, paginate
+from py_clob_client.order_builder.constants import BUY, SELL
+
+# publicly known private keys
+maker_key = "0xac0974bec39a17e36ba4a6b4d238ff944bacb478cbed5efcae784d7bf4f2ff80"
+taker_key = "0x59c6995e998f97a5a0044966f0945389dc9e86dae88c7a8412f4603b6b78690d"
+
+MARKETS = [
+    {
+        "condition_id": "0xc1",
+        "tokens": [{"token_id": "1", "outcome": "Yes"}, {"token_id": "2"}],
+        "minimum_tick_size": 0.01,
+        "neg_risk": False,
+    },
+    {
+        "condition_id": "0xc2",
+        "tokens": [{"token_id": "3", "outcome": "Yes"}],
+        "minimum_tick_size": 0.001,
+        "neg_risk": True,
+    },
+]
+
+
+def _client(server, key):
+    client = ClobClient(server.host, chain_id=AMOY, key=key)
+    client.set_api_creds(client.create_or_derive_api_creds())
+    return client
+
+
+class TestPaginate(TestCase):
+    def test_paginate(self):
+        first = paginate([1, 2, 3], "MA==", 2)
+        self.assertEqual(first["data"], [1, 2])
+        second = paginate([1, 2, 3], first["next_cursor"], 2)
+        self.assertEqual(second["data"], [3])
+        self.assertEqual(second["next_cursor"], END_CURSOR)
+        self.assertEqual(paginate([1, 2, 3], END_CURSOR, 2)["data"], [])
+
+
+class TestMockClobServer(TestCase):
+    def setUp(self):
+        self.server = MockClobServer(markets=MARKETS, page_size=2).start()
+        self.maker = _client(self.server, maker_key)
+        self.taker = _client(self.server, taker_key)
+
+    def tearDown(self):
+        self.server.stop()
+
+    def test_public_routes(self):
+        self.assertEqual(self.maker.get_ok(), "OK")
+        self.assertEqual(self.maker.get_tick_size("3"), "0.001")
+        self.assertTrue(self.maker.get_neg_risk("3"))
+        self.assertEqual(self.maker.get_tick_size("unknown"), "0.01")
+        self.assertEqual(
+            [m["condition_id"] for m in self.maker.iter_markets()], ["0xc1", "0xc2"]
+        )
+        self.assertEqual(self.maker.get_market("0xc2")["minimum_tick_size"], 0.001)
+
+    def test_api_keys(self):
+        # created once, then derived
+        creds = self.maker.create_or_derive_api_creds()
+        self.assertEqual(creds, self.maker.creds)
+        self.assertEqual(self.maker.get_api_keys(), {"apiKeys": [creds.api_key]})
+        self.assertNotEqual(self.taker.creds, creds)
+
+    def test_rejects_bad_credentials(self):
+        client = ClobClient(
+            self.server.host,
+            chain_id=AMOY,
+            key=maker_key,
+            creds=ApiCreds(
+                api_key=self.maker.creds.api_key,
+                api_secret="AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA=",
+                api_passphrase=self.maker.creds.api_passphrase,
+            ),
+        )
+        with self.assertRaises(PolyApiException) as e:
+            client.get_orders()
+        self.assertEqual(e.exception.status_code, 401)
+
+        # the L2 headers of another address
+        client = ClobClient(
+            self.server.host, chain_id=AMOY, key=taker_key, creds=self.maker.creds
+        )
+        with self.assertRaises(PolyApiException) as e:
+            client.get_orders()
+        self.assertEqual(e.exception.status_code, 401)
+
+    def test_matching(self):
+        asks = [
+            PostOrdersArgs(
+                order=self.maker.create_order(
+                    OrderArgs(token_id="1", price=price, size=10, side=SELL)
+                ),
+                orderType=OrderType.GTC,
+            )
+            for price in (0.6, 0.61, 0.62)
+        ]
+        responses = self.maker.post_orders(asks)
+        self.assertEqual([r["status"] for r in responses], ["live"] * 3)
+        self.assertEqual(len(self.maker.get_orders()), 3)
+
+        book = self.taker.get_order_book("1")
+        self.assertEqual([a.price for a in book.asks], ["0.62", "0.61", "0.6"])
+        self.assertEqual(self.taker.get_order_book_hash(book), book.hash)
+
+        response = self.taker.create_and_post_order(
+            OrderArgs(token_id="1", price=0.61, size=15, side=BUY)
+        )
+        self.assertEqual(response["status"], "matched")
+        self.assertEqual(response["takingAmount"], "15")
+        self.assertEqual(response["makingAmount"], "9.05")
+        self.assertEqual(self.taker.get_last_trade_price("1")["price"], "0.61")
+
+        # paginated by 2
+        trades = self.maker.get_trades(TradeParams(asset_id="1"))
+        self.assertEqual(len(trades), 2)
+        self.assertEqual(self.taker.get_trades(), trades)
+
+        self.assertEqual(
+            self.maker.get_order(responses[1]["orderID"])["size_matched"], "5"
+        )
+        self.assertEqual(
+            self.maker.cancel_all()["canceled"],
+            [responses[1]["orderID"], responses[2]["orderID"]],
+        )
+        self.assertEqual(self.taker.get_order_books([BookParams("1")])[0].asks, [])
+
+    def test_tick_size_rejection(self):
+        self.maker.market_cache.set_tick_size("3", "0.0001")
+        order = self.maker.create_order(
+            OrderArgs(token_id="3", price=0.5001, size=10, side=BUY)
+        )
+        responses = self.maker.post_orders(
+            [PostOrdersArgs(order=order, orderType=OrderType.GTC)]
+        )
+        self.assertFalse(responses[0]["success"])
+        self.assertIn("INVALID_ORDER_MIN_TICK_SIZE", responses[0]["errorMsg"])
+        # dropped by the client, fetched again
+        self.assertEqual(self.maker.get_tick_size("3"), "0.001")
+
+    def test_market_data(self):
+        for price, side in ((0.4, BUY), (0.6, SELL)):
+            self.maker.create_and_post_order(
+                OrderArgs(token_id="1", price=price, size=10, side=side)
+            )
+        self.assertEqual(self.taker.get_midpoint("1"), {"mid": "0.5"})
+        self.assertEqual(self.taker.get_spread("1"), {"spread": "0.2"})
+        self.assertEqual(self.taker.get_price("1", BUY), {"price": "0.4"})
+        self.assertEqual(
+            self.taker.get_prices([BookParams("1", BUY), BookParams("1", SELL)]),
+            {"1": {BUY: "0.4", SELL: "0.6"}},
+        )
+        self.assertEqual(self.taker.get_midpoints([BookParams("1")]), {"1": "0.5"})
+        with self.assertRaises(PolyApiException) as e:
+            self.taker.get_midpoint("2")
+        self.assertEqual(e.exception.status_code, 404)
+
+
+class TestMockClobServerAsync(IsolatedAsyncioTestCase):
+    async def test_async_client(self):
+        with MockClobServer(markets=MARKETS) as server:
+            creds = _client(server, maker_key).creds
+            async with AsyncClobClient(
+                server.host, chain_id=AMOY, key=maker_key, creds=creds
+            ) as client:
+                response = await client.create_and_post_order(
+                    OrderArgs(token_id="1", price=0.5, size=10, side=BUY)
+                )
+                self.assertEqual(response["status"], "live")
+                self.assertEqual(len(await client.get_orders()), 1)
+                book = await client.get_order_book("1")
+                self.assertEqual(book.bids[0].price, "0.5")
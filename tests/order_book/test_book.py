@@ -0,0 +1,114 @@
+from unittest import TestCase
+
+from py_clob_client.clob_types import OrderBookSummary, OrderSummary, OrderType
+from py_clob_client.constants import AMOY
+from py_clob_client.order_book.book import LocalOrderBook
+from py_clob_client.order_builder.builder import OrderBuilder
+from py_clob_client.order_builder.constants import BUY, SELL
+from py_clob_client.signer import Signer
+
+# publicly known private key
+private_key = "0xac0974bec39a17e36ba4a6b4d238ff944bacb478cbed5efcae784d7bf4f2ff80"
+builder = OrderBuilder(Signer(private_key, AMOY))
+
+
+def _summary():
+    return OrderBookSummary(
+        market="0xaabbcc",
+        asset_id="100",
+        timestamp="123456789",
+        bids=[
+            OrderSummary(price="0.3", size="100"),
+            OrderSummary(price="0.4", size="100"),
+            OrderSummary(price="0.5", size="100"),
+        ],
+        asks=[
+            OrderSummary(price="0.8", size="100"),
+            OrderSummary(price="0.7", size="100"),
+            OrderSummary(price="0.6", size="100"),
+        ],
+        hash="",
+    )
+
+
+class TestLocalOrderBook(TestCase):
+    def test_from_summary(self):
+        book = LocalOrderBook.from_summary(_summary())
+        self.assertEqual(list(book.bid_prices), [0.3, 0.4, 0.5])
+        self.assertEqual(list(book.ask_prices), [0.6, 0.7, 0.8])
+        self.assertEqual(book.best_bid(), 0.5)
+        self.assertEqual(book.best_ask(), 0.6)
+        self.assertAlmostEqual(book.midpoint(), 0.55)
+        self.assertAlmostEqual(book.spread(), 0.1)
+        self.assertEqual(book.to_summary(), _summary())
+
+    def test_set_levels_unsorted(self):
+        book = LocalOrderBook("100")
+        book.set_levels(
+            [{"price": "0.5", "size": "1"}, {"price": "0.3", "size": "2"}],
+            [{"price": "0.6", "size": "3"}, {"price": "0.9", "size": "4"}],
+        )
+        self.assertEqual(list(book.bid_prices), [0.3, 0.5])
+        self.assertEqual(list(book.bid_sizes), [2, 1])
+        self.assertEqual(list(book.ask_prices), [0.6, 0.9])
+        self.assertEqual(list(book.ask_sizes), [3, 4])
+
+    def test_set_level(self):
+        book = LocalOrderBook.from_summary(_summary())
+
+        # new best bid
+        book.set_level(BUY, 0.55, 10)
+        self.assertEqual(book.best_bid(), 0.55)
+
+        # update
+        book.set_level(BUY, 0.4, 20)
+        self.assertEqual(list(book.bid_sizes), [100, 20, 100, 10])
+
+        # removes
+        book.set_level(BUY, 0.55, 0)
+        book.set_level(SELL, 0.6, 0)
+        self.assertEqual(book.best_bid(), 0.5)
+        self.assertEqual(book.best_ask(), 0.7)
+
+        # removing a missing level is a no op
+        book.set_level(SELL, 0.65, 0)
+        self.assertEqual(list(book.ask_prices), [0.7, 0.8])
+
+        # new worst ask
+        book.set_level(SELL, 0.95, 5)
+        self.assertEqual(list(book.ask_prices), [0.7, 0.8, 0.95])
+
+        with self.assertRaises(ValueError):
+            book.set_level("BOTH", 0.5, 1)
+
+    def test_empty_book(self):
+        book = LocalOrderBook("100")
+        self.assertIsNone(book.best_bid())
+        self.assertIsNone(book.best_ask())
+        self.assertIsNone(book.midpoint())
+        self.assertIsNone(book.spread())
+        with self.assertRaises(Exception):
+            book.calculate_market_price(BUY, 100, OrderType.FOK)
+        with self.assertRaises(Exception):
+            book.calculate_market_price(SELL, 100, OrderType.FAK)
+
+    def test_calculate_market_price(self):
+        summary = _summary()
+        book = LocalOrderBook.from_summary(summary)
+
+        for amount in (1, 50, 60, 61, 129, 130, 200, 210, 211, 300, 1000):
+            for order_type in (OrderType.FOK, OrderType.FAK):
+                for side, positions, fn in (
+                    (BUY, summary.asks, builder.calculate_buy_market_price),
+                    (SELL, summary.bids, builder.calculate_sell_market_price),
+                ):
+                    try:
+                        expected = fn(positions, amount, order_type)
+                    except Exception:
+                        with self.assertRaises(Exception):
+                            book.calculate_market_price(side, amount, order_type)
+                        continue
+                    self.assertEqual(
+                        book.calculate_market_price(side, amount, order_type),
+                        expected,
+                    )
@@ -0,0 +1,124 @@
+from array import array
+from unittest import TestCase
+
+from py_clob_client.clob_types import OrderSummary
+from py_clob_client.order_book.book import LocalOrderBook
+from py_clob_client.order_book.compact import CompactOrderBookSummary
+from py_clob_client.order_builder.constants import BUY, SELL
+from py_clob_client.utilities import (
+    generate_orderbook_summary_hash,
+    parse_raw_orderbook_summary,
+)
+
+raw_obs = {
+    "market": "0xbd31dc8a20211944f6b70f31557f1001557b59905b7738480ca09bd4532f84af",
+    "asset_id": "52114319501245915516055106046884209969926127482827954674443846427813813222426",
+    "bids": [
+        {"price": "0.15", "size": "100"},
+        {"price": "0.31", "size": "148.56"},
+        {"price": "0.33", "size": "58"},
+        {"price": "0.5", "size": "100"},
+    ],
+    "asks": [
+        {"price": "0.9", "size": "12.5"},
+        {"price": "0.65", "size": "1000000"},
+    ],
+    "hash": "9d6d9e8831a150ac4cd878f99f7b2c6d419b875f",
+    "timestamp": "123456789",
+}
+
+
+class TestCompactOrderBookSummary(TestCase):
+    def test_from_raw(self):
+        book = CompactOrderBookSummary.from_raw(raw_obs)
+
+        self.assertEqual(book.market, raw_obs["market"])
+        self.assertEqual(book.asset_id, raw_obs["asset_id"])
+        self.assertEqual(book.hash, raw_obs["hash"])
+        self.assertEqual(book.timestamp, "123456789")
+        self.assertEqual(list(book.bid_prices), [0.15, 0.31, 0.33, 0.5])
+        self.assertEqual(list(book.bid_sizes), [100, 148.56, 58, 100])
+        self.assertEqual(list(book.ask_prices), [0.9, 0.65])
+        self.assertEqual(list(book.ask_sizes), [12.5, 1000000])
+
+        # levels are only built when accessed
+        self.assertNotIn("bids", vars(book))
+        self.assertEqual(book.bids, parse_raw_orderbook_summary(raw_obs).bids)
+        self.assertIn("bids", vars(book))
+        self.assertIs(book.bids, book.bids)
+
+        self.assertEqual(book.to_summary(), parse_raw_orderbook_summary(raw_obs))
+
+    def test_empty(self):
+        book = CompactOrderBookSummary.from_raw(
+            {
+                "market": "0xaabbcc",
+                "asset_id": "100",
+                "bids": [],
+                "asks": [],
+                "hash": "",
+                "timestamp": "123456789",
+            }
+        )
+        self.assertEqual(len(book.bid_prices), 0)
+        self.assertEqual(book.bids, [])
+        self.assertEqual(book.asks, [])
+
+    def test_local_order_book(self):
+        compact = CompactOrderBookSummary.from_raw(raw_obs)
+        book = LocalOrderBook.from_summary(compact)
+        self.assertEqual(list(book.ask_prices), [0.65, 0.9])
+        self.assertEqual(book.best_ask(), 0.65)
+        self.assertEqual(book.best_bid(), 0.5)
+        self.assertEqual(
+            book.to_summary(),
+            LocalOrderBook.from_summary(compact.to_summary()).to_summary(),
+        )
+
+    def test_depth(self):
+        book = CompactOrderBookSummary.from_raw(raw_obs)
+        self.assertEqual(list(book.depth(BUY).prices), [0.65, 0.9])
+        self.assertEqual(list(book.depth(SELL).prices), [0.5, 0.33, 0.31, 0.15])
+
+        # built once per snapshot
+        self.assertIs(book.depth(BUY), book.depth(BUY))
+        self.assertIs(book.depth(SELL), book.depth(SELL))
+
+        # and again if a column is replaced
+        depth = book.depth(SELL)
+        book.bid_prices = array("d", [0.15, 0.31, 0.33, 0.4])
+        self.assertIsNot(book.depth(SELL), depth)
+        self.assertEqual(list(book.depth(SELL).prices), [0.4, 0.33, 0.31, 0.15])
+
+    def test_json(self):
+        # trailing zeros and numbers repr writes with an exponent
+        raw = dict(
+            raw_obs,
+            bids=[
+                {"price": "0.50", "size": "0.00001"},
+                {"price": "0.001", "size": "10000000000000000"},
+            ],
+            asks=[{"price": "0.9", "size": "12.50"}],
+        )
+        book = CompactOrderBookSummary.from_raw(raw)
+        summary = parse_raw_orderbook_summary(raw)
+        self.assertEqual(book.json, summary.json)
+        self.assertEqual(
+            generate_orderbook_summary_hash(book),
+            generate_orderbook_summary_hash(summary),
+        )
+        self.assertEqual(book.bids, summary.bids)
+        self.assertEqual(book.asks, summary.asks)
+
+        # the server's strings are dropped with the columns
+        book.bid_prices = array("d", [0.5, 0.001])
+        self.assertIn('{"price":"0.5","size":"1e-05"}', book.json)
+
+    def test_levels_follow_columns(self):
+        book = CompactOrderBookSummary.from_raw(raw_obs)
+        self.assertEqual(book.bids[-1], OrderSummary(price="0.5", size="100"))
+
+        book.bid_prices = array("d", [0.15, 0.31, 0.33, 0.4])
+        self.assertEqual(book.bids[-1], OrderSummary(price="0.4", size="100"))
+        self.assertEqual(book.to_summary().bids, book.bids)
+        self.assertEqual(book.json, book.to_summary().json)
@@ -0,0 +1,141 @@
+import random
+from unittest import TestCase
+
+from py_clob_client.clob_types import OrderBookSummary, OrderSummary, OrderType
+from py_clob_client.constants import AMOY
+from py_clob_client.order_book.book import LocalOrderBook
+from py_clob_client.order_book.compact import CompactOrderBookSummary
+from py_clob_client.order_book.depth import DepthIndex
+from py_clob_client.order_builder.builder import OrderBuilder
+from py_clob_client.order_builder.constants import BUY, SELL
+from py_clob_client.signer import Signer
+
+# publicly known private key
+private_key = "0xac0974bec39a17e36ba4a6b4d238ff944bacb478cbed5efcae784d7bf4f2ff80"
+builder = OrderBuilder(Signer(private_key, AMOY))
+
+
+def _random_summary(rng: random.Random, depth: int) -> OrderBookSummary:
+    prices = rng.sample(range(1, 100), 2 * depth)
+    prices.sort()
+
+    def level(price):
+        return OrderSummary(
+            price=str(price / 100), size=str(round(rng.uniform(0.01, 500), 2))
+        )
+
+    return OrderBookSummary(
+        asset_id="1",
+        # best level last
+        bids=[level(p) for p in prices[:depth]],
+        asks=[level(p) for p in reversed(prices[depth:])],
+    )
+
+
+class TestDepthIndex(TestCase):
+    def test_market_price_matches_linear_walk(self):
+        rng = random.Random(0)
+        for _ in range(200):
+            summary = _random_summary(rng, rng.randint(1, 40))
+            book = LocalOrderBook.from_summary(summary)
+            for side, positions, fn in (
+                (BUY, summary.asks, builder.calculate_buy_market_price),
+                (SELL, summary.bids, builder.calculate_sell_market_price),
+            ):
+                depth = DepthIndex.from_summary(summary, side)
+                self.assertEqual(depth.prices, book.depth(side).prices)
+
+                # the level boundaries, which are hit exactly, and random amounts
+                amounts = list(depth.cum_notionals if side == BUY else depth.cum_sizes)
+                amounts += [rng.uniform(0, amounts[-1] * 1.2) for _ in range(20)]
+                for order_type in (OrderType.FOK, OrderType.FAK):
+                    for amount in amounts:
+                        try:
+                            expected = fn(positions, amount, order_type)
+                        except Exception:
+                            with self.assertRaises(Exception):
+                                depth.market_price(amount, order_type)
+                            continue
+                        self.assertEqual(
+                            depth.market_price(amount, order_type), expected
+                        )
+
+                    # the level boundaries are all fillable
+                    boundaries = amounts[: len(depth)]
+                    self.assertEqual(
+                        depth.market_prices(boundaries, order_type),
+                        [depth.market_price(a, order_type) for a in boundaries],
+                    )
+
+    def test_impact_buy(self):
+        # best first: 100 @ 0.5 then 100 @ 0.6
+        depth = DepthIndex(BUY, [0.5, 0.6], [100, 100])
+        self.assertEqual(list(depth.cum_notionals), [50, 110])
+        self.assertEqual(len(depth), 2)
+
+        impact = depth.impact(20)
+        self.assertEqual(impact.filled, 20)
+        self.assertEqual(impact.worst_price, 0.5)
+        self.assertEqual(impact.vwap, 0.5)
+        self.assertEqual(impact.slippage, 0)
+
+        # 100 shares for 50, then 50 shares for 30
+        impact = depth.impact(80)
+        self.assertEqual(impact.best_price, 0.5)
+        self.assertEqual(impact.worst_price, 0.6)
+        self.assertAlmostEqual(impact.vwap, 80 / 150)
+        self.assertAlmostEqual(impact.slippage, (80 / 150 - 0.5) / 0.5)
+
+        # too thin, the whole side
+        impact = depth.impact(200)
+        self.assertEqual(impact.amount, 200)
+        self.assertEqual(impact.filled, 110)
+        self.assertEqual(impact.worst_price, 0.6)
+        self.assertAlmostEqual(impact.vwap, 110 / 200)
+
+        self.assertEqual(depth.impacts([20, 80]), [depth.impact(20), depth.impact(80)])
+
+    def test_impact_sell(self):
+        # best first: 100 @ 0.5 then 100 @ 0.4
+        depth = DepthIndex(SELL, [0.5, 0.4], [100, 100])
+
+        impact = depth.impact(150)
+        self.assertEqual(impact.filled, 150)
+        self.assertEqual(impact.worst_price, 0.4)
+        self.assertAlmostEqual(impact.vwap, 70 / 150)
+        self.assertAlmostEqual(impact.slippage, (0.5 - 70 / 150) / 0.5)
+
+        impact = depth.impact(300)
+        self.assertEqual(impact.filled, 200)
+        self.assertAlmostEqual(impact.vwap, 0.45)
+
+    def test_empty(self):
+        depth = DepthIndex(BUY, [], [])
+        with self.assertRaises(Exception):
+            depth.market_price(1, OrderType.FAK)
+        with self.assertRaises(Exception):
+            depth.impact(1)
+        with self.assertRaises(ValueError):
+            DepthIndex(BUY, [0.5], [])
+
+    def test_books(self):
+        raw = {
+            "market": "0xaabbcc",
+            "asset_id": "1",
+            "timestamp": "1",
+            "hash": "",
+            "bids": [{"price": "0.4", "size": "100"}, {"price": "0.5", "size": "10"}],
+            "asks": [{"price": "0.7", "size": "100"}, {"price": "0.6", "size": "10"}],
+        }
+        compact = CompactOrderBookSummary.from_raw(raw)
+        self.assertEqual(list(compact.depth(BUY).prices), [0.6, 0.7])
+        self.assertEqual(list(compact.depth(SELL).prices), [0.5, 0.4])
+
+        # cached until the book changes
+        book = LocalOrderBook.from_summary(compact)
+        depth = book.depth(SELL)
+        self.assertIs(book.depth(SELL), depth)
+        book.set_level(BUY, 0.55, 1)
+        self.assertIsNot(book.depth(SELL), depth)
+        self.assertEqual(list(book.depth(SELL).prices), [0.55, 0.5, 0.4])
+        self.assertEqual(book.calculate_market_price(SELL, 2, OrderType.FOK), 0.5)
@@ -0,0 +1,153 @@
+import asyncio
+import json
+import threading
+import time
+from unittest import TestCase
+
+import websockets
+
+from py_clob_client.order_book.feed import MarketFeed
+from py_clob_client.order_book.mirror import OrderBookMirror
+
+
+def _book_event(asset_id):
+    return {
+        "event_type": "book",
+        "asset_id": asset_id,
+        "market": "0xaabbcc",
+        "bids": [{"price": "0.5", "size": "10"}],
+        "asks": [{"price": "0.6", "size": "10"}],
+        "timestamp": "1",
+        "hash": "",
+    }
+
+
+class MarketChannelStub:
+    """
+    Local market channel: on subscription, sends a book snapshot of every
+    requested token then a price change, the connection is dropped after
+    `drop_after` subscriptions are served
+    """
+
+    def __init__(self, drop_after: int = 1):
+        self.subscriptions = []
+        self.drop_after = drop_after
+        self.ready = threading.Event()
+        self.stopped = None
+        self.loop = None
+
+    async def _handler(self, ws, *args):
+        subscription = json.loads(await ws.recv())
+        self.subscriptions.append(subscription)
+        await ws.send(json.dumps([_book_event(a) for a in subscription["assets_ids"]]))
+        await ws.send("PONG")
+        await ws.send(
+            json.dumps(
+                {
+                    "event_type": "price_change",
+                    "asset_id": subscription["assets_ids"][0],
+                    "changes": [
+                        {
+                            "price": "0.55",
+                            "side": "BUY",
+                            "size": str(len(self.subscriptions)),
+                        }
+                    ],
+                    "timestamp": "2",
+                }
+            )
+        )
+        if len(self.subscriptions) <= self.drop_after:
+            await ws.close()
+        else:
+            await ws.wait_closed()
+
+    async def _serve(self):
+        self.loop = asyncio.get_running_loop()
+        self.stopped = asyncio.Event()
+        async with websockets.serve(self._handler, "127.0.0.1", 0) as server:
+            self.url = "ws://127.0.0.1:{}".format(server.sockets[0].getsockname()[1])
+            self.ready.set()
+            await self.stopped.wait()
+
+    def start(self):
+        threading.Thread(target=asyncio.run, args=(self._serve(),), daemon=True).start()
+        self.ready.wait()
+        return self
+
+    def stop(self):
+        self.loop.call_soon_threadsafe(self.stopped.set)
+
+
+class TestMarketFeed(TestCase):
+    def test_feed(self):
+        server = MarketChannelStub(drop_after=1).start()
+        mirror = OrderBookMirror()
+        feed = MarketFeed(mirror, ["1", "2"], url=server.url, reconnect_delay=0.01)
+        feed.start()
+        try:
+            deadline = time.time() + 5
+            while len(server.subscriptions) < 2 and time.time() < deadline:
+                time.sleep(0.01)
+            while mirror.best_bid("1") != 0.55 and time.time() < deadline:
+                time.sleep(0.01)
+        finally:
+            feed.stop()
+            server.stop()
+
+        # resubscribed after the connection was dropped
+        self.assertEqual(
+            server.subscriptions,
+            [{"assets_ids": ["1", "2"], "type": "market"}] * 2,
+        )
+        self.assertEqual(mirror.token_ids(), ["1", "2"])
+        self.assertEqual(mirror.best_bid("1"), 0.55)
+        self.assertEqual(mirror.get_order_book("1").bids[-1].size, "2")
+        self.assertEqual(mirror.best_bid("2"), 0.5)
+
+    def test_feed_survives_errors(self):
+        class FailingMirror(OrderBookMirror):
+            failures = 1
+
+            def apply_message(self, message):
+                if self.failures:
+                    self.failures -= 1
+                    raise RuntimeError("boom")
+                super().apply_message(message)
+
+        server = MarketChannelStub(drop_after=0).start()
+        mirror = FailingMirror()
+        feed = MarketFeed(mirror, ["1"], url=server.url, reconnect_delay=0.01)
+        with self.assertLogs("MarketFeed", "ERROR"):
+            feed.start()
+            try:
+                deadline = time.time() + 5
+                while time.time() < deadline and not (
+                    mirror.is_fresh("1") and mirror.best_bid("1") == 0.55
+                ):
+                    time.sleep(0.01)
+                fresh = mirror.is_fresh("1")
+            finally:
+                feed.stop()
+                server.stop()
+
+        # reconnected and resubscribed after the error
+        self.assertEqual(len(server.subscriptions), 2)
+        self.assertTrue(fresh)
+        self.assertEqual(mirror.best_bid("1"), 0.55)
+
+    def test_backs_off_when_closed_by_server(self):
+        server = MarketChannelStub(drop_after=100).start()
+        mirror = OrderBookMirror()
+        feed = MarketFeed(mirror, ["1"], url=server.url, reconnect_delay=0.2)
+        with self.assertLogs("MarketFeed", "WARNING") as logs:
+            feed.start()
+            time.sleep(0.5)
+            feed.stop()
+            server.stop()
+
+        # a reconnection every reconnect_delay, not in a loop
+        self.assertLessEqual(len(server.subscriptions), 4)
+        self.assertIn("closed by the server", logs.output[0])
+        self.assertFalse(mirror.connected)
+        self.assertFalse(mirror.is_fresh("1"))
@@ -0,0 +1,183 @@
+from unittest import TestCase
+
+from py_clob_client.clob_types import OrderSummary, OrderType
+from py_clob_client.order_book.compact import CompactOrderBookSummary
+from py_clob_client.order_book.mirror import OrderBookMirror
+
+
+def _book_event(asset_id):
+    return {
+        "event_type": "book",
+        "asset_id": asset_id,
+        "market": "0xaabbcc",
+        "bids": [{"price": "0.4", "size": "100"}, {"price": "0.5", "size": "10"}],
+        "asks": [{"price": "0.7", "size": "100"}, {"price": "0.6", "size": "10"}],
+        "timestamp": "1",
+        "hash": "0x1",
+    }
+
+
+class TestOrderBookMirror(TestCase):
+    def test_book_event(self):
+        mirror = OrderBookMirror()
+        mirror.track(["1", "2"])
+        mirror.apply_message([_book_event("1"), _book_event("2")])
+
+        # untracked tokens are ignored
+        mirror.apply_message(_book_event("3"))
+
+        self.assertEqual(mirror.token_ids(), ["1", "2"])
+        self.assertFalse(mirror.is_fresh("3"))
+        self.assertIn("1", mirror)
+        self.assertNotIn("3", mirror)
+        self.assertEqual(mirror.best_bid("1"), 0.5)
+        self.assertEqual(mirror.best_ask("1"), 0.6)
+        self.assertAlmostEqual(mirror.midpoint("2"), 0.55)
+        self.assertAlmostEqual(mirror.spread("2"), 0.1)
+
+        book = mirror.get_order_book("1")
+        self.assertEqual(book.market, "0xaabbcc")
+        self.assertEqual(book.hash, "0x1")
+        self.assertEqual(book.asks[-1], OrderSummary(price="0.6", size="10"))
+        self.assertIsNone(mirror.get_order_book("3"))
+
+    def test_price_change_event(self):
+        mirror = OrderBookMirror()
+        mirror.track(["1"])
+        mirror.apply_message(_book_event("1"))
+
+        mirror.apply_message(
+            {
+                "event_type": "price_change",
+                "asset_id": "1",
+                "changes": [
+                    {"price": "0.55", "side": "BUY", "size": "5"},
+                    {"price": "0.6", "side": "SELL", "size": "0"},
+                ],
+                "timestamp": "2",
+                "hash": "0x2",
+            }
+        )
+        self.assertEqual(mirror.best_bid("1"), 0.55)
+        self.assertEqual(mirror.best_ask("1"), 0.7)
+        self.assertEqual(mirror.get_order_book("1").hash, "0x2")
+        self.assertEqual(mirror.get_order_book("1").timestamp, "2")
+
+        # one entry per level, untracked tokens are skipped
+        mirror.apply_message(
+            {
+                "event_type": "price_change",
+                "market": "0xaabbcc",
+                "price_changes": [
+                    {"asset_id": "1", "price": "0.65", "side": "SELL", "size": "1"},
+                    {"asset_id": "2", "price": "0.1", "side": "BUY", "size": "1"},
+                ],
+                "timestamp": "3",
+            }
+        )
+        self.assertEqual(mirror.best_ask("1"), 0.65)
+        self.assertNotIn("2", mirror)
+
+        # other events are ignored
+        mirror.apply_message({"event_type": "last_trade_price", "asset_id": "1"})
+        self.assertEqual(mirror.get_order_book("1").timestamp, "3")
+
+    def test_seed(self):
+        class Client:
+            def get_order_books(self, params, compact=False):
+                return [
+                    CompactOrderBookSummary.from_raw(
+                        {
+                            "market": "0xaabbcc",
+                            "asset_id": p.token_id,
+                            "timestamp": "1",
+                            "hash": "",
+                            "bids": [{"price": "0.5", "size": "100"}],
+                            "asks": [{"price": "0.6", "size": "100"}],
+                        }
+                    )
+                    for p in params
+                ]
+
+        mirror = OrderBookMirror()
+        mirror.seed(Client(), ["1", "2"])
+        self.assertEqual(mirror.token_ids(), ["1", "2"])
+
+        # not fresh without a connected feed
+        self.assertFalse(mirror.is_fresh("1"))
+        mirror.set_connected(True)
+        self.assertTrue(mirror.is_fresh("1"))
+        mirror.set_connected(False)
+        self.assertFalse(mirror.is_fresh("1"))
+        self.assertEqual(
+            mirror.calculate_market_price("1", "BUY", 10, OrderType.FOK), 0.6
+        )
+        with self.assertRaises(Exception):
+            mirror.calculate_market_price("1", "BUY", 100, OrderType.FOK)
+
+    def test_malformed_events(self):
+        mirror = OrderBookMirror()
+        mirror.track(["1", "2"])
+        with self.assertLogs("OrderBookMirror", "WARNING"):
+            mirror.apply_message(
+                [
+                    "PONG",
+                    {"event_type": "book", "asset_id": "1", "bids": [{"price": "0.5"}]},
+                    {"event_type": "price_change", "changes": [{"price": "0.5"}]},
+                    _book_event("2"),
+                ]
+            )
+        # the valid events are still applied
+        self.assertEqual(mirror.best_bid("2"), 0.5)
+        self.assertFalse(mirror.is_fresh("1"))
+
+    def test_is_fresh(self):
+        mirror = OrderBookMirror()
+        mirror.track(["1"])
+        mirror.set_connected(True)
+        mirror.apply_message(_book_event("1"))
+        self.assertTrue(mirror.is_fresh("1"))
+        self.assertFalse(mirror.is_fresh("2"))
+
+        mirror.max_age = 0
+        self.assertFalse(mirror.is_fresh("1"))
+        mirror.max_age = None
+
+    def test_fresh_after_reconnection(self):
+        mirror = OrderBookMirror()
+        mirror.track(["1", "2"])
+        mirror.apply_message([_book_event("1"), _book_event("2")])
+        mirror.set_connected(False)
+        self.assertFalse(mirror.is_fresh("1"))
+
+        # only the books whose snapshot was received again
+        mirror.set_connected(True)
+        mirror.apply_message(
+            {
+                "event_type": "price_change",
+                "asset_id": "2",
+                "changes": [{"price": "0.55", "side": "BUY", "size": "1"}],
+            }
+        )
+        mirror.apply_message(_book_event("1"))
+        self.assertTrue(mirror.is_fresh("1"))
+        self.assertFalse(mirror.is_fresh("2"))
+
+    def test_malformed_price_change(self):
+        mirror = OrderBookMirror()
+        mirror.track(["1", "2"])
+        mirror.set_connected(True)
+        mirror.apply_message([_book_event("1"), _book_event("2")])
+        with self.assertLogs("OrderBookMirror", "WARNING"):
+            mirror.apply_message(
+                {
+                    "event_type": "price_change",
+                    "asset_id": "1",
+                    "changes": [{"price": "0.55", "side": "BUY"}],
+                }
+            )
+        # stale until its next snapshot
+        self.assertFalse(mirror.is_fresh("1"))
+        self.assertTrue(mirror.is_fresh("2"))
+        mirror.apply_message(_book_event("1"))
+        self.assertTrue(mirror.is_fresh("1"))
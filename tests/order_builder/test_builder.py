@@ -1,3 +1,4 @@
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from unittest import TestCase
 
 from py_clob_client.clob_types import (
@@ -5,14 +6,19 @@ from py_clob_client.clob_types import (
     MarketOrderArgs,
     CreateOrderOptions,
     OrderSummary,
+    PostOrdersArgs,
     OrderType,
 )
+from py_clob_client.config import get_contract_config
 from py_clob_client.constants import AMOY
 from py_clob_client.order_builder.constants import BUY, SELL
 
 from py_clob_client.signer import Signer
 from py_clob_client.order_builder.builder import OrderBuilder, ROUNDING_CONFIG
 from py_clob_client.order_builder.helpers import decimal_places, round_normal
+from eth_account import Account
+from py_order_utils.builders import OrderBuilder as UtilsOrderBuilder
+from py_order_utils.signer import Signer as UtilsSigner
 from py_order_utils.model import (
     POLY_GNOSIS_SAFE,
     EOA,
@@ -3442,3 +3448,132 @@ class TestOrderBuilder(TestCase):
             / float(signed_order.order["makerAmount"]),
             0.0056,
         )
+
+    def test_create_order_reuses_order_builders(self):
+        builder = OrderBuilder(signer)
+        order_args = OrderArgs(token_id="123", price=0.5, size=10, side=BUY)
+
+        for neg_risk in (False, True, False, True):
+            signed_order = builder.create_order(
+                order_args, CreateOrderOptions(tick_size="0.01", neg_risk=neg_risk)
+            )
+            self.assertIsNotNone(signed_order.signature)
+
+        order_builders = builder._OrderBuilder__order_builders
+        self.assertEqual(
+            set(order_builders.keys()), {(chain_id, False), (chain_id, True)}
+        )
+        self.assertEqual(
+            order_builders[(chain_id, False)].contract_address,
+            get_contract_config(chain_id, False).exchange,
+        )
+        self.assertEqual(
+            order_builders[(chain_id, True)].contract_address,
+            get_contract_config(chain_id, True).exchange,
+        )
+
+        # signed by the signer, over the neg risk exchange domain
+        signed_order = builder.create_order(
+            order_args, CreateOrderOptions(tick_size="0.01", neg_risk=True)
+        )
+        struct_hash = UtilsOrderBuilder(
+            get_contract_config(chain_id, True).exchange,
+            chain_id,
+            UtilsSigner(key=private_key),
+        )._create_struct_hash(signed_order.order)
+        self.assertEqual(
+            Account._recover_hash(struct_hash, signature=signed_order.signature),
+            signer.address(),
+        )
+
+    def test_create_orders(self):
+        builder = OrderBuilder(signer)
+        orders = [
+            OrderArgs(token_id=str(i % 3), price=price, size=10, side=BUY)
+            for i, price in enumerate([0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8])
+        ]
+        options = [
+            CreateOrderOptions(tick_size="0.01", neg_risk=i % 2 == 0)
+            for i in range(len(orders))
+        ]
+
+        with self.assertRaises(ValueError):
+            builder.create_orders(orders, options[1:])
+
+        expected = [builder.create_order(o, opt) for o, opt in zip(orders, options)]
+
+        with ThreadPoolExecutor(max_workers=2) as thread_pool:
+            with ProcessPoolExecutor(max_workers=2) as process_pool:
+                for executor in (None, thread_pool, process_pool):
+                    signed_orders = builder.create_orders(orders, options, executor)
+                    self.assertEqual(len(signed_orders), len(orders))
+                    for signed_order, exp in zip(signed_orders, expected):
+                        for field in ("tokenId", "makerAmount", "takerAmount"):
+                            self.assertEqual(
+                                signed_order.order[field], exp.order[field]
+                            )
+                        self.assertEqual(signed_order.order["maker"], signer.address())
+                        self.assertIsNotNone(signed_order.signature)
+
+    def test_create_order_ladder(self):
+        builder = OrderBuilder(signer)
+        options = CreateOrderOptions(tick_size="0.01", neg_risk=True)
+        prices = [0.45, 0.44, 0.43, 0.42]
+        sizes = [10, 20.5, 30.123, 40]
+
+        with self.assertRaises(ValueError):
+            builder.create_order_ladder("123", BUY, prices, sizes[1:], options)
+
+        # no order is signed if any price is out of range
+        with self.assertRaises(ValueError):
+            builder.create_order_ladder("123", BUY, prices + [1], sizes + [1], options)
+
+        for side in (BUY, SELL):
+            expected = [
+                builder.create_order(
+                    OrderArgs(token_id="123", price=price, size=size, side=side),
+                    options,
+                )
+                for price, size in zip(prices, sizes)
+            ]
+            with ThreadPoolExecutor(max_workers=2) as thread_pool:
+                with ProcessPoolExecutor(max_workers=2) as process_pool:
+                    for executor in (None, thread_pool, process_pool):
+                        ladder = builder.create_order_ladder(
+                            "123",
+                            side,
+                            prices,
+                            sizes,
+                            options,
+                            order_type=OrderType.GTD,
+                            expiration=50000,
+                            executor=executor,
+                        )
+                        self.assertEqual(len(ladder), len(prices))
+                        for args, exp in zip(ladder, expected):
+                            self.assertIsInstance(args, PostOrdersArgs)
+                            self.assertEqual(args.orderType, OrderType.GTD)
+                            self.assertEqual(args.order.order["expiration"], 50000)
+                            for field in ("tokenId", "makerAmount", "takerAmount"):
+                                self.assertEqual(
+                                    args.order.order[field], exp.order[field]
+                                )
+                            self.assertIsNotNone(args.order.signature)
+
+    def test_get_market_order_amounts_exact(self):
+        builder = OrderBuilder(signer)
+
+        # 45.51 / 0.0001 is exactly 455100 shares, float division loses a unit
+        side, maker, taker = builder.get_market_order_amounts(
+            BUY, 45.51, 0.0001, ROUNDING_CONFIG["0.0001"]
+        )
+        self.assertEqual(side, UtilsBuy)
+        self.assertEqual(maker, 45510000)
+        self.assertEqual(taker, 455100000000)
+
+        # 10 / 0.3 rounded down to the amount decimals
+        side, maker, taker = builder.get_market_order_amounts(
+            BUY, 10, 0.3, ROUNDING_CONFIG["0.1"]
+        )
+        self.assertEqual(maker, 10000000)
+        self.assertEqual(taker, 33333000)
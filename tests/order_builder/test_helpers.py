@@ -1,9 +1,35 @@
 from unittest import TestCase
 
-from py_clob_client.order_builder.helpers import decimal_places
+from py_clob_client.order_builder.helpers import (
+    decimal_places,
+    to_ticks,
+    to_lots,
+    amount_to_token_decimals,
+)
 
 
 class TestHelpers(TestCase):
     def test_decimal_places(self):
         self.assertEqual(decimal_places(949.9970999999999), 13)
         self.assertEqual(decimal_places(949), 0)
+
+    def test_to_ticks(self):
+        self.assertEqual(to_ticks(0.5, 2), 50)
+        self.assertEqual(to_ticks(0.555, 2), 56)
+        self.assertEqual(to_ticks(0.0001, 4), 1)
+        self.assertEqual(to_ticks(0.56, 2), 56)
+
+    def test_to_lots(self):
+        self.assertEqual(to_lots(21.04, 2), 2104)
+        self.assertEqual(to_lots(21.049, 2), 2104)
+        self.assertEqual(to_lots(100, 2), 10000)
+
+    def test_amount_to_token_decimals(self):
+        # exact, within the amount decimals
+        self.assertEqual(amount_to_token_decimals(2104 * 5, 10**3, 3), 10520000)
+        # rounded down to the amount decimals
+        self.assertEqual(amount_to_token_decimals(1, 3, 4), 333300)
+        self.assertEqual(amount_to_token_decimals(2, 3, 4), 666600)
+        # up to amount decimals + 4 first
+        self.assertEqual(amount_to_token_decimals(99999999999, 10**15, 4), 100)
+        self.assertEqual(amount_to_token_decimals(45510000, 100, 6), 455100000000)
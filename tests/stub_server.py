@@ -0,0 +1,81 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+
+class StubServer:
+    """
+    Minimal local HTTP server for the client tests
+
+    routes maps (method, path) to a callable taking (query, body) and returning
+    a (status, payload) tuple, every received request is recorded in `requests`
+    """
+
+    def __init__(self, routes: dict):
+        self.routes = routes
+        self.requests = []
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler())
+        self.host = "http://127.0.0.1:{}".format(self._server.server_port)
+
+    def _handler(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def _handle(self):
+                url = urlparse(self.path)
+                query = {k: v[0] for k, v in parse_qs(url.query).items()}
+                length = int(self.headers.get("Content-Length", 0))
+                raw = self.rfile.read(length) if length else b""
+                body = json.loads(raw) if raw else None
+
+                with stub._lock:
+                    stub.requests.append(
+                        {
+                            "method": self.command,
+                            "path": url.path,
+                            "query": query,
+                            "headers": dict(self.headers),
+                            "raw_body": raw,
+                            "body": body,
+                        }
+                    )
+
+                route = stub.routes.get((self.command, url.path))
+                if route is None:
+                    status, payload = 404, {"error": "not found"}
+                else:
+                    status, payload = route(query, body)
+
+                out = json.dumps(payload).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(out)))
+                self.end_headers()
+                self.wfile.write(out)
+
+            do_GET = _handle
+            do_POST = _handle
+            do_DELETE = _handle
+
+            def log_message(self, *args):
+                pass
+
+        return Handler
+
+    def start(self):
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *args):
+        self.stop()
@@ -0,0 +1,276 @@
+import asyncio
+from unittest import IsolatedAsyncioTestCase
+
+from py_clob_client.async_client import AsyncClobClient
+from py_clob_client.clob_types import (
+    ApiCreds,
+    BookParams,
+    OpenOrderParams,
+    OrderArgs,
+    PostOrdersArgs,
+    TradeParams,
+)
+from py_clob_client.constants import AMOY, END_CURSOR
+from py_clob_client.headers.headers import POLY_ADDRESS, POLY_API_KEY, POLY_SIGNATURE
+from py_clob_client.exceptions import PolyApiException
+from py_clob_client.http_helpers.rate_limit import RetryPolicy
+from py_clob_client.metrics import ClientMetrics
+from py_clob_client.order_builder.constants import BUY
+
+from tests.stub_server import StubServer
+
+# publicly known private key
+private_key = "0xac0974bec39a17e36ba4a6b4d238ff944bacb478cbed5efcae784d7bf4f2ff80"
+chain_id = AMOY
+
+creds = ApiCreds(
+    api_key="000000000-0000-0000-0000-000000000000",
+    api_passphrase="aaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaa",
+    api_secret="AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA=",
+)
+
+
+def _book(token_id):
+    return {
+        "market": "0xaabbcc",
+        "asset_id": token_id,
+        "bids": [{"price": "0.4", "size": "100"}, {"price": "0.5", "size": "10"}],
+        "asks": [{"price": "0.7", "size": "100"}, {"price": "0.6", "size": "10"}],
+        "hash": "",
+        "timestamp": "123456789",
+    }
+
+
+def _paginated(query, body):
+    pages = {
+        "MA==": ({"data": [1, 2], "next_cursor": "MQ=="}),
+        "MQ==": ({"data": [3], "next_cursor": END_CURSOR}),
+    }
+    return 200, pages[query["next_cursor"]]
+
+
+ROUTES = {
+    ("GET", "/book"): lambda q, b: (200, _book(q["token_id"])),
+    ("POST", "/books"): lambda q, b: (200, [_book(p["token_id"]) for p in b]),
+    ("POST", "/prices"): lambda q, b: (
+        200,
+        {p["token_id"]: {p["side"]: "0.5"} for p in b},
+    ),
+    ("GET", "/tick-size"): lambda q, b: (200, {"minimum_tick_size": 0.01}),
+    ("GET", "/neg-risk"): lambda q, b: (200, {"neg_risk": False}),
+    ("POST", "/orders"): lambda q, b: (200, [{"success": True} for _ in b]),
+    ("DELETE", "/orders"): lambda q, b: (200, {"canceled": b, "not_canceled": {}}),
+    ("GET", "/markets"): _paginated,
+    ("GET", "/data/orders"): _paginated,
+    ("GET", "/data/trades"): _paginated,
+}
+
+
+class TestAsyncClobClient(IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.server = StubServer(ROUTES).start()
+
+    def tearDown(self):
+        self.server.stop()
+
+    async def test_get_order_book(self):
+        async with AsyncClobClient(self.server.host) as client:
+            book = await client.get_order_book("100")
+            self.assertEqual(book.asset_id, "100")
+            self.assertEqual(book.bids[1].price, "0.5")
+
+            books = await client.get_order_books(
+                [BookParams(token_id="1"), BookParams(token_id="2")]
+            )
+            self.assertEqual([b.asset_id for b in books], ["1", "2"])
+
+            compact = await client.get_order_book("100", compact=True)
+            self.assertEqual(list(compact.bid_prices), [0.4, 0.5])
+            self.assertEqual(compact.to_summary(), book)
+
+            books = await client.get_order_books(
+                [BookParams(token_id="1"), BookParams(token_id="2")], compact=True
+            )
+            self.assertEqual([list(b.ask_prices) for b in books], [[0.7, 0.6]] * 2)
+
+    async def test_concurrent_requests(self):
+        async with AsyncClobClient(self.server.host) as client:
+            books = await asyncio.gather(
+                *[client.get_order_book(str(i)) for i in range(200)]
+            )
+        self.assertEqual([b.asset_id for b in books], [str(i) for i in range(200)])
+
+    async def test_retries_gets(self):
+        calls = []
+
+        def flaky(query, body):
+            calls.append(query)
+            if len(calls) == 3:
+                return 200, {"mid": "0.5"}
+            return 503, {"error": "unavailable"}
+
+        metrics = ClientMetrics()
+        with StubServer({("GET", "/midpoint"): flaky}) as server:
+            async with AsyncClobClient(server.host, metrics=metrics) as client:
+                self.assertEqual(await client.get_midpoint("1"), {"mid": "0.5"})
+                self.assertEqual(len(calls), 3)
+
+                self.assertEqual(metrics.retries[("GET", "/midpoint")], 2)
+                self.assertEqual(
+                    sorted(metrics.requests.items()),
+                    [
+                        (("GET", "/midpoint", "200"), 1),
+                        (("GET", "/midpoint", "503"), 2),
+                    ],
+                )
+
+                client.transport.retry = RetryPolicy(max_retries=0)
+                with self.assertRaises(PolyApiException) as ctx:
+                    await client.get_midpoint("1")
+                self.assertEqual(ctx.exception.status_code, 503)
+
+    async def test_batch_reads_are_chunked(self):
+        async with AsyncClobClient(self.server.host, batch_chunk_size=3) as client:
+            params = [BookParams(token_id=str(i)) for i in range(10)]
+            books = await client.get_order_books(params, compact=True)
+            prices = await client.get_prices(
+                [BookParams(token_id=p.token_id, side="BUY") for p in params]
+            )
+
+        self.assertEqual([b.asset_id for b in books], [p.token_id for p in params])
+        self.assertEqual(list(prices), [p.token_id for p in params])
+        paths = [r["path"] for r in self.server.requests]
+        self.assertEqual(paths.count("/books"), 4)
+        self.assertEqual(paths.count("/prices"), 4)
+
+    async def test_concurrent_tick_size_requests_are_shared(self):
+        async with AsyncClobClient(self.server.host) as client:
+            tick_sizes = await asyncio.gather(
+                *[client.get_tick_size("1") for _ in range(10)],
+                *[client.get_neg_risk("1") for _ in range(10)],
+            )
+        self.assertEqual(tick_sizes, ["0.01"] * 10 + [False] * 10)
+        paths = [r["path"] for r in self.server.requests]
+        self.assertEqual(sorted(paths), ["/neg-risk", "/tick-size"])
+
+    async def test_post_orders_mixed_responses(self):
+        def post_orders(query, body):
+            return 200, ["unexpected", {"errorMsg": "INVALID_ORDER_MIN_TICK_SIZE"}]
+
+        with StubServer({**ROUTES, ("POST", "/orders"): post_orders}) as server:
+            async with AsyncClobClient(
+                server.host, chain_id=chain_id, key=private_key, creds=creds
+            ) as client:
+                orders = [
+                    PostOrdersArgs(
+                        order=await client.create_order(
+                            OrderArgs(token_id=token_id, price=0.5, size=10, side=BUY)
+                        )
+                    )
+                    for token_id in ("1", "2")
+                ]
+                await client.post_orders(orders)
+
+        # only the token of the rejected order
+        self.assertEqual(client.market_cache.get_tick_size("1"), "0.01")
+        self.assertIsNone(client.market_cache.get_tick_size("2"))
+
+    async def test_get_prices(self):
+        async with AsyncClobClient(self.server.host) as client:
+            prices = await client.get_prices(
+                [BookParams(token_id="1", side="BUY"), BookParams("2", "SELL")]
+            )
+        self.assertEqual(prices, {"1": {"BUY": "0.5"}, "2": {"SELL": "0.5"}})
+
+    async def test_post_orders(self):
+        async with AsyncClobClient(
+            self.server.host, chain_id=chain_id, key=private_key, creds=creds
+        ) as client:
+            orders = []
+            for price in (0.5, 0.51):
+                order = await client.create_order(
+                    OrderArgs(token_id="123", price=price, size=10, side=BUY)
+                )
+                orders.append(PostOrdersArgs(order=order))
+
+            resp = await client.post_orders(orders)
+            self.assertEqual(resp, [{"success": True}, {"success": True}])
+
+        post = [r for r in self.server.requests if r["path"] == "/orders"][0]
+        self.assertEqual(post["headers"][POLY_ADDRESS], client.get_address())
+        self.assertEqual(post["headers"][POLY_API_KEY], creds.api_key)
+        self.assertIsNotNone(post["headers"][POLY_SIGNATURE])
+        self.assertEqual(len(post["body"]), 2)
+        self.assertEqual(post["body"][0]["owner"], creds.api_key)
+
+        # tick size and neg risk are cached after the first order
+        paths = [r["path"] for r in self.server.requests]
+        self.assertEqual(paths.count("/tick-size"), 1)
+        self.assertEqual(paths.count("/neg-risk"), 1)
+
+    async def test_create_orders(self):
+        async with AsyncClobClient(
+            self.server.host, chain_id=chain_id, key=private_key, creds=creds
+        ) as client:
+            orders = [
+                OrderArgs(token_id=token_id, price=0.5, size=10, side=BUY)
+                for token_id in ("1", "2", "1", "2")
+            ]
+            signed_orders = await client.create_orders(orders)
+
+        self.assertEqual(
+            [str(o.order["tokenId"]) for o in signed_orders], ["1", "2", "1", "2"]
+        )
+        paths = [r["path"] for r in self.server.requests]
+        self.assertEqual(paths.count("/tick-size"), 2)
+        self.assertEqual(paths.count("/neg-risk"), 2)
+
+    async def test_create_order_ladder(self):
+        async with AsyncClobClient(
+            self.server.host, chain_id=chain_id, key=private_key, creds=creds
+        ) as client:
+            ladder = await client.create_order_ladder(
+                "1", BUY, [0.5, 0.49, 0.48], [10, 20, 30]
+            )
+            resp = await client.post_orders(ladder)
+
+        self.assertEqual(
+            [args.order.order["makerAmount"] for args in ladder],
+            [5000000, 9800000, 14400000],
+        )
+        self.assertEqual(len(resp), 3)
+
+    async def test_cancel_orders(self):
+        async with AsyncClobClient(
+            self.server.host, chain_id=chain_id, key=private_key, creds=creds
+        ) as client:
+            resp = await client.cancel_orders(["0x1", "0x2"])
+        self.assertEqual(resp["canceled"], ["0x1", "0x2"])
+
+    async def test_paginated(self):
+        async with AsyncClobClient(
+            self.server.host, chain_id=chain_id, key=private_key, creds=creds
+        ) as client:
+            orders = await client.get_orders(OpenOrderParams(market="0xaabbcc"))
+            self.assertEqual(orders, [1, 2, 3])
+            trades = await client.get_trades(TradeParams(market="0xaabbcc"))
+            self.assertEqual(trades, [1, 2, 3])
+
+            markets = [m async for m in client.iter_markets(prefetch=False)]
+            self.assertEqual(markets, [1, 2, 3])
+
+            # without params
+            self.assertEqual([o async for o in client.iter_orders()], [1, 2, 3])
+            async for trade in client.iter_trades(next_cursor="MQ=="):
+                self.assertEqual(trade, 3)
+
+    async def test_auth(self):
+        client = AsyncClobClient(self.server.host)
+        with self.assertRaises(Exception):
+            await client.get_orders()
+        # raised on call, as by ClobClient, not on iteration
+        with self.assertRaises(Exception):
+            client.iter_orders()
+        with self.assertRaises(Exception):
+            client.iter_trades()
+        await client.close()
@@ -0,0 +1,543 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest import TestCase
+
+from py_clob_client.client import ClobClient
+from py_clob_client.clob_types import (
+    ApiCreds,
+    BookParams,
+    OrderArgs,
+    OrderType,
+    PartialCreateOrderOptions,
+    PostOrdersArgs,
+)
+from py_clob_client.constants import AMOY, END_CURSOR
+from py_clob_client.exceptions import (
+    PolyApiException,
+    PolyBatchException,
+    PolyException,
+)
+from py_clob_client.headers.headers import POLY_SIGNATURE, POLY_TIMESTAMP
+from py_clob_client.metrics import ClientMetrics
+from py_clob_client.order_book.mirror import OrderBookMirror
+from py_clob_client.order_builder.constants import BUY
+from py_clob_client.signing.hmac import build_hmac_signature
+
+from tests.stub_server import StubServer
+
+# publicly known private key
+private_key = "0xac0974bec39a17e36ba4a6b4d238ff944bacb478cbed5efcae784d7bf4f2ff80"
+chain_id = AMOY
+
+creds = ApiCreds(
+    api_key="000000000-0000-0000-0000-000000000000",
+    api_passphrase="aaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaa",
+    api_secret="AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA=",
+)
+
+
+def _batch(fn):
+    def route(query, body):
+        if any(p["token_id"] == "bad" for p in body):
+            return 500, {"error": "bad token"}
+        return 200, fn(body)
+
+    return route
+
+
+def _prices(body):
+    prices = {}
+    for p in body:
+        prices.setdefault(p["token_id"], {})[p["side"]] = "0.5"
+    return prices
+
+
+def _paginated(query, body):
+    pages = {
+        "MA==": ({"data": [1, 2], "next_cursor": "MQ=="}),
+        "MQ==": ({"data": [3], "next_cursor": END_CURSOR}),
+    }
+    return 200, pages[query["next_cursor"]]
+
+
+def _markets(query, body):
+    pages = {
+        "MA==": (
+            {"data": [{"condition_id": "0x1", "tokens": []}], "next_cursor": "MQ=="}
+        ),
+        "MQ==": (
+            {"data": [{"condition_id": "0x2", "tokens": []}], "next_cursor": END_CURSOR}
+        ),
+    }
+    return 200, pages[query["next_cursor"]]
+
+
+ROUTES = {
+    ("GET", "/markets"): _markets,
+    ("GET", "/simplified-markets"): _markets,
+    ("GET", "/sampling-markets"): _markets,
+    ("GET", "/sampling-simplified-markets"): _markets,
+    ("GET", "/data/orders"): _paginated,
+    ("GET", "/data/trades"): _paginated,
+    ("POST", "/books"): _batch(
+        lambda b: [
+            {
+                "market": "0xaabbcc",
+                "asset_id": p["token_id"],
+                "bids": [],
+                "asks": [{"price": "0.6", "size": "10"}],
+                "hash": "",
+                "timestamp": "1",
+            }
+            for p in b
+        ]
+    ),
+    ("POST", "/prices"): _batch(_prices),
+    ("POST", "/midpoints"): _batch(lambda b: {p["token_id"]: "0.5" for p in b}),
+    ("POST", "/spreads"): _batch(lambda b: {p["token_id"]: "0.1" for p in b}),
+    ("POST", "/last-trades-prices"): _batch(
+        lambda b: [{"token_id": p["token_id"], "price": "0.5"} for p in b]
+    ),
+    ("GET", "/midpoint"): lambda q, b: (
+        (404, {"error": "No orderbook exists for the requested token id"})
+        if q["token_id"] == "bad"
+        else (200, {"mid": "0.5"})
+    ),
+    ("GET", "/book"): lambda q, b: (
+        200,
+        {
+            "market": "0xaabbcc",
+            "asset_id": q["token_id"],
+            "bids": [{"price": "0.4", "size": "100"}, {"price": "0.5", "size": "10"}],
+            "asks": [{"price": "0.7", "size": "100"}, {"price": "0.6", "size": "10"}],
+            "hash": "",
+            "timestamp": "123456789",
+        },
+    ),
+    ("GET", "/tick-size"): lambda q, b: (200, {"minimum_tick_size": 0.01}),
+    ("GET", "/neg-risk"): lambda q, b: (200, {"neg_risk": False}),
+    ("POST", "/order"): lambda q, b: (
+        (400, {"error": "INVALID_ORDER_MIN_TICK_SIZE"})
+        if b["order"]["tokenId"] == "3"
+        else (200, {"success": True})
+    ),
+    ("POST", "/orders"): lambda q, b: (200, [{"success": True} for _ in b]),
+    ("DELETE", "/orders"): lambda q, b: (200, {"canceled": b, "not_canceled": {}}),
+}
+
+
+class TestClobClient(TestCase):
+    def setUp(self):
+        self.server = StubServer(ROUTES).start()
+        self.client = ClobClient(
+            self.server.host, chain_id=chain_id, key=private_key, creds=creds
+        )
+
+    def tearDown(self):
+        self.client.close()
+        self.server.stop()
+
+    def assertSignedBody(self, request):
+        # the signature covers the exact bytes that were sent
+        self.assertEqual(
+            request["headers"][POLY_SIGNATURE],
+            build_hmac_signature(
+                creds.api_secret,
+                request["headers"][POLY_TIMESTAMP],
+                request["method"],
+                request["path"],
+                request["raw_body"],
+            ),
+        )
+
+    def test_post_orders_signs_sent_bytes(self):
+        args = [
+            PostOrdersArgs(
+                order=self.client.create_order(
+                    OrderArgs(token_id="123", price=price, size=10, side=BUY)
+                )
+            )
+            for price in (0.5, 0.51, 0.52)
+        ]
+        resp = self.client.post_orders(args)
+        self.assertEqual(len(resp), 3)
+
+        request = [r for r in self.server.requests if r["path"] == "/orders"][0]
+        self.assertEqual(len(request["body"]), 3)
+        self.assertEqual(request["body"][0]["owner"], creds.api_key)
+        self.assertSignedBody(request)
+
+    def test_post_order_signs_sent_bytes(self):
+        order = self.client.create_order(
+            OrderArgs(token_id="123", price=0.5, size=10, side=BUY)
+        )
+        self.assertEqual(self.client.post_order(order), {"success": True})
+
+        request = [r for r in self.server.requests if r["path"] == "/order"][0]
+        self.assertEqual(request["body"]["orderType"], "GTC")
+        self.assertSignedBody(request)
+
+    def test_cancel_orders_signs_sent_bytes(self):
+        resp = self.client.cancel_orders(["0x1", "0x2"])
+        self.assertEqual(resp["canceled"], ["0x1", "0x2"])
+
+        request = [r for r in self.server.requests if r["path"] == "/orders"][0]
+        self.assertSignedBody(request)
+
+    def test_create_orders(self):
+        orders = [
+            OrderArgs(token_id=token_id, price=price, size=10, side=BUY)
+            for token_id in ("1", "2")
+            for price in (0.5, 0.51, 0.52)
+        ]
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            signed_orders = self.client.create_orders(orders, executor=executor)
+
+        self.assertEqual(
+            [str(o.order["tokenId"]) for o in signed_orders],
+            [o.token_id for o in orders],
+        )
+        self.assertEqual(
+            [o.order["makerAmount"] for o in signed_orders],
+            [5000000, 5100000, 5200000] * 2,
+        )
+
+        # resolved once per token
+        paths = [r["path"] for r in self.server.requests]
+        self.assertEqual(paths.count("/tick-size"), 2)
+        self.assertEqual(paths.count("/neg-risk"), 2)
+
+        resp = self.client.post_orders([PostOrdersArgs(order=o) for o in signed_orders])
+        self.assertEqual(len(resp), 6)
+
+        # invalid prices fail before anything is signed
+        with self.assertRaises(Exception):
+            self.client.create_orders(
+                [OrderArgs(token_id="1", price=0.5, size=10, side=BUY)]
+                + [OrderArgs(token_id="1", price=1.5, size=10, side=BUY)]
+            )
+
+    def test_create_orders_resolves_tokens_concurrently(self):
+        def slow(payload):
+            def handler(query, body):
+                time.sleep(0.2)
+                return 200, payload
+
+            return handler
+
+        routes = {
+            **ROUTES,
+            ("GET", "/tick-size"): slow({"minimum_tick_size": 0.01}),
+            ("GET", "/neg-risk"): slow({"neg_risk": False}),
+        }
+        with StubServer(routes) as server:
+            with ClobClient(server.host, chain_id=chain_id, key=private_key) as client:
+                start = time.monotonic()
+                client.create_orders(
+                    [
+                        OrderArgs(token_id=str(i % 4), price=0.5, size=10, side=BUY)
+                        for i in range(8)
+                    ]
+                )
+                elapsed = time.monotonic() - start
+
+        # 8 requests of 0.2s, 4 tokens at a time
+        self.assertLess(elapsed, 1.2)
+        paths = [r["path"] for r in server.requests]
+        self.assertEqual(paths.count("/tick-size"), 4)
+        self.assertEqual(paths.count("/neg-risk"), 4)
+
+    def test_create_order_ladder(self):
+        ladder = self.client.create_order_ladder(
+            "1", BUY, [0.5, 0.49, 0.48], [10, 20, 30]
+        )
+        self.assertEqual(
+            [args.order.order["makerAmount"] for args in ladder],
+            [5000000, 9800000, 14400000],
+        )
+
+        # resolved once for the whole ladder
+        paths = [r["path"] for r in self.server.requests]
+        self.assertEqual(paths.count("/tick-size"), 1)
+        self.assertEqual(paths.count("/neg-risk"), 1)
+
+        resp = self.client.post_orders(ladder)
+        self.assertEqual(len(resp), 3)
+
+    def test_order_book_mirror(self):
+        mirror = OrderBookMirror()
+        mirror.track(["1"])
+        # as by a MarketFeed
+        mirror.set_connected(True)
+        mirror.apply_message(
+            {
+                "event_type": "book",
+                "asset_id": "1",
+                "bids": [
+                    {"price": "0.5", "size": "10"},
+                    {"price": "0.49", "size": "10"},
+                ],
+                "asks": [
+                    {"price": "0.52", "size": "10"},
+                    {"price": "0.51", "size": "10"},
+                ],
+            }
+        )
+        client = ClobClient(
+            self.server.host,
+            chain_id=chain_id,
+            key=private_key,
+            order_book_mirror=mirror,
+        )
+
+        self.assertEqual(client.get_midpoint("1"), {"mid": "0.505"})
+        self.assertEqual(client.get_spread("1"), {"spread": "0.01"})
+        self.assertEqual(
+            client.calculate_market_price("1", BUY, 5, OrderType.FOK), 0.51
+        )
+        self.assertEqual(
+            client.calculate_market_price("1", "SELL", 15, OrderType.FOK), 0.49
+        )
+        self.assertEqual(self.server.requests, [])
+
+        # untracked tokens are requested
+        self.assertEqual(client.get_midpoint("2"), {"mid": "0.5"})
+        self.assertEqual(self.server.requests[0]["path"], "/midpoint")
+
+        # and the tracked ones while the feed is disconnected
+        mirror.set_connected(False)
+        self.assertEqual(client.get_midpoint("1"), {"mid": "0.5"})
+        self.assertEqual(self.server.requests[1]["path"], "/midpoint")
+
+    def test_calculate_market_price(self):
+        self.assertEqual(
+            self.client.calculate_market_price("1", BUY, 6, OrderType.FOK), 0.6
+        )
+        self.assertEqual(
+            self.client.calculate_market_price("1", BUY, 7, OrderType.FOK), 0.7
+        )
+        self.assertEqual(
+            self.client.calculate_market_price("1", "SELL", 50, OrderType.FOK), 0.4
+        )
+        with self.assertRaises(Exception):
+            self.client.calculate_market_price("1", "SELL", 500, OrderType.FOK)
+        self.assertEqual(
+            self.client.calculate_market_price("1", "SELL", 500, OrderType.FAK), 0.4
+        )
+
+    def test_batch_reads_are_chunked(self):
+        client = ClobClient(self.server.host, batch_chunk_size=3)
+        token_ids = [str(i) for i in range(10)]
+        params = [BookParams(token_id=t) for t in token_ids]
+
+        books = client.get_order_books(params)
+        self.assertEqual([b.asset_id for b in books], token_ids)
+        books = client.get_order_books(params, compact=True)
+        self.assertEqual([b.asset_id for b in books], token_ids)
+        self.assertEqual(list(client.get_midpoints(params)), token_ids)
+        self.assertEqual(list(client.get_spreads(params)), token_ids)
+        self.assertEqual(
+            [p["token_id"] for p in client.get_last_trades_prices(params)], token_ids
+        )
+        prices = client.get_prices(
+            [BookParams(token_id=t, side=s) for t in token_ids for s in ("BUY", "SELL")]
+        )
+        self.assertEqual(list(prices), token_ids)
+        self.assertEqual(prices["9"], {"BUY": "0.5", "SELL": "0.5"})
+
+        # 4 chunks per call, 7 for the 20 prices
+        paths = [r["path"] for r in self.server.requests]
+        self.assertEqual(paths.count("/books"), 8)
+        self.assertEqual(paths.count("/prices"), 7)
+        self.assertTrue(all(len(r["body"]) <= 3 for r in self.server.requests))
+
+        # partial failures
+        params.insert(4, BookParams(token_id="bad"))
+        with self.assertRaises(PolyBatchException) as e:
+            client.get_order_books(params)
+        self.assertEqual(
+            [b.asset_id for b in e.exception.result], ["0", "1", "2"] + token_ids[5:]
+        )
+        self.assertEqual([(s, e) for s, e, _ in e.exception.errors], [(3, 6)])
+        self.assertEqual(e.exception.errors[0][2].status_code, 500)
+
+    def test_close(self):
+        def batch_threads():
+            return [t for t in threading.enumerate() if t.name.startswith("clob-batch")]
+
+        # those of the clients of the other tests
+        others = batch_threads()
+        with ClobClient(self.server.host, batch_chunk_size=1) as client:
+            client.get_midpoints([BookParams(token_id=t) for t in ("1", "2", "3")])
+            workers = [t for t in batch_threads() if t not in others]
+            self.assertTrue(workers)
+        # the executor is shut down and its workers joined
+        self.assertFalse(any(t.is_alive() for t in workers))
+
+    def test_coalesced_reads(self):
+        client = ClobClient(self.server.host, coalesce_window=0.05)
+        token_ids = [str(i) for i in range(10)]
+
+        with ThreadPoolExecutor(max_workers=30) as executor:
+            mids = list(executor.map(client.get_midpoint, token_ids))
+            prices = list(executor.map(client.get_price, token_ids, ["BUY"] * 10))
+            books = list(executor.map(client.get_order_book, token_ids))
+
+        self.assertEqual(mids, [{"mid": "0.5"}] * 10)
+        self.assertEqual(prices, [{"price": "0.5"}] * 10)
+        self.assertEqual([b.asset_id for b in books], token_ids)
+        paths = [r["path"] for r in self.server.requests]
+        self.assertEqual(sorted(paths), ["/books", "/midpoints", "/prices"])
+
+        # a failed batch fails every call, without a request per token
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            futures = [executor.submit(client.get_midpoint, t) for t in ("1", "bad")]
+        self.assertEqual([f.exception().status_code for f in futures], [500, 500])
+        paths = [r["path"] for r in self.server.requests]
+        self.assertNotIn("/midpoint", paths)
+
+    def test_concurrent_tick_size_requests_are_shared(self):
+        def tick_size(query, body):
+            time.sleep(0.1)
+            return 200, {"minimum_tick_size": 0.01}
+
+        with StubServer({**ROUTES, ("GET", "/tick-size"): tick_size}) as server:
+            client = ClobClient(server.host)
+            with ThreadPoolExecutor(max_workers=10) as executor:
+                tick_sizes = list(executor.map(client.get_tick_size, ["1"] * 10))
+            self.assertEqual(tick_sizes, ["0.01"] * 10)
+            self.assertEqual(len(server.requests), 1)
+
+    def test_market_cache(self):
+        self.client.market_cache.warm(
+            [
+                {
+                    "minimum_tick_size": 0.01,
+                    "neg_risk": False,
+                    "tokens": [{"token_id": "2"}, {"token_id": "3"}],
+                }
+            ]
+        )
+        self.client.create_order(OrderArgs(token_id="2", price=0.5, size=10, side=BUY))
+        self.assertEqual(self.server.requests, [])
+
+        # a finer tick size than the cached one is checked with the server
+        with self.assertRaises(Exception):
+            self.client.create_order(
+                OrderArgs(token_id="2", price=0.5, size=10, side=BUY),
+                PartialCreateOrderOptions(tick_size="0.001"),
+            )
+        self.assertEqual(self.server.requests[0]["path"], "/tick-size")
+
+        # an order rejected for its tick size invalidates the cached one
+        order = self.client.create_order(
+            OrderArgs(token_id="3", price=0.5, size=10, side=BUY)
+        )
+        with self.assertRaises(PolyApiException):
+            self.client.post_order(order)
+        self.assertIsNone(self.client.market_cache.get_tick_size("3"))
+        self.assertIs(self.client.market_cache.get_neg_risk("3"), False)
+
+    def test_post_orders_mixed_responses(self):
+        def post_orders(query, body):
+            return 200, ["unexpected", {"errorMsg": "INVALID_ORDER_MIN_TICK_SIZE"}]
+
+        with StubServer({**ROUTES, ("POST", "/orders"): post_orders}) as server:
+            client = ClobClient(
+                server.host, chain_id=chain_id, key=private_key, creds=creds
+            )
+            args = [
+                PostOrdersArgs(
+                    order=client.create_order(
+                        OrderArgs(token_id=token_id, price=0.5, size=10, side=BUY)
+                    )
+                )
+                for token_id in ("1", "2")
+            ]
+            client.post_orders(args)
+            client.transport.close()
+
+        # only the token of the rejected order
+        self.assertEqual(client.market_cache.get_tick_size("1"), "0.01")
+        self.assertIsNone(client.market_cache.get_tick_size("2"))
+
+    def test_paginated(self):
+        self.assertEqual(self.client.get_orders(), [1, 2, 3])
+        self.assertEqual(self.client.get_trades(), [1, 2, 3])
+
+        orders = self.client.iter_orders()
+        self.assertEqual(next(orders), 1)
+        orders.close()
+        self.assertEqual(list(self.client.iter_trades(prefetch=False)), [1, 2, 3])
+
+        # every page is signed
+        requests = [r for r in self.server.requests if r["path"] == "/data/trades"]
+        self.assertEqual(
+            [r["query"]["next_cursor"] for r in requests], ["MA==", "MQ=="] * 2
+        )
+        self.assertTrue(all(POLY_SIGNATURE in r["headers"] for r in requests))
+
+        with self.assertRaises(PolyException):
+            ClobClient(self.server.host).iter_orders()
+
+    def test_iter_markets(self):
+        for iter_markets in (
+            self.client.iter_markets,
+            self.client.iter_simplified_markets,
+            self.client.iter_sampling_markets,
+            self.client.iter_sampling_simplified_markets,
+        ):
+            self.assertEqual(
+                [m["condition_id"] for m in iter_markets()], ["0x1", "0x2"]
+            )
+
+        self.assertEqual(
+            list(self.client.iter_markets(fields=["condition_id"], prefetch=False)),
+            [{"condition_id": "0x1"}, {"condition_id": "0x2"}],
+        )
+        self.assertEqual(len(list(self.client.iter_markets(next_cursor="MQ=="))), 1)
+
+    def test_metrics(self):
+        metrics = ClientMetrics()
+        client = ClobClient(
+            self.server.host,
+            chain_id=chain_id,
+            key=private_key,
+            creds=creds,
+            metrics=metrics,
+        )
+        order = client.create_order(
+            OrderArgs(token_id="1", price=0.5, size=10, side=BUY)
+        )
+        client.post_order(order)
+        client.post_orders([PostOrdersArgs(order=order)])
+
+        self.assertEqual(
+            sorted(metrics.phases),
+            [
+                ("create_order", "amounts"),
+                ("create_order", "signing"),
+                ("create_order", "tick_size"),
+                ("post_order", "hmac"),
+                ("post_order", "http"),
+                ("post_order", "serialize"),
+                ("post_orders", "hmac"),
+                ("post_orders", "http"),
+                ("post_orders", "serialize"),
+            ],
+        )
+        self.assertEqual(
+            sorted(metrics.requests),
+            [
+                ("GET", "/neg-risk", "200"),
+                ("GET", "/tick-size", "200"),
+                ("POST", "/order", "200"),
+                ("POST", "/orders", "200"),
+            ],
+        )
+        request = [r for r in self.server.requests if r["path"] == "/orders"][0]
+        self.assertEqual(
+            metrics.request_bytes[("POST", "/orders")], len(request["raw_body"])
+        )
+        self.assertGreater(metrics.response_bytes[("POST", "/orders")], 0)
@@ -0,0 +1,125 @@
+import os
+import tempfile
+import time
+from unittest import IsolatedAsyncioTestCase, TestCase
+
+from py_clob_client.market_cache import (
+    TICK_SIZE,
+    MarketMetadataCache,
+    is_tick_size_error,
+)
+
+
+def _market(condition_id, tick_size, neg_risk):
+    return {
+        "condition_id": condition_id,
+        "minimum_tick_size": tick_size,
+        "neg_risk": neg_risk,
+        "tokens": [
+            {"token_id": condition_id + "-yes", "outcome": "Yes"},
+            {"token_id": condition_id + "-no", "outcome": "No"},
+        ],
+    }
+
+
+PAGES = {
+    "MA==": {"data": [_market("a", 0.01, False)], "next_cursor": "MQ=="},
+    "MQ==": {"data": [_market("b", 0.001, True)], "next_cursor": "LTE="},
+}
+
+
+class Client:
+    def __init__(self):
+        self.cursors = []
+
+    def get_markets(self, next_cursor="MA=="):
+        self.cursors.append(next_cursor)
+        return PAGES[next_cursor]
+
+
+class AsyncClient(Client):
+    async def get_markets(self, next_cursor="MA=="):
+        return Client.get_markets(self, next_cursor)
+
+
+class TestMarketMetadataCache(TestCase):
+    def test_get_set(self):
+        cache = MarketMetadataCache()
+        self.assertIsNone(cache.get_tick_size("1"))
+        self.assertIsNone(cache.get_neg_risk("1"))
+
+        cache.set_tick_size("1", 0.01)
+        cache.set_neg_risk("1", False)
+        self.assertEqual(cache.get_tick_size("1"), "0.01")
+        self.assertIs(cache.get_neg_risk("1"), False)
+
+        cache.invalidate("1", TICK_SIZE)
+        self.assertIsNone(cache.get_tick_size("1"))
+        self.assertIs(cache.get_neg_risk("1"), False)
+        cache.invalidate("1")
+        self.assertIsNone(cache.get_neg_risk("1"))
+
+    def test_ttl(self):
+        cache = MarketMetadataCache(ttl=0.05)
+        cache.set_tick_size("1", "0.01")
+        self.assertEqual(cache.get_tick_size("1"), "0.01")
+        time.sleep(0.06)
+        self.assertIsNone(cache.get_tick_size("1"))
+        self.assertEqual(len(cache), 0)
+
+    def test_lru(self):
+        cache = MarketMetadataCache(maxsize=2)
+        cache.set_tick_size("1", "0.01")
+        cache.set_tick_size("2", "0.01")
+        cache.get_tick_size("1")
+        cache.set_tick_size("3", "0.01")
+        self.assertEqual(len(cache), 2)
+        self.assertIsNone(cache.get_tick_size("2"))
+        self.assertEqual(cache.get_tick_size("1"), "0.01")
+
+    def test_warm(self):
+        cache = MarketMetadataCache()
+        client = Client()
+        self.assertEqual(cache.warm_from(client), 4)
+        self.assertEqual(client.cursors, ["MA==", "MQ=="])
+        self.assertEqual(cache.get_tick_size("a-no"), "0.01")
+        self.assertEqual(cache.get_tick_size("b-yes"), "0.001")
+        self.assertIs(cache.get_neg_risk("b-yes"), True)
+
+        cache = MarketMetadataCache()
+        self.assertEqual(cache.warm_from(Client(), max_pages=1), 2)
+        self.assertIsNone(cache.get_tick_size("b-yes"))
+
+        # simplified markets have no tick size nor neg risk flag, nothing is cached
+        self.assertEqual(
+            cache.warm([{"condition_id": "c", "tokens": [{"token_id": "c-yes"}]}]), 0
+        )
+        self.assertIsNone(cache.get_tick_size("c-yes"))
+        self.assertIsNone(cache.get_neg_risk("c-yes"))
+
+    def test_save_load(self):
+        cache = MarketMetadataCache()
+        cache.warm_from(Client())
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "markets.json")
+            self.assertEqual(MarketMetadataCache().load(path), 0)
+
+            cache.save(path)
+            loaded = MarketMetadataCache()
+            self.assertEqual(loaded.load(path), 8)
+        self.assertEqual(loaded.get_tick_size("b-no"), "0.001")
+        self.assertIs(loaded.get_neg_risk("a-yes"), False)
+
+    def test_is_tick_size_error(self):
+        self.assertTrue(is_tick_size_error("INVALID_ORDER_MIN_TICK_SIZE"))
+        self.assertTrue(is_tick_size_error({"error": "breaks minimum tick size rule"}))
+        self.assertFalse(is_tick_size_error("not enough balance / allowance"))
+        self.assertFalse(is_tick_size_error(None))
+
+
+class TestMarketMetadataCacheAsync(IsolatedAsyncioTestCase):
+    async def test_warm(self):
+        cache = MarketMetadataCache()
+        self.assertEqual(await cache.warm_from_async(AsyncClient()), 4)
+        self.assertEqual(cache.get_tick_size("b-no"), "0.001")
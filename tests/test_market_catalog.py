@@ -0,0 +1,196 @@
+import os
+import sqlite3
+import tempfile
+import time
+from unittest import TestCase
+from unittest.mock import patch
+
+from py_clob_client.client import ClobClient
+from py_clob_client.clob_types import OrderArgs
+from py_clob_client.constants import AMOY, END_CURSOR
+from py_clob_client.market_cache import TICK_SIZE
+from py_clob_client.market_catalog import MARKETS, MarketCatalog
+from py_clob_client.order_builder.constants import BUY
+
+# publicly known private key
+private_key = "0xac0974bec39a17e36ba4a6b4d238ff944bacb478cbed5efcae784d7bf4f2ff80"
+
+
+def _market(i, tick_size=0.01, neg_risk=False):
+    return {
+        "condition_id": "0x{}".format(i),
+        "question": "Q{}?".format(i),
+        "market_slug": "q{}".format(i),
+        "active": True,
+        "closed": False,
+        "minimum_tick_size": tick_size,
+        "neg_risk": neg_risk,
+        "tokens": [
+            {"token_id": "{}1".format(i), "outcome": "Yes"},
+            {"token_id": "{}2".format(i), "outcome": "No"},
+        ],
+    }
+
+
+class Client:
+    """
+    Catalog of `markets`, two per page, the cursor being the offset
+    """
+
+    def __init__(self, markets):
+        self.markets = markets
+        self.cursors = []
+
+    def get_markets(self, next_cursor="MA=="):
+        self.cursors.append(next_cursor)
+        offset = 0 if next_cursor == "MA==" else int(next_cursor)
+        end = offset + 2
+        return {
+            "data": self.markets[offset:end],
+            "next_cursor": str(end) if end < len(self.markets) else END_CURSOR,
+        }
+
+
+class TestMarketCatalog(TestCase):
+    def test_sync(self):
+        client = Client([_market(i) for i in range(5)])
+        catalog = MarketCatalog()
+
+        self.assertIsNone(catalog.get_checkpoint())
+        self.assertEqual(catalog.sync(client), 5)
+        self.assertEqual(client.cursors, ["MA==", "2", "4"])
+        self.assertEqual(len(catalog), 5)
+        # the last page is fetched again by the next sync
+        self.assertEqual(catalog.get_checkpoint(MARKETS), "4")
+
+        # only the pages from the checkpoint are fetched
+        client.markets += [_market(5, tick_size=0.001, neg_risk=True), _market(6)]
+        client.cursors = []
+        self.assertEqual(catalog.sync(client, prefetch=False), 3)
+        self.assertEqual(client.cursors, ["4", "6"])
+        self.assertEqual(len(catalog), 7)
+        self.assertEqual(catalog.get_tick_size("51"), "0.001")
+        self.assertIs(catalog.get_neg_risk("52"), True)
+
+        client.cursors = []
+        self.assertEqual(catalog.sync(client, full=True), 7)
+        self.assertEqual(client.cursors, ["MA==", "2", "4", "6"])
+
+    def test_lookups(self):
+        catalog = MarketCatalog()
+        catalog.upsert_markets([_market(1), {"tokens": []}])
+
+        self.assertEqual(catalog.get_condition_id("12"), "0x1")
+        self.assertEqual(catalog.get_token_ids("0x1"), ["11", "12"])
+        market = catalog.get_market("0x1")
+        self.assertEqual(market["question"], "Q1?")
+        self.assertEqual(market["minimum_tick_size"], "0.01")
+        self.assertEqual(market["tokens"][1], {"token_id": "12", "outcome": "No"})
+        self.assertIsNone(catalog.get_market("0x2"))
+        self.assertIsNone(catalog.get_condition_id("21"))
+        self.assertEqual(catalog.get_token_ids("0x2"), [])
+
+    def test_metadata(self):
+        catalog = MarketCatalog()
+        catalog.upsert_markets([_market(1)])
+        self.assertEqual(catalog.get_tick_size("11"), "0.01")
+        self.assertIs(catalog.get_neg_risk("11"), False)
+
+        catalog.invalidate("11", TICK_SIZE)
+        self.assertIsNone(catalog.get_tick_size("11"))
+        self.assertIs(catalog.get_neg_risk("11"), False)
+        catalog.invalidate("11")
+        self.assertIsNone(catalog.get_neg_risk("11"))
+
+        # tokens missing from the catalog
+        self.assertIsNone(catalog.get_tick_size("99"))
+        catalog.set_tick_size("99", 0.001)
+        catalog.set_neg_risk("99", True)
+        self.assertEqual(catalog.get_tick_size("99"), "0.001")
+        self.assertIs(catalog.get_neg_risk("99"), True)
+
+    def test_ttl(self):
+        client = Client([_market(1)])
+        catalog = MarketCatalog(ttl=60)
+        catalog.sync(client)
+        later = time.time() + 61
+
+        with patch("time.time", return_value=later):
+            self.assertIsNone(catalog.get_tick_size("11"))
+            self.assertIsNone(catalog.get_neg_risk("11"))
+            # the other fields are still catalogued
+            self.assertEqual(catalog.get_condition_id("11"), "0x1")
+
+            catalog.set_tick_size("11", 0.01)
+            self.assertEqual(catalog.get_tick_size("11"), "0.01")
+            self.assertIsNone(catalog.get_neg_risk("11"))
+
+            catalog.sync(client, full=True)
+            self.assertIs(catalog.get_neg_risk("11"), False)
+
+    def test_refresh_after(self):
+        client = Client([_market(i) for i in range(5)])
+        catalog = MarketCatalog()
+        self.assertIsNone(catalog.get_last_full_sync())
+        catalog.sync(client, refresh_after=60)
+        self.assertIsNotNone(catalog.get_last_full_sync())
+
+        # a market of the first page changed its tick size
+        client.markets[0] = _market(0, tick_size=0.001)
+        client.cursors = []
+        catalog.sync(client, refresh_after=60)
+        self.assertEqual(client.cursors, ["4"])
+        self.assertEqual(catalog.get_tick_size("01"), "0.01")
+
+        # the last full sync is too old
+        with patch("time.time", return_value=time.time() + 61):
+            catalog.sync(client, refresh_after=60)
+        self.assertEqual(client.cursors, ["4", "MA==", "2", "4"])
+        self.assertEqual(catalog.get_tick_size("01"), "0.001")
+
+        # never expire by default, i.e. after a restart
+        with patch("time.time", return_value=time.time() + 86400):
+            self.assertEqual(catalog.get_tick_size("01"), "0.001")
+
+    def test_migration(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "catalog.db")
+            db = sqlite3.connect(path)
+            db.execute(
+                "CREATE TABLE tokens (token_id TEXT PRIMARY KEY, condition_id TEXT "
+                "NOT NULL, outcome TEXT, tick_size TEXT, neg_risk INTEGER)"
+            )
+            db.execute("INSERT INTO tokens VALUES ('11', '0x1', 'Yes', '0.01', 0)")
+            db.commit()
+            db.close()
+
+            with MarketCatalog(path) as catalog:
+                self.assertIs(catalog.get_neg_risk("11"), False)
+            with MarketCatalog(path, ttl=60) as catalog:
+                # stored without a timestamp, expired
+                self.assertIsNone(catalog.get_tick_size("11"))
+                catalog.upsert_markets([_market(1)])
+                self.assertEqual(catalog.get_tick_size("11"), "0.01")
+
+    def test_persistence(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "catalog.db")
+            with MarketCatalog(path) as catalog:
+                catalog.sync(Client([_market(i) for i in range(3)]))
+
+            with MarketCatalog(path) as catalog:
+                self.assertEqual(len(catalog), 3)
+                self.assertEqual(catalog.get_checkpoint(), "2")
+                self.assertEqual(catalog.get_tick_size("21"), "0.01")
+
+    def test_client_metadata_source(self):
+        catalog = MarketCatalog()
+        catalog.upsert_markets([_market(1)])
+        # never requested, the host is unreachable
+        client = ClobClient(
+            "http://127.0.0.1:9", chain_id=AMOY, key=private_key, market_cache=catalog
+        )
+        order = client.create_order(
+            OrderArgs(token_id="11", price=0.5, size=10, side=BUY)
+        )
+        self.assertEqual(str(order.order["tokenId"]), "11")
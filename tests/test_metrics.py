@@ -0,0 +1,95 @@
+from unittest import TestCase
+
+from py_clob_client.metrics import (
+    NO_PHASE,
+    PHASE,
+    REQUEST,
+    RETRY,
+    ClientMetrics,
+    Histogram,
+    endpoint_label,
+    error_class,
+    phase,
+)
+
+
+class TestMetrics(TestCase):
+    def test_histogram(self):
+        histogram = Histogram((0.1, 1.0))
+        for value in (0.05, 0.1, 0.5, 2.0):
+            histogram.observe(value)
+        self.assertEqual(histogram.cumulative(), [("0.1", 2), ("1.0", 3), ("+Inf", 4)])
+        self.assertEqual(histogram.count, 4)
+        self.assertAlmostEqual(histogram.sum, 2.65)
+
+    def test_labels(self):
+        self.assertEqual(endpoint_label("http://h/book?token_id=1"), "/book")
+        self.assertEqual(endpoint_label("http://h/markets/0xabc"), "/markets/{id}")
+        self.assertEqual(endpoint_label("http://h/markets"), "/markets")
+        self.assertEqual(endpoint_label("http://h/data/order/0x1"), "/data/order/{id}")
+        self.assertEqual(error_class(429), "4xx")
+        self.assertEqual(error_class(None, ConnectionError()), "ConnectionError")
+
+    def test_observe(self):
+        metrics = ClientMetrics(buckets=(0.01, 0.1))
+        events = []
+        metrics.add_hook(lambda kind, data: events.append((kind, data)))
+
+        metrics.observe_request(
+            "GET", "http://h/book?token_id=1", 200, 0.005, 0, 300, 0.001
+        )
+        metrics.observe_request("GET", "http://h/book?token_id=2", 503, 0.05, 0, 20)
+        metrics.observe_retry("GET", "http://h/book?token_id=2", 0, 0.1)
+        metrics.observe_request(
+            "POST", "http://h/orders", None, 0.2, 500, exception=TimeoutError()
+        )
+        with metrics.phase("post_orders", "hmac"):
+            pass
+
+        self.assertEqual(
+            [kind for kind, _ in events], [REQUEST, REQUEST, RETRY, REQUEST, PHASE]
+        )
+        self.assertEqual(events[1][1]["error"], "5xx")
+        self.assertEqual(events[3][1]["error"], "TimeoutError")
+        self.assertEqual(metrics.response_bytes[("GET", "/book")], 320)
+        self.assertEqual(metrics.request_bytes[("POST", "/orders")], 500)
+        self.assertEqual(metrics.latency[("GET", "/book")].count, 2)
+        self.assertEqual(metrics.retries[("GET", "/book")], 1)
+        self.assertEqual(metrics.phases[("post_orders", "hmac")].count, 1)
+
+        text = metrics.to_prometheus()
+        self.assertIn("# TYPE clob_request_duration_seconds histogram", text)
+        self.assertIn(
+            'clob_request_duration_seconds_bucket{method="GET",endpoint="/book",le="0.01"} 1',
+            text,
+        )
+        self.assertIn(
+            'clob_request_duration_seconds_bucket{method="GET",endpoint="/book",le="+Inf"} 2',
+            text,
+        )
+        self.assertIn(
+            'clob_requests_total{method="GET",endpoint="/book",status="503"} 1', text
+        )
+        self.assertIn(
+            'clob_requests_total{method="POST",endpoint="/orders",status="0"} 1', text
+        )
+        self.assertIn(
+            'clob_request_errors_total{method="POST",endpoint="/orders",error="TimeoutError"} 1',
+            text,
+        )
+        self.assertIn(
+            'clob_request_retries_total{method="GET",endpoint="/book"} 1', text
+        )
+        self.assertIn(
+            'clob_phase_duration_seconds_count{operation="post_orders",phase="hmac"} 1',
+            text,
+        )
+        self.assertTrue(text.endswith("\n"))
+
+        metrics.reset()
+        self.assertEqual(metrics.latency, {})
+
+    def test_no_metrics(self):
+        self.assertIs(phase(None, "create_order", "signing"), NO_PHASE)
+        with phase(None, "create_order", "signing"):
+            pass
@@ -1,11 +1,16 @@
+import json
+from dataclasses import asdict
 from unittest import TestCase
 
 from py_clob_client.clob_types import (
+    OrderBookSummary,
+    OrderSummary,
     OrderArgs,
     OrderType,
     CreateOrderOptions,
 )
 from py_clob_client.constants import AMOY
+from py_clob_client.order_book.compact import CompactOrderBookSummary
 from py_clob_client.order_builder.constants import BUY, SELL
 from py_clob_client.signer import Signer
 from py_clob_client.order_builder.builder import OrderBuilder
@@ -13,8 +18,11 @@ from py_clob_client.utilities import (
     parse_raw_orderbook_summary,
     generate_orderbook_summary_hash,
     order_to_json,
+    serialize_body,
     is_tick_size_smaller,
     price_valid,
+    format_number,
+    OrderBookHashCache,
 )
 
 
@@ -164,6 +172,113 @@ class TestUtilities(TestCase):
             "6d754a2f0304a83544f91a076fa3faa9cbfb9f63",
         )
 
+    def test_orderbook_summary_json(self):
+        summaries = [
+            OrderBookSummary(),
+            OrderBookSummary(
+                market="0xaabbcc",
+                asset_id="100",
+                timestamp="123456789",
+                bids=[OrderSummary(price="0.3", size="100")],
+                asks=[],
+                hash="",
+            ),
+            # escaped and non ascii strings
+            OrderBookSummary(
+                market='"quoted"\\',
+                asset_id="caf\u00e9",
+                bids=[OrderSummary(price="0.3\n", size="10\u2028")],
+                asks=[OrderSummary()],
+            ),
+            # non string levels
+            OrderBookSummary(asset_id="1", bids=[OrderSummary(price=0.5, size=10)]),
+        ]
+        for summary in summaries:
+            self.assertEqual(
+                summary.json, json.dumps(asdict(summary), separators=(",", ":"))
+            )
+
+    def test_generate_orderbook_summary_hash_compact(self):
+        raw_obs = {
+            "market": "0xaabbcc",
+            "asset_id": "100",
+            "bids": [
+                {"price": "0.3", "size": "100"},
+                {"price": "0.4", "size": "100"},
+            ],
+            "asks": [
+                {"price": "0.6", "size": "100"},
+                {"price": "0.7", "size": "100"},
+            ],
+            "hash": "",
+            "timestamp": "123456789",
+        }
+
+        compact = CompactOrderBookSummary.from_raw(raw_obs)
+        self.assertEqual(compact.json, compact.to_summary().json)
+        self.assertEqual(
+            generate_orderbook_summary_hash(compact),
+            "5489da29343426f88622d61044975dc5fd828a27",
+        )
+        self.assertEqual(compact.hash, "5489da29343426f88622d61044975dc5fd828a27")
+
+    def test_orderbook_hash_cache(self):
+        raw_obs = {
+            "market": "0xaabbcc",
+            "asset_id": "100",
+            "bids": [
+                {"price": "0.3", "size": "100"},
+                {"price": "0.4", "size": "100"},
+            ],
+            "asks": [
+                {"price": "0.6", "size": "100"},
+                {"price": "0.7", "size": "100"},
+            ],
+            "hash": "",
+            "timestamp": "123456789",
+        }
+        digest = "5489da29343426f88622d61044975dc5fd828a27"
+        cache = OrderBookHashCache(maxsize=2)
+
+        # an empty hash is always hashed
+        summary = parse_raw_orderbook_summary(raw_obs)
+        self.assertEqual(cache.hash(summary), digest)
+        self.assertEqual(summary.hash, digest)
+
+        # the hash set by a previous call is not trusted
+        summary.bids[0] = OrderSummary(price="0.3", size="50")
+        changed = cache.hash(summary)
+        self.assertNotEqual(changed, digest)
+        self.assertEqual(changed, generate_orderbook_summary_hash(summary))
+
+        # nor after being hashed twice
+        summary = parse_raw_orderbook_summary(raw_obs)
+        cache.hash(summary)
+        self.assertEqual(cache.hash(summary), digest)
+        summary.bids[0] = OrderSummary(price="0.3", size="50")
+        self.assertEqual(cache.hash(summary), changed)
+        self.assertEqual(
+            generate_orderbook_summary_hash(summary), cache.hash(summary)
+        )
+
+        # a server sent hash is hashed once
+        summary = parse_raw_orderbook_summary(dict(raw_obs, hash="0x1"))
+        self.assertEqual(cache.hash(summary), digest)
+        self.assertEqual(summary.hash, digest)
+
+        # then not hashed again
+        summary = parse_raw_orderbook_summary(dict(raw_obs, hash="0x1"))
+        summary.bids = None
+        self.assertEqual(cache.hash(summary), digest)
+        self.assertEqual(summary.hash, digest)
+
+        # least recently used entries are evicted
+        for server_hash in ("0x2", "0x3"):
+            cache.hash(parse_raw_orderbook_summary(dict(raw_obs, hash=server_hash)))
+        summary = parse_raw_orderbook_summary(dict(raw_obs, hash="0x1"))
+        summary.bids = None
+        self.assertNotEqual(cache.hash(summary), digest)
+
     def test_order_to_json_0_1(self):
         # publicly known private key
         private_key = (
@@ -1561,3 +1676,22 @@ class TestUtilities(TestCase):
         self.assertFalse(price_valid(0.999, "0.1"))
         self.assertFalse(price_valid(0.9999, "0.1"))
         self.assertFalse(price_valid(0.99999, "0.1"))
+
+    def test_serialize_body(self):
+        body = {"orderID": "0x123", "owner": "aa-bb", "ids": ["1", "2"]}
+        serialized = serialize_body(body)
+        self.assertIsInstance(serialized, bytes)
+        self.assertEqual(
+            serialized, b'{"orderID": "0x123", "owner": "aa-bb", "ids": ["1", "2"]}'
+        )
+        # same message the hmac used to be built from
+        self.assertEqual(serialized.decode("utf-8"), str(body).replace("'", '"'))
+
+        with self.assertRaises(ValueError):
+            serialize_body({"price": float("nan")})
+
+    def test_format_number(self):
+        self.assertEqual(format_number(0.5), "0.5")
+        self.assertEqual(format_number(100.0), "100")
+        self.assertEqual(format_number(148.56), "148.56")
+        self.assertEqual(format_number(0.0001), "0.0001")